@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark da Importação em Lote - HullZero
+
+Compara a importação legada de AIS (mapeamento de colunas por linha +
+OperationalDataRepository.create, com commit por linha) com o carregador
+em lote de import_ais_data (blocos + executemany). Usa um banco SQLite em
+arquivo temporário e um CSV AIS sintético.
+
+Uso:
+    python scripts/benchmark_bulk_import.py
+    python scripts/benchmark_bulk_import.py --rows 1000000 --legacy-sample 2000
+"""
+
+import sys
+import csv
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import Base, Vessel, OperationalData, IngestionLedger
+from src.database.repositories import OperationalDataRepository
+from src.data.import_real_data import import_ais_data, parse_datetime
+
+
+VESSEL_NAME = "NAVIO BENCHMARK"
+
+
+def write_ais_csv(path: Path, rows: int):
+    """Gera CSV AIS sintético"""
+    start = datetime(2024, 1, 1)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "latitude", "longitude", "speed", "heading"])
+        for i in range(rows):
+            writer.writerow([
+                (start + timedelta(minutes=10 * i)).strftime("%Y-%m-%d %H:%M:%S"),
+                f"{-23.0 + (i % 1000) * 0.001:.5f}",
+                f"{-43.0 - (i % 700) * 0.001:.5f}",
+                f"{8 + (i % 90) / 10:.1f}",
+                f"{i % 360}",
+            ])
+
+
+def legacy_import(db, vessel_id: str, csv_path: Path, limit: int) -> int:
+    """Importação linha a linha (comportamento anterior, sem o limite de 1000)"""
+    count = 0
+    with open(csv_path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            values = {}
+            for key, value in row.items():
+                key_lower = key.lower()
+                if any(x in key_lower for x in ['timestamp', 'data', 'date', 'hora', 'time']):
+                    values["timestamp"] = parse_datetime(str(value))
+                if any(x in key_lower for x in ['latitude', 'lat']):
+                    values["latitude"] = float(value) if value else None
+                if any(x in key_lower for x in ['longitude', 'lon', 'lng']):
+                    values["longitude"] = float(value) if value else None
+                if any(x in key_lower for x in ['speed', 'velocidade', 'sog']):
+                    values["speed_knots"] = float(value) if value else None
+                if any(x in key_lower for x in ['heading', 'direção', 'course', 'cog']):
+                    values["heading"] = float(value) if value else None
+            OperationalDataRepository.create(db, {"vessel_id": vessel_id, **values})
+            count += 1
+            if count >= limit:
+                break
+    return count
+
+
+def new_session(db_path: Path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[Vessel.__table__, OperationalData.__table__, IngestionLedger.__table__]
+    )
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    if not db.get(Vessel, "BENCH_VESSEL"):
+        db.add(Vessel(id="BENCH_VESSEL", name=VESSEL_NAME, imo_number="9000001", vessel_type="tanker"))
+        db.commit()
+    return engine, db
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da importação AIS em lote")
+    parser.add_argument("--rows", type=int, default=500_000, help="Linhas do CSV sintético")
+    parser.add_argument("--legacy-sample", type=int, default=2_000,
+                        help="Linhas importadas pelo caminho legado (extrapolado)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / f"{VESSEL_NAME}.csv"
+        write_ais_csv(csv_path, args.rows)
+
+        print("=" * 60)
+        print(f"📊 BENCHMARK - IMPORTAÇÃO AIS ({args.rows:,} linhas)")
+        print("=" * 60)
+
+        engine, db = new_session(tmp / "legacy.db")
+        start = time.perf_counter()
+        legacy_rows = legacy_import(db, "BENCH_VESSEL", csv_path, args.legacy_sample)
+        legacy_rate = legacy_rows / (time.perf_counter() - start)
+        db.close()
+        engine.dispose()
+        print(f"Legado (linha a linha): {legacy_rate:>12,.0f} linhas/s "
+              f"(amostra de {legacy_rows:,} linhas)")
+
+        engine, db = new_session(tmp / "bulk.db")
+        start = time.perf_counter()
+        bulk_rows = import_ais_data(db, VESSEL_NAME, str(csv_path))
+        bulk_rate = bulk_rows / (time.perf_counter() - start)
+        stored = db.query(func.count(OperationalData.id)).scalar()
+        db.close()
+        engine.dispose()
+        print(f"Em lote:                {bulk_rate:>12,.0f} linhas/s "
+              f"({bulk_rows:,} importadas, {stored:,} no banco)")
+
+        print("-" * 60)
+        print(f"🚀 Aceleração: {bulk_rate / legacy_rate:,.0f}x")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
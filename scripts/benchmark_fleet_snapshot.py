@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark do Snapshot da Frota - HullZero
+
+Compara o acesso legado (N+1: última predição, última limpeza e última
+pintura consultadas navio a navio) com o FleetSnapshotRepository, que
+resolve tudo em uma única consulta. Mede número de consultas e latência
+em um banco SQLite em memória com frotas sintéticas.
+
+Uso:
+    python scripts/benchmark_fleet_snapshot.py
+    python scripts/benchmark_fleet_snapshot.py --sizes 50 500 5000 --repeat 5
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.data.synthetic_fleet import SyntheticFleetGenerator, write_to_database
+from src.database.models import Base
+from src.database.repositories import (
+    VesselRepository,
+    FoulingDataRepository,
+    MaintenanceEventRepository,
+    FleetSnapshotRepository
+)
+
+
+# Frota sintética: 20 leituras semanais de bioincrustação por navio
+FOULING_EVERY_HOURS = 7 * 24
+HISTORY_YEARS = 20 * 7 / 365
+
+
+def build_database(n_vessels: int):
+    """Cria banco em memória com a frota sintética (src/data/synthetic_fleet.py) de n_vessels embarcações"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+
+    # O acesso medido não lê dados operacionais: cadência igual à da bioincrustação
+    generator = SyntheticFleetGenerator(
+        n_vessels,
+        years=HISTORY_YEARS,
+        cadence_minutes=FOULING_EVERY_HOURS * 60,
+        fouling_every_hours=FOULING_EVERY_HOURS,
+        id_prefix="BENCH"
+    )
+    db = sessionmaker(bind=engine)()
+    try:
+        write_to_database(generator, db)
+    finally:
+        db.close()
+
+    return engine
+
+
+def legacy_access(db):
+    """Padrão N+1 usado anteriormente pelos endpoints de dashboard"""
+    rows = []
+    for vessel in VesselRepository.get_all(db, limit=100000):
+        rows.append((
+            vessel,
+            FoulingDataRepository.get_latest(db, vessel.id),
+            MaintenanceEventRepository.get_latest_by_type(db, vessel.id, "cleaning"),
+            MaintenanceEventRepository.get_latest_by_type(db, vessel.id, "painting"),
+        ))
+    return rows
+
+
+def snapshot_access(db):
+    """Acesso em consulta única via FleetSnapshotRepository"""
+    return FleetSnapshotRepository.get_all(db)
+
+
+def measure(engine, access_fn, repeat: int):
+    """Executa access_fn repetidamente e retorna (consultas, latência mediana em ms)"""
+    Session = sessionmaker(bind=engine)
+    counter = {"queries": 0}
+
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        counter["queries"] += 1
+
+    event.listen(engine, "before_cursor_execute", count_query)
+    timings = []
+    try:
+        for _ in range(repeat):
+            counter["queries"] = 0
+            db = Session()
+            try:
+                start = time.perf_counter()
+                access_fn(db)
+                timings.append((time.perf_counter() - start) * 1000)
+            finally:
+                db.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", count_query)
+
+    return counter["queries"], statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do snapshot da frota")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("📊 BENCHMARK - SNAPSHOT DA FROTA (SQLite em memória)")
+    print("=" * 78)
+    print(f"{'Navios':>8} | {'Legado (consultas)':>18} | {'Legado (ms)':>11} | "
+          f"{'Snapshot (consultas)':>20} | {'Snapshot (ms)':>13}")
+    print("-" * 78)
+
+    for size in args.sizes:
+        engine = build_database(size)
+        legacy_queries, legacy_ms = measure(engine, legacy_access, args.repeat)
+        snapshot_queries, snapshot_ms = measure(engine, snapshot_access, args.repeat)
+        engine.dispose()
+
+        print(f"{size:>8} | {legacy_queries:>18} | {legacy_ms:>11.1f} | "
+              f"{snapshot_queries:>20} | {snapshot_ms:>13.1f}")
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
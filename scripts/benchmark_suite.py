@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Suíte de Benchmarks - HullZero
+
+Mede, sobre um banco sintético de tamanho configurável:
+
+- models: predict_fouling, predict_advanced_fouling, predict_normam401_risk,
+  optimize_inspections, detect_compliance_anomalies e
+  get_cleaning_recommendation;
+- repositories: as consultas dos repositórios usadas pela API (histórico
+  de um navio, snapshot e tendências da frota, fleet_state);
+- endpoints: dashboard e frota via cliente ASGI (TestClient, sem rede).
+
+Cada caso roda algumas vezes para aquecimento (carga de modelos, cache do
+SQLite) e depois --repeat vezes. O resultado (mediana, p95, mínimo...) é
+gravado em JSON e comparado com um baseline: um caso regrediu quando a
+mediana piora mais que --tolerance e mais que --min-delta-ms, quando
+falhou ou quando está no baseline (e foi selecionado por --group/--only)
+mas não foi medido. Com regressões o script sai com código 1 (para uso
+em CI).
+
+O cache de respostas fica desligado durante os benchmarks: mede-se o
+trabalho de cada endpoint, não os hits do cache.
+
+Uso:
+    python scripts/benchmark_suite.py --save-baseline
+    python scripts/benchmark_suite.py
+    python scripts/benchmark_suite.py --vessels 1000 --history-days 365 --group endpoints
+    python scripts/benchmark_suite.py --only dashboard --repeat 50
+    python scripts/benchmark_suite.py --database-url sqlite:///./copia_producao.db
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Adicionar src ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "latest.json"
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+GROUPS = ("models", "repositories", "endpoints")
+FOULING_EVERY_DAYS = 3
+OPERATIONAL_EVERY_HOURS = 6
+
+
+class BenchmarkCase(NamedTuple):
+    name: str
+    group: str
+    run: Callable[[], object]
+
+
+# ==================== BANCO SINTÉTICO ====================
+
+def build_database(n_vessels: int, history_days: int) -> Dict[str, int]:
+    """Grava no DATABASE_URL a frota sintética (src/data/synthetic_fleet.py) com history_days de histórico"""
+    from src.database import SessionLocal, init_db
+    from src.data.synthetic_fleet import SyntheticFleetGenerator, write_to_database
+
+    generator = SyntheticFleetGenerator(
+        n_vessels,
+        years=history_days / 365,
+        cadence_minutes=OPERATIONAL_EVERY_HOURS * 60,
+        fouling_every_hours=FOULING_EVERY_DAYS * 24,
+        id_prefix="BENCH"
+    )
+    init_db()
+    db = SessionLocal()
+    try:
+        return write_to_database(generator, db)
+    finally:
+        db.close()
+
+
+def rebuild_fleet_state():
+    """fleet_state é mantido na escrita pela sessão; o insert em lote não passa por ela"""
+    from src.database import SessionLocal
+    from src.services.fleet_state_service import rebuild_fleet_state as rebuild
+
+    db = SessionLocal()
+    try:
+        return rebuild(db)
+    finally:
+        db.close()
+
+
+def fleet_vessel_ids() -> List[str]:
+    from src.database import SessionLocal
+    from src.database.models import Vessel
+
+    db = SessionLocal()
+    try:
+        return [row[0] for row in db.query(Vessel.id).order_by(Vessel.id).all()]
+    finally:
+        db.close()
+
+
+# ==================== CASOS ====================
+
+def model_cases(vessel_id: str) -> List[BenchmarkCase]:
+    from src.models.fouling_prediction import VesselFeatures, predict_fouling
+    from src.models.advanced_fouling_prediction import AdvancedVesselFeatures, predict_advanced_fouling
+    from src.models.normam401_risk import predict_normam401_risk
+    from src.models.inspection_optimizer import optimize_inspections
+    from src.models.anomaly_detector import ComplianceDataPoint, detect_compliance_anomalies
+    from src.services.recommendation_service import get_cleaning_recommendation
+
+    features = VesselFeatures(
+        vessel_id=vessel_id,
+        time_since_cleaning_days=120,
+        water_temperature_c=26.0,
+        salinity_psu=34.5,
+        time_in_port_hours=96,
+        average_speed_knots=12.5,
+        route_region="South_Atlantic",
+        paint_type="Antifouling_Type_A",
+        vessel_type="Tanker",
+        hull_area_m2=5800.0
+    )
+    advanced_features = AdvancedVesselFeatures(
+        **features.__dict__,
+        last_cleaning_method="hull_cleaning",
+        paint_age_days=400,
+        seasonal_factor="summer"
+    )
+    now = datetime.now()
+    compliance_history = [
+        ComplianceDataPoint(
+            timestamp=now - timedelta(days=15 * (24 - k)),
+            vessel_id=vessel_id,
+            fouling_mm=1.0 + 0.15 * k + (2.5 if k == 17 else 0.0),
+            roughness_um=150.0 + 12.0 * k,
+            compliance_status="compliant" if k < 18 else "warning",
+            compliance_score=max(0.1, 0.95 - 0.03 * k),
+            source=("prediction", "inspection", "measurement")[k % 3]
+        )
+        for k in range(24)
+    ]
+
+    return [
+        BenchmarkCase("models.predict_fouling", "models", lambda: predict_fouling(features)),
+        BenchmarkCase("models.predict_advanced_fouling", "models",
+                      lambda: predict_advanced_fouling(advanced_features)),
+        BenchmarkCase("models.predict_normam401_risk", "models",
+                      lambda: predict_normam401_risk(vessel_id, features, 30)),
+        BenchmarkCase("models.optimize_inspections", "models",
+                      lambda: optimize_inspections(vessel_id, features, 365)),
+        BenchmarkCase("models.detect_compliance_anomalies", "models",
+                      lambda: detect_compliance_anomalies(compliance_history)),
+        BenchmarkCase("models.get_cleaning_recommendation", "models",
+                      lambda: get_cleaning_recommendation(vessel_id, 3.2, 420.0, features)),
+    ]
+
+
+def repository_cases(vessel_id: str) -> List[BenchmarkCase]:
+    from src.database import SessionLocal
+    from src.database.repositories import (
+        VesselRepository,
+        FoulingDataRepository,
+        OperationalDataRepository,
+        MaintenanceEventRepository,
+        FleetSnapshotRepository,
+        FleetTrendsRepository,
+        FleetStateRepository
+    )
+    from src.services.compliance_service import NORMAM401ComplianceService
+
+    year_ago = datetime.now() - timedelta(days=365)
+
+    def with_session(query):
+        def run():
+            db = SessionLocal()
+            try:
+                return query(db)
+            finally:
+                db.close()
+        return run
+
+    queries = {
+        "vessels_page": lambda db: VesselRepository.get_page(db, limit=100),
+        "fouling_by_vessel": lambda db: FoulingDataRepository.get_by_vessel(db, vessel_id, limit=100),
+        "operational_by_vessel": lambda db: OperationalDataRepository.get_by_vessel(db, vessel_id, limit=500),
+        "operational_latest": lambda db: OperationalDataRepository.get_latest(db, vessel_id),
+        "maintenance_latest_cleaning": lambda db: MaintenanceEventRepository.get_latest_by_type(
+            db, vessel_id, "cleaning"
+        ),
+        "fleet_snapshot": lambda db: FleetSnapshotRepository.get_all(db),
+        "fleet_state": lambda db: FleetStateRepository.get_all(db),
+        "monthly_fouling": lambda db: FleetTrendsRepository.get_monthly_fouling(
+            db, year_ago, NORMAM401ComplianceService.VESSEL_TYPE_LIMITS
+        ),
+        "monthly_maintenance": lambda db: FleetTrendsRepository.get_monthly_maintenance_counts(db, year_ago),
+    }
+    return [
+        BenchmarkCase(f"repositories.{name}", "repositories", with_session(query))
+        for name, query in queries.items()
+    ]
+
+
+def endpoint_cases(vessel_id: str) -> List[BenchmarkCase]:
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    client = TestClient(app)
+    client.__enter__()  # executa os eventos de startup uma única vez
+
+    paths = {
+        "dashboard_kpis": "/api/dashboard/kpis",
+        "dashboard_trends": "/api/dashboard/trends?period=12_months",
+        "dashboard_fleet_status": "/api/dashboard/fleet-status",
+        "fleet_summary": "/api/fleet/summary",
+        "fleet_detailed_status": "/api/fleet/detailed-status",
+        "vessels_list": "/api/vessels?limit=100",
+        "vessel_fouling_latest": f"/api/vessels/{vessel_id}/fouling/latest",
+        "vessel_operational_data": f"/api/vessels/{vessel_id}/operational-data?limit=500",
+    }
+
+    def get(path):
+        def run():
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} retornou {response.status_code}")
+            return response
+        return run
+
+    return [
+        BenchmarkCase(f"endpoints.{name}", "endpoints", get(path))
+        for name, path in paths.items()
+    ]
+
+
+# ==================== EXECUÇÃO ====================
+
+def measure(case: BenchmarkCase, repeat: int, warmup: int) -> Dict:
+    """Tempos em ms de repeat execuções, após warmup execuções descartadas"""
+    for _ in range(warmup):
+        case.run()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.run()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "group": case.group,
+        "rounds": repeat,
+        "min_ms": round(samples[0], 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "stdev_ms": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    results: Dict,
+    baseline: Dict,
+    tolerance: float,
+    min_delta_ms: float,
+    selected: Callable[[str, str], bool]
+) -> List[str]:
+    """
+    Imprime a comparação com o baseline; retorna os casos que regrediram.
+
+    Casos do baseline que falharam ou não foram medidos contam como
+    regressão; `selected(nome, grupo)` exclui os filtrados por --group/--only.
+    """
+    if baseline.get("parameters") != results["parameters"]:
+        print(f"⚠️  Baseline gerado com outros parâmetros: {baseline.get('parameters')}")
+
+    regressions = []
+    print(f"\n{'caso':<45} {'baseline':>10} {'atual':>10} {'variação':>9}")
+    for name, current in results["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            print(f"{name:<45} {'-':>10} {current['median_ms']:>8.2f}ms {'novo':>9}")
+            continue
+        before, after = reference["median_ms"], current["median_ms"]
+        change = (after - before) / before if before else 0.0
+        status = ""
+        if change > tolerance and after - before > min_delta_ms:
+            status = "⚠️  REGRESSÃO"
+            regressions.append(name)
+        elif change < -tolerance and before - after > min_delta_ms:
+            status = "🚀 melhora"
+        print(f"{name:<45} {before:>8.2f}ms {after:>8.2f}ms {change:>+8.0%}  {status}")
+
+    for name, reference in baseline.get("results", {}).items():
+        if name in results["results"] or not selected(name, reference.get("group", "")):
+            continue
+        status = "❌ ERRO" if name in results["errors"] else "❌ AUSENTE"
+        print(f"{name:<45} {reference['median_ms']:>8.2f}ms {'-':>10} {'-':>9}  {status}")
+        regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de modelos, repositórios e endpoints")
+    parser.add_argument("--vessels", type=int, default=200, help="Embarcações no banco sintético")
+    parser.add_argument("--history-days", type=int, default=180, help="Dias de histórico por embarcação")
+    parser.add_argument("--database-url", help="Usar um banco existente em vez do sintético")
+    parser.add_argument("--group", choices=GROUPS, action="append", dest="groups",
+                        help="Executar apenas este grupo (pode repetir)")
+    parser.add_argument("--only", help="Executar apenas casos cujo nome contém este texto")
+    parser.add_argument("--repeat", type=int, default=20, help="Execuções medidas por caso")
+    parser.add_argument("--warmup", type=int, default=3, help="Execuções descartadas por caso")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Arquivo JSON de resultados")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline para comparação")
+    parser.add_argument("--save-baseline", action="store_true", help="Gravar os resultados como novo baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Piora relativa da mediana tolerada (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="Piora absoluta mínima para contar como regressão")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⏱️  SUÍTE DE BENCHMARKS HULLZERO")
+    print("=" * 60)
+
+    workdir = tempfile.TemporaryDirectory(prefix="hullzero_bench_")
+    database_url = args.database_url or f"sqlite:///{Path(workdir.name) / 'bench.db'}"
+    # Configuração lida na importação de src.config: definir antes de importar a API
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    os.environ["SLOW_QUERY_LOG_ENABLED"] = "false"
+    os.environ["PROFILING_ENABLED"] = "false"
+
+    if not args.database_url:
+        print(f"📦 Gerando frota sintética: {args.vessels} embarcações, {args.history_days} dias de histórico...")
+        start = time.perf_counter()
+        build_database(args.vessels, args.history_days)
+        count = rebuild_fleet_state()
+        print(f"✅ Banco pronto em {time.perf_counter() - start:.1f}s ({count} embarcações em fleet_state)")
+
+    vessel_ids = fleet_vessel_ids()
+    if not vessel_ids:
+        print("❌ Banco sem embarcações")
+        sys.exit(1)
+    vessel_id = vessel_ids[len(vessel_ids) // 2]
+
+    groups = args.groups or list(GROUPS)
+    builders = {"models": model_cases, "repositories": repository_cases, "endpoints": endpoint_cases}
+    def selected(name: str, group: str) -> bool:
+        return group in groups and (not args.only or args.only in name)
+
+    cases = [case for group in groups for case in builders[group](vessel_id)]
+    cases = [case for case in cases if selected(case.name, case.group)]
+
+    results = {
+        "created_at": datetime.now().isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "vessels": None if args.database_url else args.vessels,
+            "history_days": None if args.database_url else args.history_days,
+            "database": "custom" if args.database_url else "synthetic",
+        },
+        "results": {},
+        "errors": {},
+    }
+
+    print(f"\n{'caso':<45} {'mediana':>10} {'p95':>10} {'mín':>10}")
+    for case in cases:
+        try:
+            stats = measure(case, args.repeat, args.warmup)
+        except Exception as e:
+            print(f"{case.name:<45} ❌ {e}")
+            results["errors"][case.name] = str(e)
+            continue
+        results["results"][case.name] = stats
+        print(f"{case.name:<45} {stats['median_ms']:>8.2f}ms {stats['p95_ms']:>8.2f}ms {stats['min_ms']:>8.2f}ms")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\n💾 Resultados: {args.output}")
+
+    # Caso com erro é falha mesmo sem baseline (e não entra em um baseline novo)
+    regressions = list(results["errors"])
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"💾 Baseline atualizado: {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms, selected)
+        regressions += [name for name in results["errors"] if name not in regressions]
+    else:
+        print(f"ℹ️  Sem baseline em {args.baseline} (gere com --save-baseline)")
+
+    print("=" * 60)
+    if regressions:
+        print(f"❌ {len(regressions)} regressão(ões): {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ Nenhuma regressão")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Gerador de Frota Sintética - HullZero
+
+Gera N embarcações (classes da frota Transpetro como modelo) com anos de
+dados operacionais na cadência do AIS, predições de bioincrustação e
+eventos de manutenção, para testes de carga em escala de produção.
+Ver src/data/synthetic_fleet.py.
+
+As embarcações recebem IDs com prefixo (padrão SYN_), para não colidir
+com a frota real. Com a mesma --seed e a mesma --end-date os dados são
+idênticos entre execuções.
+
+Uso:
+    python scripts/generate_synthetic_fleet.py --vessels 1000 --years 2
+    python scripts/generate_synthetic_fleet.py --vessels 1000 --years 2 --format parquet --output-dir frota_sintetica/
+    python scripts/generate_synthetic_fleet.py --vessels 50 --years 1 --cadence-minutes 60 --end-date 2025-12-31
+"""
+
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Lotes de escrita ultrapassam o limite do log de consultas lentas
+os.environ.setdefault("SLOW_QUERY_LOG_ENABLED", "false")
+
+from src.data.bulk_loader import DEFAULT_BATCH_SIZE
+from src.data.synthetic_fleet import DEFAULT_SEED, SyntheticFleetGenerator
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Gera uma frota sintética em escala")
+    parser.add_argument("--vessels", type=int, default=100, help="Número de embarcações")
+    parser.add_argument("--years", type=float, default=2.0, help="Anos de histórico")
+    parser.add_argument("--cadence-minutes", type=int, default=15,
+                        help="Intervalo entre registros operacionais (AIS)")
+    parser.add_argument("--fouling-every-hours", type=int, default=24,
+                        help="Intervalo entre predições de bioincrustação")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Semente (reprodutibilidade)")
+    parser.add_argument("--end-date", type=datetime.fromisoformat,
+                        help="Fim do histórico, AAAA-MM-DD (padrão: hoje)")
+    parser.add_argument("--id-prefix", default="SYN", help="Prefixo dos IDs das embarcações")
+    parser.add_argument("--format", choices=("db", "parquet"), default="db", dest="output_format",
+                        help="Banco de dados (DATABASE_URL) ou arquivos Parquet")
+    parser.add_argument("--output-dir", default="synthetic_fleet",
+                        help="Diretório dos arquivos Parquet")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Linhas por transação na gravação no banco")
+    parser.add_argument("--skip-fleet-state", action="store_true",
+                        help="Não reconstruir fleet_state ao final")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("=" * 60)
+    print("🚢 GERADOR DE FROTA SINTÉTICA - HULLZERO")
+    print("=" * 60)
+
+    generator = SyntheticFleetGenerator(
+        args.vessels,
+        years=args.years,
+        cadence_minutes=args.cadence_minutes,
+        fouling_every_hours=args.fouling_every_hours,
+        seed=args.seed,
+        end_date=args.end_date,
+        id_prefix=args.id_prefix
+    )
+    print(f"   Embarcações: {args.vessels}")
+    print(f"   Período: {generator.start_date:%Y-%m-%d} a {generator.end_date:%Y-%m-%d}")
+    print(f"   Registros operacionais: {generator.operational_steps:,} por embarcação "
+          f"({generator.operational_steps * args.vessels:,} no total)")
+    print(f"   Seed: {args.seed}")
+
+    start = time.perf_counter()
+    report_every = max(1, args.vessels // 20)
+
+    def progress(vessels_done: int, rows: int):
+        if vessels_done % report_every == 0 or vessels_done == args.vessels:
+            elapsed = time.perf_counter() - start
+            print(f"   {vessels_done}/{args.vessels} embarcações, {rows:,} linhas "
+                  f"({rows / elapsed:,.0f} linhas/s)")
+
+    if args.output_format == "parquet":
+        from src.data.synthetic_fleet import PARQUET_AVAILABLE, write_parquet
+
+        if not PARQUET_AVAILABLE:
+            print("❌ Saída Parquet requer pyarrow (pip install pyarrow)")
+            sys.exit(1)
+        print(f"\n📦 Gravando Parquet em {args.output_dir}/ ...")
+        totals = write_parquet(generator, args.output_dir, progress)
+    else:
+        from src.database import SessionLocal, init_db
+        from src.database.models import Vessel
+        from src.data.synthetic_fleet import write_to_database
+
+        init_db()
+        db = SessionLocal()
+        try:
+            if db.query(Vessel.id).filter(Vessel.id.like(f"{args.id_prefix}\\_%", escape="\\")).first():
+                print(f"❌ Já existem embarcações com prefixo {args.id_prefix}_ no banco "
+                      f"(use outro --id-prefix ou remova-as)")
+                sys.exit(1)
+            print("\n📦 Gravando no banco de dados...")
+            totals = write_to_database(generator, db, args.batch_size, progress)
+
+            if not args.skip_fleet_state:
+                from src.services.fleet_state_service import rebuild_fleet_state
+
+                print("\n🔄 Reconstruindo fleet_state...")
+                rebuild_fleet_state(db)
+        except Exception as e:
+            db.rollback()
+            print(f"❌ Erro ao gravar a frota sintética: {e}")
+            sys.exit(1)
+        finally:
+            db.close()
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    for table, rows in totals.items():
+        print(f"   {table}: {rows:,}")
+    print(f"✅ {sum(totals.values()):,} linhas em {elapsed:.1f}s")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,14 @@
 Script de Importação e Predição - HullZero
 
 Importa dados reais e gera predições de bioincrustação.
+
+Uso:
+    python scripts/import_and_predict.py
+    python scripts/import_and_predict.py --parallel --workers 8
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Adicionar src ao path
@@ -15,12 +20,28 @@ from src.database import SessionLocal, init_db
 from src.data.import_real_data import import_all_real_data
 from src.data.prediction_pipeline import PredictionPipeline
 from src.data.validation_pipeline import ValidationPipeline
+from src.data.parallel_import import default_workers
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Importa dados reais e gera predições")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Importar os CSVs AIS em paralelo (parsing em pool de processos)")
+    parser.add_argument("--workers", type=int, default=default_workers(),
+                        help="Processos de parsing no modo paralelo (padrão: número de CPUs)")
+    parser.add_argument("--writers", type=int, default=1,
+                        help="Conexões de escrita no modo paralelo (SQLite usa sempre 1)")
+    parser.add_argument("--full", action="store_true",
+                        help="Reler todos os arquivos, ignorando o registro de ingestão")
+    return parser.parse_args()
 
 
 def main():
     """
     Executa importação de dados reais e gera predições.
     """
+    args = parse_args()
+    
     print("="*80)
     print("🚀 HullZero - Importação e Predição de Dados Reais")
     print("="*80)
@@ -37,7 +58,13 @@ def main():
         print("FASE 1: Importação de Dados Reais")
         print("="*80)
         
-        import_results = import_all_real_data(db)
+        import_results = import_all_real_data(
+            db,
+            parallel=args.parallel,
+            workers=args.workers,
+            writers=args.writers,
+            incremental=not args.full
+        )
         
         print("\n" + "="*80)
         print("FASE 2: Geração de Predições de Bioincrustação")
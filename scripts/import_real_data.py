@@ -6,9 +6,11 @@ Importa dados reais da pasta dados/ para o banco de dados.
 
 Uso:
     python scripts/import_real_data.py
+    python scripts/import_real_data.py --parallel --workers 8 --writers 2
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Adicionar src ao path
@@ -16,10 +18,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import SessionLocal, init_db
 from src.data.import_real_data import import_all_real_data
+from src.data.parallel_import import default_workers
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Importa dados reais da pasta dados/")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Importar os CSVs AIS em paralelo (parsing em pool de processos)")
+    parser.add_argument("--workers", type=int, default=default_workers(),
+                        help="Processos de parsing no modo paralelo (padrão: número de CPUs)")
+    parser.add_argument("--writers", type=int, default=1,
+                        help="Conexões de escrita no modo paralelo (SQLite usa sempre 1)")
+    parser.add_argument("--full", action="store_true",
+                        help="Reler todos os arquivos, ignorando o registro de ingestão")
+    return parser.parse_args()
 
 
 def main():
     """Função principal"""
+    args = parse_args()
+    
     print("="*60)
     print("🚀 IMPORTADOR DE DADOS REAIS - HULLZERO")
     print("="*60)
@@ -34,7 +52,13 @@ def main():
     
     try:
         # Importar todos os dados
-        results = import_all_real_data(db)
+        results = import_all_real_data(
+            db,
+            parallel=args.parallel,
+            workers=args.workers,
+            writers=args.writers,
+            incremental=not args.full
+        )
         
         print("\n" + "="*60)
         print("✅ IMPORTAÇÃO CONCLUÍDA COM SUCESSO!")
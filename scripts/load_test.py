@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Teste de Carga HTTP - HullZero
+
+Dispara, contra uma instância uvicorn local, um mix de tráfego que
+reproduz o uso real da plataforma:
+
+- polling do dashboard (/api/dashboard/kpis, /trends, /fleet-status);
+- drill-down de embarcações (detalhe, última incrustação, histórico
+  operacional e de manutenção);
+- inclusão de dados operacionais (POST operational-data);
+- chamadas pesadas ocasionais (optimize-inspections, predict/advanced).
+
+Os mixes ficam em SCENARIOS. Dois modelos de carga:
+
+- fechado (--users): N usuários virtuais, cada um espera a resposta e um
+  tempo de reflexão (--think-time-ms, exponencial) antes da próxima;
+- aberto (--rate): chegadas de Poisson a R requisições/s, independentes
+  das respostas. A latência conta a partir do instante agendado, então a
+  fila do lado do cliente entra na medida (sem "coordinated omission").
+
+O relatório traz vazão, latência (p50/p90/p95/p99/máx), taxa de erro e o
+tempo de servidor (header Server-Timing, ver metrics_middleware) por rota.
+Os resultados vão para JSON, com commit e parâmetros, e são comparados
+com um baseline do mesmo cenário. Com a mesma --seed a sequência de
+requisições de cada usuário é a mesma entre execuções.
+
+Sem --base-url o script sobe a API em subprocesso, sobre DATABASE_URL
+(ou --database-url), por exemplo o banco gerado por
+generate_synthetic_fleet.py. As inclusões de dados operacionais vão para
+embarcações criadas pelo próprio teste (POST /api/vessels).
+
+Uso:
+    python scripts/generate_synthetic_fleet.py --vessels 200 --years 1
+    python scripts/load_test.py --save-baseline
+    python scripts/load_test.py --users 50 --duration 120
+    python scripts/load_test.py --rate 40 --scenario dashboard
+    python scripts/load_test.py --base-url http://127.0.0.1:8000 --vessel-prefix SYN_
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import platform
+import re
+import subprocess
+import tempfile
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_OUTPUT_DIR = ROOT / "benchmarks"
+
+ROUTE_REGIONS = ("South_Atlantic", "Brazil_Coast", "Tropical")
+PAINT_TYPES = ("Antifouling_Type_A", "Antifouling_Type_B", "Silicone_Based")
+VESSEL_TYPES = ("Tanker", "Gas_Carrier", "Container")
+SEASONS = ("summer", "autumn", "winter", "spring")
+
+_SERVER_TIMING = re.compile(r"(\w+);dur=([\d.]+)")
+
+
+# ==================== CORPOS DAS REQUISIÇÕES ====================
+
+def vessel_features(rng: random.Random, vessel_id: str) -> Dict:
+    return {
+        "vessel_id": vessel_id,
+        "time_since_cleaning_days": rng.randint(20, 400),
+        "water_temperature_c": round(rng.uniform(18.0, 30.0), 1),
+        "salinity_psu": round(rng.uniform(33.0, 36.5), 1),
+        "time_in_port_hours": round(rng.uniform(12.0, 240.0), 1),
+        "average_speed_knots": round(rng.uniform(9.0, 15.0), 1),
+        "route_region": rng.choice(ROUTE_REGIONS),
+        "paint_type": rng.choice(PAINT_TYPES),
+        "vessel_type": rng.choice(VESSEL_TYPES),
+        "hull_area_m2": round(rng.uniform(3000.0, 9000.0)),
+    }
+
+
+def advanced_features(rng: random.Random, vessel_id: str) -> Dict:
+    return {
+        **vessel_features(rng, vessel_id),
+        "last_cleaning_method": rng.choice(("hull_cleaning", "dry_dock", "robotic")),
+        "paint_age_days": rng.randint(60, 1500),
+        "seasonal_factor": rng.choice(SEASONS),
+    }
+
+
+def inspection_request(rng: random.Random, vessel_id: str) -> Dict:
+    return {"vessel_features": vessel_features(rng, vessel_id), "horizon_days": 365}
+
+
+def operational_record(rng: random.Random, vessel_id: str) -> Dict:
+    speed = rng.uniform(8.0, 15.0)
+    return {
+        "vessel_id": vessel_id,
+        "latitude": round(rng.uniform(-28.0, -2.0), 4),
+        "longitude": round(rng.uniform(-48.0, -34.0), 4),
+        "speed_knots": round(speed, 1),
+        "engine_power_kw": round(speed * rng.uniform(600.0, 800.0)),
+        "fuel_consumption_kg_h": round(speed * rng.uniform(80.0, 110.0), 1),
+        "water_temperature_c": round(rng.uniform(18.0, 30.0), 1),
+        "wind_speed_knots": round(rng.uniform(0.0, 30.0), 1),
+        "wave_height_m": round(rng.uniform(0.2, 4.0), 1),
+        "heading": round(rng.uniform(0.0, 360.0), 1),
+    }
+
+
+def load_test_vessel(index: int) -> Dict:
+    """Embarcação em memória que recebe as inclusões de dados operacionais"""
+    return {
+        "name": f"Teste de Carga {index}",
+        "imo_number": f"98{index:05d}",
+        "call_sign": f"PPLT{index}",
+        "vessel_type": "tanker",
+        "length_m": 250.0,
+        "width_m": 44.0,
+        "draft_m": 15.0,
+        "hull_area_m2": 8000.0,
+        "displacement_tonnes": 120000.0,
+        "hull_material": "steel",
+        "paint_type": "Antifouling_Type_A",
+        "max_speed_knots": 16.0,
+        "typical_speed_knots": 12.5,
+        "home_port": "Santos",
+        "engine_type": "diesel",
+        "engine_power_kw": 15000.0,
+        "fuel_type": "MGO",
+        "typical_consumption_kg_h": 1200.0,
+    }
+
+
+# ==================== CENÁRIOS ====================
+
+class Operation(NamedTuple):
+    route: str                  # chave das estatísticas (path com {vessel_id})
+    weight: float
+    method: str = "GET"
+    body: Optional[Callable[[random.Random, str], Dict]] = None
+    appends: bool = False       # usa as embarcações criadas pelo teste
+
+
+DASHBOARD_POLLING = [
+    Operation("/api/dashboard/kpis", 20),
+    Operation("/api/dashboard/trends?period=12_months", 10),
+    Operation("/api/dashboard/fleet-status", 15),
+]
+DRILL_DOWN = [
+    Operation("/api/vessels/{vessel_id}", 10),
+    Operation("/api/vessels/{vessel_id}/fouling/latest", 8),
+    Operation("/api/vessels/{vessel_id}/operational-data?limit=96", 6),
+    Operation("/api/vessels/{vessel_id}/operational-data/latest", 3),
+    Operation("/api/vessels/{vessel_id}/maintenance", 4),
+]
+APPENDS = [
+    Operation("/api/vessels/{vessel_id}/operational-data", 20, "POST", operational_record, appends=True),
+]
+HEAVY = [
+    Operation("/api/vessels/{vessel_id}/normam401/optimize-inspections", 2, "POST", inspection_request),
+    Operation("/api/vessels/{vessel_id}/fouling/predict/advanced", 2, "POST", advanced_features),
+]
+
+SCENARIOS: Dict[str, List[Operation]] = {
+    # ~45% polling, ~31% drill-down, ~20% inclusões, ~4% pesadas
+    "realistic": DASHBOARD_POLLING + DRILL_DOWN + APPENDS + HEAVY,
+    "dashboard": DASHBOARD_POLLING,
+    "drilldown": DRILL_DOWN + APPENDS,
+    # Pesadas em ~30% do tráfego: limite de CPU dos modelos
+    "heavy": DASHBOARD_POLLING + [op._replace(weight=op.weight * 5) for op in HEAVY],
+}
+
+
+# ==================== SERVIDOR ====================
+
+def start_server(port: int, workers: int, database_url: Optional[str], log_path: Path) -> subprocess.Popen:
+    """Sobe a API com uvicorn em subprocesso e aguarda o /health responder"""
+    import httpx
+
+    env = dict(os.environ)
+    if database_url:
+        env["DATABASE_URL"] = database_url
+        env.pop("ASYNC_DATABASE_URL", None)
+    log = open(log_path, "w")
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.api.main:app",
+            "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers),
+            "--log-level", "warning", "--no-access-log", "--timeout-keep-alive", "600",
+        ],
+        cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT
+    )
+    log.close()
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Servidor encerrou ao iniciar (log: {log_path})")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    process.kill()
+    raise RuntimeError(f"Servidor não respondeu em 120s (log: {log_path})")
+
+
+def fleet_vessel_ids(client, prefix: Optional[str], limit: int) -> List[str]:
+    """IDs das embarcações do banco, pela própria API"""
+    response = client.get("/api/vessels", params={"limit": min(limit, 1000)})
+    response.raise_for_status()
+    ids = [vessel["id"] for vessel in response.json()]
+    if prefix:
+        ids = [vessel_id for vessel_id in ids if vessel_id.startswith(prefix)]
+    return sorted(ids)[:limit]
+
+
+def create_append_vessels(client, count: int) -> List[str]:
+    ids = []
+    for index in range(count):
+        response = client.post("/api/vessels", json=load_test_vessel(index))
+        if response.status_code == 200:
+            ids.append(response.json()["id"])
+    return ids
+
+
+# ==================== CARGA ====================
+
+class LoadRecorder:
+    """Resultados por rota, só da janela medida (após o aquecimento)"""
+
+    def __init__(self, measure_from: float):
+        self.measure_from = measure_from
+        self.routes: Dict[str, Dict] = {}
+
+    def record(self, route: str, started: float, latency_ms: float, status: Optional[int], server_timing: str = ""):
+        if started < self.measure_from:
+            return
+        stats = self.routes.setdefault(route, {"latencies": [], "statuses": Counter(), "server": {}})
+        stats["latencies"].append(latency_ms)
+        stats["statuses"][str(status) if status is not None else "exception"] += 1
+        for name, duration in _SERVER_TIMING.findall(server_timing):
+            stats["server"].setdefault(name, []).append(float(duration))
+
+
+async def send(client, operation: Operation, rng: random.Random, vessel_id: str,
+               scheduled: float, recorder: LoadRecorder):
+    path = operation.route.format(vessel_id=vessel_id)
+    body = operation.body(rng, vessel_id) if operation.body else None
+    status, server_timing = None, ""
+    try:
+        response = await client.request(operation.method, path, json=body)
+        status, server_timing = response.status_code, response.headers.get("server-timing", "")
+    except Exception:
+        pass
+    recorder.record(operation.route, scheduled, (time.perf_counter() - scheduled) * 1000, status, server_timing)
+
+
+def choose(rng: random.Random, operations: List[Operation], weights: List[float],
+           vessel_ids: List[str], append_ids: List[str]):
+    operation = rng.choices(operations, weights)[0]
+    return operation, rng.choice(append_ids if operation.appends else vessel_ids)
+
+
+async def run_load(base_url: str, operations: List[Operation], vessel_ids: List[str],
+                   append_ids: List[str], args) -> LoadRecorder:
+    import httpx
+
+    weights = [operation.weight for operation in operations]
+    start = time.perf_counter()
+    deadline = start + args.warmup + args.duration
+    recorder = LoadRecorder(start + args.warmup)
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        if args.rate:
+            # Modelo aberto: chegadas de Poisson, sem esperar as respostas
+            rng = random.Random(args.seed)
+            tasks = set()
+            scheduled = start
+            while True:
+                scheduled += rng.expovariate(args.rate)
+                if scheduled >= deadline:
+                    break
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                operation, vessel_id = choose(rng, operations, weights, vessel_ids, append_ids)
+                task = asyncio.create_task(send(client, operation, rng, vessel_id, scheduled, recorder))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks, timeout=args.timeout)
+        else:
+            # Modelo fechado: usuários virtuais com tempo de reflexão
+            async def user(index: int):
+                rng = random.Random(args.seed * 100_003 + index)
+                # Partidas escalonadas, para não sincronizar os usuários
+                await asyncio.sleep(rng.uniform(0, args.think_time_ms / 1000))
+                while time.perf_counter() < deadline:
+                    operation, vessel_id = choose(rng, operations, weights, vessel_ids, append_ids)
+                    await send(client, operation, rng, vessel_id, time.perf_counter(), recorder)
+                    if args.think_time_ms:
+                        await asyncio.sleep(rng.expovariate(1000 / args.think_time_ms))
+
+            await asyncio.gather(*(user(index) for index in range(args.users)))
+    return recorder
+
+
+# ==================== RELATÓRIO ====================
+
+def percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def summarize(latencies: List[float], statuses: Counter, duration: float, server: Dict = None) -> Dict:
+    ordered = sorted(latencies)
+    count = len(ordered)
+    errors = sum(n for status, n in statuses.items() if status == "exception" or int(status) >= 400)
+    summary = {
+        "requests": count,
+        "throughput_rps": round(count / duration, 2),
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "statuses": dict(sorted(statuses.items())),
+        "p50_ms": round(percentile(ordered, 0.50), 2),
+        "p90_ms": round(percentile(ordered, 0.90), 2),
+        "p95_ms": round(percentile(ordered, 0.95), 2),
+        "p99_ms": round(percentile(ordered, 0.99), 2),
+        "max_ms": round(ordered[-1], 2),
+        "mean_ms": round(sum(ordered) / count, 2),
+    }
+    if server:
+        # Mediana do tempo de servidor (app, db, inference) vs. latência no cliente
+        summary["server_p50_ms"] = {
+            name: round(percentile(sorted(values), 0.50), 2) for name, values in sorted(server.items())
+        }
+    return summary
+
+
+def build_report(recorder: LoadRecorder, duration: float) -> Dict:
+    routes = {
+        route: summarize(stats["latencies"], stats["statuses"], duration, stats["server"])
+        for route, stats in sorted(recorder.routes.items())
+    }
+    all_latencies = [value for stats in recorder.routes.values() for value in stats["latencies"]]
+    all_statuses = sum((stats["statuses"] for stats in recorder.routes.values()), Counter())
+    overall = summarize(all_latencies, all_statuses, duration) if all_latencies else {}
+    return {"overall": overall, "routes": routes}
+
+
+def print_report(report: Dict):
+    print(f"\n{'rota':<58} {'req/s':>7} {'erros':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'servidor':>9}")
+    rows = list(report["routes"].items()) + [("TOTAL", report["overall"])]
+    for route, stats in rows:
+        server = stats.get("server_p50_ms", {}).get("app")
+        print(
+            f"{route:<58} {stats['throughput_rps']:>7.1f} {stats['error_rate']:>6.1%} "
+            f"{stats['p50_ms']:>6.0f}ms {stats['p95_ms']:>6.0f}ms {stats['p99_ms']:>6.0f}ms "
+            f"{f'{server:.0f}ms' if server is not None else '-':>9}"
+        )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float, min_delta_ms: float, min_samples: int) -> List[str]:
+    """
+    Compara p95, taxa de erro e vazão com o baseline; retorna as rotas que
+    regrediram (p95 pior que tolerance e min_delta_ms, ou mais erros).
+    Rotas com menos de min_samples requisições não são avaliadas: o p95
+    delas é praticamente o máximo.
+    """
+    if baseline.get("parameters") != results["parameters"]:
+        print(f"⚠️  Baseline gerado com outros parâmetros: {baseline.get('parameters')}")
+        print(f"   (commit {baseline.get('git_commit')}): a comparação pode não ser válida")
+
+    regressions = []
+    rows = list(results["routes"].items()) + [("TOTAL", results["overall"])]
+    reference_rows = {**baseline.get("routes", {}), "TOTAL": baseline.get("overall", {})}
+    print(f"\n{'rota':<58} {'p95 base':>9} {'p95 atual':>9} {'variação':>9} {'req/s':>13}")
+    for route, current in rows:
+        reference = reference_rows.get(route)
+        if not reference:
+            print(f"{route:<58} {'-':>9} {current['p95_ms']:>7.0f}ms {'novo':>9}")
+            continue
+        before, after = reference["p95_ms"], current["p95_ms"]
+        change = (after - before) / before if before else 0.0
+        status = ""
+        if min(current["requests"], reference["requests"]) < min_samples:
+            status = "poucas amostras"
+        elif change > tolerance and after - before > min_delta_ms:
+            status = "⚠️  REGRESSÃO"
+        elif current["error_rate"] > reference["error_rate"] + 0.01:
+            status = "⚠️  MAIS ERROS"
+        elif change < -tolerance and before - after > min_delta_ms:
+            status = "🚀 melhora"
+        if status.startswith("⚠️"):
+            regressions.append(route)
+        throughput = f"{reference['throughput_rps']:.1f}→{current['throughput_rps']:.1f}"
+        print(f"{route:<58} {before:>7.0f}ms {after:>7.0f}ms {change:>+8.0%} {throughput:>13}  {status}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga HTTP com mix de tráfego realista")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="realistic")
+    parser.add_argument("--users", type=int, default=20,
+                        help="Usuários virtuais (modelo fechado) ou conexões máximas (com --rate)")
+    parser.add_argument("--rate", type=float, help="Chegadas por segundo (modelo aberto)")
+    parser.add_argument("--think-time-ms", type=float, default=500, help="Tempo médio entre requisições de um usuário")
+    parser.add_argument("--duration", type=float, default=60, help="Segundos medidos")
+    parser.add_argument("--warmup", type=float, default=10, help="Segundos iniciais descartados")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=60, help="Timeout por requisição (s)")
+    parser.add_argument("--base-url", help="API já em execução (padrão: sobe uma local)")
+    parser.add_argument("--database-url", help="Banco da API local (padrão: DATABASE_URL)")
+    parser.add_argument("--port", type=int, default=8790, help="Porta da API local")
+    parser.add_argument("--workers", type=int, default=1, help="Workers uvicorn da API local")
+    parser.add_argument("--vessel-prefix", help="Usar só embarcações com este prefixo de ID (ex.: SYN_)")
+    parser.add_argument("--max-vessels", type=int, default=500, help="Embarcações sorteadas no drill-down")
+    parser.add_argument("--append-vessels", type=int, default=5,
+                        help="Embarcações criadas para receber dados operacionais")
+    parser.add_argument("--output", type=Path, help="JSON de resultados (padrão: benchmarks/load_<cenário>_latest.json)")
+    parser.add_argument("--baseline", type=Path, help="Baseline (padrão: benchmarks/load_<cenário>_baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Gravar os resultados como novo baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Piora relativa do p95 tolerada (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0,
+                        help="Piora absoluta mínima do p95 para contar como regressão")
+    parser.add_argument("--min-samples", type=int, default=100,
+                        help="Requisições mínimas de uma rota para avaliar regressão")
+    args = parser.parse_args()
+
+    import httpx
+
+    output = args.output or DEFAULT_OUTPUT_DIR / f"load_{args.scenario}_latest.json"
+    baseline_path = args.baseline or DEFAULT_OUTPUT_DIR / f"load_{args.scenario}_baseline.json"
+
+    print("=" * 60)
+    print("🔥 TESTE DE CARGA HULLZERO")
+    print("=" * 60)
+
+    server = None
+    log_path = Path(tempfile.gettempdir()) / f"hullzero_load_{args.port}.log"
+    base_url = args.base_url
+    if not base_url:
+        print(f"🚀 Subindo API local (porta {args.port}, {args.workers} worker(s))...")
+        try:
+            server = start_server(args.port, args.workers, args.database_url, log_path)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        with httpx.Client(base_url=base_url, timeout=args.timeout) as client:
+            vessel_ids = fleet_vessel_ids(client, args.vessel_prefix, args.max_vessels)
+            operations = SCENARIOS[args.scenario]
+            append_ids = []
+            if any(operation.appends for operation in operations):
+                append_ids = create_append_vessels(client, args.append_vessels)
+                if not append_ids:
+                    print("⚠️  Não foi possível criar embarcações de teste: inclusões desativadas")
+                    operations = [operation for operation in operations if not operation.appends]
+        if not vessel_ids:
+            print("❌ Nenhuma embarcação na API (gere com scripts/generate_synthetic_fleet.py)")
+            sys.exit(1)
+
+        mode = f"aberto, {args.rate:g} req/s" if args.rate else f"fechado, {args.users} usuários"
+        print(f"   Cenário: {args.scenario} ({mode})")
+        print(f"   Embarcações: {len(vessel_ids)} no drill-down, {len(append_ids)} recebendo inclusões")
+        print(f"   Duração: {args.warmup:g}s de aquecimento + {args.duration:g}s medidos")
+
+        recorder = asyncio.run(run_load(base_url, operations, vessel_ids, append_ids, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report = build_report(recorder, args.duration)
+    if not report["overall"]:
+        print("❌ Nenhuma requisição concluída na janela medida")
+        sys.exit(1)
+    print_report(report)
+
+    results = {
+        "created_at": datetime.now().isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "scenario": args.scenario,
+            "model": "open" if args.rate else "closed",
+            "users": args.users,
+            "rate": args.rate,
+            "think_time_ms": None if args.rate else args.think_time_ms,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "seed": args.seed,
+            "workers": None if args.base_url else args.workers,
+            "vessels": len(vessel_ids),
+            "append_vessels": len(append_ids),
+        },
+        **report,
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\n💾 Resultados: {output}")
+    if server is not None and report["overall"]["errors"]:
+        print(f"ℹ️  Log da API local: {log_path}")
+
+    regressions = []
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"💾 Baseline atualizado: {baseline_path}")
+    elif baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms, args.min_samples)
+    else:
+        print(f"ℹ️  Sem baseline em {baseline_path} (gere com --save-baseline)")
+
+    print("=" * 60)
+    if regressions:
+        print(f"❌ {len(regressions)} regressão(ões): {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ Nenhuma regressão")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Reconstrução do Estado da Frota - HullZero
+
+Recalcula a tabela fleet_state (uma linha por embarcação) a partir dos
+dados de bioincrustação e manutenção. Executar após a migração 005 e
+agendar diariamente: o risco FR em 15/30 dias depende da data atual.
+
+Uso:
+    python scripts/rebuild_fleet_state.py
+    python scripts/rebuild_fleet_state.py --vessel TP_SUEZMAX_MILTON_SANTOS
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import SessionLocal
+from src.services.fleet_state_service import rebuild_fleet_state, refresh_fleet_state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconstrói a tabela fleet_state")
+    parser.add_argument("--vessel", action="append", dest="vessels",
+                        help="Recalcular apenas esta embarcação (pode repetir)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🚢 RECONSTRUÇÃO DO ESTADO DA FROTA")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        if args.vessels:
+            count = refresh_fleet_state(db, args.vessels)
+        else:
+            count = rebuild_fleet_state(db)
+        elapsed = time.perf_counter() - start
+        print(f"✅ {count} embarcações atualizadas em {elapsed:.2f}s")
+    except Exception as e:
+        print(f"❌ Erro ao reconstruir fleet_state: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Script de Treinamento de Modelos - HullZero
+
+Treina os modelos de bioincrustação (híbrido e avançado) a partir do
+histórico de predições/medições em fouling_data e publica novas versões
+no registro de modelos (ML_MODEL_PATH). Os processos da API detectam a
+nova versão e trocam o modelo sem reinício.
+
+Uso:
+    python scripts/train_models.py
+    python scripts/train_models.py --model fouling_hybrid --version 2025.01
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import SessionLocal
+from src.database.models import FoulingData
+from src.models.model_registry import get_model_registry
+from src.models.fouling_prediction import FOULING_MODEL_NAME, HISTORY_ROW_DEFAULTS, train_fouling_model
+from src.models.advanced_fouling_prediction import ADVANCED_MODEL_NAME, train_advanced_model
+
+
+# Mínimo de amostras para treinar (mesmo critério usado anteriormente na API)
+MIN_TRAINING_SAMPLES = 50
+
+# Mapeamento das chaves de FoulingData.features para as colunas de treinamento
+FEATURE_COLUMNS = {
+    "vessel_id": "vessel_id",
+    "time_since_cleaning_days": "days_since_cleaning",
+    "water_temperature_c": "temperature",
+    "salinity_psu": "salinity",
+    "time_in_port_hours": "time_in_port",
+    "average_speed_knots": "speed",
+    "route_region": "route",
+    "paint_type": "paint",
+    "vessel_type": "vessel_type",
+    "hull_area_m2": "hull_area",
+}
+
+TRAINERS = {
+    FOULING_MODEL_NAME: train_fouling_model,
+    ADVANCED_MODEL_NAME: train_advanced_model,
+}
+
+
+def load_training_data(db) -> pd.DataFrame:
+    """
+    Monta o DataFrame de treinamento a partir de fouling_data.
+    
+    Chaves ausentes ou nulas em features viram NaN no DataFrame (e NaN
+    passa por row.get nos treinadores); são preenchidas com
+    HISTORY_ROW_DEFAULTS antes de montar as features.
+    """
+    rows = []
+    query = (
+        db.query(FoulingData.features, FoulingData.estimated_thickness_mm)
+        .filter(FoulingData.features.isnot(None))
+        .filter(FoulingData.estimated_thickness_mm.isnot(None))
+    )
+    for features, thickness in query:
+        row = {
+            column: features[key]
+            for key, column in FEATURE_COLUMNS.items()
+            if features.get(key) is not None
+        }
+        row["fouling_thickness"] = thickness
+        rows.append(row)
+    frame = pd.DataFrame(rows, columns=[*FEATURE_COLUMNS.values(), "fouling_thickness"])
+    return frame.fillna(HISTORY_ROW_DEFAULTS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Treina e publica modelos de bioincrustação")
+    parser.add_argument("--model", choices=list(TRAINERS), action="append",
+                        help="Modelo a treinar (padrão: todos)")
+    parser.add_argument("--version", help="Versão a publicar (padrão: timestamp UTC)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        historical_data = load_training_data(db)
+    finally:
+        db.close()
+
+    print(f"📊 Amostras de treinamento: {len(historical_data)}")
+    if len(historical_data) <= MIN_TRAINING_SAMPLES:
+        print(f"❌ São necessárias mais de {MIN_TRAINING_SAMPLES} amostras para treinar")
+        return 1
+
+    registry = get_model_registry()
+    for name in args.model or list(TRAINERS):
+        print(f"\n🔧 Treinando {name}...")
+        model = TRAINERS[name](historical_data)
+        entry = registry.publish(name, model, version=args.version)
+        print(f"✅ {name} v{entry.version} publicado em {entry.artifact_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
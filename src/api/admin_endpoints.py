@@ -0,0 +1,60 @@
+"""
+Endpoints de Administração - HullZero
+
+Ferramentas de diagnóstico de desempenho, restritas a usuários com a
+permissão manage_system: perfis de requisições e consultas lentas.
+"""
+
+from typing import Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from ..auth import PermissionEnum, require_permission
+from ..config import PROFILE_DIR, SLOW_QUERY_LOG_ENABLED, SLOW_QUERY_THRESHOLD_MS
+from ..database import slow_query_log
+from .profiler import list_profiles, profile_file
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_permission(PermissionEnum.MANAGE_SYSTEM))]
+)
+
+
+@router.get("/profiles", response_model=List[Dict])
+async def get_profiles(limit: int = Query(100, ge=1, le=1000)):
+    """Perfis de requisições gravados (mais recentes primeiro)"""
+    return list_profiles(PROFILE_DIR, limit)
+
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str):
+    """Pilhas no formato collapsed (speedscope / flamegraph.pl)"""
+    path = profile_file(PROFILE_DIR, profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Perfil não encontrado")
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=path.name)
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = Query(20, ge=1, le=200),
+    order_by: str = Query("total_ms", pattern="^(total_ms|max_ms|count)$")
+):
+    """
+    Consultas acima do limite configurado, agrupadas pelo texto SQL.
+    Cada uma traz rotas, parâmetros e plano de execução da execução mais lenta.
+    """
+    return {
+        "enabled": SLOW_QUERY_LOG_ENABLED,
+        "threshold_ms": SLOW_QUERY_THRESHOLD_MS,
+        "statements": slow_query_log.top(limit, order_by)
+    }
+
+
+@router.delete("/slow-queries")
+async def reset_slow_queries():
+    """Limpa o log (ex.: após criar um índice)"""
+    slow_query_log.reset()
+    return {"message": "Log de consultas lentas limpo"}
@@ -24,20 +24,7 @@ from ..models.data_loader import (
     get_operational_history,
     calculate_average_operational_metrics
 )
-from ..models.fouling_prediction import (
-    predict_fouling,
-    VesselFeatures,
-    HybridFoulingModel
-)
-from ..models.advanced_fouling_prediction import (
-    predict_advanced_fouling,
-    AdvancedVesselFeatures,
-    AdvancedHybridModel
-)
-from ..models.fuel_impact import (
-    calculate_fuel_impact,
-    ConsumptionFeatures
-)
+# Modelos de ML são importados nos endpoints de predição (ver main.py)
 
 
 # Router para endpoints com banco de dados
@@ -181,6 +168,8 @@ async def get_latest_fouling_db(
     
     # Se não houver predição, gerar uma nova baseada em dados reais
     if not latest:
+        from ..models.fouling_prediction import predict_fouling, VesselFeatures
+        
         # Carregar features reais do banco
         features_dict = get_vessel_features_from_db(db, vessel_id)
         
@@ -239,6 +228,9 @@ async def predict_fouling_db(
             detail="Não foi possível carregar features da embarcação"
         )
     
+    from ..models.fouling_prediction import predict_fouling, VesselFeatures
+    from ..models.advanced_fouling_prediction import predict_advanced_fouling, AdvancedVesselFeatures
+    
     try:
         if use_advanced:
             # Usar modelo avançado
@@ -0,0 +1,304 @@
+"""
+Endpoints de Exportação - HullZero
+
+Exportação do histórico completo (dados operacionais, bioincrustação e
+manutenção) de uma embarcação ou da frota inteira, em NDJSON, CSV ou
+Parquet, sem passar pelos modelos Pydantic nem pela paginação.
+
+As linhas são lidas com cursor no servidor (yield_per) e enviadas em
+blocos de EXPORT_BATCH_SIZE via StreamingResponse: a memória usada é a de
+um bloco, independente do número de linhas exportadas. A serialização de
+cada bloco roda no threadpool para não bloquear o event loop.
+
+Uso:
+    curl -o operacional.csv \\
+        "http://localhost:8000/api/export/operational-data?vessel_id=TP_SUEZMAX_MILTON_SANTOS&format=csv"
+
+    import pandas as pd
+    df = pd.read_json("http://localhost:8000/api/export/fouling", lines=True)
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, JSON, select
+from starlette.concurrency import run_in_threadpool
+
+from ..config import EXPORT_BATCH_SIZE
+from ..database import async_engine
+from ..database.models import Vessel, OperationalData, FoulingData, MaintenanceEvent
+
+# Parquet (opcional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+router = APIRouter(prefix="/api/export", tags=["Export"])
+
+EXPORT_FORMATS = "^(ndjson|csv|parquet)$"
+
+
+# ========== FORMATOS ==========
+
+def _plain_value(value: Any) -> Any:
+    """Valor serializável em texto (datas em ISO 8601)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class NdjsonEncoder:
+    """Um objeto JSON por linha"""
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def __init__(self, columns):
+        self.names = [column.name for column in columns]
+        self.json_encoder = json.JSONEncoder(default=_plain_value, ensure_ascii=False)
+
+    def start(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence) -> bytes:
+        names = self.names
+        encode = self.json_encoder.encode
+        return "".join(
+            encode(dict(zip(names, row))) + "\n" for row in rows
+        ).encode("utf-8")
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class CsvEncoder:
+    """CSV com cabeçalho; colunas JSON são gravadas como texto JSON"""
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self, columns):
+        self.names = [column.name for column in columns]
+        # Apenas estas colunas precisam de conversão; as demais vão como estão
+        self.date_positions = [
+            position for position, column in enumerate(columns)
+            if isinstance(column.type, (DateTime, Date))
+        ]
+        self.json_positions = [
+            position for position, column in enumerate(columns)
+            if isinstance(column.type, JSON)
+        ]
+
+    def _write(self, rows) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    def start(self) -> bytes:
+        return self._write([self.names])
+
+    def encode(self, rows: Sequence) -> bytes:
+        if not self.date_positions and not self.json_positions:
+            return self._write(rows)
+        converted = []
+        for row in rows:
+            values = list(row)
+            for position in self.date_positions:
+                if values[position] is not None:
+                    values[position] = values[position].isoformat()
+            for position in self.json_positions:
+                if values[position] is not None:
+                    values[position] = json.dumps(values[position], ensure_ascii=False)
+            converted.append(values)
+        return self._write(converted)
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ChunkSink(io.RawIOBase):
+    """Arquivo de saída do ParquetWriter; os bytes são retirados a cada bloco"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetEncoder:
+    """Parquet com um row group por bloco (requer pyarrow)"""
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self, columns):
+        self.names = [column.name for column in columns]
+        self.json_positions = [
+            position for position, column in enumerate(columns)
+            if isinstance(column.type, JSON)
+        ]
+        self.schema = pa.schema([
+            (column.name, self._arrow_type(column.type)) for column in columns
+        ])
+        self.sink = _ChunkSink()
+        self.writer = None
+
+    @staticmethod
+    def _arrow_type(column_type):
+        if isinstance(column_type, Boolean):
+            return pa.bool_()
+        if isinstance(column_type, Integer):
+            return pa.int64()
+        if isinstance(column_type, Float):
+            return pa.float64()
+        if isinstance(column_type, DateTime):
+            return pa.timestamp("us")
+        if isinstance(column_type, Date):
+            return pa.date32()
+        return pa.string()
+
+    def start(self) -> bytes:
+        self.writer = pq.ParquetWriter(self.sink, self.schema)
+        return self.sink.drain()
+
+    def encode(self, rows: Sequence) -> bytes:
+        columns = [list(values) for values in zip(*rows)]
+        for position in self.json_positions:
+            columns[position] = [
+                json.dumps(value, ensure_ascii=False) if value is not None else None
+                for value in columns[position]
+            ]
+        self.writer.write_batch(pa.record_batch(columns, schema=self.schema))
+        return self.sink.drain()
+
+    def finish(self) -> bytes:
+        self.writer.close()
+        return self.sink.drain()
+
+
+ENCODERS = {
+    "ndjson": NdjsonEncoder,
+    "csv": CsvEncoder,
+    "parquet": ParquetEncoder,
+}
+
+
+# ========== STREAMING ==========
+
+async def _stream_rows(statement, encoder) -> AsyncIterator[bytes]:
+    """Lê o resultado em blocos (cursor no servidor) e serializa cada bloco"""
+    async with async_engine.connect() as conn:
+        result = await conn.stream(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        yield await run_in_threadpool(encoder.start)
+        async for rows in result.partitions():
+            yield await run_in_threadpool(encoder.encode, rows)
+        yield await run_in_threadpool(encoder.finish)
+
+
+async def _export(
+    model,
+    time_column,
+    name: str,
+    vessel_id: Optional[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    export_format: str,
+    extra_filters: Sequence = ()
+) -> StreamingResponse:
+    if async_engine is None:
+        raise HTTPException(status_code=503, detail="Driver assíncrono do banco não disponível")
+    if export_format == "parquet" and not PARQUET_AVAILABLE:
+        raise HTTPException(
+            status_code=400,
+            detail="Exportação em Parquet requer pyarrow (pip install pyarrow). Use format=ndjson ou csv."
+        )
+
+    columns = list(model.__table__.columns)
+    statement = select(*columns)
+    if vessel_id:
+        async with async_engine.connect() as conn:
+            if await conn.scalar(select(Vessel.id).where(Vessel.id == vessel_id)) is None:
+                raise HTTPException(status_code=404, detail="Embarcação não encontrada")
+        statement = statement.where(model.vessel_id == vessel_id)
+    if start_date:
+        statement = statement.where(time_column >= start_date)
+    if end_date:
+        statement = statement.where(time_column <= end_date)
+    for condition in extra_filters:
+        statement = statement.where(condition)
+    # Mesma ordem do índice (vessel_id, tempo): sem ordenação em memória no banco
+    statement = statement.order_by(model.vessel_id, time_column)
+
+    encoder = ENCODERS[export_format](columns)
+    filename = f"{name}_{vessel_id or 'frota'}.{encoder.extension}"
+    return StreamingResponse(
+        _stream_rows(statement, encoder),
+        media_type=encoder.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+# ========== ENDPOINTS ==========
+
+@router.get("/operational-data")
+async def export_operational_data(
+    vessel_id: Optional[str] = Query(None, description="Embarcação (padrão: frota inteira)"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    export_format: str = Query("ndjson", alias="format", pattern=EXPORT_FORMATS)
+):
+    """Exporta o histórico de dados operacionais (NDJSON, CSV ou Parquet)"""
+    return await _export(
+        OperationalData, OperationalData.timestamp, "operational-data",
+        vessel_id, start_date, end_date, export_format
+    )
+
+
+@router.get("/fouling")
+async def export_fouling_data(
+    vessel_id: Optional[str] = Query(None, description="Embarcação (padrão: frota inteira)"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    export_format: str = Query("ndjson", alias="format", pattern=EXPORT_FORMATS)
+):
+    """Exporta o histórico de bioincrustação (NDJSON, CSV ou Parquet)"""
+    return await _export(
+        FoulingData, FoulingData.timestamp, "fouling",
+        vessel_id, start_date, end_date, export_format
+    )
+
+
+@router.get("/maintenance")
+async def export_maintenance_events(
+    vessel_id: Optional[str] = Query(None, description="Embarcação (padrão: frota inteira)"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    event_type: Optional[str] = Query(None, description="cleaning, inspection, repair, paint_application"),
+    export_format: str = Query("ndjson", alias="format", pattern=EXPORT_FORMATS)
+):
+    """Exporta o histórico de manutenção (NDJSON, CSV ou Parquet)"""
+    extra_filters = [MaintenanceEvent.event_type == event_type] if event_type else []
+    return await _export(
+        MaintenanceEvent, MaintenanceEvent.start_date, "maintenance",
+        vessel_id, start_date, end_date, export_format, extra_filters
+    )
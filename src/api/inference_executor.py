@@ -0,0 +1,296 @@
+"""
+Executor de Inferência - HullZero
+
+Tira do event loop o trabalho de CPU dos endpoints de predição (NumPy,
+XGBoost, SHAP, otimização de inspeções). Há dois tipos de executor:
+
+- thread: para chamadas que liberam o GIL (XGBoost/NumPy). Usado pelo
+  executor "ml".
+- process: processos com os modelos pré-carregados, para caminhos em
+  Python puro como o InspectionOptimizer. Usado pelo executor
+  "optimizer"; configurável via INFERENCE_OPTIMIZER_EXECUTOR.
+
+Cada executor aceita no máximo `workers + max_queue` tarefas. Acima disso
+a chamada é recusada na hora com 429, para que a fila não cresça sem
+limite. Tarefas que passam do tempo limite retornam 504. Uma tarefa que
+ainda não começou é descartada; uma que já está rodando continua
+ocupando a vaga até terminar.
+"""
+
+import asyncio
+import functools
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+from ..services.metrics_service import record_inference
+from ..config import (
+    INFERENCE_THREAD_WORKERS,
+    INFERENCE_PROCESS_WORKERS,
+    INFERENCE_MAX_QUEUE,
+    INFERENCE_TIMEOUT_SECONDS,
+    INFERENCE_OPTIMIZER_EXECUTOR
+)
+
+
+ML_EXECUTOR = "ml"
+OPTIMIZER_EXECUTOR = "optimizer"
+
+
+class InferenceSaturated(Exception):
+    """Executor com todas as vagas (workers + fila) ocupadas"""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"Executor de inferência '{name}' saturado")
+        self.retry_after = retry_after
+
+
+class InferenceTimeout(Exception):
+    """Tarefa de inferência excedeu o tempo limite"""
+
+
+_models_ready = threading.Event()
+
+
+def preload_models():
+    """
+    Importa os módulos de ML usados pelos endpoints e carrega os modelos
+    registrados. A API não os importa na subida (ver main.py); isto roda em
+    segundo plano após o startup e no início de cada processo do otimizador.
+
+    Returns:
+        Entradas do registro de modelos carregadas
+    """
+    from ..models import (  # noqa: F401 (importar registra os modelos)
+        fouling_prediction,
+        advanced_fouling_prediction,
+        fuel_impact,
+        normam401_risk,
+        inspection_optimizer,
+        anomaly_detector,
+        explainability
+    )
+    from ..services import recommendation_service  # noqa: F401
+    from ..models.model_registry import get_model_registry
+    entries = get_model_registry().load_all()
+    _models_ready.set()
+    return entries
+
+
+def _preload_models():
+    """Initializer dos processos: carrega os modelos uma vez por processo"""
+    preload_models()
+
+
+def _warm_up_models():
+    started_at = time.perf_counter()
+    try:
+        for entry in preload_models():
+            print(f"✅ Modelo {entry.name} carregado (versão {entry.version})")
+        print(f"✅ Modelos de ML prontos em {time.perf_counter() - started_at:.1f}s")
+    except Exception as e:
+        print(f"⚠️  Erro ao carregar modelos de ML: {e}. Serão carregados na primeira predição.")
+
+
+def start_model_warm_up() -> threading.Thread:
+    """Carrega os modelos em uma thread daemon, sem atrasar o startup"""
+    thread = threading.Thread(target=_warm_up_models, name="hullzero-model-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def models_ready() -> bool:
+    """Indica se o aquecimento dos modelos terminou neste processo"""
+    return _models_ready.is_set()
+
+
+def _noop():
+    return None
+
+
+class InferenceExecutor:
+    """
+    Pool limitado para inferência chamado a partir de handlers async.
+
+    Uso:
+        executor = InferenceExecutor("ml", "thread", workers=4, max_queue=32, timeout_seconds=30)
+        result = await executor.run(predict_fouling, features)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        workers: int,
+        max_queue: int,
+        timeout_seconds: float
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Tipo de executor inválido: {kind}")
+        self.name = name
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout_seconds = timeout_seconds
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._avg_seconds = 0.0  # duração média (EWMA) das tarefas
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix=f"inference-{self.name}"
+                )
+            else:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_preload_models
+                )
+        return self._pool
+
+    def _submit(self, call: Callable[[], Any]):
+        try:
+            return self._get_pool().submit(call)
+        except BrokenExecutor:
+            # Processo do pool morreu: recriar o pool e tentar uma vez mais
+            self._pool = None
+            return self._get_pool().submit(call)
+
+    def _task_done(self, started_at: float, _future):
+        elapsed = time.perf_counter() - started_at
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+            self._avg_seconds = elapsed if self._avg_seconds == 0 else 0.8 * self._avg_seconds + 0.2 * elapsed
+
+    def _retry_after(self) -> int:
+        """Segundos sugeridos (Retry-After) até liberar uma vaga"""
+        return max(1, math.ceil(self._avg_seconds * self.capacity / self.workers))
+
+    async def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Executa fn(*args, **kwargs) no pool e aguarda o resultado.
+
+        Raises:
+            InferenceSaturated: todas as vagas ocupadas
+            InferenceTimeout: tempo limite excedido
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise InferenceSaturated(self.name, self._retry_after())
+            self._in_flight += 1
+
+        try:
+            future = self._submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(functools.partial(self._task_done, time.perf_counter()))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout_seconds)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise InferenceTimeout(
+                f"Inferência excedeu {timeout or self.timeout_seconds:.0f}s no executor '{self.name}'"
+            )
+
+    def warm_up(self):
+        """Inicia os workers (e, em processos, o carregamento dos modelos) sem aguardar"""
+        for _ in range(self.workers):
+            self._submit(_noop)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+                "avg_task_ms": round(self._avg_seconds * 1000, 1),
+            }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_executors: Dict[str, InferenceExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _build_executor(name: str) -> InferenceExecutor:
+    if name == OPTIMIZER_EXECUTOR and INFERENCE_OPTIMIZER_EXECUTOR == "process":
+        kind, workers = "process", INFERENCE_PROCESS_WORKERS or os.cpu_count() or 1
+    else:
+        kind, workers = "thread", INFERENCE_THREAD_WORKERS
+    return InferenceExecutor(name, kind, workers, INFERENCE_MAX_QUEUE, INFERENCE_TIMEOUT_SECONDS)
+
+
+def get_inference_executor(name: str = ML_EXECUTOR) -> InferenceExecutor:
+    """Executor compartilhado pelo processo (criado na primeira chamada)"""
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = _executors[name] = _build_executor(name)
+    return executor
+
+
+def inference_status() -> Dict[str, Any]:
+    """Estado dos executores já criados e dos modelos (para o /health)"""
+    status: Dict[str, Any] = {name: executor.status() for name, executor in list(_executors.items())}
+    status["models_ready"] = models_ready()
+    return status
+
+
+def shutdown_inference_executors():
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown()
+        _executors.clear()
+
+
+async def run_inference(executor_name: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Executa a inferência no executor indicado, convertendo saturação em
+    HTTP 429 (com Retry-After) e tempo limite em HTTP 504.
+    """
+    started_at = time.perf_counter()
+    try:
+        result = await get_inference_executor(executor_name).run(fn, *args, **kwargs)
+        record_inference(getattr(fn, "__name__", repr(fn)), executor_name, time.perf_counter() - started_at)
+        return result
+    except InferenceSaturated as e:
+        raise HTTPException(
+            status_code=429,
+            detail=f"{e}. Tente novamente em instantes.",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except InferenceTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
@@ -4,8 +4,9 @@ API Principal - HullZero
 API REST para acesso aos serviços do sistema HullZero.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from ..config import (
     CORS_ORIGINS,
     CORS_CREDENTIALS,
@@ -13,7 +14,16 @@ from ..config import (
     CORS_HEADERS,
     API_HOST,
     API_PORT,
-    API_RELOAD
+    API_RELOAD,
+    ML_WARMUP_ON_STARTUP,
+    METRICS_ENABLED,
+    PROFILING_ENABLED,
+    PROFILE_SAMPLE_RATE,
+    PROFILE_INTERVAL_MS,
+    PROFILE_DIR,
+    PROFILE_MAX_FILES,
+    MEMORY_STORE_MAX_ROWS_PER_VESSEL,
+    MEMORY_STORE_RETENTION_DAYS
 )
 from pydantic import BaseModel
 from typing import List, Optional, Dict
@@ -29,14 +39,32 @@ except ImportError as e:
     DB_AVAILABLE = False
     print(f"⚠️  Banco de dados não disponível: {e}. Usando armazenamento em memória.")
 
-from ..models.fouling_prediction import predict_fouling, VesselFeatures, FoulingPrediction
-from ..models.fuel_impact import calculate_fuel_impact, ConsumptionFeatures, FuelImpactResult
-from ..models.normam401_risk import predict_normam401_risk, NORMAM401RiskPrediction
-from ..models.inspection_optimizer import optimize_inspections, InspectionSchedule
-from ..models.anomaly_detector import detect_compliance_anomalies, ComplianceDataPoint, Anomaly
+from .response_cache import (
+    cached_response,
+    invalidate_response_cache,
+    response_cache_status
+)
+from .metrics_middleware import MetricsMiddleware
+from ..services.metrics_service import render_metrics
+from ..services.memory_store import (
+    TimeSeriesStore,
+    MemoryOperationalDataRepository,
+    MemoryMaintenanceEventRepository
+)
+from .inference_executor import (
+    ML_EXECUTOR,
+    OPTIMIZER_EXECUTOR,
+    get_inference_executor,
+    inference_status,
+    run_inference,
+    shutdown_inference_executors,
+    start_model_warm_up
+)
+# Modelos de ML (scikit-learn, XGBoost, SciPy, pandas, SHAP, Prophet) são
+# importados dentro dos endpoints de predição ou pelo aquecimento em segundo
+# plano no startup; importá-los aqui atrasaria a subida de cada worker em
+# segundos. tests/test_import_time.py verifica o orçamento de importação.
 from ..models.corrective_actions import recommend_corrective_actions, CorrectiveAction
-from ..models.explainability import ModelExplainer, PredictionExplanation
-from ..services.recommendation_service import get_cleaning_recommendation, Recommendation
 from ..services.compliance_service import check_normam401_compliance, ComplianceCheck, NORMAM401ComplianceService
 from ..services.economy_service import calculate_accumulated_economy, FleetEconomy
 from ..services.co2_service import calculate_co2_reduction, CO2Reduction
@@ -46,11 +74,6 @@ from ..services.invasive_species_service import (
     InvasiveSpeciesService,
     InvasiveSpecies
 )
-from ..models.advanced_fouling_prediction import (
-    predict_advanced_fouling,
-    AdvancedVesselFeatures,
-    AdvancedFoulingPrediction
-)
 from ..data.transpetro_fleet_data import (
     get_transpetro_fleet,
     get_vessel_by_id,
@@ -85,6 +108,20 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Listagens paginadas por cursor devolvem o cursor da próxima página neste header
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def validate_cursor(cursor: Optional[str], kind: str = "time"):
+    """Valida o cursor antes do acesso ao banco (cursor inválido -> 400)"""
+    if not cursor:
+        return
+    from ..cursors import InvalidCursor, decode_id_cursor, decode_time_cursor
+    try:
+        (decode_id_cursor if kind == "id" else decode_time_cursor)(cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 # Incluir router de autenticação (não depende de DB_AVAILABLE)
 # IMPORTANTE: Router deve ser registrado mesmo se houver erros de importação
 try:
@@ -134,6 +171,22 @@ if DB_AVAILABLE:
     except Exception as e:
         print(f"⚠️  Não foi possível carregar endpoints de compliance normalizados: {e}")
 
+    # Exportação em streaming (NDJSON/CSV/Parquet)
+    try:
+        from .export_endpoints import router as export_router
+        app.include_router(export_router)
+        print("✅ Endpoints de exportação habilitados em /api/export/*")
+    except Exception as e:
+        print(f"⚠️  Não foi possível carregar endpoints de exportação: {e}")
+
+    # Diagnóstico de desempenho (perfis de requisições), apenas manage_system
+    try:
+        from .admin_endpoints import router as admin_router
+        app.include_router(admin_router)
+        print("✅ Endpoints de administração habilitados em /api/admin/*")
+    except Exception as e:
+        print(f"⚠️  Não foi possível carregar endpoints de administração: {e}")
+
 # CORS - Configurado via variáveis de ambiente
 app.add_middleware(
     CORSMiddleware,
@@ -141,8 +194,24 @@ app.add_middleware(
     allow_credentials=CORS_CREDENTIALS,
     allow_methods=CORS_METHODS,
     allow_headers=CORS_HEADERS,
+    expose_headers=[NEXT_CURSOR_HEADER, "Server-Timing", "X-Profile-Id"],
 )
 
+# Profiler por requisição (desligado: middleware não instalado, custo zero)
+if PROFILING_ENABLED:
+    from .profiler import ProfilerMiddleware
+    app.add_middleware(
+        ProfilerMiddleware,
+        directory=PROFILE_DIR,
+        sample_rate=PROFILE_SAMPLE_RATE,
+        interval_ms=PROFILE_INTERVAL_MS,
+        max_files=PROFILE_MAX_FILES
+    )
+
+# Métricas por requisição (latência, banco, inferência) e header Server-Timing
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, timing_allow_origin=", ".join(CORS_ORIGINS))
+
 
 # Schemas Pydantic
 class VesselFeaturesRequest(BaseModel):
@@ -168,6 +237,19 @@ class FoulingPredictionResponse(BaseModel):
     predicted_co2_impact_kg: float
 
 
+class FleetFoulingBatchRequest(BaseModel):
+    vessels: List[VesselFeaturesRequest]
+
+
+class VesselFoulingPredictionResponse(FoulingPredictionResponse):
+    vessel_id: str
+
+
+class FleetFoulingBatchResponse(BaseModel):
+    total_vessels: int
+    predictions: List[VesselFoulingPredictionResponse]
+
+
 class ConsumptionFeaturesRequest(BaseModel):
     vessel_id: str
     speed_knots: float
@@ -434,6 +516,40 @@ class VesselResponse(BaseModel):
     last_update: str
 
 
+@app.on_event("startup")
+async def load_trained_models():
+    """Agenda o carregamento dos modelos e prepara o estado da frota"""
+    # Modelos de ML carregam em segundo plano: /health e CRUD respondem já.
+    # Workers só de CRUD podem desligar com ML_WARMUP_ON_STARTUP=false
+    # (os modelos são então importados e os processos do otimizador
+    # criados na primeira predição).
+    if ML_WARMUP_ON_STARTUP:
+        start_model_warm_up()
+        
+        # Processos do otimizador sobem (e carregam os modelos) em segundo plano
+        optimizer = get_inference_executor(OPTIMIZER_EXECUTOR)
+        if optimizer.kind == "process":
+            optimizer.warm_up()
+    
+    # Primeira execução após a migração 005: popular o estado da frota
+    if DB_AVAILABLE:
+        from ..services.fleet_state_service import ensure_fleet_state
+        db = SessionLocal()
+        try:
+            rebuilt = ensure_fleet_state(db)
+            if rebuilt:
+                print(f"✅ Estado da frota materializado ({rebuilt} embarcações)")
+        except Exception as e:
+            print(f"⚠️  Erro ao popular fleet_state: {e}")
+        finally:
+            db.close()
+
+
+@app.on_event("shutdown")
+async def stop_inference_executors():
+    shutdown_inference_executors()
+
+
 # Endpoints
 
 @app.get("/")
@@ -449,7 +565,20 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "inference": inference_status(),
+        "response_cache": response_cache_status()
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Métricas de desempenho no formato de texto do Prometheus"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Métricas desabilitadas (METRICS_ENABLED=false)")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 @app.post("/vessels/{vessel_id}/fouling/predict", response_model=FoulingPredictionResponse)
@@ -461,6 +590,8 @@ async def predict_fouling_endpoint(
     Prediz estado de bioincrustação para uma embarcação.
     """
     try:
+        from ..models.fouling_prediction import predict_fouling, VesselFeatures
+        
         vessel_features = VesselFeatures(
             vessel_id=features.vessel_id,
             time_since_cleaning_days=features.time_since_cleaning_days,
@@ -474,7 +605,7 @@ async def predict_fouling_endpoint(
             hull_area_m2=features.hull_area_m2
         )
         
-        prediction = predict_fouling(vessel_features)
+        prediction = await run_inference(ML_EXECUTOR, predict_fouling, vessel_features)
         
         return FoulingPredictionResponse(
             timestamp=prediction.timestamp.isoformat(),
@@ -485,6 +616,59 @@ async def predict_fouling_endpoint(
             predicted_fuel_impact_percent=prediction.predicted_fuel_impact_percent,
             predicted_co2_impact_kg=prediction.predicted_co2_impact_kg
         )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/fleet/fouling/predict-batch", response_model=FleetFoulingBatchResponse)
+async def predict_fleet_fouling_batch(request: FleetFoulingBatchRequest):
+    """
+    Prediz estado de bioincrustação para várias embarcações em uma chamada.
+    
+    O lote é avaliado de forma vetorizada (uma chamada ao modelo ML para
+    todas as embarcações), adequado para pontuar a frota inteira.
+    """
+    try:
+        from ..models.fouling_prediction import predict_fouling_batch, VesselFeatures
+        
+        vessel_features = [
+            VesselFeatures(
+                vessel_id=features.vessel_id,
+                time_since_cleaning_days=features.time_since_cleaning_days,
+                water_temperature_c=features.water_temperature_c,
+                salinity_psu=features.salinity_psu,
+                time_in_port_hours=features.time_in_port_hours,
+                average_speed_knots=features.average_speed_knots,
+                route_region=features.route_region,
+                paint_type=features.paint_type,
+                vessel_type=features.vessel_type,
+                hull_area_m2=features.hull_area_m2
+            )
+            for features in request.vessels
+        ]
+        
+        predictions = await run_inference(ML_EXECUTOR, predict_fouling_batch, vessel_features)
+        
+        return FleetFoulingBatchResponse(
+            total_vessels=len(predictions),
+            predictions=[
+                VesselFoulingPredictionResponse(
+                    vessel_id=features.vessel_id,
+                    timestamp=prediction.timestamp.isoformat(),
+                    estimated_thickness_mm=prediction.estimated_thickness_mm,
+                    estimated_roughness_um=prediction.estimated_roughness_um,
+                    fouling_severity=prediction.fouling_severity,
+                    confidence_score=prediction.confidence_score,
+                    predicted_fuel_impact_percent=prediction.predicted_fuel_impact_percent,
+                    predicted_co2_impact_kg=prediction.predicted_co2_impact_kg
+                )
+                for features, prediction in zip(vessel_features, predictions)
+            ]
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -499,6 +683,8 @@ async def calculate_fuel_impact_endpoint(
     Calcula impacto da bioincrustação no consumo de combustível.
     """
     try:
+        from ..models.fuel_impact import calculate_fuel_impact, ConsumptionFeatures
+        
         consumption_features = ConsumptionFeatures(
             vessel_id=features.vessel_id,
             speed_knots=features.speed_knots,
@@ -543,6 +729,9 @@ async def get_recommendation_endpoint(
     Obtém recomendação de limpeza para uma embarcação.
     """
     try:
+        from ..models.fouling_prediction import VesselFeatures
+        from ..services.recommendation_service import get_cleaning_recommendation
+        
         if features is None:
             raise HTTPException(status_code=400, detail="Features são obrigatórias")
         
@@ -559,7 +748,9 @@ async def get_recommendation_endpoint(
             hull_area_m2=features.hull_area_m2
         )
         
-        recommendation = get_cleaning_recommendation(
+        recommendation = await run_inference(
+            ML_EXECUTOR,
+            get_cleaning_recommendation,
             vessel_id,
             current_fouling_mm,
             current_roughness_um,
@@ -580,6 +771,8 @@ async def get_recommendation_endpoint(
             reasoning=recommendation.reasoning,
             status=recommendation.status
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -694,6 +887,7 @@ async def check_compliance_endpoint(
 # ==================== ENDPOINTS DE DASHBOARD ====================
 
 @app.get("/api/dashboard/kpis", response_model=KPIsResponse)
+@cached_response("dashboard:kpis")
 async def get_dashboard_kpis(
     period: str = Query("6_months", description="Período: 1_month, 3_months, 6_months, 12_months")
 ):
@@ -716,14 +910,14 @@ async def get_dashboard_kpis(
         # Buscar dados reais do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import VesselRepository, FoulingDataRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncFleetSnapshotRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    # Contar embarcações monitoradas
-                    all_vessels = VesselRepository.get_all(db, limit=1000)
-                    monitored_vessels = len(all_vessels)
+                    # Snapshot da frota (última predição por navio em uma única consulta)
+                    snapshots = await AsyncFleetSnapshotRepository.get_all(db)
+                    monitored_vessels = len(snapshots)
                     
                     # Calcular conformidade baseada em dados reais
                     compliant_count = 0
@@ -731,8 +925,9 @@ async def get_dashboard_kpis(
                     total_economy = 0.0
                     total_co2_reduction = 0.0
                     
-                    for vessel in all_vessels:
-                        latest_fouling = FoulingDataRepository.get_latest(db, vessel.id)
+                    for snapshot in snapshots:
+                        vessel = snapshot.vessel
+                        latest_fouling = snapshot.latest_fouling
                         
                         if latest_fouling:
                             total_checked += 1
@@ -785,7 +980,7 @@ async def get_dashboard_kpis(
                         last_update=datetime.now().isoformat()
                     )
                 finally:
-                    db.close()
+                    await db.close()
             except Exception as db_error:
                 print(f"⚠️  Erro ao buscar KPIs do banco: {db_error}. Usando valores estimados.")
         
@@ -809,6 +1004,7 @@ async def get_dashboard_kpis(
 
 
 @app.get("/api/dashboard/trends", response_model=TrendsResponse)
+@cached_response("dashboard:trends")
 async def get_dashboard_trends(
     period: str = Query("6_months", description="Período")
 ):
@@ -837,87 +1033,59 @@ async def get_dashboard_trends(
         # Buscar dados reais do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import VesselRepository, FoulingDataRepository, MaintenanceEventRepository
-                from sqlalchemy import func, extract
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncVesselRepository, AsyncFleetTrendsRepository
+                from ..services.compliance_service import mean_compliance_scores
+                import pandas as pd
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    # Obter todas as embarcações
-                    all_vessels = VesselRepository.get_all(db, limit=1000)
-                    vessel_ids = [v.id for v in all_vessels]
+                    vessel_count = await AsyncVesselRepository.count(db)
+                    
+                    # Agregação mensal no banco (GROUP BY mês e classe de limite NORMAM 401)
+                    rollup = pd.DataFrame(await AsyncFleetTrendsRepository.get_monthly_fouling(
+                        db, start_date, NORMAM401ComplianceService.VESSEL_TYPE_LIMITS
+                    ))
+                    maintenance_by_month = await AsyncFleetTrendsRepository.get_monthly_maintenance_counts(db, start_date)
                     
                     # Agrupar dados por mês
                     trends_by_month = defaultdict(lambda: {
                         'economy_brl': 0.0,
                         'co2_tonnes': 0.0,
-                        'compliance_scores': [],
-                        'fouling_mm': [],
-                        'roughness_um': [],
-                        'vessels_count': 0,
+                        'compliance_score': None,
+                        'avg_fouling_mm': None,
+                        'avg_roughness_um': None,
+                        'vessels_count': vessel_count,
                         'maintenance_count': 0
                     })
                     
-                    # Processar dados de bioincrustação por mês
-                    for vessel_id in vessel_ids:
-                        fouling_history = FoulingDataRepository.get_by_vessel(
-                            db, vessel_id, start_date=start_date
-                        )
+                    if not rollup.empty:
+                        fuel_price_per_kg = 3.5
+                        hours_in_month = 720
                         
-                        for fouling in fouling_history:
-                            month_key = fouling.timestamp.strftime('%Y-%m')
-                            trends_by_month[month_key]['fouling_mm'].append(
-                                fouling.estimated_thickness_mm or 0.0
-                            )
-                            trends_by_month[month_key]['roughness_um'].append(
-                                fouling.estimated_roughness_um or 0.0
-                            )
-                            
-                            # Calcular economia e CO₂
-                            if fouling.predicted_fuel_impact_percent:
-                                # Estimativa de economia baseada no impacto
-                                vessel = next((v for v in all_vessels if v.id == vessel_id), None)
-                                if vessel:
-                                    typical_consumption = vessel.typical_consumption_kg_h or 1000.0
-                                    fuel_price_per_kg = 3.5
-                                    hours_in_month = 720
-                                    fuel_saved_percent = max(0, fouling.predicted_fuel_impact_percent)
-                                    fuel_saved_kg = (typical_consumption * fuel_saved_percent / 100) * hours_in_month
-                                    economy = fuel_saved_kg * fuel_price_per_kg
-                                    trends_by_month[month_key]['economy_brl'] += economy
-                                    
-                                    # CO₂ reduzido
-                                    if fouling.predicted_co2_impact_kg:
-                                        trends_by_month[month_key]['co2_tonnes'] += (
-                                            fouling.predicted_co2_impact_kg * hours_in_month / 1000
-                                        )
-                            
-                            # Calcular conformidade
-                            vessel = next((v for v in all_vessels if v.id == vessel_id), None)
-                            if vessel:
-                                from ..services.compliance_service import check_normam401_compliance
-                                compliance = check_normam401_compliance(
-                                    vessel_id=vessel_id,
-                                    fouling_thickness_mm=fouling.estimated_thickness_mm or 0.0,
-                                    roughness_um=fouling.estimated_roughness_um or 0.0,
-                                    vessel_type=vessel.vessel_type or 'standard'
-                                )
-                                trends_by_month[month_key]['compliance_scores'].append(
-                                    compliance.compliance_score
-                                )
-                    
-                    # Processar eventos de manutenção por mês
-                    for vessel_id in vessel_ids:
-                        maintenance_events = MaintenanceEventRepository.get_by_vessel(
-                            db, vessel_id, start_date=start_date
-                        )
-                        for event in maintenance_events:
-                            month_key = event.start_date.strftime('%Y-%m')
-                            trends_by_month[month_key]['maintenance_count'] += 1
+                        # Conformidade em uma passada vetorizada sobre os grupos agregados
+                        rollup['compliance_total'] = mean_compliance_scores(
+                            rollup['limit_type'].tolist(),
+                            rollup['readings'].to_numpy(),
+                            rollup['capped_thickness_sum'].to_numpy(),
+                            rollup['capped_roughness_sum'].to_numpy()
+                        ) * rollup['readings']
+                        
+                        monthly = rollup.groupby('month')[[
+                            'readings', 'thickness_sum', 'roughness_sum',
+                            'fuel_impact_kg_h', 'co2_impact_kg_h', 'compliance_total'
+                        ]].sum()
+                        
+                        for month_key, row in monthly.iterrows():
+                            month_data = trends_by_month[month_key]
+                            month_data['economy_brl'] = row['fuel_impact_kg_h'] * hours_in_month * fuel_price_per_kg
+                            month_data['co2_tonnes'] = row['co2_impact_kg_h'] * hours_in_month / 1000
+                            month_data['compliance_score'] = row['compliance_total'] / row['readings']
+                            month_data['avg_fouling_mm'] = row['thickness_sum'] / row['readings']
+                            month_data['avg_roughness_um'] = row['roughness_sum'] / row['readings']
                     
-                    # Contar embarcações por mês (assumindo que todas estão ativas)
-                    for month_key in trends_by_month:
-                        trends_by_month[month_key]['vessels_count'] = len(all_vessels)
+                    for month_key, count in maintenance_by_month.items():
+                        trends_by_month[month_key]['maintenance_count'] = count
                     
                     # Gerar lista de meses (garantir meses únicos e ordenados)
                     months = []
@@ -945,28 +1113,20 @@ async def get_dashboard_trends(
                     month_names = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
                     
                     for i, month_key in enumerate(months):
-                        month_data = trends_by_month.get(month_key, {
-                            'economy_brl': 0.0,
-                            'co2_tonnes': 0.0,
-                            'compliance_scores': [],
-                            'fouling_mm': [],
-                            'roughness_um': [],
-                            'vessels_count': len(all_vessels),
-                            'maintenance_count': 0
-                        })
+                        month_data = trends_by_month[month_key]
                         
-                        # Calcular médias
+                        # Médias (valores padrão para meses sem leituras)
                         avg_compliance = (
-                            sum(month_data['compliance_scores']) / len(month_data['compliance_scores']) * 100
-                            if month_data['compliance_scores'] else 95.0
+                            month_data['compliance_score'] * 100
+                            if month_data['compliance_score'] is not None else 95.0
                         )
                         avg_fouling = (
-                            sum(month_data['fouling_mm']) / len(month_data['fouling_mm'])
-                            if month_data['fouling_mm'] else 3.5
+                            month_data['avg_fouling_mm']
+                            if month_data['avg_fouling_mm'] is not None else 3.5
                         )
                         avg_roughness = (
-                            sum(month_data['roughness_um']) / len(month_data['roughness_um'])
-                            if month_data['roughness_um'] else 350.0
+                            month_data['avg_roughness_um']
+                            if month_data['avg_roughness_um'] is not None else 350.0
                         )
                         
                         # Nome do mês
@@ -1000,7 +1160,7 @@ async def get_dashboard_trends(
                         base_compliance = 95.0
                         base_fouling = 3.5
                         base_roughness = 350.0
-                        base_vessels = len(all_vessels)
+                        base_vessels = vessel_count
                         base_maintenance = 5
                         
                         for i in range(months_back):
@@ -1026,7 +1186,7 @@ async def get_dashboard_trends(
                         data=trends_data
                     )
                 finally:
-                    db.close()
+                    await db.close()
             except Exception as db_error:
                 print(f"⚠️  Erro ao buscar tendências do banco: {db_error}. Usando dados estimados.")
         
@@ -1103,6 +1263,7 @@ async def get_dashboard_trends(
 
 
 @app.get("/api/dashboard/fleet-status", response_model=FleetStatusResponse)
+@cached_response("dashboard:fleet-status")
 async def get_fleet_status():
     """
     Retorna status de todas as embarcações da frota.
@@ -1111,26 +1272,23 @@ async def get_fleet_status():
         # Buscar dados reais do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import VesselRepository, FoulingDataRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncFleetStateRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    # Buscar todas as embarcações
-                    all_vessels = VesselRepository.get_all(db, limit=1000)
+                    # Estado materializado: uma linha por embarcação
+                    states = await AsyncFleetStateRepository.get_all(db)
                     
                     vessel_statuses = []
                     
-                    for vessel in all_vessels:
-                        # Buscar última predição de bioincrustação
-                        latest_fouling = FoulingDataRepository.get_latest(db, vessel.id)
-                        
-                        if latest_fouling:
+                    for state in states:
+                        if state.fouling_timestamp:
                             # Usar dados reais da predição
-                            fouling_mm = latest_fouling.estimated_thickness_mm or 0.0
-                            roughness_um = latest_fouling.estimated_roughness_um or 0.0
-                            fouling_severity = latest_fouling.fouling_severity or "light"
-                            last_update = latest_fouling.timestamp.isoformat()
+                            fouling_mm = state.fouling_mm or 0.0
+                            roughness_um = state.roughness_um or 0.0
+                            fouling_severity = state.fouling_severity or "light"
+                            last_update = state.fouling_timestamp.isoformat()
                         else:
                             # Sem dados de bioincrustação
                             fouling_mm = 0.0
@@ -1138,15 +1296,6 @@ async def get_fleet_status():
                             fouling_severity = "light"
                             last_update = datetime.now().isoformat()
                         
-                        # Calcular status de conformidade
-                        vessel_type = vessel.vessel_type or "standard"
-                        compliance_check = check_normam401_compliance(
-                            vessel_id=vessel.id,
-                            fouling_thickness_mm=fouling_mm,
-                            roughness_um=roughness_um,
-                            vessel_type=vessel_type
-                        )
-                        
                         # Mapear severidade para status do dashboard
                         if fouling_severity == "critical":
                             status = "critical"
@@ -1159,19 +1308,19 @@ async def get_fleet_status():
                         
                         vessel_statuses.append(
                             VesselStatus(
-                                id=vessel.id,
-                                name=vessel.name,
+                                id=state.vessel_id,
+                                name=state.vessel_name,
                                 status=status,
                                 fouling_mm=fouling_mm,
                                 roughness_um=roughness_um,
-                                compliance_status=compliance_check.status.value,
+                                compliance_status=state.compliance_status,
                                 last_update=last_update
                             )
                         )
                     
                     return FleetStatusResponse(vessels=vessel_statuses)
                 finally:
-                    db.close()
+                    await db.close()
             except Exception as db_error:
                 print(f"⚠️  Erro ao buscar dados do banco: {db_error}")
                 import traceback
@@ -1196,6 +1345,7 @@ async def explain_fouling_prediction(
     """
     try:
         from ..models.explainability import ModelExplainer
+        from ..models.fouling_prediction import predict_fouling, VesselFeatures
         
         vessel_features = VesselFeatures(
             vessel_id=features.vessel_id,
@@ -1211,7 +1361,7 @@ async def explain_fouling_prediction(
         )
         
         # Fazer predição
-        prediction = predict_fouling(vessel_features)
+        prediction = await run_inference(ML_EXECUTOR, predict_fouling, vessel_features)
         
         # Explicar
         features_dict = {
@@ -1227,7 +1377,13 @@ async def explain_fouling_prediction(
         }
         
         explainer = ModelExplainer()
-        explanation = explainer.explain_fouling_prediction(None, features_dict, prediction.estimated_thickness_mm)
+        explanation = await run_inference(
+            ML_EXECUTOR,
+            explainer.explain_fouling_prediction,
+            None,
+            features_dict,
+            prediction.estimated_thickness_mm
+        )
         
         return ExplanationResponse(
             prediction_id=explanation.prediction_id,
@@ -1246,6 +1402,8 @@ async def explain_fouling_prediction(
             confidence=explanation.confidence,
             model_type=explanation.model_type
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1273,7 +1431,7 @@ async def explain_compliance_status(
         
         # Explicar
         explainer = ModelExplainer()
-        explanation = explainer.explain_compliance_status(check)
+        explanation = await run_inference(ML_EXECUTOR, explainer.explain_compliance_status, check)
         
         return ExplanationResponse(
             prediction_id=explanation.prediction_id,
@@ -1292,6 +1450,8 @@ async def explain_compliance_status(
             confidence=explanation.confidence,
             model_type=explanation.model_type
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1307,6 +1467,9 @@ async def predict_normam401_risk_endpoint(
     Prediz risco de não conformidade NORMAM 401.
     """
     try:
+        from ..models.fouling_prediction import VesselFeatures
+        from ..models.normam401_risk import predict_normam401_risk
+        
         vessel_features = VesselFeatures(
             vessel_id=vessel_id,
             time_since_cleaning_days=request.vessel_features.time_since_cleaning_days,
@@ -1320,7 +1483,9 @@ async def predict_normam401_risk_endpoint(
             hull_area_m2=request.vessel_features.hull_area_m2
         )
         
-        risk_prediction = predict_normam401_risk(
+        risk_prediction = await run_inference(
+            ML_EXECUTOR,
+            predict_normam401_risk,
             vessel_id,
             vessel_features,
             request.days_ahead
@@ -1348,6 +1513,8 @@ async def predict_normam401_risk_endpoint(
             recommendations=risk_prediction.recommendations,
             confidence=risk_prediction.confidence
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1361,6 +1528,9 @@ async def optimize_inspections_endpoint(
     Otimiza cronograma de inspeções NORMAM 401.
     """
     try:
+        from ..models.fouling_prediction import VesselFeatures
+        from ..models.inspection_optimizer import optimize_inspections
+        
         vessel_features = VesselFeatures(
             vessel_id=vessel_id,
             time_since_cleaning_days=request.vessel_features.time_since_cleaning_days,
@@ -1374,7 +1544,9 @@ async def optimize_inspections_endpoint(
             hull_area_m2=request.vessel_features.hull_area_m2
         )
         
-        schedule = optimize_inspections(
+        schedule = await run_inference(
+            OPTIMIZER_EXECUTOR,
+            optimize_inspections,
             vessel_id,
             vessel_features,
             request.horizon_days
@@ -1400,6 +1572,8 @@ async def optimize_inspections_endpoint(
             risk_reduction=schedule.risk_reduction,
             compliance_improvement=schedule.compliance_improvement
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1412,6 +1586,8 @@ async def detect_anomalies_endpoint(
     Detecta anomalias em dados de conformidade.
     """
     try:
+        from ..models.anomaly_detector import detect_compliance_anomalies, ComplianceDataPoint
+        
         # TODO: Em produção, buscar histórico real do banco de dados
         # Mock data para exemplo
         from datetime import datetime, timedelta
@@ -1527,31 +1703,41 @@ _vessels_storage: Dict[str, dict] = {}
 @app.get("/api/vessels", response_model=List[VesselResponse])
 # Protegido - requer visualização de embarcações
 async def list_vessels(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     vessel_type: Optional[str] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (header X-Next-Cursor)")
 ):
     """
     Lista todas as embarcações.
+    
+    Paginação por cursor: repetir a chamada com o valor do header
+    X-Next-Cursor até ele não vir mais. `skip` é mantido por compatibilidade.
     """
+    validate_cursor(cursor, kind="id")
+    
     try:
         # Tentar usar banco de dados primeiro
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import VesselRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncVesselRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    if vessel_type:
-                        vessels = VesselRepository.get_by_type(db, vessel_type)
-                    elif status:
-                        vessels = VesselRepository.get_by_status(db, status)
+                    next_cursor = None
+                    if skip and not cursor and not (vessel_type or status):
+                        # Compatibilidade: offset (custo cresce com skip)
+                        vessels = await AsyncVesselRepository.get_all(db, skip=skip, limit=limit)
                     else:
-                        vessels = VesselRepository.get_all(db, skip=skip, limit=limit)
+                        page = await AsyncVesselRepository.get_page(
+                            db, cursor=cursor, limit=limit, vessel_type=vessel_type, status=status
+                        )
+                        vessels, next_cursor = page.items, page.next_cursor
                     
-                    return [
+                    items = [
                         VesselResponse(
                             id=v.id,
                             name=v.name,
@@ -1577,13 +1763,16 @@ async def list_vessels(
                             fuel_type=v.fuel_type or "",
                             typical_consumption_kg_h=v.typical_consumption_kg_h or 0.0,
                             status=v.status or "active",
-                            registration_date=v.registration_date.isoformat() if v.registration_date else datetime.now().isoformat(),
+                            registration_date=v.created_at.isoformat() if v.created_at else datetime.now().isoformat(),
                             last_update=datetime.now().isoformat()
                         )
                         for v in vessels
                     ]
+                    if next_cursor:
+                        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+                    return items
                 finally:
-                    db.close()
+                    await db.close()
             except Exception as db_error:
                 # Fallback para storage em memória se banco falhar
                 print(f"⚠️  Erro ao acessar banco de dados: {db_error}. Usando storage em memória.")
@@ -1619,12 +1808,12 @@ async def get_vessel(vessel_id: str):
         # Tentar usar banco de dados primeiro
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import VesselRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncVesselRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    vessel = VesselRepository.get_by_id(db, vessel_id)
+                    vessel = await AsyncVesselRepository.get_by_id(db, vessel_id)
                     if vessel:
                         return VesselResponse(
                             id=vessel.id,
@@ -1651,11 +1840,11 @@ async def get_vessel(vessel_id: str):
                             fuel_type=vessel.fuel_type or "",
                             typical_consumption_kg_h=vessel.typical_consumption_kg_h or 0.0,
                             status=vessel.status or "active",
-                            registration_date=vessel.registration_date.isoformat() if vessel.registration_date else datetime.now().isoformat(),
+                            registration_date=vessel.created_at.isoformat() if vessel.created_at else datetime.now().isoformat(),
                             last_update=datetime.now().isoformat()
                         )
                 finally:
-                    db.close()
+                    await db.close()
             except Exception:
                 # Fallback para storage em memória
                 pass
@@ -1802,6 +1991,7 @@ async def create_vessel(vessel: VesselCreate):
         }
         
         _vessels_storage[vessel_id] = vessel_data
+        invalidate_response_cache()
         
         return VesselResponse(**vessel_data)
     except Exception as e:
@@ -1836,6 +2026,7 @@ async def update_vessel(vessel_id: str, vessel_update: VesselUpdate):
             vessel_data["status"] = vessel_update.status
         
         vessel_data["last_update"] = datetime.now().isoformat()
+        invalidate_response_cache()
         
         return VesselResponse(**vessel_data)
     except HTTPException:
@@ -1855,6 +2046,7 @@ async def delete_vessel(vessel_id: str):
             raise HTTPException(status_code=404, detail="Embarcação não encontrada")
         
         del _vessels_storage[vessel_id]
+        invalidate_response_cache()
         
         return {"message": "Embarcação deletada com sucesso", "vessel_id": vessel_id}
     except HTTPException:
@@ -1896,8 +2088,13 @@ class OperationalDataResponse(BaseModel):
     wave_height_m: float
 
 
-# Mock storage para dados operacionais
-_operational_data_storage: Dict[str, List[dict]] = {}
+# Séries em memória (sem banco ou embarcação só em memória), ver memory_store
+_operational_data_store = TimeSeriesStore(
+    "timestamp",
+    OperationalDataResponse.model_fields,
+    max_rows_per_vessel=MEMORY_STORE_MAX_ROWS_PER_VESSEL,
+    retention_days=MEMORY_STORE_RETENTION_DAYS
+)
 
 
 @app.post("/api/vessels/{vessel_id}/operational-data", response_model=OperationalDataResponse)
@@ -1914,7 +2111,7 @@ async def create_operational_data(
             raise HTTPException(status_code=404, detail="Embarcação não encontrada")
         
         # Criar registro
-        record_id = f"OP_{vessel_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        record_id = f"OP_{vessel_id}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
         record = {
             "id": record_id,
             "timestamp": datetime.now().isoformat(),
@@ -1930,9 +2127,8 @@ async def create_operational_data(
         }
         
         # Armazenar (em produção, salvar no banco de dados)
-        if vessel_id not in _operational_data_storage:
-            _operational_data_storage[vessel_id] = []
-        _operational_data_storage[vessel_id].append(record)
+        MemoryOperationalDataRepository.create(_operational_data_store, record)
+        invalidate_response_cache()
         
         return OperationalDataResponse(**record)
     except HTTPException:
@@ -1944,22 +2140,29 @@ async def create_operational_data(
 @app.get("/api/vessels/{vessel_id}/operational-data", response_model=List[OperationalDataResponse])
 async def get_operational_data(
     vessel_id: str,
+    response: Response,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (header X-Next-Cursor)")
 ):
     """
     Obtém histórico de dados operacionais de uma embarcação.
+    
+    Paginação por cursor: repetir a chamada (mesmos filtros) com o valor do
+    header X-Next-Cursor até ele não vir mais.
     """
+    validate_cursor(cursor)
+    
     try:
         # Tentar buscar do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import OperationalDataRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncOperationalDataRepository
                 from datetime import timedelta
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
                     # Se não há filtros de data, buscar últimos N dias
                     if not start_date and not end_date:
@@ -1969,11 +2172,12 @@ async def get_operational_data(
                         start_date_obj = datetime.fromisoformat(start_date) if start_date else datetime.now() - timedelta(days=30)
                         end_date_obj = datetime.fromisoformat(end_date) if end_date else datetime.now()
                     
-                    history = OperationalDataRepository.get_by_vessel(
-                        db, vessel_id, start_date=start_date_obj, end_date=end_date_obj, limit=limit
+                    page = await AsyncOperationalDataRepository.get_page_by_vessel(
+                        db, vessel_id, cursor=cursor,
+                        start_date=start_date_obj, end_date=end_date_obj, limit=limit
                     )
-                    if history:
-                        return [
+                    if page.items:
+                        items = [
                             OperationalDataResponse(
                                 id=op.id,
                                 timestamp=op.timestamp.isoformat(),
@@ -1987,31 +2191,27 @@ async def get_operational_data(
                                 wind_speed_knots=op.wind_speed_knots,
                                 wave_height_m=op.wave_height_m
                             )
-                            for op in history
+                            for op in page.items
                         ]
+                        if page.next_cursor:
+                            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+                        return items
                 finally:
-                    db.close()
+                    await db.close()
             except Exception:
                 pass
         
-        # Fallback: storage em memória
-        if vessel_id in _operational_data_storage and _operational_data_storage[vessel_id]:
-            data = _operational_data_storage[vessel_id]
-            
-            # Filtrar por data se fornecido
-            if start_date:
-                start = datetime.fromisoformat(start_date)
-                data = [d for d in data if datetime.fromisoformat(d["timestamp"]) >= start]
-            
-            if end_date:
-                end = datetime.fromisoformat(end_date)
-                data = [d for d in data if datetime.fromisoformat(d["timestamp"]) <= end]
-            
-            # Ordenar por timestamp (mais recente primeiro) e limitar
-            data.sort(key=lambda x: x["timestamp"], reverse=True)
-            data = data[:limit]
-            
-            return [OperationalDataResponse(**d) for d in data]
+        # Fallback: séries em memória
+        if vessel_id in _operational_data_store:
+            page = MemoryOperationalDataRepository.get_page_by_vessel(
+                _operational_data_store, vessel_id, cursor=cursor,
+                start_date=datetime.fromisoformat(start_date) if start_date else None,
+                end_date=datetime.fromisoformat(end_date) if end_date else None,
+                limit=limit
+            )
+            if page.next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+            return [OperationalDataResponse(**d) for d in page.items]
         
         # Fallback: gerar dados sintéticos para IDs conhecidos
         if vessel_id in ["TP_SUEZMAX_MILTON_SANTOS", "TP_SUEZMAX_ABDIAS_NASCIMENTO", 
@@ -2143,12 +2343,12 @@ async def get_latest_operational_data(vessel_id: str):
         # Tentar buscar do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import OperationalDataRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncOperationalDataRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    latest = OperationalDataRepository.get_latest(db, vessel_id)
+                    latest = await AsyncOperationalDataRepository.get_latest(db, vessel_id)
                     if latest:
                         return OperationalDataResponse(
                             id=latest.id,
@@ -2164,13 +2364,13 @@ async def get_latest_operational_data(vessel_id: str):
                             wave_height_m=latest.wave_height_m
                         )
                 finally:
-                    db.close()
+                    await db.close()
             except Exception:
                 pass
         
-        # Fallback: storage em memória
-        if vessel_id in _operational_data_storage and _operational_data_storage[vessel_id]:
-            latest = max(_operational_data_storage[vessel_id], key=lambda x: x["timestamp"])
+        # Fallback: séries em memória
+        latest = MemoryOperationalDataRepository.get_latest(_operational_data_store, vessel_id)
+        if latest:
             return OperationalDataResponse(**latest)
         
         # Fallback: dados mock para IDs conhecidos (incluindo IDs da frota Transpetro)
@@ -2285,8 +2485,37 @@ class MaintenanceEventResponse(BaseModel):
     photos_paths: Optional[List[str]] = []
 
 
-# Mock storage para manutenção
-_maintenance_storage: Dict[str, List[dict]] = {}
+# Eventos de manutenção em memória (sem retenção por idade)
+_maintenance_store = TimeSeriesStore(
+    "start_date",
+    MaintenanceEventResponse.model_fields,
+    max_rows_per_vessel=MEMORY_STORE_MAX_ROWS_PER_VESSEL
+)
+
+
+def maintenance_event_response(event) -> MaintenanceEventResponse:
+    """Resposta de um MaintenanceEvent do banco (custo de parada não é persistido)"""
+    return MaintenanceEventResponse(
+        id=event.id,
+        vessel_id=event.vessel_id,
+        event_type=event.event_type,
+        start_date=event.start_date.isoformat(),
+        end_date=event.end_date.isoformat() if event.end_date else event.start_date.isoformat(),
+        duration_hours=(event.end_date - event.start_date).total_seconds() / 3600.0 if event.end_date else 24.0,
+        cleaning_method=event.cleaning_method,
+        fouling_before_mm=event.fouling_thickness_before_mm or 0.0,
+        fouling_after_mm=event.fouling_thickness_after_mm or 0.0,
+        roughness_before_um=event.roughness_before_um or 0.0,
+        roughness_after_um=event.roughness_after_um or 0.0,
+        cost_brl=event.cost_brl or 0.0,
+        downtime_cost_brl=0.0,
+        total_cost_brl=event.cost_brl or 0.0,
+        port_name=event.location or "N/A",
+        port_country="Brasil",
+        inspector_name=event.contractor,
+        notes=event.description,
+        photos_paths=event.photos_paths or []
+    )
 
 
 from fastapi import UploadFile, File
@@ -2367,36 +2596,15 @@ async def create_maintenance_event(
                         "roughness_before_um": data.roughness_before_um,
                         "roughness_after_um": data.roughness_after_um,
                         "cost_brl": data.cost_brl,
-                        "downtime_cost_brl": data.downtime_cost_brl,
                         "location": data.port_name,
+                        "contractor": data.inspector_name,
                         "description": data.notes,
                         "photos_paths": data.photos_paths
                     }
                     
                     event_db = MaintenanceEventRepository.create(db, event_data)
                     
-                    # Retornar resposta formatada
-                    return MaintenanceEventResponse(
-                        id=event_db.id,
-                        vessel_id=event_db.vessel_id,
-                        event_type=event_db.event_type,
-                        start_date=event_db.start_date.isoformat(),
-                        end_date=event_db.end_date.isoformat() if event_db.end_date else None,
-                        duration_hours=event_db.duration_hours,
-                        cleaning_method=event_db.cleaning_method,
-                        fouling_before_mm=event_db.fouling_thickness_before_mm,
-                        fouling_after_mm=event_db.fouling_thickness_after_mm,
-                        roughness_before_um=event_db.roughness_before_um,
-                        roughness_after_um=event_db.roughness_after_um,
-                        cost_brl=event_db.cost_brl,
-                        downtime_cost_brl=event_db.downtime_cost_brl,
-                        total_cost_brl=(event_db.cost_brl or 0) + (event_db.downtime_cost_brl or 0),
-                        port_name=event_db.location or "",
-                        port_country="Brasil",
-                        inspector_name=event_db.contractor,
-                        notes=event_db.description,
-                        photos_paths=event_db.photos_paths
-                    )
+                    return maintenance_event_response(event_db)
                 finally:
                     db.close()
             except Exception as e:
@@ -2405,7 +2613,7 @@ async def create_maintenance_event(
                 pass
 
         # Fallback: Armazenar em memória
-        event_id = f"MAINT_{vessel_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        event_id = f"MAINT_{vessel_id}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
         total_cost = (data.cost_brl or 0) + (data.downtime_cost_brl or 0)
         event = {
             "id": event_id,
@@ -2429,9 +2637,8 @@ async def create_maintenance_event(
             "photos_paths": data.photos_paths
         }
         
-        if vessel_id not in _maintenance_storage:
-            _maintenance_storage[vessel_id] = []
-        _maintenance_storage[vessel_id].append(event)
+        MemoryMaintenanceEventRepository.create(_maintenance_store, event)
+        invalidate_response_cache()
         
         return MaintenanceEventResponse(**event)
     except HTTPException:
@@ -2444,83 +2651,66 @@ async def create_maintenance_event(
 @app.get("/api/vessels/{vessel_id}/maintenance", response_model=List[MaintenanceEventResponse])
 async def get_maintenance_history(
     vessel_id: str,
+    response: Response,
     event_type: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (header X-Next-Cursor)")
 ):
     """
     Obtém histórico de manutenção de uma embarcação.
+    
+    Paginação por cursor: repetir a chamada (mesmos filtros) com o valor do
+    header X-Next-Cursor até ele não vir mais.
     """
+    validate_cursor(cursor)
+    
     try:
         # Tentar buscar do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import MaintenanceEventRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncMaintenanceEventRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
                     start = datetime.fromisoformat(start_date) if start_date else None
                     end = datetime.fromisoformat(end_date) if end_date else None
-                    history = MaintenanceEventRepository.get_by_vessel(
-                        db, vessel_id, 
+                    page = await AsyncMaintenanceEventRepository.get_page_by_vessel(
+                        db, vessel_id,
+                        cursor=cursor,
                         event_type=event_type,
                         start_date=start,
                         end_date=end,
                         limit=limit
                     )
-                    if history:
-                        return [
-                            MaintenanceEventResponse(
-                                id=event.id,
-                                vessel_id=event.vessel_id,
-                                event_type=event.event_type,
-                                start_date=event.start_date.isoformat(),
-                                end_date=event.end_date.isoformat() if event.end_date else event.start_date.isoformat(),
-                                duration_hours=(event.end_date - event.start_date).total_seconds() / 3600.0 if event.end_date else 24.0,
-                                cleaning_method=event.cleaning_method,
-                                fouling_before_mm=event.fouling_thickness_before_mm or 0.0,
-                                fouling_after_mm=event.fouling_thickness_after_mm or 0.0,
-                                roughness_before_um=event.roughness_before_um or 0.0,
-                                roughness_after_um=event.roughness_after_um or 0.0,
-                                cost_brl=event.cost_brl or 0.0,
-                                downtime_cost_brl=event.downtime_cost_brl or 0.0,
-                                total_cost_brl=(event.cost_brl or 0.0) + (event.downtime_cost_brl or 0.0),
-                                port_name=event.port_name or "N/A",
-                                port_country=event.port_country,
-                                inspector_name=event.inspector_name,
-                                notes=event.description or event.notes
-                            )
-                            for event in history
+                    if page.items:
+                        items = [
+                            maintenance_event_response(event)
+                            for event in page.items
                         ]
+                        if page.next_cursor:
+                            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+                        return items
                 finally:
-                    db.close()
+                    await db.close()
             except Exception:
                 pass
         
-        # Fallback: storage em memória
-        if vessel_id in _maintenance_storage:
-            events = _maintenance_storage[vessel_id]
-            
-            # Filtrar por tipo se fornecido
-            if event_type:
-                events = [e for e in events if e["event_type"] == event_type]
-            
-            # Filtrar por data se fornecido
-            if start_date:
-                start = datetime.fromisoformat(start_date)
-                events = [e for e in events if datetime.fromisoformat(e["start_date"]) >= start]
-            
-            if end_date:
-                end = datetime.fromisoformat(end_date)
-                events = [e for e in events if datetime.fromisoformat(e["start_date"]) <= end]
-            
-            # Ordenar por data (mais recente primeiro) e limitar
-            events.sort(key=lambda x: x["start_date"], reverse=True)
-            events = events[:limit]
-            
-            return [MaintenanceEventResponse(**e) for e in events]
+        # Fallback: séries em memória
+        if vessel_id in _maintenance_store:
+            page = MemoryMaintenanceEventRepository.get_page_by_vessel(
+                _maintenance_store, vessel_id,
+                cursor=cursor,
+                event_type=event_type,
+                start_date=datetime.fromisoformat(start_date) if start_date else None,
+                end_date=datetime.fromisoformat(end_date) if end_date else None,
+                limit=limit
+            )
+            if page.next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+            return [MaintenanceEventResponse(**e) for e in page.items]
         
         # Fallback: dados sintéticos para IDs conhecidos e Transpetro
         known_vessels = [
@@ -2782,41 +2972,22 @@ async def get_latest_maintenance(vessel_id: str):
         # Tentar buscar do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import MaintenanceEventRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncMaintenanceEventRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    latest = MaintenanceEventRepository.get_latest_by_type(db, vessel_id, "cleaning")
+                    latest = await AsyncMaintenanceEventRepository.get_latest_by_type(db, vessel_id, "cleaning")
                     if latest:
-                        return MaintenanceEventResponse(
-                            id=latest.id,
-                            vessel_id=latest.vessel_id,
-                            event_type=latest.event_type,
-                            start_date=latest.start_date.isoformat(),
-                            end_date=latest.end_date.isoformat() if latest.end_date else latest.start_date.isoformat(),
-                            duration_hours=(latest.end_date - latest.start_date).total_seconds() / 3600.0 if latest.end_date else 24.0,
-                            cleaning_method=latest.cleaning_method,
-                            fouling_before_mm=latest.fouling_before_mm,
-                            fouling_after_mm=latest.fouling_after_mm,
-                            roughness_before_um=latest.roughness_before_um,
-                            roughness_after_um=latest.roughness_after_um,
-                            cost_brl=latest.cost_brl or 0.0,
-                            downtime_cost_brl=latest.downtime_cost_brl,
-                            total_cost_brl=(latest.cost_brl or 0.0) + (latest.downtime_cost_brl or 0.0),
-                            port_name=latest.port_name or "N/A",
-                            port_country=latest.port_country,
-                            inspector_name=latest.inspector_name,
-                            notes=latest.notes
-                        )
+                        return maintenance_event_response(latest)
                 finally:
-                    db.close()
+                    await db.close()
             except Exception:
                 pass
         
-        # Fallback: storage em memória
-        if vessel_id in _maintenance_storage and _maintenance_storage[vessel_id]:
-            latest = max(_maintenance_storage[vessel_id], key=lambda x: x["start_date"])
+        # Fallback: séries em memória
+        latest = MemoryMaintenanceEventRepository.get_latest(_maintenance_store, vessel_id)
+        if latest:
             return MaintenanceEventResponse(**latest)
         
         # Fallback: dados mock para IDs conhecidos
@@ -2879,12 +3050,12 @@ async def get_latest_fouling_fallback(vessel_id: str):
         # Tentar buscar do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import FoulingDataRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncFoulingDataRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    latest = FoulingDataRepository.get_latest(db, vessel_id)
+                    latest = await AsyncFoulingDataRepository.get_latest(db, vessel_id)
                     if latest:
                         return FoulingDataResponse(
                             id=latest.id,
@@ -2899,7 +3070,7 @@ async def get_latest_fouling_fallback(vessel_id: str):
                             model_type=latest.model_type
                         )
                 finally:
-                    db.close()
+                    await db.close()
             except Exception:
                 pass
         
@@ -2949,25 +3120,35 @@ async def get_latest_fouling_fallback(vessel_id: str):
 @app.get("/api/vessels/{vessel_id}/fouling", response_model=List[FoulingDataResponse])
 async def get_fouling_history_fallback(
     vessel_id: str,
-    days: int = Query(90, ge=1, le=365)
+    response: Response,
+    days: int = Query(90, ge=1, le=365),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (header X-Next-Cursor)")
 ):
     """
     Obtém histórico de predições de bioincrustação (fallback para IDs mock).
+    
+    Paginação por cursor: repetir a chamada (mesmos filtros) com o valor do
+    header X-Next-Cursor até ele não vir mais.
     """
+    validate_cursor(cursor)
+    
     try:
         # Tentar buscar do banco de dados
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import FoulingDataRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncFoulingDataRepository
                 from datetime import timedelta
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
                     start_date = datetime.now() - timedelta(days=days)
-                    history = FoulingDataRepository.get_by_vessel(db, vessel_id, start_date=start_date)
-                    if history:
-                        return [
+                    page = await AsyncFoulingDataRepository.get_page_by_vessel(
+                        db, vessel_id, cursor=cursor, start_date=start_date, limit=limit
+                    )
+                    if page.items:
+                        items = [
                             FoulingDataResponse(
                                 id=f.id,
                                 vessel_id=f.vessel_id,
@@ -2980,10 +3161,13 @@ async def get_fouling_history_fallback(
                                 predicted_co2_impact_kg=f.predicted_co2_impact_kg,
                                 model_type=f.model_type
                             )
-                            for f in history
+                            for f in page.items
                         ]
+                        if page.next_cursor:
+                            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+                        return items
                 finally:
-                    db.close()
+                    await db.close()
             except Exception:
                 pass
         
@@ -3219,6 +3403,7 @@ async def initialize_transpetro_fleet():
 
 
 @app.get("/api/transpetro/fleet/statistics", response_model=Dict)
+@cached_response("transpetro:fleet-statistics")
 async def get_fleet_statistics_endpoint():
     """
     Retorna estatísticas agregadas da frota Transpetro.
@@ -3311,6 +3496,12 @@ async def predict_advanced_fouling_endpoint(
     Inclui análise de espécies invasoras e recomendações de controle natural.
     """
     try:
+        from ..models.advanced_fouling_prediction import (
+            predict_advanced_fouling,
+            AdvancedVesselFeatures,
+            AdvancedFoulingPrediction
+        )
+        
         # Converter para AdvancedVesselFeatures com valores padrão
         try:
             advanced_features = AdvancedVesselFeatures(
@@ -3342,7 +3533,9 @@ async def predict_advanced_fouling_endpoint(
         
         # Predição avançada
         try:
-            prediction = predict_advanced_fouling(advanced_features)
+            prediction = await run_inference(ML_EXECUTOR, predict_advanced_fouling, advanced_features)
+        except HTTPException:
+            raise
         except Exception as pred_error:
             # Se a predição falhar, retornar erro mais detalhado
             import traceback
@@ -3492,39 +3685,6 @@ async def list_invasive_species():
 
 # ==================== ENDPOINTS DE GESTÃO DE FROTA (DASHBOARD) ====================
 
-def calculate_fr_level(fouling_mm: float, roughness_um: float) -> int:
-    """
-    Calcula nível FR (Fouling Risk) baseado em espessura e rugosidade.
-    
-    FR 0: Limpo (Sem incrustação) - fouling < 1mm
-    FR 1: Microincrustação - 1mm <= fouling < 3mm
-    FR 2: Macro Leve (Alerta) - 3mm <= fouling < 4mm
-    FR 3: Macro Moderada - 4mm <= fouling < 5mm
-    FR 4: Macro Pesada (Crítico) - fouling >= 5mm
-    """
-    if fouling_mm < 1.0:
-        return 0
-    elif fouling_mm < 3.0:
-        return 1
-    elif fouling_mm < 4.0:
-        return 2
-    elif fouling_mm < 5.0:
-        return 3
-    else:
-        return 4
-
-
-def calculate_performance_loss(fouling_mm: float, roughness_um: float) -> float:
-    """
-    Calcula perda de performance (resistência adicional) em %.
-    Baseado em modelos empíricos de resistência hidrodinâmica.
-    """
-    # Fórmula simplificada baseada em estudos de resistência
-    thickness_impact = (fouling_mm / 5.0) * 15.0  # Até 15% por 5mm
-    roughness_impact = ((roughness_um - 100.0) / 400.0) * 10.0  # Até 10% por 500um
-    return min(50.0, max(0.0, thickness_impact + roughness_impact))
-
-
 class FleetSummaryResponse(BaseModel):
     monitored_vessels: int
     average_additional_consumption_percent: float
@@ -3557,6 +3717,7 @@ class FleetDetailedStatusResponse(BaseModel):
 
 
 @app.get("/api/fleet/summary", response_model=FleetSummaryResponse)
+@cached_response("fleet:summary")
 async def get_fleet_summary():
     """
     Retorna sumário da frota: navios monitorados, consumo adicional médio, distribuição FR.
@@ -3564,29 +3725,21 @@ async def get_fleet_summary():
     try:
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import VesselRepository, FoulingDataRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncFleetStateRepository
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    all_vessels = VesselRepository.get_all(db, limit=1000)
-                    active_vessels = [v for v in all_vessels if v.status == "active"]
+                    active_states = await AsyncFleetStateRepository.get_all(db, status="active")
                     
                     fr_counts = {0: 0, 1: 0, 2: 0, 3: 0, 4: 0}
                     total_consumption_impact = 0.0
                     vessels_with_data = 0
                     
-                    for vessel in active_vessels:
-                        latest_fouling = FoulingDataRepository.get_latest(db, vessel.id)
-                        
-                        if latest_fouling:
-                            fouling_mm = latest_fouling.estimated_thickness_mm or 0.0
-                            roughness_um = latest_fouling.estimated_roughness_um or 0.0
-                            fr_level = calculate_fr_level(fouling_mm, roughness_um)
-                            fr_counts[fr_level] = fr_counts.get(fr_level, 0) + 1
-                            
-                            performance_loss = calculate_performance_loss(fouling_mm, roughness_um)
-                            total_consumption_impact += performance_loss
+                    for state in active_states:
+                        if state.fouling_timestamp:
+                            fr_counts[state.fr_level] = fr_counts.get(state.fr_level, 0) + 1
+                            total_consumption_impact += state.performance_loss_percent
                             vessels_with_data += 1
                         else:
                             # Sem dados, assumir FR 1 (microincrustação leve)
@@ -3598,7 +3751,7 @@ async def get_fleet_summary():
                     )
                     
                     return FleetSummaryResponse(
-                        monitored_vessels=len(active_vessels),
+                        monitored_vessels=len(active_states),
                         average_additional_consumption_percent=round(avg_consumption, 1),
                         fr_distribution={
                             "FR 0": fr_counts[0],
@@ -3609,7 +3762,7 @@ async def get_fleet_summary():
                         last_update=datetime.now().isoformat()
                     )
                 finally:
-                    db.close()
+                    await db.close()
             except Exception as db_error:
                 print(f"⚠️  Erro ao buscar sumário da frota: {db_error}")
         
@@ -3630,6 +3783,7 @@ async def get_fleet_summary():
 
 
 @app.get("/api/fleet/detailed-status", response_model=FleetDetailedStatusResponse)
+@cached_response("fleet:detailed-status")
 async def get_fleet_detailed_status():
     """
     Retorna status detalhado de cada navio com FR, perda de performance, alertas, etc.
@@ -3637,155 +3791,59 @@ async def get_fleet_detailed_status():
     try:
         if DB_AVAILABLE:
             try:
-                from ..database import SessionLocal
-                from ..database.repositories import (
-                    VesselRepository, FoulingDataRepository, MaintenanceEventRepository
+                from ..database import AsyncSessionLocal
+                from ..database.repositories import AsyncFleetStateRepository
+                from ..services.fleet_state_service import (
+                    FR_LABELS,
+                    DEFAULT_FOULING_MM,
+                    DEFAULT_ROUGHNESS_UM,
+                    fleet_alert
                 )
-                from ..models.normam401_risk import predict_normam401_risk
-                from ..models.fouling_prediction import VesselFeatures
                 
-                db = SessionLocal()
+                db = AsyncSessionLocal()
                 try:
-                    all_vessels = VesselRepository.get_all(db, limit=1000)
-                    active_vessels = [v for v in all_vessels if v.status == "active"]
+                    active_states = await AsyncFleetStateRepository.get_all(db, status="active")
+                    
+                    # Calibração sensor (simulado - em produção viria de tabela específica)
+                    sensor_calibration_date = (
+                        (datetime.now() - timedelta(days=120)).strftime("%Y-%m-%d")
+                    )
                     
                     detailed_statuses = []
                     
-                    for vessel in active_vessels:
-                        # Buscar última predição de bioincrustação
-                        latest_fouling = FoulingDataRepository.get_latest(db, vessel.id)
-                        
-                        if latest_fouling:
-                            fouling_mm = latest_fouling.estimated_thickness_mm or 0.0
-                            roughness_um = latest_fouling.estimated_roughness_um or 0.0
+                    for state in active_states:
+                        if state.fouling_timestamp:
+                            fouling_mm = state.fouling_mm or 0.0
+                            roughness_um = state.roughness_um or 0.0
                         else:
                             # Valores padrão
-                            fouling_mm = 3.5
-                            roughness_um = 350.0
-                        
-                        # Calcular FR
-                        fr_level = calculate_fr_level(fouling_mm, roughness_um)
-                        fr_labels = {
-                            0: "Sem Incrustação",
-                            1: "Micro Incrustação",
-                            2: "Macro Leve",
-                            3: "Macro Moderada",
-                            4: "Macro Pesada"
-                        }
-                        
-                        # Calcular perda de performance
-                        performance_loss = calculate_performance_loss(fouling_mm, roughness_um)
-                        
-                        # Buscar última limpeza
-                        last_cleaning = None
-                        try:
-                            last_cleaning = MaintenanceEventRepository.get_latest_by_type(
-                                db, vessel.id, "cleaning"
-                            )
-                        except:
-                            pass
-                        last_cleaning_date = (
-                            last_cleaning.start_date.strftime("%Y-%m-%d") 
-                            if last_cleaning and last_cleaning.start_date else None
-                        )
+                            fouling_mm = DEFAULT_FOULING_MM
+                            roughness_um = DEFAULT_ROUGHNESS_UM
                         
-                        # Buscar última pintura
-                        last_painting = None
-                        try:
-                            last_painting = MaintenanceEventRepository.get_latest_by_type(
-                                db, vessel.id, "painting"
-                            )
-                        except:
-                            pass
-                        last_painting_date = (
-                            last_painting.start_date.strftime("%Y-%m-%d")
-                            if last_painting and last_painting.start_date else (
-                                vessel.paint_application_date.strftime("%Y-%m-%d")
-                                if vessel.paint_application_date else None
-                            )
-                        )
-                        
-                        # Calibração sensor (simulado - em produção viria de tabela específica)
-                        sensor_calibration_date = (
-                            (datetime.now() - timedelta(days=120)).strftime("%Y-%m-%d")
-                        )
-                        
-                        # Predizer risco 15 e 30 dias
-                        try:
-                            time_since_cleaning = 90
-                            if last_cleaning and last_cleaning.start_date:
-                                time_since_cleaning = (datetime.now() - last_cleaning.start_date).days
-                            
-                            vessel_features = VesselFeatures(
-                                vessel_id=vessel.id,
-                                time_since_cleaning_days=time_since_cleaning,
-                                water_temperature_c=25.0,
-                                salinity_psu=35.0,
-                                time_in_port_hours=48.0,
-                                average_speed_knots=vessel.typical_speed_knots or 12.0,
-                                route_region="Brazil_Coast",
-                                paint_type=vessel.paint_type or "AFS",
-                                vessel_type=vessel.vessel_type or "tanker",
-                                hull_area_m2=vessel.hull_area_m2 or 5000.0
-                            )
-                            
-                            risk_15 = predict_normam401_risk(
-                                vessel.id, vessel_features, days_ahead=15,
-                                current_fouling_mm=fouling_mm,
-                                current_roughness_um=roughness_um
-                            )
-                            risk_30 = predict_normam401_risk(
-                                vessel.id, vessel_features, days_ahead=30,
-                                current_fouling_mm=fouling_mm,
-                                current_roughness_um=roughness_um
-                            )
-                            
-                            risk_15_fr = calculate_fr_level(
-                                risk_15.predicted_fouling_mm,
-                                risk_15.predicted_roughness_um
-                            )
-                            risk_30_fr = calculate_fr_level(
-                                risk_30.predicted_fouling_mm,
-                                risk_30.predicted_roughness_um
-                            )
-                        except:
-                            # Fallback se predição falhar
-                            risk_15_fr = fr_level
-                            risk_30_fr = min(4, fr_level + 1)
-                        
-                        # Gerar alerta
-                        alert_message = None
-                        alert_type = None
-                        
-                        if fr_level >= 4:
-                            alert_message = f"CRÍTICO: FR {fr_level}. Docagem a Seco Reativa urgente."
-                            alert_type = "critical"
-                        elif fr_level == 3 or risk_30_fr >= 3:
-                            alert_message = f"Proximidade FR 3 em 30 dias. Limpeza Reativa necessária."
-                            alert_type = "warning"
-                        elif fr_level == 0:
-                            alert_message = "Sem incrustação. Limpeza Proativa recomendada em 30 dias."
-                            alert_type = "info"
-                        
-                        # ID curto do navio (extrair do nome ou usar IMO)
-                        vessel_id_short = vessel.call_sign or vessel.imo_number[-6:] if vessel.imo_number else vessel.id[:6]
+                        alert_message, alert_type = fleet_alert(state.fr_level, state.risk_30_fr)
                         
                         detailed_statuses.append(
                             VesselDetailedStatus(
-                                id=vessel.id,
-                                name=vessel.name,
-                                vessel_id=vessel_id_short,
-                                vessel_class=vessel.vessel_class,
-                                fr_level=fr_level,
-                                fr_label=fr_labels[fr_level],
-                                performance_loss_percent=round(performance_loss, 1),
+                                id=state.vessel_id,
+                                name=state.vessel_name,
+                                vessel_id=state.short_id,
+                                vessel_class=state.vessel_class,
+                                fr_level=state.fr_level,
+                                fr_label=FR_LABELS[state.fr_level],
+                                performance_loss_percent=round(state.performance_loss_percent, 1),
                                 fouling_mm=round(fouling_mm, 2),
                                 roughness_um=round(roughness_um, 1),
-                                last_cleaning_date=last_cleaning_date,
-                                last_painting_date=last_painting_date,
+                                last_cleaning_date=(
+                                    state.last_cleaning_date.strftime("%Y-%m-%d")
+                                    if state.last_cleaning_date else None
+                                ),
+                                last_painting_date=(
+                                    state.last_painting_date.strftime("%Y-%m-%d")
+                                    if state.last_painting_date else None
+                                ),
                                 sensor_calibration_date=sensor_calibration_date,
-                                risk_15_days=risk_15_fr,
-                                risk_30_days=risk_30_fr,
+                                risk_15_days=state.risk_15_fr,
+                                risk_30_days=state.risk_30_fr,
                                 alert_message=alert_message,
                                 alert_type=alert_type
                             )
@@ -3796,7 +3854,7 @@ async def get_fleet_detailed_status():
                         last_update=datetime.now().isoformat()
                     )
                 finally:
-                    db.close()
+                    await db.close()
             except Exception as db_error:
                 print(f"⚠️  Erro ao buscar status detalhado: {db_error}")
                 import traceback
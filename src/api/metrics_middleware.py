@@ -0,0 +1,70 @@
+"""
+Middleware de Métricas - HullZero
+
+Middleware ASGI que mede cada requisição (latência, consultas e tempo de
+banco, inferência) e adiciona o header Server-Timing, exibido na aba
+Network das ferramentas de desenvolvedor do navegador:
+
+    Server-Timing: db;dur=12.4;desc="3 queries", inference;dur=85.0, app;dur=104.2
+
+`app` é o tempo até o início da resposta. As métricas agregadas ficam em
+/metrics (services/metrics_service.py).
+"""
+
+from typing import Optional
+
+from starlette.routing import Match
+
+from ..services.metrics_service import (
+    HTTP_IN_FLIGHT,
+    begin_request,
+    end_request,
+    record_request
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Registra métricas por rota (modelo do path, não a URL concreta)"""
+
+    def __init__(self, app, timing_allow_origin: Optional[str] = None):
+        self.app = app
+        self.timing_allow_origin = timing_allow_origin
+
+    def _route_template(self, scope) -> str:
+        route = scope.get("route")
+        if route is None:
+            # Starlette antigo não expõe a rota no scope
+            for candidate in getattr(scope.get("app"), "routes", ()):
+                if candidate.matches(scope)[0] == Match.FULL:
+                    route = candidate
+                    break
+        return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = begin_request(scope)
+        status_code = 500
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.server_timing().encode("latin-1")))
+                if self.timing_allow_origin:
+                    headers.append((b"timing-allow-origin", self.timing_allow_origin.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            record_request(scope["method"], self._route_template(scope), status_code, timing)
+            end_request(token)
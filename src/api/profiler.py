@@ -0,0 +1,258 @@
+"""
+Profiler por Requisição - HullZero
+
+Perfil de requisições individuais em produção, sem redeploy. Ativado com
+PROFILING_ENABLED=true; desligado, o middleware nem é instalado.
+
+Uma requisição é perfilada quando:
+- traz o header `X-Profile: 1` e o token Bearer de um usuário com a
+  permissão manage_system (mesma verificação de require_permission); ou
+- é sorteada pela taxa de amostragem PROFILE_SAMPLE_RATE (0.0 a 1.0).
+
+Durante a requisição um thread amostra as pilhas de todas as threads do
+processo a cada PROFILE_INTERVAL_MS (event loop e threadpool, onde rodam
+os endpoints síncronos e as consultas). Threads ociosas são descartadas.
+Em requisições simultâneas, o trabalho das outras também aparece no
+perfil: é o retrato do processo enquanto a requisição rodava.
+
+O resultado é gravado em PROFILE_DIR no formato "collapsed stacks"
+(`<perfil>.collapsed`, abrir em https://www.speedscope.app ou com
+flamegraph.pl) com metadados em `<perfil>.json`. A resposta perfilada
+traz o header X-Profile-Id. Listagem e download em /api/admin/profiles.
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+PROFILE_ID_PATTERN = re.compile(r"^[\w.-]+$")
+
+# (arquivo, função) do frame mais interno de uma thread parada esperando trabalho
+_IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+
+def _short_path(filename: str) -> str:
+    """Caminho a partir de site-packages/ ou src/ (demais: só o nome do arquivo)"""
+    position = filename.rfind(os.sep + "site-packages" + os.sep)
+    if position >= 0:
+        return filename[position + len("site-packages") + 2:]
+    position = filename.rfind(os.sep + "src" + os.sep)
+    if position >= 0:
+        return filename[position + 1:]
+    return os.path.basename(filename)
+
+
+class SamplingProfiler:
+    """Amostra as pilhas de todas as threads em intervalos fixos"""
+
+    def __init__(self, interval_seconds: float = 0.005):
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.duration_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="hullzero-profiler", daemon=True)
+        self._started_at = 0.0
+
+    def start(self):
+        self._started_at = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.duration_seconds = time.perf_counter() - self._started_at
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        labels: Dict[tuple, str] = {}
+        thread_names: Dict[int, str] = {}
+        while not self._stop.wait(self.interval_seconds):
+            frames = sys._current_frames()
+            if frames.keys() - thread_names.keys():
+                thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in frames.items():
+                if ident == own_ident:
+                    continue
+                code = frame.f_code
+                if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    key = (code.co_filename, code.co_name, code.co_firstlineno)
+                    label = labels.get(key)
+                    if label is None:
+                        label = labels[key] = (
+                            f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+                        ).replace(";", ":")
+                    stack.append(label)
+                    frame = frame.f_back
+                stack.append(thread_names.get(ident, f"thread-{ident}"))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """Pilhas no formato collapsed (`raiz;...;folha contagem`)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+# ==================== ARMAZENAMENTO ====================
+
+def save_profile(directory: str, profile_id: str, profiler: SamplingProfiler, metadata: Dict, max_files: int):
+    """Grava o perfil e seus metadados; mantém apenas os max_files mais recentes"""
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    (path / f"{profile_id}.collapsed").write_text(profiler.collapsed(), encoding="utf-8")
+    metadata = {
+        **metadata,
+        "id": profile_id,
+        "duration_ms": round(profiler.duration_seconds * 1000, 1),
+        "samples": profiler.samples,
+        "interval_ms": profiler.interval_seconds * 1000,
+    }
+    (path / f"{profile_id}.json").write_text(json.dumps(metadata, ensure_ascii=False), encoding="utf-8")
+
+    stored = sorted(path.glob("*.json"), key=lambda item: item.stat().st_mtime, reverse=True)
+    for old in stored[max(1, max_files):]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".collapsed").unlink(missing_ok=True)
+
+
+def list_profiles(directory: str, limit: int = 100) -> List[Dict]:
+    """Metadados dos perfis gravados, do mais recente ao mais antigo"""
+    path = Path(directory)
+    if not path.exists():
+        return []
+    stored = sorted(path.glob("*.json"), key=lambda item: item.stat().st_mtime, reverse=True)
+    profiles = []
+    for item in stored[:limit]:
+        try:
+            profiles.append(json.loads(item.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return profiles
+
+
+def profile_file(directory: str, profile_id: str) -> Optional[Path]:
+    """Caminho do .collapsed de um perfil (None se inválido ou inexistente)"""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = Path(directory) / f"{profile_id}.collapsed"
+    return path if path.is_file() else None
+
+
+# ==================== MIDDLEWARE ====================
+
+async def _is_profiling_admin(authorization: str) -> bool:
+    """Mesma verificação de require_permission(PermissionEnum.MANAGE_SYSTEM)"""
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        from fastapi import HTTPException
+        from ..auth import PermissionEnum, get_current_user, require_permission
+        from ..database import SessionLocal
+    except ImportError:
+        return False
+
+    db = SessionLocal()
+    try:
+        user = await get_current_user(token=token, db=db)
+        await require_permission(PermissionEnum.MANAGE_SYSTEM)(current_user=user, db=db)
+        return True
+    except HTTPException:
+        return False
+    finally:
+        db.close()
+
+
+class ProfilerMiddleware:
+    """Perfila requisições pedidas por administradores ou sorteadas"""
+
+    def __init__(
+        self,
+        app,
+        directory: str,
+        sample_rate: float = 0.0,
+        interval_ms: float = 5.0,
+        max_files: int = 200
+    ):
+        self.app = app
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.interval_seconds = interval_ms / 1000.0
+        self.max_files = max_files
+
+    async def _trigger(self, scope) -> Optional[str]:
+        headers = dict(scope.get("headers") or ())
+        if headers.get(b"x-profile", b"").strip() in (b"1", b"true"):
+            authorization = headers.get(b"authorization", b"").decode("latin-1")
+            if await _is_profiling_admin(authorization):
+                return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        trigger = await self._trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        started = datetime.now()
+        profile_id = f"{started:%Y%m%d-%H%M%S}-{scope['method'].lower()}-{uuid.uuid4().hex[:8]}"
+        status_code = 500
+
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+                }
+            await send(message)
+
+        profiler = SamplingProfiler(self.interval_seconds)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            route = getattr(scope.get("route"), "path", None)
+            metadata = {
+                "created_at": started.isoformat(),
+                "method": scope["method"],
+                "path": scope["path"],
+                "query_string": scope.get("query_string", b"").decode("latin-1"),
+                "route": route,
+                "status": status_code,
+                "trigger": trigger,
+            }
+            try:
+                await run_in_threadpool(
+                    save_profile, self.directory, profile_id, profiler, metadata, self.max_files
+                )
+            except OSError as e:
+                print(f"⚠️  Não foi possível gravar o perfil {profile_id}: {e}")
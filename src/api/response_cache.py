@@ -0,0 +1,317 @@
+"""
+Cache de Respostas - HullZero
+
+Cache das respostas dos endpoints agregados (KPIs, tendências, status e
+sumário da frota). Esses dados só mudam quando chegam novos dados de
+bioincrustação, operação ou manutenção, mas eram recalculados a cada
+atualização de cada aba do dashboard.
+
+- Chave: endpoint + parâmetros da requisição.
+- Backends: LRU em memória com TTL (padrão, por processo) ou Redis
+  (compartilhado entre workers). Qualquer cliente compatível com Redis
+  (get/set/scan_iter/delete) pode ser usado, via set_response_cache_backend.
+- Invalidação na escrita: commits que alteram Vessel, FoulingData,
+  OperationalData, MaintenanceEvent ou FleetState (incluindo
+  FoulingDataRepository.create e MaintenanceEventRepository.create) limpam
+  o cache, assim como os endpoints de escrita em memória. Escritas feitas
+  em outros processos sem Redis ficam limitadas pelo TTL.
+- Coalescência: requisições simultâneas com a mesma chave ausente aguardam
+  uma única execução do endpoint. Após uma invalidação, novas requisições
+  não se juntam a execuções iniciadas antes dela (podem ter lido dados
+  antigos) e disparam um novo cálculo.
+
+Uso:
+    @app.get("/api/dashboard/kpis")
+    @cached_response("dashboard:kpis")
+    async def get_dashboard_kpis(period: str = "6_months"):
+        ...
+"""
+
+import asyncio
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from ..config import (
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_BACKEND,
+    RESPONSE_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    REDIS_HOST,
+    REDIS_PORT,
+    REDIS_DB,
+    REDIS_PASSWORD
+)
+
+
+class MemoryCacheBackend:
+    """LRU em memória com TTL por entrada"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> Optional[int]:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Backend compartilhado em um servidor Redis (valores em JSON)"""
+
+    name = "redis"
+
+    def __init__(self, client, prefix: str = "hullzero:response:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        self.client.set(self.prefix + key, json.dumps(value), ex=max(1, int(ttl_seconds)))
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class ResponseCache:
+    """Cache com coalescência de misses simultâneos e contadores"""
+
+    def __init__(self, backend, ttl_seconds: float = 60.0):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        # Cálculos em andamento por (chave, geração): após invalidate() os
+        # novos pedidos não aguardam um cálculo iniciado com dados antigos
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "invalidations": 0,
+            "backend_errors": 0,
+        }
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _backend_get(self, key: str) -> Optional[Any]:
+        try:
+            return self.backend.get(key)
+        except Exception:
+            # Backend indisponível: tratar como miss
+            self._count("backend_errors")
+            return None
+
+    async def _compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: float,
+        generation: int
+    ) -> Any:
+        value = jsonable_encoder(await compute())
+        # Invalidação durante o cálculo: o resultado pode estar defasado
+        if generation == self._generation:
+            try:
+                self.backend.set(key, value, ttl_seconds)
+            except Exception:
+                self._count("backend_errors")
+        return value
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None
+    ) -> Any:
+        """Retorna o valor em cache ou executa compute() uma única vez por chave"""
+        value = self._backend_get(key)
+        if value is not None:
+            self._count("hits")
+            return value
+
+        generation = self._generation
+        inflight_key = (key, generation)
+        task = self._inflight.get(inflight_key)
+        if task is not None:
+            self._count("coalesced")
+        else:
+            self._count("misses")
+            task = asyncio.ensure_future(self._compute(
+                key, compute, ttl_seconds or self.ttl_seconds, generation
+            ))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _task: self._inflight.pop(inflight_key, None))
+        # shield: o cancelamento de um cliente não cancela o cálculo dos demais
+        return await asyncio.shield(task)
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._counters["invalidations"] += 1
+        try:
+            self.backend.clear()
+        except Exception:
+            self._count("backend_errors")
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"] + counters["coalesced"]
+        return {
+            "backend": self.backend.name,
+            "ttl_seconds": self.ttl_seconds,
+            "entries": self.backend.size(),
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+def _build_backend():
+    if RESPONSE_CACHE_BACKEND == "redis":
+        try:
+            import redis
+            client = redis.Redis(
+                host=REDIS_HOST,
+                port=REDIS_PORT,
+                db=REDIS_DB,
+                password=REDIS_PASSWORD or None,
+                socket_timeout=0.5
+            )
+            client.ping()
+            return RedisCacheBackend(client)
+        except Exception as e:
+            print(f"⚠️  Redis indisponível para o cache de respostas ({e}). Usando cache em memória.")
+    return MemoryCacheBackend(RESPONSE_CACHE_MAX_ENTRIES)
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Cache compartilhado pelo processo (None se desabilitado)"""
+    global _response_cache
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache(_build_backend(), RESPONSE_CACHE_TTL_SECONDS)
+    return _response_cache
+
+
+def set_response_cache_backend(backend) -> Optional[ResponseCache]:
+    """Troca o backend (ex.: um cliente compatível com Redis em testes)"""
+    cache = get_response_cache()
+    if cache is not None:
+        cache.backend = backend
+    return cache
+
+
+def invalidate_response_cache():
+    """Descarta todas as respostas em cache (chamado após escritas)"""
+    if _response_cache is not None:
+        _response_cache.invalidate()
+
+
+def response_cache_status() -> Dict[str, Any]:
+    """Contadores do cache (para o /health)"""
+    if _response_cache is None:
+        return {"enabled": RESPONSE_CACHE_ENABLED}
+    return {"enabled": True, **_response_cache.status()}
+
+
+def cache_key(namespace: str, params: Dict[str, Any]) -> str:
+    """Chave estável: namespace + parâmetros ordenados"""
+    if not params:
+        return namespace
+    return namespace + "?" + "&".join(f"{name}={params[name]}" for name in sorted(params))
+
+
+def cached_response(namespace: str, ttl_seconds: Optional[float] = None):
+    """
+    Decorator para handlers async cujos parâmetros são todos de query/path.
+    A resposta é guardada em formato JSON (jsonable_encoder).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            cache = get_response_cache()
+            if cache is None:
+                return await fn(*args, **kwargs)
+            return await cache.get_or_compute(
+                cache_key(namespace, kwargs),
+                lambda: fn(*args, **kwargs),
+                ttl_seconds
+            )
+        return wrapper
+    return decorator
+
+
+# ==================== INVALIDAÇÃO NA ESCRITA ====================
+
+try:
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+    from ..database.models import Vessel, FoulingData, OperationalData, MaintenanceEvent, FleetState
+
+    _CACHED_MODELS = (Vessel, FoulingData, OperationalData, MaintenanceEvent, FleetState)
+
+    @event.listens_for(Session, "after_flush")
+    def _mark_stale(session, flush_context):
+        if any(isinstance(obj, _CACHED_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+            session.info["response_cache_stale"] = True
+
+    @event.listens_for(Session, "after_commit")
+    def _invalidate_after_commit(session):
+        if session.info.pop("response_cache_stale", False):
+            invalidate_response_cache()
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard_after_rollback(session):
+        session.info.pop("response_cache_stale", None)
+except ImportError:
+    # Sem banco de dados: apenas os endpoints de escrita em memória invalidam
+    pass
@@ -37,10 +37,40 @@ DATABASE_URL = os.getenv(
     "sqlite:///./hullzero.db"
 )
 
+
+
+def _async_database_url(url: str) -> str:
+    """URL equivalente com driver assíncrono (aiosqlite / asyncpg)"""
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    for prefix in ("postgresql+psycopg2:", "postgresql:", "postgres:"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg:" + url[len(prefix):]
+    return url
+
+
+# Engine assíncrono (handlers async da API); por padrão derivado de DATABASE_URL
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _async_database_url(DATABASE_URL))
+# Handlers de leitura via AsyncSession. Desligado por padrão: em SQLite com a
+# CPU saturada o p99 piorou (scripts/benchmark_async_api.py); ligar após medir
+# com PostgreSQL. Desligado, as mesmas consultas rodam em sessões síncronas,
+# em threads (sem bloquear o event loop).
+ASYNC_DB_ENABLED = os.getenv("ASYNC_DB_ENABLED", "false").lower() == "true"
+
 DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
 DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
 DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
 USE_TIMESCALEDB = os.getenv("USE_TIMESCALEDB", "false").lower() == "true"
+# Linhas lidas por bloco (cursor no servidor) nas exportações /api/export/*
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "5000"))
+# Log de consultas lentas (com EXPLAIN), listado em /api/admin/slow-queries
+SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "true").lower() == "true"
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true"
+SLOW_QUERY_MAX_STATEMENTS = int(os.getenv("SLOW_QUERY_MAX_STATEMENTS", "200"))
+# Séries em memória (dados operacionais e manutenção) quando não há banco
+MEMORY_STORE_MAX_ROWS_PER_VESSEL = int(os.getenv("MEMORY_STORE_MAX_ROWS_PER_VESSEL", "50000"))
+MEMORY_STORE_RETENTION_DAYS = float(os.getenv("MEMORY_STORE_RETENTION_DAYS", "90"))  # dados operacionais; 0 = sem limite
 
 # ============================================
 # Autenticação e Segurança
@@ -97,17 +127,45 @@ REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
 
+# Cache de respostas da API (dashboard/frota): "memory" (LRU por processo) ou "redis"
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower()
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+
 # ============================================
 # Logging
 # ============================================
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = os.getenv("LOG_FILE", "logs/hullzero.log")
 
+# Métricas de desempenho (/metrics no formato Prometheus + header Server-Timing)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# Profiler por requisição (header X-Profile de administradores ou amostragem)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0.0"))  # fração das requisições (0.0 a 1.0)
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles/")
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "200"))
+
 # ============================================
 # Modelos de IA/ML
 # ============================================
 ML_MODEL_PATH = os.getenv("ML_MODEL_PATH", "models/")
 ML_CACHE_ENABLED = os.getenv("ML_CACHE_ENABLED", "true").lower() == "true"
+# Intervalo (s) para verificar novas versões publicadas no registro de modelos
+ML_MODEL_REFRESH_SECONDS = float(os.getenv("ML_MODEL_REFRESH_SECONDS", "30"))
+# Carregar os modelos e subir os processos do otimizador em segundo plano após o startup (false: na primeira predição)
+ML_WARMUP_ON_STARTUP = os.getenv("ML_WARMUP_ON_STARTUP", "true").lower() == "true"
+
+# Executor de inferência (predições fora do event loop da API)
+INFERENCE_THREAD_WORKERS = int(os.getenv("INFERENCE_THREAD_WORKERS", str(min(4, os.cpu_count() or 1))))
+INFERENCE_PROCESS_WORKERS = int(os.getenv("INFERENCE_PROCESS_WORKERS", "0"))  # 0 = um por CPU
+INFERENCE_MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "32"))  # tarefas aguardando além dos workers
+INFERENCE_TIMEOUT_SECONDS = float(os.getenv("INFERENCE_TIMEOUT_SECONDS", "30"))
+# Otimizador de inspeções (Python puro): "process" ou "thread"
+INFERENCE_OPTIMIZER_EXECUTOR = os.getenv("INFERENCE_OPTIMIZER_EXECUTOR", "process").lower()
 
 # ============================================
 # Email (Opcional)
@@ -0,0 +1,63 @@
+"""
+Cursores de Paginação - HullZero
+
+Codificação dos cursores das listagens paginadas: JSON em base64 (urlsafe)
+com os valores de ordenação da última linha da página, opaco para o
+cliente. Sem dependência de banco: usado pelos repositórios SQLAlchemy
+(src/database/pagination.py) e pelo armazenamento em memória
+(src/services/memory_store.py), que assim aceitam os mesmos cursores.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class InvalidCursor(ValueError):
+    """Cursor malformado ou de outro tipo de listagem"""
+
+
+@dataclass
+class Page(Generic[T]):
+    """Uma página de resultados e o cursor da próxima (None na última)"""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str, size: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise InvalidCursor("Cursor inválido")
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor("Cursor inválido")
+    return values
+
+
+def decode_time_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Cursor de séries temporais: (timestamp, id) da última linha"""
+    timestamp, row_id = _decode(cursor, 2)
+    try:
+        return datetime.fromisoformat(timestamp), str(row_id)
+    except (TypeError, ValueError):
+        raise InvalidCursor("Cursor inválido")
+
+
+def decode_id_cursor(cursor: str) -> str:
+    """Cursor por chave primária: id da última linha"""
+    (row_id,) = _decode(cursor, 1)
+    return str(row_id)
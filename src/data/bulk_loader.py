@@ -0,0 +1,301 @@
+"""
+Carga em Lote - HullZero
+
+Leitura de CSV em blocos e escrita em lote para importações grandes
+(AIS, consumo, eventos). Substitui o padrão de um add/commit/refresh por
+linha usado pelos repositórios:
+
+- PostgreSQL: COPY ... FROM STDIN (psycopg2)
+- SQLite e demais bancos: executemany via insert() do SQLAlchemy Core
+
+Cada lote é gravado e confirmado em sua própria transação, de modo que
+arquivos com milhões de linhas não mantêm uma transação gigante aberta.
+
+Com `conflict_columns` a inserção ignora linhas que já existem (ON CONFLICT
+DO NOTHING sobre um índice único), tornando reimportações idempotentes. No
+PostgreSQL o COPY vai para uma tabela temporária e segue por
+INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+# Linhas lidas do CSV por bloco
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Linhas gravadas por transação
+DEFAULT_BATCH_SIZE = 10_000
+
+# Formato de DateTime do SQLAlchemy no SQLite (ver write_frame)
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def detect_delimiter(csv_path: str, encoding: str = 'utf-8') -> str:
+    """Detecta o delimitador pela primeira linha (',' ou ';')"""
+    with open(csv_path, 'r', encoding=encoding) as f:
+        first_line = f.readline()
+    return ',' if ',' in first_line else ';'
+
+
+def read_csv_chunks(
+    csv_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = 'utf-8',
+    delimiter: Optional[str] = None,
+    usecols: Optional[List[int]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Lê um CSV em blocos de `chunk_size` linhas.
+
+    Todas as colunas são lidas como texto (células vazias = ''); a
+    conversão de tipos é feita por coluna, de forma vetorizada, por quem
+    consome os blocos. `delimiter` e `usecols` normalmente vêm do plano de
+    colunas do arquivo (ver column_plan).
+    """
+    return pd.read_csv(
+        csv_path,
+        sep=delimiter or detect_delimiter(csv_path, encoding),
+        dtype=str,
+        keep_default_na=False,
+        usecols=usecols,
+        chunksize=chunk_size,
+        encoding=encoding
+    )
+
+
+def frame_to_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Converte um DataFrame em lista de dicts prontos para inserção.
+
+    NaN/NaT viram None e datetimes viram datetime do Python.
+    """
+    names = list(frame.columns)
+    columns = []
+    for name in names:
+        series = frame[name]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = np.array(series.dt.to_pydatetime(), dtype=object)
+        else:
+            values = series.to_numpy(dtype=object)
+        values[series.isna().to_numpy()] = None
+        columns.append(values)
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+class BulkInserter:
+    """
+    Acumula linhas (dicts) de uma tabela e grava em lotes.
+
+    Uso:
+        with BulkInserter(db, OperationalData) as writer:
+            writer.extend(rows)
+        print(writer.total, writer.inserted)
+
+    `total` conta as linhas gravadas (enviadas ao banco); `inserted`, as
+    efetivamente inseridas (menor que `total` quando `conflict_columns`
+    descarta duplicatas).
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        model,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        conflict_columns: Optional[Sequence[str]] = None
+    ):
+        self.db = db
+        self.table = model.__table__
+        self.batch_size = batch_size
+        self.conflict_columns = list(conflict_columns) if conflict_columns else None
+        self.total = 0
+        self.inserted = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._dialect = db.get_bind().dialect.name
+        self._use_copy = self._dialect == "postgresql"
+
+    @property
+    def count(self) -> int:
+        """Linhas recebidas até agora (gravadas + pendentes)"""
+        return self.total + len(self._pending)
+
+    def add(self, row: Dict[str, Any]):
+        self.extend([row])
+
+    def extend(self, rows: Iterable[Dict[str, Any]]):
+        self._pending.extend(rows)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Grava e confirma as linhas pendentes (em transações de até batch_size linhas)"""
+        while self._pending:
+            rows = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            try:
+                if self._use_copy:
+                    inserted = self._copy(rows)
+                else:
+                    inserted = self.db.execute(self._insert_statement(), rows).rowcount
+                self.db.commit()
+            except Exception:
+                self._pending = []
+                self.db.rollback()
+                raise
+            self.total += len(rows)
+            self.inserted += inserted if inserted is not None and inserted >= 0 else len(rows)
+
+    def write_frame(self, frame: pd.DataFrame):
+        """
+        Grava um DataFrame (colunas com os nomes das colunas da tabela).
+
+        No PostgreSQL (COPY), com conflict_columns ou em drivers de parâmetros
+        nomeados, segue por extend(frame_to_records(frame)). Nos demais
+        (SQLite), as colunas são convertidas de uma vez, com os mesmos bind
+        processors que o SQLAlchemy aplicaria linha a linha, e gravadas por
+        executemany direto no driver, sem um dict por linha.
+        """
+        dialect = self.db.get_bind().dialect
+        if self._use_copy or self.conflict_columns or not dialect.positional:
+            self.extend(frame_to_records(frame))
+            return
+        self.flush()
+        if frame.empty:
+            return
+
+        columns = [
+            c for c in self.table.columns
+            if c.key in frame.columns or (c.default is not None and (c.default.is_scalar or c.default.is_callable))
+        ]
+        statement = str(insert(self.table).compile(dialect=dialect, column_keys=[c.key for c in columns]))
+        for start in range(0, len(frame), self.batch_size):
+            block = frame.iloc[start:start + self.batch_size]
+            values = [self._frame_column_values(column, block, dialect) for column in columns]
+            try:
+                self.db.connection().exec_driver_sql(statement, list(zip(*values)))
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            self.total += len(block)
+            self.inserted += len(block)
+
+    @staticmethod
+    def _frame_column_values(column, frame: pd.DataFrame, dialect) -> List[Any]:
+        """Valores de uma coluna do DataFrame já convertidos para o driver"""
+        processor = column.type.dialect_impl(dialect).bind_processor(dialect)
+        if column.key not in frame.columns:
+            default = column.default
+            if default.is_callable:
+                values = [default.arg(None) for _ in range(len(frame))]
+            else:
+                values = [default.arg] * len(frame)
+            return [processor(value) for value in values] if processor else values
+
+        series = frame[column.key]
+        missing = series.isna().to_numpy()
+        is_datetime = pd.api.types.is_datetime64_any_dtype(series)
+        if is_datetime and dialect.name == "sqlite" and processor is not None:
+            # DATETIME do SQLite é texto: formatar em lote, conferindo com o processor
+            values = series.dt.strftime(SQLITE_DATETIME_FORMAT).to_numpy(dtype=object)
+            present = np.flatnonzero(~missing)
+            if not len(present) or values[present[0]] == processor(series.iloc[present[0]].to_pydatetime()):
+                processor = None
+            else:
+                values = np.array(series.dt.to_pydatetime(), dtype=object)
+        elif is_datetime:
+            values = np.array(series.dt.to_pydatetime(), dtype=object)
+        else:
+            values = series.to_numpy(dtype=object)
+        values[missing] = None
+        if processor is not None:
+            return [processor(value) if value is not None else None for value in values]
+        return values.tolist()
+
+    def __enter__(self) -> "BulkInserter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._pending = []
+
+    def _columns(self, rows: List[Dict[str, Any]]) -> list:
+        """Colunas gravadas: presentes nas linhas ou com default no modelo"""
+        keys = rows[0].keys()
+        return [c for c in self.table.columns if c.key in keys or c.default is not None]
+
+    @staticmethod
+    def _column_values(column, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Valores de uma coluna para todas as linhas (aplicando o default do modelo)"""
+        default = column.default
+        if default is None:
+            return [row.get(column.key) for row in rows]
+        if default.is_callable:
+            return [
+                row[column.key] if column.key in row else default.arg(None)
+                for row in rows
+            ]
+        return [row.get(column.key, default.arg) for row in rows]
+
+    def _insert_statement(self):
+        """insert() do Core, com ON CONFLICT DO NOTHING se houver conflict_columns"""
+        if not self.conflict_columns:
+            return insert(self.table)
+        if self._dialect == "sqlite":
+            return sqlite.insert(self.table).on_conflict_do_nothing(index_elements=self.conflict_columns)
+        if self._dialect == "postgresql":
+            return postgresql.insert(self.table).on_conflict_do_nothing(index_elements=self.conflict_columns)
+        raise ValueError(f"conflict_columns não suportado no dialeto {self._dialect}")
+
+    def _copy(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        COPY FROM STDIN (PostgreSQL); defaults das colunas são aplicados aqui.
+
+        Returns:
+            Linhas inseridas
+        """
+        columns = self._columns(rows)
+        values = [
+            [json.dumps(v) if isinstance(v, (dict, list)) else v for v in self._column_values(c, rows)]
+            for c in columns
+        ]
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(zip(*values))
+        buffer.seek(0)
+
+        column_list = ", ".join(f'"{c.name}"' for c in columns)
+        dbapi_connection = self.db.connection().connection
+        with dbapi_connection.cursor() as cursor:
+            if not self.conflict_columns:
+                cursor.copy_expert(
+                    f'COPY "{self.table.name}" ({column_list}) FROM STDIN WITH (FORMAT csv)',
+                    buffer
+                )
+                return len(rows)
+
+            staging = f"{self.table.name}_staging"
+            conflict_list = ", ".join(f'"{name}"' for name in self.conflict_columns)
+            cursor.execute(
+                f'CREATE TEMP TABLE IF NOT EXISTS "{staging}" '
+                f'(LIKE "{self.table.name}" INCLUDING DEFAULTS) ON COMMIT DELETE ROWS'
+            )
+            cursor.copy_expert(
+                f'COPY "{staging}" ({column_list}) FROM STDIN WITH (FORMAT csv)',
+                buffer
+            )
+            cursor.execute(
+                f'INSERT INTO "{self.table.name}" ({column_list}) '
+                f'SELECT {column_list} FROM "{staging}" '
+                f'ON CONFLICT ({conflict_list}) DO NOTHING'
+            )
+            return cursor.rowcount
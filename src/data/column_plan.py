@@ -0,0 +1,201 @@
+"""
+Plano de Colunas de CSV - HullZero
+
+Resolve uma única vez por arquivo como as colunas de um CSV mapeiam para
+os campos de um importador. O resultado é um plano compilado com:
+- o delimitador;
+- o índice da coluna de cada campo;
+- o formato de data detectado nas primeiras linhas.
+
+Os importadores aplicam esse plano a todos os blocos, sem tentar adivinhar
+nada linha a linha.
+
+Os planos ficam em cache pela assinatura do arquivo (caminho, tamanho e
+mtime). Reimportar o mesmo arquivo pula a detecção.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .bulk_loader import detect_delimiter
+
+
+# Linhas inspecionadas para detectar formatos de data
+DEFAULT_SAMPLE_ROWS = 200
+
+# Formatos de data aceitos, em ordem de preferência
+DATETIME_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+]
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """Plano compilado de leitura de um CSV"""
+    delimiter: str
+    header: Tuple[str, ...]
+    fields: Dict[str, int]  # campo -> índice da coluna no cabeçalho
+    datetime_formats: Dict[str, Optional[str]]  # campo -> formato detectado (None = não detectado)
+
+    def column(self, field: str) -> Optional[str]:
+        """Nome da coluna mapeada para o campo (None se não houver)"""
+        index = self.fields.get(field)
+        return self.header[index] if index is not None else None
+
+    def datetime_format(self, field: str) -> Optional[str]:
+        return self.datetime_formats.get(field)
+
+    @property
+    def usecols(self) -> List[int]:
+        """Índices das colunas efetivamente usadas (as demais não são lidas)"""
+        return sorted(set(self.fields.values()))
+
+
+def resolve_columns(
+    header: Sequence[str],
+    rules: Dict[str, List[str]],
+    first_match: Sequence[str] = ()
+) -> Dict[str, int]:
+    """
+    Mapeia campos de destino para índices de colunas do cabeçalho.
+
+    Quando várias colunas casam com o mesmo campo prevalece a última,
+    exceto para os campos em `first_match`.
+
+    Returns:
+        Dict campo -> índice da coluna (campos sem coluna ficam de fora)
+    """
+    mapping = {}
+    for index, column in enumerate(header):
+        column_lower = column.lower()
+        for field, patterns in rules.items():
+            if field in first_match and field in mapping:
+                continue
+            if any(pattern in column_lower for pattern in patterns):
+                mapping[field] = index
+    return mapping
+
+
+def detect_datetime_format(
+    values: pd.Series,
+    formats: Sequence[str] = DATETIME_FORMATS
+) -> Optional[str]:
+    """
+    Formato que converte o maior número de valores da amostra.
+
+    Em caso de empate vale a ordem de `formats`; retorna None se nenhum
+    formato converter ao menos um valor.
+    """
+    values = values.str.strip()
+    values = values[values != '']
+    best_format, best_count = None, 0
+    for fmt in formats:
+        count = int(pd.to_datetime(values, format=fmt, errors='coerce').notna().sum())
+        if count > best_count:
+            best_format, best_count = fmt, count
+            if count == len(values):
+                break
+    return best_format
+
+
+def compile_column_plan(
+    csv_path: str,
+    rules: Dict[str, List[str]],
+    datetime_fields: Sequence[str] = (),
+    first_match: Sequence[str] = (),
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    encoding: str = 'utf-8'
+) -> ColumnPlan:
+    """
+    Compila o plano de colunas a partir do cabeçalho e das primeiras linhas.
+
+    Args:
+        csv_path: Caminho do CSV
+        rules: Campo de destino -> substrings aceitas no nome da coluna
+        datetime_fields: Campos cujo formato de data deve ser detectado
+        first_match: Campos em que prevalece a primeira coluna que casar
+        sample_rows: Linhas lidas para a detecção de formatos
+
+    Returns:
+        ColumnPlan
+    """
+    delimiter = detect_delimiter(csv_path, encoding)
+    sample = pd.read_csv(
+        csv_path,
+        sep=delimiter,
+        dtype=str,
+        keep_default_na=False,
+        nrows=sample_rows,
+        encoding=encoding
+    )
+    header = tuple(sample.columns)
+    fields = resolve_columns(header, rules, first_match)
+
+    datetime_formats = {}
+    for field in datetime_fields:
+        if field in fields:
+            datetime_formats[field] = detect_datetime_format(sample[header[fields[field]]])
+
+    return ColumnPlan(
+        delimiter=delimiter,
+        header=header,
+        fields=fields,
+        datetime_formats=datetime_formats
+    )
+
+
+def file_signature(csv_path: str) -> Tuple[str, int, int]:
+    """Assinatura do arquivo: caminho absoluto, tamanho e mtime (ns)"""
+    stat = os.stat(csv_path)
+    return os.path.abspath(csv_path), stat.st_size, stat.st_mtime_ns
+
+
+_plan_cache: Dict[tuple, ColumnPlan] = {}
+_plan_cache_lock = threading.Lock()
+
+
+def get_column_plan(
+    csv_path: str,
+    rules: Dict[str, List[str]],
+    datetime_fields: Sequence[str] = (),
+    first_match: Sequence[str] = (),
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    encoding: str = 'utf-8'
+) -> ColumnPlan:
+    """
+    Plano de colunas do arquivo, compilado apenas na primeira vez.
+
+    A chave do cache combina a assinatura do arquivo com as regras do
+    importador; se o arquivo for alterado (tamanho/mtime), o plano é
+    recompilado.
+    """
+    key = (
+        file_signature(csv_path),
+        tuple((field, tuple(patterns)) for field, patterns in rules.items()),
+        tuple(datetime_fields),
+        tuple(first_match),
+        sample_rows,
+        encoding,
+    )
+    with _plan_cache_lock:
+        plan = _plan_cache.get(key)
+    if plan is None:
+        plan = compile_column_plan(csv_path, rules, datetime_fields, first_match, sample_rows, encoding)
+        with _plan_cache_lock:
+            _plan_cache[key] = plan
+    return plan
+
+
+def clear_column_plan_cache():
+    """Descarta todos os planos em cache"""
+    with _plan_cache_lock:
+        _plan_cache.clear()
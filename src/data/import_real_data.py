@@ -7,15 +7,22 @@ incluindo:
 - Dados de consumo (CSV)
 - Dados de eventos (CSV)
 - Dados de navios (Excel)
+
+Os CSVs são lidos em blocos e gravados em lote (ver bulk_loader). O
+mapeamento de colunas e os formatos de data são resolvidos uma vez por
+arquivo (ver column_plan). A conversão de tipos é vetorizada por bloco.
 """
 
-import csv
 import os
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from collections import Counter
+from typing import Iterator, List, Dict, Optional
+from datetime import datetime
 from pathlib import Path
 import json
 
+import numpy as np
+import pandas as pd
+
 # SQLAlchemy
 from sqlalchemy.orm import Session
 
@@ -28,27 +35,60 @@ from ..database.models import (
 )
 from ..database.repositories import (
     VesselRepository,
-    FoulingDataRepository,
-    OperationalDataRepository,
-    MaintenanceEventRepository
+    FoulingDataRepository
 )
+from ..services.fleet_state_service import refresh_fleet_state
 from .vessel_name_mapper import VesselNameMapper
+from .bulk_loader import (
+    BulkInserter,
+    DEFAULT_CHUNK_SIZE,
+    frame_to_records,
+    read_csv_chunks
+)
+from .column_plan import DATETIME_FORMATS, ColumnPlan, get_column_plan
+from .parallel_import import import_ais_files_parallel
+from .ingestion_ledger import (
+    AIS_SOURCE,
+    CONSUMPTION_SOURCE,
+    EVENTS_SOURCE,
+    MAINTENANCE_NATURAL_KEY,
+    OPERATIONAL_NATURAL_KEY,
+    FileLedger,
+    latest_timestamp
+)
 
 # Base path para dados
 DATA_BASE_PATH = Path(__file__).parent.parent.parent / "dados"
 
+# Mapeamento de colunas: campo de destino -> substrings aceitas no cabeçalho
+AIS_COLUMNS = {
+    "timestamp": ['timestamp', 'data', 'date', 'hora', 'time'],
+    "latitude": ['latitude', 'lat'],
+    "longitude": ['longitude', 'lon', 'lng'],
+    "speed_knots": ['speed', 'velocidade', 'sog'],
+    "heading": ['heading', 'direção', 'course', 'cog'],
+}
+
+CONSUMPTION_COLUMNS = {
+    "vessel": ['vessel', 'navio', 'embarcação', 'id', 'imo'],
+    "timestamp": ['timestamp', 'data', 'date', 'hora', 'time'],
+    "fuel_consumption_kg_h": ['consumo', 'consumption', 'fuel', 'combustivel'],
+    "engine_power_kw": ['power', 'potencia', 'engine'],
+}
+
+EVENTS_COLUMNS = {
+    "vessel": ['vessel', 'navio', 'embarcação', 'id'],
+    "start_date": ['data', 'date', 'timestamp', 'inicio', 'start'],
+    "event_type": ['tipo', 'type', 'evento', 'event'],
+    "description": ['descrição', 'description', 'descricao', 'obs', 'observação'],
+    "ship_name": ['shipname', 'ship_name'],
+}
+
 
 def parse_datetime(date_str: str, formats: List[str] = None) -> Optional[datetime]:
     """Tenta parsear uma string de data em vários formatos"""
     if formats is None:
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%d/%m/%Y %H:%M:%S",
-            "%d/%m/%Y",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S.%f",
-        ]
+        formats = DATETIME_FORMATS
     
     for fmt in formats:
         try:
@@ -59,313 +99,380 @@ def parse_datetime(date_str: str, formats: List[str] = None) -> Optional[datetim
     return None
 
 
-def import_ais_data(db: Session, vessel_name: str, csv_path: str) -> int:
+def parse_float_column(chunk: pd.DataFrame, plan: ColumnPlan, field: str) -> pd.Series:
+    """Converte a coluna do campo para float (vazio/inválido = NaN)"""
+    column = plan.column(field)
+    if column is None:
+        return pd.Series(np.nan, index=chunk.index)
+    return pd.to_numeric(chunk[column].str.strip(), errors='coerce')
+
+
+def parse_datetime_column(chunk: pd.DataFrame, plan: ColumnPlan, field: str) -> pd.Series:
+    """
+    Converte a coluna do campo para datetime com o formato detectado no plano.
+    
+    Os demais DATETIME_FORMATS só são tentados para os valores que não
+    casarem com o formato detectado (arquivos com formatos misturados).
+    """
+    result = pd.Series(pd.NaT, index=chunk.index, dtype='datetime64[us]')
+    column = plan.column(field)
+    if column is None:
+        return result
+    
+    detected = plan.datetime_format(field)
+    formats = DATETIME_FORMATS
+    if detected:
+        formats = [detected] + [fmt for fmt in DATETIME_FORMATS if fmt != detected]
+    
+    values = chunk[column].str.strip()
+    pending = values != ''
+    for fmt in formats:
+        if not pending.any():
+            break
+        result[pending] = pd.to_datetime(values[pending], format=fmt, errors='coerce')
+        pending &= result.isna()
+    return result
+
+
+def parse_text_column(chunk: pd.DataFrame, plan: ColumnPlan, field: str) -> pd.Series:
+    """Coluna de texto do campo sem espaços nas pontas (ausente = '')"""
+    column = plan.column(field)
+    if column is None:
+        return pd.Series('', index=chunk.index)
+    return chunk[column].str.strip()
+
+
+def read_planned_chunks(csv_path: str, plan: ColumnPlan, chunk_size: int):
+    """Blocos do CSV lendo apenas as colunas usadas pelo plano"""
+    return read_csv_chunks(
+        csv_path,
+        chunk_size,
+        delimiter=plan.delimiter,
+        usecols=plan.usecols or None
+    )
+
+
+def parse_ais_chunks(
+    csv_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rejected: Optional[Counter] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Lê e converte um CSV AIS em blocos (sem acesso ao banco).
+    
+    Cada bloco é um DataFrame com timestamp, latitude, longitude,
+    speed_knots e heading, contendo apenas linhas com dados mínimos e
+    timestamp válido. Não depende de sessão, então também pode rodar em
+    processos de parsing (ver parallel_import).
+    
+    Linhas com dados mínimos mas sem timestamp são descartadas (o
+    timestamp faz parte da chave natural) e contadas em
+    rejected["missing_timestamp"], quando informado.
+    """
+    plan = get_column_plan(csv_path, AIS_COLUMNS, datetime_fields=("timestamp",))
+    for chunk in read_planned_chunks(csv_path, plan, chunk_size):
+        data = pd.DataFrame({
+            "timestamp": parse_datetime_column(chunk, plan, "timestamp"),
+            "latitude": parse_float_column(chunk, plan, "latitude"),
+            "longitude": parse_float_column(chunk, plan, "longitude"),
+            "speed_knots": parse_float_column(chunk, plan, "speed_knots"),
+            "heading": parse_float_column(chunk, plan, "heading"),
+        })
+        
+        # Criar registro apenas se tiver dados mínimos
+        data = data[
+            data["latitude"].notna() |
+            data["longitude"].notna() |
+            data["speed_knots"].notna()
+        ]
+        
+        missing = data["timestamp"].isna()
+        if missing.any():
+            if rejected is not None:
+                rejected["missing_timestamp"] += int(missing.sum())
+            data = data[~missing]
+        if data.empty:
+            continue
+        
+        yield data.reset_index(drop=True)
+
+
+def report_rejected(csv_path: str, rejected: Counter):
+    """Avisa as linhas descartadas por parse_ais_chunks"""
+    if rejected["missing_timestamp"]:
+        print(f"⚠️  {rejected['missing_timestamp']:,} linhas sem timestamp descartadas: {csv_path}")
+
+
+def import_ais_data(
+    db: Session,
+    vessel_name: str,
+    csv_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    incremental: bool = True
+) -> int:
     """
     Importa dados AIS de um CSV para operational_data
     
     Args:
         db: Sessão do banco de dados
-        vessel_id: ID da embarcação
+        vessel_name: Nome da embarcação (mapeado para o ID via VesselNameMapper)
         csv_path: Caminho para o arquivo CSV
+        chunk_size: Linhas lidas por bloco
+        incremental: Pular arquivos já importados e linhas antes da marca
+            d'água (ver ingestion_ledger); False relê o arquivo inteiro
         
     Returns:
-        Número de registros importados
+        Número de registros novos importados
     """
     if not os.path.exists(csv_path):
         print(f"⚠️  Arquivo não encontrado: {csv_path}")
         return 0
     
-    count = 0
+    vessel_id = map_vessel_name_to_id(vessel_name, db)
+    if not vessel_id:
+        print(f"⚠️  Embarcação não encontrada para {vessel_name}")
+        return 0
+    
+    ledger = FileLedger(db, AIS_SOURCE, csv_path)
+    if incremental and ledger.is_unchanged():
+        print(f"⏭️  Sem alterações desde a última importação: {csv_path}")
+        return 0
+    watermark = ledger.watermark(vessel_id) if incremental else None
+    
+    writer = BulkInserter(db, OperationalData, conflict_columns=OPERATIONAL_NATURAL_KEY)
+    last_timestamp = None
+    rejected = Counter()
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            # Detectar delimitador
-            first_line = f.readline()
-            f.seek(0)
-            
-            delimiter = ',' if ',' in first_line else ';'
-            reader = csv.DictReader(f, delimiter=delimiter)
-            
-            # Mapear colunas (flexível)
-            for row in reader:
-                try:
-                    # Extrair dados baseado em nomes de colunas comuns
-                    timestamp = None
-                    latitude = None
-                    longitude = None
-                    speed_knots = None
-                    heading = None
-                    
-                    # Tentar diferentes nomes de colunas
-                    for key, value in row.items():
-                        key_lower = key.lower()
-                        
-                        # Timestamp
-                        if any(x in key_lower for x in ['timestamp', 'data', 'date', 'hora', 'time']):
-                            timestamp = parse_datetime(str(value))
-                        
-                        # Latitude
-                        if any(x in key_lower for x in ['latitude', 'lat']):
-                            try:
-                                latitude = float(value) if value else None
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # Longitude
-                        if any(x in key_lower for x in ['longitude', 'lon', 'lng']):
-                            try:
-                                longitude = float(value) if value else None
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # Velocidade
-                        if any(x in key_lower for x in ['speed', 'velocidade', 'sog']):
-                            try:
-                                speed_knots = float(value) if value else None
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # Direção
-                        if any(x in key_lower for x in ['heading', 'direção', 'course', 'cog']):
-                            try:
-                                heading = float(value) if value else None
-                            except (ValueError, TypeError):
-                                pass
-                    
-                    # Se não encontrou timestamp, usar data atual
-                    if not timestamp:
-                        timestamp = datetime.utcnow() - timedelta(days=count/24)  # Distribuir no tempo
-                    
-                    # Criar registro apenas se tiver dados mínimos
-                    if latitude is not None or longitude is not None or speed_knots is not None:
-                        operational_data = {
-                            "vessel_id": vessel_id,
-                            "timestamp": timestamp,
-                            "latitude": latitude,
-                            "longitude": longitude,
-                            "speed_knots": speed_knots,
-                            "heading": heading,
-                        }
-                        
-                        OperationalDataRepository.create(db, operational_data)
-                        count += 1
-                        
-                        # Limitar para não sobrecarregar
-                        if count >= 1000:
-                            break
-                            
-                except Exception as e:
-                    print(f"⚠️  Erro ao processar linha: {e}")
-                    continue
+        with writer:
+            for data in parse_ais_chunks(csv_path, chunk_size, rejected):
+                if watermark is not None:
+                    data = data[data["timestamp"] >= watermark]
+                    if data.empty:
+                        continue
+                last_timestamp = latest_timestamp(last_timestamp, data["timestamp"].max())
+                data.insert(0, "vessel_id", vessel_id)
+                data["source"] = AIS_SOURCE
+                writer.extend(frame_to_records(data))
+        
+        ledger.complete({vessel_id: (last_timestamp, writer.inserted)})
+        report_rejected(csv_path, rejected)
     
     except Exception as e:
         print(f"❌ Erro ao importar {csv_path}: {e}")
     
-    return count
+    return writer.inserted
 
 
-def import_consumption_data(db: Session, csv_path: str) -> int:
+def import_consumption_data(
+    db: Session,
+    csv_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    incremental: bool = True
+) -> int:
     """
     Importa dados de consumo do CSV para operational_data
     
     Args:
         db: Sessão do banco de dados
         csv_path: Caminho para o arquivo CSV
+        chunk_size: Linhas lidas por bloco
+        incremental: Pular o arquivo se já importado e linhas antes da
+            marca d'água de cada embarcação
         
     Returns:
-        Número de registros importados
+        Número de registros novos importados
     """
     if not os.path.exists(csv_path):
         print(f"⚠️  Arquivo não encontrado: {csv_path}")
         return 0
     
-    count = 0
+    ledger = FileLedger(db, CONSUMPTION_SOURCE, csv_path)
+    if incremental and ledger.is_unchanged():
+        print(f"⏭️  Sem alterações desde a última importação: {csv_path}")
+        return 0
+    watermarks = ledger.watermarks() if incremental else {}
+    imported: Dict[str, tuple] = {}
+    
+    # Resolução de embarcação por valor distinto (uma consulta por navio, não por linha)
+    resolved: Dict[str, Optional[str]] = {}
+    vessels = None
+    
+    def resolve_vessel(key: str) -> Optional[str]:
+        nonlocal vessels
+        if key not in resolved:
+            vessel = VesselRepository.get_by_id(db, key)
+            if not vessel:
+                # Tentar buscar por nome
+                if vessels is None:
+                    vessels = VesselRepository.get_all(db)
+                for v in vessels:
+                    if key.lower() in v.name.lower() or v.name.lower() in key.lower():
+                        vessel = v
+                        break
+            resolved[key] = vessel.id if vessel else None
+        return resolved[key]
+    
+    writer = BulkInserter(db, OperationalData, conflict_columns=OPERATIONAL_NATURAL_KEY)
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline()
-            f.seek(0)
-            delimiter = ',' if ',' in first_line else ';'
-            reader = csv.DictReader(f, delimiter=delimiter)
-            
-            for row in reader:
-                try:
-                    # Extrair dados
-                    vessel_id = None
-                    timestamp = None
-                    fuel_consumption = None
-                    engine_power = None
-                    
-                    for key, value in row.items():
-                        key_lower = key.lower()
-                        
-                        # ID da embarcação
-                        if any(x in key_lower for x in ['vessel', 'navio', 'embarcação', 'id', 'imo']):
-                            vessel_id = str(value).strip()
-                        
-                        # Timestamp
-                        if any(x in key_lower for x in ['timestamp', 'data', 'date', 'hora', 'time']):
-                            timestamp = parse_datetime(str(value))
-                        
-                        # Consumo de combustível
-                        if any(x in key_lower for x in ['consumo', 'consumption', 'fuel', 'combustivel']):
-                            try:
-                                fuel_consumption = float(value) if value else None
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # Potência do motor
-                        if any(x in key_lower for x in ['power', 'potencia', 'engine']):
-                            try:
-                                engine_power = float(value) if value else None
-                            except (ValueError, TypeError):
-                                pass
-                    
-                    if vessel_id and timestamp:
-                        # Buscar embarcação por ID ou nome
-                        vessel = VesselRepository.get_by_id(db, vessel_id)
-                        if not vessel:
-                            # Tentar buscar por nome
-                            vessels = VesselRepository.get_all(db)
-                            for v in vessels:
-                                if vessel_id.lower() in v.name.lower() or v.name.lower() in vessel_id.lower():
-                                    vessel = v
-                                    break
-                        
-                        if vessel:
-                            operational_data = {
-                                "vessel_id": vessel.id,
-                                "timestamp": timestamp,
-                                "fuel_consumption_kg_h": fuel_consumption,
-                                "engine_power_kw": engine_power,
-                            }
-                            
-                            OperationalDataRepository.create(db, operational_data)
-                            count += 1
-                            
-                            if count >= 5000:
-                                break
-                                
-                except Exception as e:
-                    print(f"⚠️  Erro ao processar linha: {e}")
-                    continue
+        plan = get_column_plan(csv_path, CONSUMPTION_COLUMNS, datetime_fields=("timestamp",))
+        with writer:
+            for chunk in read_planned_chunks(csv_path, plan, chunk_size):
+                vessel_keys = parse_text_column(chunk, plan, "vessel")
+                data = pd.DataFrame({
+                    "vessel_id": vessel_keys.map(
+                        {key: resolve_vessel(key) for key in vessel_keys.unique() if key}
+                    ),
+                    "timestamp": parse_datetime_column(chunk, plan, "timestamp"),
+                    "fuel_consumption_kg_h": parse_float_column(chunk, plan, "fuel_consumption_kg_h"),
+                    "engine_power_kw": parse_float_column(chunk, plan, "engine_power_kw"),
+                })
+                
+                data = data[data["vessel_id"].notna() & data["timestamp"].notna()]
+                data = data[past_watermark(data, "timestamp", watermarks, inclusive=True)]
+                track_imported(imported, data, "timestamp")
+                data["source"] = CONSUMPTION_SOURCE
+                writer.extend(frame_to_records(data))
+        
+        ledger.complete(imported)
     
     except Exception as e:
         print(f"❌ Erro ao importar {csv_path}: {e}")
     
-    return count
+    return writer.inserted
+
+
+def past_watermark(
+    data: pd.DataFrame,
+    column: str,
+    watermarks: Dict[str, datetime],
+    inclusive: bool
+) -> pd.Series:
+    """
+    Máscara das linhas após a marca d'água da sua embarcação.
+    
+    `inclusive` mantém linhas no próprio timestamp da marca (seguro quando
+    o índice único descarta as já importadas).
+    """
+    if not watermarks or data.empty:
+        return pd.Series(True, index=data.index)
+    limits = pd.to_datetime(data["vessel_id"].map(watermarks))
+    after = data[column] >= limits if inclusive else data[column] > limits
+    return limits.isna() | after
+
+
+def track_imported(imported: Dict[str, tuple], data: pd.DataFrame, column: str):
+    """Acumula (último timestamp, linhas) por embarcação para o ledger"""
+    if data.empty:
+        return
+    grouped = data.groupby("vessel_id")[column].agg(["max", "size"])
+    for vessel_id, (last, rows) in grouped.iterrows():
+        previous_last, previous_rows = imported.get(vessel_id, (None, 0))
+        imported[vessel_id] = (latest_timestamp(previous_last, last), previous_rows + int(rows))
+
 
+def normalize_event_type(event_type: str) -> str:
+    """Normaliza o tipo de evento para cleaning/inspection/repair/maintenance"""
+    event_type = event_type.lower()
+    if "limpeza" in event_type or "cleaning" in event_type:
+        return "cleaning"
+    elif "inspeção" in event_type or "inspection" in event_type:
+        return "inspection"
+    elif "reparo" in event_type or "repair" in event_type:
+        return "repair"
+    return "maintenance"
 
-def import_events_data(db: Session, csv_path: str) -> int:
+
+def import_events_data(
+    db: Session,
+    csv_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    incremental: bool = True
+) -> int:
     """
     Importa dados de eventos do CSV para maintenance_events
     
     Args:
         db: Sessão do banco de dados
         csv_path: Caminho para o arquivo CSV
+        chunk_size: Linhas lidas por bloco
+        incremental: Pular o arquivo se já importado e eventos até a
+            marca d'água de cada embarcação
         
     Returns:
-        Número de registros importados
+        Número de registros novos importados
     """
     if not os.path.exists(csv_path):
         print(f"⚠️  Arquivo não encontrado: {csv_path}")
         return 0
     
-    count = 0
+    ledger = FileLedger(db, EVENTS_SOURCE, csv_path)
+    if incremental and ledger.is_unchanged():
+        print(f"⏭️  Sem alterações desde a última importação: {csv_path}")
+        return 0
+    watermarks = ledger.watermarks() if incremental else {}
+    imported: Dict[str, tuple] = {}
     
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline()
-            f.seek(0)
-            delimiter = ',' if ',' in first_line else ';'
-            reader = csv.DictReader(f, delimiter=delimiter)
+    # Resolução de embarcação por par distinto (id, shipName)
+    resolved: Dict[tuple, Optional[str]] = {}
+    
+    def resolve_vessel(key: tuple) -> Optional[str]:
+        if key not in resolved:
+            vessel_id, ship_name = key
+            
+            # Se não tem vessel_id mas tem shipName, usar mapper
+            if not vessel_id and ship_name:
+                vessel_id = VesselNameMapper.get_vessel_id_from_name(db, ship_name)
             
-            for row in reader:
-                try:
-                    # Extrair dados
-                    vessel_id = None
-                    start_date = None
-                    event_type = None
-                    description = None
-                    
-                    for key, value in row.items():
-                        key_lower = key.lower()
-                        
-                        # ID da embarcação
-                        if any(x in key_lower for x in ['vessel', 'navio', 'embarcação', 'id']):
-                            vessel_id = str(value).strip()
-                        
-                        # Data
-                        if any(x in key_lower for x in ['data', 'date', 'timestamp', 'inicio', 'start']):
-                            start_date = parse_datetime(str(value))
-                        
-                        # Tipo de evento
-                        if any(x in key_lower for x in ['tipo', 'type', 'evento', 'event']):
-                            event_type = str(value).strip().lower()
-                        
-                        # Descrição
-                        if any(x in key_lower for x in ['descrição', 'description', 'descricao', 'obs', 'observação']):
-                            description = str(value).strip()
-                    
-                    # Extrair shipName se disponível
-                    ship_name = None
-                    for key, value in row.items():
-                        key_lower = key.lower()
-                        if 'shipname' in key_lower or 'ship_name' in key_lower:
-                            ship_name = str(value).strip()
-                            break
-                    
-                    # Se não tem vessel_id mas tem shipName, usar mapper
-                    if not vessel_id and ship_name:
-                        vessel = VesselNameMapper.find_vessel_by_name(db, ship_name)
-                        if vessel:
-                            vessel_id = vessel.id
-                    
-                    if vessel_id and start_date:
-                        # Buscar embarcação por ID
-                        vessel = VesselRepository.get_by_id(db, vessel_id)
-                        if not vessel:
-                            # Tentar buscar por nome usando mapper
-                            vessel = VesselNameMapper.find_vessel_by_name(db, vessel_id)
-                            if vessel:
-                                vessel_id = vessel.id
-                        
-                        if vessel:
-                            # Normalizar tipo de evento
-                            if not event_type:
-                                event_type = "maintenance"
-                            
-                            if "limpeza" in event_type or "cleaning" in event_type:
-                                event_type = "cleaning"
-                            elif "inspeção" in event_type or "inspection" in event_type:
-                                event_type = "inspection"
-                            elif "reparo" in event_type or "repair" in event_type:
-                                event_type = "repair"
-                            else:
-                                event_type = "maintenance"
-                            
-                            maintenance_data = {
-                                "vessel_id": vessel.id,
-                                "event_type": event_type,
-                                "start_date": start_date,
-                                "description": description or f"Evento importado de {csv_path}",
-                                "maintenance_type": "preventive",
-                            }
-                            
-                            MaintenanceEventRepository.create(db, maintenance_data)
-                            count += 1
-                            
-                            if count >= 1000:
-                                break
-                                
-                except Exception as e:
-                    print(f"⚠️  Erro ao processar linha: {e}")
-                    continue
+            if vessel_id and not VesselRepository.get_by_id(db, vessel_id):
+                # Tentar buscar por nome usando mapper
+                vessel_id = VesselNameMapper.get_vessel_id_from_name(db, vessel_id)
+            resolved[key] = vessel_id or None
+        return resolved[key]
+    
+    default_description = f"Evento importado de {csv_path}"
+    writer = BulkInserter(db, MaintenanceEvent, conflict_columns=MAINTENANCE_NATURAL_KEY)
+    
+    try:
+        plan = get_column_plan(
+            csv_path, EVENTS_COLUMNS,
+            datetime_fields=("start_date",),
+            first_match=("ship_name",)
+        )
+        with writer:
+            for chunk in read_planned_chunks(csv_path, plan, chunk_size):
+                keys = pd.Series(list(zip(
+                    parse_text_column(chunk, plan, "vessel"),
+                    parse_text_column(chunk, plan, "ship_name")
+                )), index=chunk.index)
+                event_types = parse_text_column(chunk, plan, "event_type")
+                descriptions = parse_text_column(chunk, plan, "description")
+                
+                data = pd.DataFrame({
+                    "vessel_id": keys.map({key: resolve_vessel(key) for key in keys.unique()}),
+                    "event_type": event_types.map(
+                        {value: normalize_event_type(value) for value in event_types.unique()}
+                    ),
+                    "start_date": parse_datetime_column(chunk, plan, "start_date"),
+                    "description": descriptions.where(descriptions != '', default_description),
+                    "maintenance_type": "preventive",
+                })
+                
+                data = data[data["vessel_id"].notna() & data["start_date"].notna()]
+                data = data[past_watermark(data, "start_date", watermarks, inclusive=True)]
+                track_imported(imported, data, "start_date")
+                data["source"] = EVENTS_SOURCE
+                writer.extend(frame_to_records(data))
+        
+        ledger.complete(imported)
+        # Inserção via Core não passa pelos eventos de sessão
+        refresh_fleet_state(db, imported.keys())
     
     except Exception as e:
         print(f"❌ Erro ao importar {csv_path}: {e}")
     
-    return count
+    return writer.inserted
 
 
 def map_vessel_name_to_id(vessel_name: str, db: Session) -> Optional[str]:
@@ -379,14 +486,26 @@ def map_vessel_name_to_id(vessel_name: str, db: Session) -> Optional[str]:
     Returns:
         ID da embarcação ou None
     """
-    vessel = VesselNameMapper.find_vessel_by_name(db, vessel_name)
-    return vessel.id if vessel else None
+    return VesselNameMapper.get_vessel_id_from_name(db, vessel_name)
 
 
-def import_all_ais_data(db: Session) -> Dict[str, int]:
+def import_all_ais_data(
+    db: Session,
+    parallel: bool = False,
+    workers: Optional[int] = None,
+    writers: int = 1,
+    incremental: bool = True
+) -> Dict[str, int]:
     """
     Importa todos os arquivos CSV AIS da pasta dados/
     
+    Args:
+        db: Sessão do banco de dados
+        parallel: Usar o modo paralelo (parsing em pool de processos)
+        workers: Processos de parsing no modo paralelo (padrão: CPUs)
+        writers: Conexões de escrita no modo paralelo
+        incremental: Importar apenas arquivos/linhas novos (ver ingestion_ledger)
+    
     Returns:
         Dicionário com contagem por embarcação
     """
@@ -402,22 +521,44 @@ def import_all_ais_data(db: Session) -> Dict[str, int]:
     csv_files = list(ais_folder.glob("*.csv"))
     print(f"📁 Encontrados {len(csv_files)} arquivos CSV AIS")
     
+    if parallel:
+        return import_ais_files_parallel(
+            db, csv_files, workers=workers, writers=writers, incremental=incremental
+        )
+    
     for csv_file in csv_files:
         vessel_name = csv_file.stem  # Nome do arquivo sem extensão
         print(f"\n📊 Processando: {vessel_name}")
         
         # Importar dados (a função import_ais_data agora recebe vessel_name e faz o mapeamento internamente)
-        count = import_ais_data(db, vessel_name, str(csv_file))
+        count = import_ais_data(db, vessel_name, str(csv_file), incremental=incremental)
         results[vessel_name] = count
         print(f"✅ {count} registros importados para {vessel_name}")
     
     return results
 
 
-def import_all_real_data(db: Session) -> Dict[str, any]:
+def import_all_real_data(
+    db: Session,
+    parallel: bool = False,
+    workers: Optional[int] = None,
+    writers: int = 1,
+    incremental: bool = True
+) -> Dict[str, any]:
     """
     Importa todos os dados reais da pasta dados/
     
+    Reexecuções são incrementais: arquivos inalterados são pulados e, nos
+    alterados, só entram linhas após a marca d'água (ver ingestion_ledger).
+    
+    Args:
+        db: Sessão do banco de dados
+        parallel: Importar os CSVs AIS em paralelo (ver parallel_import)
+        workers: Processos de parsing no modo paralelo (padrão: CPUs)
+        writers: Conexões de escrita no modo paralelo
+        incremental: False relê todos os arquivos (duplicatas continuam
+            sendo descartadas pelo índice único)
+    
     Returns:
         Dicionário com resultados da importação
     """
@@ -434,7 +575,9 @@ def import_all_real_data(db: Session) -> Dict[str, any]:
     print("\n" + "="*60)
     print("1️⃣  Importando dados AIS...")
     print("="*60)
-    results["ais_data"] = import_all_ais_data(db)
+    results["ais_data"] = import_all_ais_data(
+        db, parallel=parallel, workers=workers, writers=writers, incremental=incremental
+    )
     
     # 2. Importar dados de consumo
     print("\n" + "="*60)
@@ -442,7 +585,7 @@ def import_all_real_data(db: Session) -> Dict[str, any]:
     print("="*60)
     consumption_file = DATA_BASE_PATH / "ResultadoQueryConsumo.csv"
     if consumption_file.exists():
-        results["consumption_data"] = import_consumption_data(db, str(consumption_file))
+        results["consumption_data"] = import_consumption_data(db, str(consumption_file), incremental=incremental)
         print(f"✅ {results['consumption_data']} registros de consumo importados")
     else:
         print(f"⚠️  Arquivo não encontrado: {consumption_file}")
@@ -453,7 +596,7 @@ def import_all_real_data(db: Session) -> Dict[str, any]:
     print("="*60)
     events_file = DATA_BASE_PATH / "ResultadoQueryEventos.csv"
     if events_file.exists():
-        results["events_data"] = import_events_data(db, str(events_file))
+        results["events_data"] = import_events_data(db, str(events_file), incremental=incremental)
         print(f"✅ {results['events_data']} registros de eventos importados")
     else:
         print(f"⚠️  Arquivo não encontrado: {events_file}")
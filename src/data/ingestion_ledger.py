@@ -0,0 +1,144 @@
+"""
+Registro de Ingestão - HullZero
+
+Controle de reimportação incremental dos CSVs. Para cada arquivo e
+embarcação a tabela ingestion_ledger guarda:
+- a assinatura do arquivo (sha256, tamanho e mtime);
+- a marca d'água, isto é, o último timestamp importado.
+
+Ao reimportar:
+- Arquivo com mesmo tamanho e mtime: é pulado sem leitura.
+- Arquivo com mtime diferente e o mesmo hash (por exemplo, uma cópia): é
+  pulado, e só a assinatura é atualizada.
+- Arquivo alterado: só as linhas a partir da marca d'água são gravadas.
+
+Os índices únicos (vessel_id, timestamp, source) em operational_data e
+(vessel_id, event_type, start_date, source) em maintenance_events garantem
+que linhas repetidas sejam ignoradas (ver BulkInserter.conflict_columns).
+Registros manuais têm source NULL e ficam fora da chave natural.
+"""
+
+import hashlib
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..database.repositories import IngestionLedgerRepository
+
+
+# Origens registradas no ledger e em operational_data.source / maintenance_events.source
+AIS_SOURCE = "ais"
+CONSUMPTION_SOURCE = "consumption"
+EVENTS_SOURCE = "events"
+
+# Chave natural de operational_data para ON CONFLICT DO NOTHING
+OPERATIONAL_NATURAL_KEY = ("vessel_id", "timestamp", "source")
+
+# Chave natural de maintenance_events para ON CONFLICT DO NOTHING
+MAINTENANCE_NATURAL_KEY = ("vessel_id", "event_type", "start_date", "source")
+
+
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    """Hash sha256 do conteúdo do arquivo (lido em blocos)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def latest_timestamp(current: Optional[datetime], candidate) -> Optional[datetime]:
+    """Maior entre a marca d'água atual e um novo timestamp (NaT/None ignorados)"""
+    if candidate is None or pd.isna(candidate):
+        return current
+    candidate = pd.Timestamp(candidate).to_pydatetime()
+    return candidate if current is None or candidate > current else current
+
+
+class FileLedger:
+    """
+    Estado de ingestão de um arquivo para uma origem (ais, consumption, events).
+
+    Uso:
+        ledger = FileLedger(db, AIS_SOURCE, csv_path)
+        if ledger.is_unchanged():
+            return 0
+        watermark = ledger.watermark(vessel_id)
+        ...
+        ledger.complete({vessel_id: (ultimo_timestamp, linhas)})
+    """
+
+    def __init__(self, db: Session, source: str, csv_path: str):
+        self.db = db
+        self.source = source
+        self.file_path = str(Path(csv_path).resolve())
+        stat = os.stat(csv_path)
+        self.file_size = stat.st_size
+        self.file_mtime = stat.st_mtime
+        self._file_hash: Optional[str] = None
+        self.entries = {
+            entry.vessel_id: entry
+            for entry in IngestionLedgerRepository.get_by_file(db, source, self.file_path)
+        }
+
+    @property
+    def file_hash(self) -> str:
+        if self._file_hash is None:
+            self._file_hash = file_sha256(self.file_path)
+        return self._file_hash
+
+    def is_unchanged(self) -> bool:
+        """True se o arquivo já foi importado e não mudou desde então"""
+        if not self.entries:
+            return False
+        entries = self.entries.values()
+        if all(e.file_size == self.file_size and e.file_mtime == self.file_mtime for e in entries):
+            return True
+        if all(e.file_hash == self.file_hash for e in entries):
+            # Mesmo conteúdo com outro mtime: apenas atualizar a assinatura
+            self.complete({})
+            return True
+        return False
+
+    def watermark(self, vessel_id: str) -> Optional[datetime]:
+        """Último timestamp importado para a embarcação (None se nunca importado)"""
+        entry = self.entries.get(vessel_id)
+        return entry.last_timestamp if entry else None
+
+    def watermarks(self) -> Dict[str, datetime]:
+        """Marcas d'água de todas as embarcações do arquivo"""
+        return {
+            vessel_id: entry.last_timestamp
+            for vessel_id, entry in self.entries.items()
+            if entry.last_timestamp is not None
+        }
+
+    def complete(self, imported: Dict[str, Tuple[Optional[datetime], int]]):
+        """
+        Registra a importação do arquivo.
+
+        Avança a marca d'água das embarcações em `imported`
+        (vessel_id -> (último timestamp, linhas importadas)) e atualiza a
+        assinatura de todas as entradas do arquivo.
+        """
+        signature = {
+            "file_hash": self.file_hash,
+            "file_size": self.file_size,
+            "file_mtime": self.file_mtime,
+        }
+        for vessel_id in set(self.entries) | set(imported):
+            entry = self.entries.get(vessel_id)
+            last_timestamp, rows = imported.get(vessel_id, (None, 0))
+            previous_rows = (entry.rows_imported or 0) if entry else 0
+            self.entries[vessel_id] = IngestionLedgerRepository.upsert(
+                self.db, self.source, self.file_path, vessel_id,
+                {
+                    **signature,
+                    "last_timestamp": latest_timestamp(self.watermark(vessel_id), last_timestamp),
+                    "rows_imported": previous_rows + rows,
+                }
+            )
@@ -0,0 +1,295 @@
+"""
+Importação Paralela de AIS - HullZero
+
+Importa vários CSVs AIS ao mesmo tempo:
+- Um pool de processos faz o parsing dos arquivos (parse_ais_chunks).
+- Os blocos convertidos seguem por uma fila limitada até um ou mais
+  writers. Cada writer é uma thread com sua própria sessão/conexão,
+  gravando com o BulkInserter.
+
+A resolução de nomes de embarcação e a consulta ao registro de ingestão
+(arquivos inalterados são pulados) ficam no processo principal, antes do
+disparo. Os processos de parsing não acessam o banco.
+
+Com SQLite há apenas um writer, pois o banco aceita um escritor por vez.
+Com PostgreSQL, mais writers paralelizam o COPY.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..database.models import OperationalData
+from .bulk_loader import BulkInserter, DEFAULT_CHUNK_SIZE, frame_to_records
+from .ingestion_ledger import AIS_SOURCE, OPERATIONAL_NATURAL_KEY, FileLedger, latest_timestamp
+
+
+# Blocos em trânsito na fila por processo de parsing (limita a memória)
+QUEUE_BLOCKS_PER_WORKER = 4
+
+# Fila compartilhada com os processos de parsing (definida no initializer)
+_batch_queue = None
+
+
+def default_workers() -> int:
+    """Processos de parsing padrão (um por CPU)"""
+    return os.cpu_count() or 1
+
+
+@dataclass
+class FileProgress:
+    """Progresso de importação de um arquivo"""
+    vessel_name: str
+    vessel_id: str
+    watermark: Optional[datetime] = None
+    started_at: float = 0.0
+    parsed_rows: int = 0
+    rejected_rows: int = 0  # linhas descartadas no parsing (sem timestamp)
+    processed_rows: int = 0  # linhas consumidas pelos writers (inclui as antes da marca d'água)
+    written_rows: int = 0  # linhas novas efetivamente inseridas
+    last_timestamp: Optional[datetime] = None
+    parse_done: bool = False
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.error is not None or (self.parse_done and self.processed_rows >= self.parsed_rows)
+
+
+@dataclass
+class ImportProgress:
+    """Progresso agregado (thread-safe) com relatório por arquivo"""
+    files: Dict[str, FileProgress]
+    started_at: float = field(default_factory=time.time)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _reported: set = field(default_factory=set, repr=False)
+
+    def started(self, path: str, started_at: float):
+        with self._lock:
+            self.files[path].started_at = started_at
+
+    def parsed(self, path: str, rows: int, error: Optional[str] = None, rejected: int = 0):
+        with self._lock:
+            progress = self.files[path]
+            progress.parsed_rows = rows
+            progress.rejected_rows = rejected
+            progress.parse_done = True
+            progress.error = progress.error or error
+        self._report(path)
+
+    def failed(self, path: str, error: str):
+        with self._lock:
+            self.files[path].error = error
+        self._report(path)
+
+    def written(self, path: str, processed: int, inserted: int, last_timestamp=None):
+        with self._lock:
+            progress = self.files[path]
+            progress.processed_rows += processed
+            progress.written_rows += inserted
+            progress.last_timestamp = latest_timestamp(progress.last_timestamp, last_timestamp)
+        self._report(path)
+
+    def _report(self, path: str):
+        with self._lock:
+            progress = self.files[path]
+            if path in self._reported or not progress.finished:
+                return
+            self._reported.add(path)
+            done = len(self._reported)
+        total = len(self.files)
+        if progress.error:
+            print(f"❌ [{done}/{total}] {progress.vessel_name}: {progress.error}")
+            return
+        elapsed = max(time.time() - progress.started_at, 1e-9)
+        rejected = f", {progress.rejected_rows:,} sem timestamp descartadas" if progress.rejected_rows else ""
+        print(
+            f"✅ [{done}/{total}] {progress.vessel_name}: {progress.written_rows:,} registros "
+            f"({progress.written_rows / elapsed:,.0f} linhas/s{rejected})"
+        )
+
+    @property
+    def total_rows(self) -> int:
+        return sum(p.written_rows for p in self.files.values())
+
+    def results(self) -> Dict[str, int]:
+        return {p.vessel_name: p.written_rows for p in self.files.values()}
+
+
+def _init_worker(batch_queue):
+    global _batch_queue
+    _batch_queue = batch_queue
+
+
+def _parse_file(path: str, chunk_size: int) -> str:
+    """
+    Executado no processo de parsing: envia cada bloco convertido para a
+    fila e, ao final, uma mensagem 'done' com o total de linhas e as
+    descartadas sem timestamp.
+    """
+    from .import_real_data import parse_ais_chunks
+
+    _batch_queue.put(("start", path, time.time()))
+    rows = 0
+    rejected = Counter()
+    try:
+        for data in parse_ais_chunks(path, chunk_size, rejected):
+            _batch_queue.put(("batch", path, data))
+            rows += len(data)
+    except Exception as e:
+        _batch_queue.put(("done", path, (rows, str(e), rejected["missing_timestamp"])))
+        return path
+    _batch_queue.put(("done", path, (rows, None, rejected["missing_timestamp"])))
+    return path
+
+
+def _writer_loop(session_factory, batch_queue, progress: ImportProgress):
+    """Thread de escrita: consome blocos da fila e grava em lote"""
+    db = session_factory()
+    try:
+        writer = BulkInserter(db, OperationalData, conflict_columns=OPERATIONAL_NATURAL_KEY)
+        while True:
+            message = batch_queue.get()
+            if message is None:
+                break
+            kind, path, payload = message
+            if kind == "start":
+                progress.started(path, payload)
+            elif kind == "done":
+                rows, error, rejected = payload
+                progress.parsed(path, rows, error, rejected)
+            else:
+                try:
+                    file_progress = progress.files[path]
+                    processed = len(payload)
+                    if file_progress.watermark is not None:
+                        payload = payload[payload["timestamp"] >= file_progress.watermark]
+                    last_timestamp = payload["timestamp"].max() if not payload.empty else None
+                    payload.insert(0, "vessel_id", file_progress.vessel_id)
+                    payload["source"] = AIS_SOURCE
+                    inserted_before = writer.inserted
+                    writer.extend(frame_to_records(payload))
+                    writer.flush()
+                    progress.written(path, processed, writer.inserted - inserted_before, last_timestamp)
+                except Exception as e:
+                    progress.failed(path, f"erro ao gravar: {e}")
+    finally:
+        db.close()
+
+
+def import_ais_files_parallel(
+    db: Session,
+    csv_files: List[Path],
+    workers: Optional[int] = None,
+    writers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    incremental: bool = True
+) -> Dict[str, int]:
+    """
+    Importa CSVs AIS em paralelo (parsing em processos, escrita em lote).
+
+    Args:
+        db: Sessão do banco (usada para resolver embarcações e como base
+            para as sessões dos writers)
+        csv_files: Arquivos CSV (o nome do arquivo é o nome da embarcação)
+        workers: Processos de parsing (padrão: número de CPUs)
+        writers: Conexões de escrita (forçado a 1 em SQLite)
+        chunk_size: Linhas lidas por bloco
+        incremental: Pular arquivos inalterados e linhas antes da marca
+            d'água (ver ingestion_ledger)
+
+    Returns:
+        Dicionário com contagem de registros novos por embarcação
+    """
+    from .import_real_data import map_vessel_name_to_id
+
+    workers = max(1, workers or default_workers())
+    engine = db.get_bind()
+    if engine.dialect.name == "sqlite" and writers > 1:
+        print("⚠️  SQLite aceita apenas um escritor; usando 1 writer")
+        writers = 1
+    writers = max(1, writers)
+
+    files = {}
+    ledgers = {}
+    results = {}
+    for csv_file in csv_files:
+        vessel_name = csv_file.stem
+        vessel_id = map_vessel_name_to_id(vessel_name, db)
+        if not vessel_id:
+            print(f"⚠️  Embarcação não encontrada para {vessel_name}")
+            results[vessel_name] = 0
+            continue
+        ledger = FileLedger(db, AIS_SOURCE, str(csv_file))
+        if incremental and ledger.is_unchanged():
+            print(f"⏭️  Sem alterações desde a última importação: {vessel_name}")
+            results[vessel_name] = 0
+            continue
+        ledgers[str(csv_file)] = ledger
+        files[str(csv_file)] = FileProgress(
+            vessel_name=vessel_name,
+            vessel_id=vessel_id,
+            watermark=ledger.watermark(vessel_id) if incremental else None
+        )
+
+    if not files:
+        return results
+
+    print(f"⚙️  {workers} processo(s) de parsing, {writers} writer(s), {len(files)} arquivo(s)")
+
+    context = multiprocessing.get_context("spawn")
+    batch_queue = context.Queue(maxsize=workers * QUEUE_BLOCKS_PER_WORKER)
+    progress = ImportProgress(files=files)
+
+    session_factory = sessionmaker(bind=engine)
+    threads = [
+        threading.Thread(
+            target=_writer_loop,
+            args=(session_factory, batch_queue, progress),
+            name=f"ais-writer-{i}",
+            daemon=True
+        )
+        for i in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(files)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(batch_queue,)
+        ) as pool:
+            futures = [pool.submit(_parse_file, path, chunk_size) for path in files]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        for _ in threads:
+            batch_queue.put(None)
+        for thread in threads:
+            thread.join()
+
+    for path, file_progress in files.items():
+        if file_progress.finished and not file_progress.error:
+            ledgers[path].complete({
+                file_progress.vessel_id: (file_progress.last_timestamp, file_progress.written_rows)
+            })
+
+    elapsed = max(time.time() - progress.started_at, 1e-9)
+    print(
+        f"📈 AIS paralelo: {progress.total_rows:,} registros em {elapsed:.1f}s "
+        f"({progress.total_rows / elapsed:,.0f} linhas/s)"
+    )
+
+    results.update(progress.results())
+    return results
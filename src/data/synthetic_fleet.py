@@ -0,0 +1,475 @@
+"""
+Frota Sintética em Escala - HullZero
+
+Gera frotas de qualquer tamanho para testes de carga, com as classes da
+frota Transpetro (TRANSPETRO_FLEET_DATA) como modelos:
+
+- embarcações: dimensões do modelo com variação de ±3%;
+- manutenção: limpezas a cada 4-7 meses, inspeções trimestrais e uma
+  repintura em docagem a cada ~5 anos;
+- bioincrustação: predições periódicas que crescem desde a última
+  limpeza (mesma taxa de generate_realistic_fouling_data) e zeram nela;
+- dados operacionais na cadência do AIS (padrão: 15 min), alternando
+  viagens e estadias em porto. O consumo segue a lei cúbica da velocidade
+  com a penalidade da bioincrustação do momento.
+
+Cada série é gerada com NumPy, uma embarcação por vez (memória limitada
+a uma embarcação). O gerador de cada embarcação é semeado com
+(seed, índice): a mesma seed e a mesma data final reproduzem os mesmos
+dados, independentemente da ordem ou do destino da gravação.
+
+Destinos: banco de dados (BulkInserter: COPY no PostgreSQL, executemany
+nos demais) ou um arquivo Parquet por tabela (requer pyarrow).
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..database.models import Vessel, FoulingData, OperationalData, MaintenanceEvent
+from .bulk_loader import BulkInserter, DEFAULT_BATCH_SIZE
+from .transpetro_fleet_data import TRANSPETRO_FLEET_DATA, calculate_hull_area
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DEFAULT_SEED = 401
+SYNTHETIC_MODEL_VERSION = "synthetic"
+
+# Bioincrustação (mesmos parâmetros de generate_realistic_fouling_data)
+BASE_GROWTH_RATE_MM_DAY = 0.03
+MAX_THICKNESS_MM = 6.0
+ROUGHNESS_PER_MM = 80.0
+MIN_ROUGHNESS_UM = 50.0
+FUEL_PENALTY_PERCENT_PER_MM = 1.5
+CO2_KG_PER_KG_FUEL = 3.114
+SEVERITY_THRESHOLDS_MM = (1.0, 3.0, 5.0)
+SEVERITY_LABELS = np.array(["light", "moderate", "severe", "critical"])
+
+# Manutenção (dias)
+CLEANING_INTERVAL_DAYS = (120, 210)
+INSPECTION_INTERVAL_DAYS = (60, 120)
+REPAINT_INTERVAL_DAYS = 5 * 365
+CLEANING_METHODS = (
+    "underwater_cleaning", "robotic_cleaning", "water_jetting", "brush_cleaning", "cavitation"
+)
+MAINTENANCE_PORTS = ("Rio de Janeiro, RJ", "Santos, SP", "São Sebastião, SP", "Suape, PE", "Angra dos Reis, RJ")
+
+# Operação: viagens e estadias em porto (dias)
+VOYAGE_DAYS = (2.0, 12.0)
+PORT_DAYS = (0.5, 3.0)
+ROUTE_LENGTH_NM = 2000.0
+# Costa brasileira, de Rio Grande a São Luís (lat, lon)
+ROUTE_START = (-32.0, -52.0)
+ROUTE_END = (-2.5, -44.0)
+
+
+# Campos copiados do modelo (colunas de Vessel, como em init_data.populate_vessels)
+TEMPLATE_FIELDS = (
+    "vessel_type", "vessel_class", "fleet_category", "hull_material", "max_speed_knots",
+    "typical_speed_knots", "engine_type", "fuel_type", "operating_routes", "home_port",
+    "construction_country", "dp2_capable", "offshore_operations", "dynamic_positioning",
+    "cargo_types", "gas_capacity_m3", "emission_standard", "fuel_alternatives",
+)
+
+
+@dataclass
+class SyntheticVessel:
+    """Séries geradas para uma embarcação"""
+    vessel: Dict
+    maintenance: pd.DataFrame
+    fouling: pd.DataFrame
+    operational: pd.DataFrame
+
+
+def _growth_rate(template: Dict) -> float:
+    """Taxa de crescimento (mm/dia) por classe e rota do modelo"""
+    vessel_class = template.get("vessel_class", "").lower()
+    rate = BASE_GROWTH_RATE_MM_DAY
+    if "gaseiro" in vessel_class:
+        rate *= 0.9
+    elif "aliviador" in vessel_class:
+        rate *= 1.1
+    elif "suezmax" in vessel_class or "aframax" in vessel_class:
+        rate *= 1.05
+    if any("offshore" in str(route).lower() for route in template.get("operating_routes", [])):
+        rate *= 1.15
+    return rate
+
+
+def _thickness(days_since_cleaning: np.ndarray, growth_rate: float) -> np.ndarray:
+    return np.clip(days_since_cleaning * growth_rate, 0.0, MAX_THICKNESS_MM)
+
+
+class SyntheticFleetGenerator:
+    """
+    Gera n_vessels embarcações com `years` anos de histórico até end_date.
+
+    Uso:
+        generator = SyntheticFleetGenerator(1000, years=2, seed=401)
+        for data in generator:
+            ...  # data.vessel, data.maintenance, data.fouling, data.operational
+    """
+
+    def __init__(
+        self,
+        n_vessels: int,
+        years: float = 2.0,
+        cadence_minutes: int = 15,
+        fouling_every_hours: int = 24,
+        seed: int = DEFAULT_SEED,
+        end_date: Optional[datetime] = None,
+        id_prefix: str = "SYN"
+    ):
+        self.n_vessels = n_vessels
+        self.years = years
+        self.cadence_minutes = cadence_minutes
+        self.fouling_every_hours = fouling_every_hours
+        self.seed = seed
+        self.id_prefix = id_prefix
+        self.end_date = end_date or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.start_date = self.end_date - timedelta(days=365 * years)
+
+        self._start = np.datetime64(self.start_date, "s")
+        self._history_days = (self.end_date - self.start_date).total_seconds() / 86400
+        self.operational_steps = int(self._history_days * 24 * 60 // cadence_minutes)
+        self.fouling_steps = int(self._history_days * 24 // fouling_every_hours)
+
+    def __len__(self) -> int:
+        return self.n_vessels
+
+    def __iter__(self) -> Iterator[SyntheticVessel]:
+        for index in range(self.n_vessels):
+            yield self.generate(index)
+
+    def generate(self, index: int) -> SyntheticVessel:
+        """Séries completas da embarcação `index` (determinístico por seed e índice)"""
+        rng = np.random.default_rng([self.seed, index])
+        template = TRANSPETRO_FLEET_DATA[index % len(TRANSPETRO_FLEET_DATA)]
+        growth_rate = _growth_rate(template) * rng.uniform(0.8, 1.2)
+
+        maintenance, cleaning_days = self._maintenance(rng, growth_rate)
+        vessel = self._vessel(rng, index, template, maintenance)
+        maintenance.insert(0, "id", vessel["id"] + "_M" + pd.RangeIndex(len(maintenance)).astype(str))
+        maintenance.insert(1, "vessel_id", vessel["id"])
+        fouling = self._fouling(rng, vessel, cleaning_days, growth_rate)
+        operational = self._operational(rng, vessel, cleaning_days, growth_rate)
+        return SyntheticVessel(vessel, maintenance, fouling, operational)
+
+    # ==================== EMBARCAÇÃO ====================
+
+    def _vessel(self, rng, index: int, template: Dict, maintenance: pd.DataFrame) -> Dict:
+        scale = rng.normal(1.0, 0.03, size=3).tolist()
+        length_m = round(template["length_m"] * scale[0], 1)
+        width_m = round(template["width_m"] * scale[1], 1)
+        draft_m = round(template["draft_m"] * scale[2], 1)
+        size_factor = sum(scale) / 3
+
+        paintings = maintenance.loc[maintenance["event_type"] == "painting", "start_date"]
+        if len(paintings):
+            paint_date = paintings.max().to_pydatetime()
+        else:
+            paint_date = self.start_date - timedelta(days=int(rng.integers(30, REPAINT_INTERVAL_DAYS // 2)))
+
+        vessel = {key: template.get(key) for key in TEMPLATE_FIELDS}
+        vessel["dp2_capable"] = bool(vessel["dp2_capable"])
+        vessel["offshore_operations"] = bool(vessel["offshore_operations"])
+        vessel.update({
+            "id": f"{self.id_prefix}_{template['fleet_category'].upper()}_{index:05d}",
+            "name": f"{template['name']} {index:05d}",
+            "imo_number": f"{self.id_prefix}{index:07d}",
+            "call_sign": f"S{index:05d}",
+            "length_m": length_m,
+            "width_m": width_m,
+            "draft_m": draft_m,
+            "hull_area_m2": calculate_hull_area(length_m, width_m, draft_m),
+            "displacement_tonnes": round(template["displacement_tonnes"] * size_factor, 0),
+            "dwt": round(template["dwt"] * size_factor, 0),
+            "paint_type": ("Antifouling_Type_A", "Antifouling_Type_B")[int(rng.integers(2))],
+            "paint_application_date": paint_date,
+            "typical_consumption_kg_h": round(template["typical_consumption_kg_h"] * size_factor, 1),
+            "engine_power_kw": round(template["engine_power_kw"] * size_factor, 0),
+            "construction_year": int(template["construction_year"]) - int(rng.integers(0, 6)),
+            "status": "active",
+        })
+        return vessel
+
+    # ==================== MANUTENÇÃO ====================
+
+    def _event_days(self, rng, interval_days) -> np.ndarray:
+        """
+        Dias (desde start_date) de eventos periódicos até o fim do histórico.
+        O primeiro fica antes do início (o histórico começa no meio de um ciclo).
+        """
+        count = int(self._history_days / interval_days[0]) + 2
+        intervals = rng.uniform(*interval_days, size=count)
+        days = -rng.uniform(0, interval_days[1]) + np.concatenate([[0.0], np.cumsum(intervals)])
+        return days[days < self._history_days]
+
+    def _maintenance(self, rng, growth_rate: float):
+        """Eventos de manutenção e dias das limpezas (a primeira é anterior ao histórico)"""
+        cleanings = self._event_days(rng, CLEANING_INTERVAL_DAYS)
+        inspections = self._event_days(rng, INSPECTION_INTERVAL_DAYS)
+        inspections = inspections[inspections > cleanings[0]]
+        n_cleanings, n_inspections = len(cleanings), len(inspections)
+
+        # Repintura em docagem (substitui a limpeza mais próxima)
+        repaint = self._history_days - rng.uniform(0, REPAINT_INTERVAL_DAYS)
+        is_painting = np.zeros(n_cleanings, dtype=bool)
+        if repaint >= 0:
+            is_painting[np.abs(cleanings - repaint).argmin()] = True
+
+        since_previous = np.concatenate([[rng.uniform(*CLEANING_INTERVAL_DAYS)], np.diff(cleanings)])
+        before_mm = _thickness(since_previous, growth_rate) + rng.normal(0, 0.1, n_cleanings)
+        inspection_mm = _thickness(self._days_since_cleaning(inspections, cleanings), growth_rate)
+
+        days = np.concatenate([cleanings, inspections])
+        event_type = np.concatenate([
+            np.where(is_painting, "painting", "cleaning"),
+            np.full(n_inspections, "inspection")
+        ])
+        duration_hours = np.concatenate([
+            np.where(is_painting, rng.uniform(240, 480, n_cleanings), rng.uniform(8, 36, n_cleanings)),
+            rng.uniform(2, 8, n_inspections)
+        ])
+        thickness_before = np.round(np.concatenate([np.maximum(0.1, before_mm), inspection_mm]), 2)
+        thickness_after = np.round(np.concatenate([rng.uniform(0.05, 0.3, n_cleanings), inspection_mm]), 2)
+        cost_brl = np.round(np.concatenate([
+            np.where(is_painting, rng.uniform(2.5e6, 6e6, n_cleanings), rng.uniform(1.5e5, 6e5, n_cleanings)),
+            rng.uniform(1e4, 4e4, n_inspections)
+        ]), 2)
+
+        start = self._start + (days * 86400).astype("timedelta64[s]")
+        frame = pd.DataFrame({
+            "event_type": event_type,
+            "maintenance_type": "preventive",
+            "start_date": start,
+            "end_date": start + (duration_hours * 3600).astype("timedelta64[s]"),
+            "duration_hours": np.round(duration_hours, 1),
+            "location": np.array(MAINTENANCE_PORTS)[rng.integers(len(MAINTENANCE_PORTS), size=len(days))],
+            "cleaning_method": np.concatenate([
+                np.where(
+                    is_painting, "dry_dock_cleaning",
+                    np.array(CLEANING_METHODS)[rng.integers(len(CLEANING_METHODS), size=n_cleanings)]
+                ),
+                np.full(n_inspections, None, dtype=object)
+            ]),
+            "fouling_thickness_before_mm": thickness_before,
+            "fouling_thickness_after_mm": thickness_after,
+            "roughness_before_um": np.round(np.maximum(MIN_ROUGHNESS_UM, thickness_before * ROUGHNESS_PER_MM), 1),
+            "roughness_after_um": np.round(np.maximum(MIN_ROUGHNESS_UM, thickness_after * ROUGHNESS_PER_MM), 1),
+            "cost_brl": cost_brl,
+            "status": "completed",
+        }).sort_values("start_date", ignore_index=True)
+        return frame, cleanings
+
+    # ==================== BIOINCRUSTAÇÃO ====================
+
+    @staticmethod
+    def _days_since_cleaning(days: np.ndarray, cleaning_days: np.ndarray) -> np.ndarray:
+        """cleaning_days ordenado, com a primeira limpeza anterior a todos os `days`"""
+        return days - cleaning_days[np.maximum(0, np.searchsorted(cleaning_days, days, side="right") - 1)]
+
+    def _fouling(self, rng, vessel: Dict, cleaning_days: np.ndarray, growth_rate: float) -> pd.DataFrame:
+        n = self.fouling_steps
+        days = (np.arange(n) + 1) * (self.fouling_every_hours / 24)
+        since = self._days_since_cleaning(days, cleaning_days)
+        thickness = np.maximum(0.1, _thickness(since, growth_rate) + rng.normal(0, 0.08, n))
+        roughness = np.maximum(MIN_ROUGHNESS_UM, thickness * ROUGHNESS_PER_MM + rng.normal(0, 10, n))
+        fuel_impact = thickness * FUEL_PENALTY_PERCENT_PER_MM
+        co2_kg_day = vessel["typical_consumption_kg_h"] * 24 * fuel_impact / 100 * CO2_KG_PER_KG_FUEL
+
+        return pd.DataFrame({
+            "id": vessel["id"] + "_F" + pd.RangeIndex(n).astype(str),
+            "vessel_id": vessel["id"],
+            "timestamp": self._start + (days * 86400).astype("timedelta64[s]"),
+            "estimated_thickness_mm": np.round(thickness, 3),
+            "estimated_roughness_um": np.round(roughness, 1),
+            "fouling_severity": SEVERITY_LABELS[np.searchsorted(SEVERITY_THRESHOLDS_MM, thickness)],
+            "confidence_score": np.round(rng.uniform(0.75, 0.95, n), 3),
+            "predicted_fuel_impact_percent": np.round(fuel_impact, 2),
+            "predicted_co2_impact_kg": np.round(co2_kg_day, 1),
+            "model_type": "hybrid",
+            "model_version": SYNTHETIC_MODEL_VERSION,
+        })
+
+    # ==================== OPERAÇÃO (AIS) ====================
+
+    def _legs(self, rng, steps_per_day: float):
+        """Estado por passo: em viagem (bool) e carga (%) por perna"""
+        n = self.operational_steps
+        mean_leg_days = (sum(VOYAGE_DAYS) + sum(PORT_DAYS)) / 4
+        count = int(n / (steps_per_day * mean_leg_days) * 1.5) + 4
+        voyage_days = rng.uniform(*VOYAGE_DAYS, size=count // 2 + 1)
+        port_days = rng.uniform(*PORT_DAYS, size=count // 2 + 1)
+        lengths = np.empty(2 * len(voyage_days), dtype=np.int64)
+        lengths[0::2] = np.maximum(1, (voyage_days * steps_per_day).astype(np.int64))
+        lengths[1::2] = np.maximum(1, (port_days * steps_per_day).astype(np.int64))
+        # Começar em um ponto qualquer da primeira perna
+        lengths[0] = max(1, int(lengths[0] * rng.uniform(0.1, 1.0)))
+        while lengths.sum() < n:
+            lengths = np.concatenate([lengths, lengths])
+
+        at_sea = np.tile([True, False], len(lengths) // 2)
+        # Viagens alternam carregado/lastro; em porto, carga intermediária
+        cargo = np.where(
+            at_sea,
+            np.where(np.arange(len(lengths)) % 4 == 0, rng.uniform(85, 98, len(lengths)), rng.uniform(30, 45, len(lengths))),
+            rng.uniform(40, 90, len(lengths))
+        )
+        return np.repeat(at_sea, lengths)[:n], np.repeat(cargo, lengths)[:n]
+
+    def _operational(self, rng, vessel: Dict, cleaning_days: np.ndarray, growth_rate: float) -> pd.DataFrame:
+        n = self.operational_steps
+        step_hours = self.cadence_minutes / 60
+        steps_per_day = 24 / step_hours
+        days = np.arange(n) / steps_per_day
+        at_sea, cargo = self._legs(rng, steps_per_day)
+
+        typical_speed = vessel.get("typical_speed_knots") or 13.0
+        max_speed = vessel.get("max_speed_knots") or typical_speed * 1.25
+        speed = np.where(
+            at_sea,
+            typical_speed * (1 + 0.05 * np.sin(days * 2 * np.pi / 1.7)) + rng.normal(0, 0.4, n),
+            np.abs(rng.normal(0, 0.2, n))
+        ).clip(0, max_speed)
+
+        # Posição: vai e volta ao longo da costa conforme a distância navegada
+        distance = np.cumsum(speed * step_hours)
+        phase = (distance / ROUTE_LENGTH_NM) % 2
+        along = np.where(phase < 1, phase, 2 - phase)
+        latitude = ROUTE_START[0] + (ROUTE_END[0] - ROUTE_START[0]) * along + rng.normal(0, 0.02, n)
+        longitude = ROUTE_START[1] + (ROUTE_END[1] - ROUTE_START[1]) * along + rng.normal(0, 0.02, n)
+        heading = np.where(phase < 1, 25.0, 205.0) + rng.normal(0, 4, n)
+        heading = np.where(at_sea, heading, rng.uniform(0, 360, n)) % 360
+
+        # Consumo: lei cúbica da velocidade + penalidade da bioincrustação
+        thickness = _thickness(self._days_since_cleaning(days, cleaning_days), growth_rate)
+        load = (speed / max_speed) ** 3
+        typical_consumption = vessel["typical_consumption_kg_h"]
+        fuel = np.where(
+            at_sea,
+            typical_consumption * (speed / typical_speed) ** 3 * (1 + thickness * FUEL_PENALTY_PERCENT_PER_MM / 100),
+            typical_consumption * 0.12
+        ) * (1 + rng.normal(0, 0.03, n))
+
+        season = np.sin(2 * np.pi * (days + (self.start_date.timetuple().tm_yday - 45)) / 365)
+        wind = rng.gamma(4.0, 3.0, n)
+
+        return pd.DataFrame({
+            "id": vessel["id"] + "_O" + pd.RangeIndex(n).astype(str),
+            "vessel_id": vessel["id"],
+            "timestamp": self._start + (np.arange(n) * self.cadence_minutes * 60).astype("timedelta64[s]"),
+            "latitude": np.round(latitude, 5),
+            "longitude": np.round(longitude, 5),
+            "speed_knots": np.round(speed, 2),
+            "heading": np.round(heading, 1),
+            "engine_power_kw": np.round(vessel["engine_power_kw"] * np.clip(load, 0.02, 1.0), 0),
+            "rpm": np.rint(100 * speed / max_speed).astype(np.int64),
+            "fuel_consumption_kg_h": np.round(np.maximum(0.0, fuel), 1),
+            "water_temperature_c": np.round(28.0 + (latitude + 2.5) * 0.33 + 2.0 * season + rng.normal(0, 0.3, n), 2),
+            "salinity_psu": np.round(35.0 + rng.normal(0, 0.3, n), 2),
+            "wind_speed_knots": np.round(wind, 1),
+            "wave_height_m": np.round(0.02 * wind ** 1.3, 2),
+            "current_velocity": np.round(np.abs(rng.normal(0.5, 0.2, n)), 2),
+            "depth_m": np.round(np.where(at_sea, rng.uniform(80, 3000, n), rng.uniform(12, 25, n)), 0),
+            "cargo_load_percent": np.round(cargo, 1),
+        })
+
+
+# ==================== GRAVAÇÃO ====================
+
+# Chamado após cada embarcação: (embarcações gravadas, linhas gravadas)
+ProgressCallback = Callable[[int, int], None]
+
+
+def write_to_database(
+    generator: SyntheticFleetGenerator,
+    db: Session,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, int]:
+    """
+    Grava a frota no banco em lotes (uma transação por lote).
+
+    Returns:
+        Linhas gravadas por tabela
+    """
+    writers = {
+        "vessels": BulkInserter(db, Vessel, batch_size),
+        "maintenance_events": BulkInserter(db, MaintenanceEvent, batch_size),
+        "fouling_data": BulkInserter(db, FoulingData, batch_size),
+        "operational_data": BulkInserter(db, OperationalData, batch_size),
+    }
+    for count, data in enumerate(generator, start=1):
+        # Embarcação gravada antes das séries (chave estrangeira)
+        writers["vessels"].add(data.vessel)
+        writers["vessels"].flush()
+        writers["maintenance_events"].write_frame(data.maintenance)
+        writers["fouling_data"].write_frame(data.fouling)
+        writers["operational_data"].write_frame(data.operational)
+        if progress:
+            progress(count, sum(writer.count for writer in writers.values()))
+
+    for writer in writers.values():
+        writer.flush()
+    return {table: writer.total for table, writer in writers.items()}
+
+
+def write_parquet(
+    generator: SyntheticFleetGenerator,
+    directory: str,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, int]:
+    """
+    Grava a frota em <directory>/<tabela>.parquet (um row group por embarcação).
+
+    Returns:
+        Linhas gravadas por tabela
+    """
+    if not PARQUET_AVAILABLE:
+        raise ImportError("Saída Parquet requer pyarrow (pip install pyarrow)")
+
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    writers: Dict[str, "pq.ParquetWriter"] = {}
+    totals = {"vessels": 0, "maintenance_events": 0, "fouling_data": 0, "operational_data": 0}
+    vessels = []
+
+    def write(table_name: str, frame: pd.DataFrame):
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        writer = writers.get(table_name)
+        if writer is None:
+            writer = writers[table_name] = pq.ParquetWriter(path / f"{table_name}.parquet", table.schema)
+        writer.write_table(table.cast(writer.schema))
+        totals[table_name] += len(frame)
+
+    try:
+        for count, data in enumerate(generator, start=1):
+            vessels.append(data.vessel)
+            write("maintenance_events", data.maintenance)
+            write("fouling_data", data.fouling)
+            write("operational_data", data.operational)
+            if progress:
+                progress(count, sum(totals.values()) + len(vessels))
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    # Colunas JSON (listas) como texto, como no banco
+    frame = pd.DataFrame(vessels)
+    for column in ("operating_routes", "cargo_types", "fuel_alternatives"):
+        frame[column] = [json.dumps(value) if value is not None else None for value in frame[column]]
+    frame.to_parquet(path / "vessels.parquet", index=False)
+    totals["vessels"] = len(frame)
+    return totals
@@ -2,9 +2,19 @@
 Mapeador de Nomes de Navios - HullZero
 
 Mapeia nomes de navios dos dados reais para IDs de embarcações no banco de dados.
+
+As buscas usam um índice em memória (VesselNameIndex) construído uma vez por
+banco: nome normalizado → id (incluindo as variações de KNOWN_MAPPINGS) e um
+índice de trigramas para buscas por substring. O índice é invalidado quando
+uma embarcação é criada, alterada ou removida pelo ORM.
 """
 
-from typing import Dict, Optional, List
+import threading
+import weakref
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, List, Set
+
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from ..database.models import Vessel
 from ..database.repositories import VesselRepository
@@ -78,42 +88,12 @@ class VesselNameMapper:
         2. Busca por substring
         3. Busca normalizada
         4. Busca por padrões conhecidos
-        """
-        if not name:
-            return None
-        
-        normalized_name = VesselNameMapper.normalize_name(name)
         
-        # 1. Busca exata (case-insensitive)
-        vessel = db.query(Vessel).filter(
-            Vessel.name.ilike(f"%{name}%")
-        ).first()
-        
-        if vessel:
-            return vessel
-        
-        # 2. Busca normalizada
-        all_vessels = db.query(Vessel).all()
-        for v in all_vessels:
-            if VesselNameMapper.normalize_name(v.name) == normalized_name:
-                return v
-        
-        # 3. Busca por substring (normalizada)
-        for v in all_vessels:
-            v_normalized = VesselNameMapper.normalize_name(v.name)
-            if normalized_name in v_normalized or v_normalized in normalized_name:
-                return v
-        
-        # 4. Busca por padrões conhecidos
-        if name.upper() in VesselNameMapper.KNOWN_MAPPINGS:
-            patterns = VesselNameMapper.KNOWN_MAPPINGS[name.upper()]
-            for pattern in patterns:
-                for v in all_vessels:
-                    v_normalized = VesselNameMapper.normalize_name(v.name)
-                    if pattern.upper() in v_normalized or v_normalized in pattern.upper():
-                        return v
-        
-        return None
+        As estratégias são resolvidas pelo VesselNameIndex (sem varrer a
+        tabela a cada busca).
+        """
+        vessel_id = VesselNameMapper.get_vessel_id_from_name(db, name)
+        return db.get(Vessel, vessel_id) if vessel_id else None
     
     @staticmethod
     def get_or_create_vessel_by_name(
@@ -152,28 +132,169 @@ class VesselNameMapper:
         Constrói dicionário de mapeamento nome → vessel_id.
         
         Returns:
-            Dict com chave sendo nome normalizado e valor sendo vessel_id
+            Dict com chave sendo nome normalizado (e variações conhecidas)
+            e valor sendo vessel_id
         """
-        mapping = {}
-        vessels = db.query(Vessel).all()
-        
-        for vessel in vessels:
-            # Adicionar nome original
-            normalized = VesselNameMapper.normalize_name(vessel.name)
-            mapping[normalized] = vessel.id
-            
-            # Adicionar variações conhecidas
-            if vessel.name.upper() in VesselNameMapper.KNOWN_MAPPINGS:
-                for variant in VesselNameMapper.KNOWN_MAPPINGS[vessel.name.upper()]:
-                    mapping[VesselNameMapper.normalize_name(variant)] = vessel.id
-        
-        return mapping
+        return dict(VesselNameIndex.for_session(db).exact)
     
     @staticmethod
     def get_vessel_id_from_name(db: Session, name: str) -> Optional[str]:
         """
-        Obtém vessel_id a partir do nome (método rápido usando cache).
+        Obtém vessel_id a partir do nome (via índice em memória, sem consultas).
         """
-        vessel = VesselNameMapper.find_vessel_by_name(db, name)
-        return vessel.id if vessel else None
+        if not name:
+            return None
+        return VesselNameIndex.for_session(db).lookup(name)
+    
+    @staticmethod
+    def invalidate_index():
+        """Descarta os índices de nomes (reconstruídos na próxima busca)"""
+        VesselNameIndex.invalidate()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class VesselNameIndex:
+    """
+    Índice em memória dos nomes de embarcações de um banco.
+    
+    Reproduz as estratégias de busca do VesselNameMapper, na mesma ordem:
+    1. Substring do nome informado no nome da embarcação (case-insensitive)
+    2. Nome normalizado exato (inclui variações de KNOWN_MAPPINGS)
+    3. Substring normalizada, nos dois sentidos
+    4. Padrões conhecidos (KNOWN_MAPPINGS)
+    
+    Quando mais de uma embarcação casa, vence a primeira na ordem da tabela,
+    como na busca original. As buscas por substring usam trigramas para
+    reduzir os candidatos a O(k) em vez de varrer toda a frota.
+    """
+    
+    _indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+    
+    def __init__(self, vessels: Iterable[Vessel]):
+        self.ids: List[str] = []
+        self.lower_names: List[str] = []
+        self.normalized_names: List[str] = []
+        self.exact: Dict[str, str] = {}
+        self._lower_trigrams: Dict[str, Set[int]] = defaultdict(set)
+        self._normalized_trigrams: Dict[str, Set[int]] = defaultdict(set)
+        self._trigram_counts: List[int] = []
+        
+        for position, vessel in enumerate(vessels):
+            name = vessel.name or ""
+            lower = name.lower()
+            normalized = VesselNameMapper.normalize_name(name)
+            self.ids.append(vessel.id)
+            self.lower_names.append(lower)
+            self.normalized_names.append(normalized)
+            
+            for trigram in _trigrams(lower):
+                self._lower_trigrams[trigram].add(position)
+            normalized_trigrams = _trigrams(normalized)
+            for trigram in normalized_trigrams:
+                self._normalized_trigrams[trigram].add(position)
+            self._trigram_counts.append(len(normalized_trigrams))
+            
+            self.exact.setdefault(normalized, vessel.id)
+            for variant in VesselNameMapper.KNOWN_MAPPINGS.get(name.upper(), []):
+                self.exact.setdefault(VesselNameMapper.normalize_name(variant), vessel.id)
+    
+    @classmethod
+    def for_session(cls, db: Session) -> "VesselNameIndex":
+        """Índice do banco da sessão (construído na primeira busca)"""
+        engine = db.get_bind()
+        index = cls._indexes.get(engine)
+        if index is None:
+            with cls._lock:
+                index = cls._indexes.get(engine)
+                if index is None:
+                    index = cls(db.query(Vessel).all())
+                    cls._indexes[engine] = index
+        return index
+    
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._indexes.clear()
+    
+    def lookup(self, name: str) -> Optional[str]:
+        """vessel_id para o nome informado (None se nenhuma estratégia casar)"""
+        # 1. Substring (case-insensitive) no nome cadastrado
+        position = self._first_containing(name.lower(), self.lower_names, self._lower_trigrams)
+        if position is not None:
+            return self.ids[position]
+        
+        # 2. Nome normalizado exato
+        normalized_name = VesselNameMapper.normalize_name(name)
+        if normalized_name in self.exact:
+            return self.exact[normalized_name]
+        
+        # 3. Substring normalizada (nos dois sentidos)
+        position = self._first_related(normalized_name)
+        if position is not None:
+            return self.ids[position]
+        
+        # 4. Padrões conhecidos
+        for pattern in VesselNameMapper.KNOWN_MAPPINGS.get(name.upper(), []):
+            position = self._first_related(pattern.upper())
+            if position is not None:
+                return self.ids[position]
+        
+        return None
+    
+    @staticmethod
+    def _first_containing(
+        query: str,
+        names: List[str],
+        trigram_index: Dict[str, Set[int]]
+    ) -> Optional[int]:
+        """Primeira posição cujo nome contém `query`"""
+        if len(query) < 3:
+            candidates = range(len(names))
+        else:
+            postings = [trigram_index.get(trigram, set()) for trigram in _trigrams(query)]
+            candidates = sorted(set.intersection(*sorted(postings, key=len)))
+        for position in candidates:
+            if query in names[position]:
+                return position
+        return None
+    
+    def _contained_in(self, query: str) -> Set[int]:
+        """Posições cujo nome normalizado está contido em `query`"""
+        hits: Dict[int, int] = defaultdict(int)
+        for trigram in _trigrams(query):
+            for position in self._normalized_trigrams.get(trigram, ()):
+                hits[position] += 1
+        positions = {p for p, count in hits.items() if count == self._trigram_counts[p]}
+        # Nomes com menos de 3 caracteres não têm trigramas
+        positions.update(p for p, count in enumerate(self._trigram_counts) if count == 0)
+        return {p for p in positions if self.normalized_names[p] in query}
+    
+    def _first_related(self, query: str) -> Optional[int]:
+        """Primeira posição em que query ⊂ nome ou nome ⊂ query (normalizados)"""
+        containing = self._first_containing(query, self.normalized_names, self._normalized_trigrams)
+        contained = self._contained_in(query)
+        if containing is not None:
+            contained.add(containing)
+        return min(contained) if contained else None
+
+
+@event.listens_for(Vessel, "after_insert")
+@event.listens_for(Vessel, "after_update")
+@event.listens_for(Vessel, "after_delete")
+def _invalidate_on_vessel_change(mapper, connection, target):
+    # Invalida já no flush e de novo no commit, para que um índice
+    # reconstruído por outra sessão nesse intervalo não fique defasado
+    VesselNameIndex.invalidate()
+    session = Session.object_session(target)
+    if session is not None:
+        session.info["vessel_names_changed"] = True
+
 
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("vessel_names_changed", False):
+        VesselNameIndex.invalidate()
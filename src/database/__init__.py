@@ -6,7 +6,17 @@ Sistema de persistência de dados usando SQLAlchemy com suporte para:
 - PostgreSQL/TimescaleDB (produção)
 """
 
-from .database import get_db, init_db, engine, SessionLocal
+from .database import (
+    get_db,
+    get_async_db,
+    init_db,
+    engine,
+    SessionLocal,
+    async_engine,
+    AsyncSessionLocal,
+    ASYNC_DB_AVAILABLE,
+    slow_query_log
+)
 from .models import (
     Base,
     Vessel,
@@ -17,8 +27,11 @@ from .models import (
     Anomaly,
     CorrectiveAction,
     PredictionExplanation,
-    CleaningMethod
+    CleaningMethod,
+    IngestionLedger,
+    FleetState
 )
+from . import fleet_state_events  # noqa: F401 (registra a atualização de fleet_state na escrita)
 
 # Importar modelos normalizados (opcional - para uso futuro)
 try:
@@ -56,6 +69,11 @@ __all__ = [
     "init_db",
     "engine",
     "SessionLocal",
+    "get_async_db",
+    "async_engine",
+    "AsyncSessionLocal",
+    "ASYNC_DB_AVAILABLE",
+    "slow_query_log",
     "Base",
     "Vessel",
     "FoulingData",
@@ -66,6 +84,8 @@ __all__ = [
     "CorrectiveAction",
     "PredictionExplanation",
     "CleaningMethod",
+    "IngestionLedger",
+    "FleetState",
     "NORMALIZED_MODELS_AVAILABLE",
 ]
 
@@ -7,18 +7,30 @@ As configurações agora vêm de src/config.py que carrega o .env
 
 from ..config import (
     DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    ASYNC_DB_ENABLED,
     DB_ECHO,
     DB_POOL_SIZE,
     DB_MAX_OVERFLOW,
-    USE_TIMESCALEDB
+    USE_TIMESCALEDB,
+    SLOW_QUERY_LOG_ENABLED,
+    SLOW_QUERY_THRESHOLD_MS,
+    SLOW_QUERY_EXPLAIN,
+    SLOW_QUERY_MAX_STATEMENTS
 )
 
 # Re-exportar para compatibilidade com código existente
 __all__ = [
     "DATABASE_URL",
+    "ASYNC_DATABASE_URL",
+    "ASYNC_DB_ENABLED",
     "DB_ECHO",
     "DB_POOL_SIZE",
     "DB_MAX_OVERFLOW",
-    "USE_TIMESCALEDB"
+    "USE_TIMESCALEDB",
+    "SLOW_QUERY_LOG_ENABLED",
+    "SLOW_QUERY_THRESHOLD_MS",
+    "SLOW_QUERY_EXPLAIN",
+    "SLOW_QUERY_MAX_STATEMENTS"
 ]
 
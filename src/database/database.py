@@ -5,11 +5,29 @@ Configuração e Sessão do Banco de Dados - HullZero
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
-from typing import Generator
+from typing import AsyncGenerator, Generator
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import time
 
-from .config import DATABASE_URL, DB_ECHO, DB_POOL_SIZE, DB_MAX_OVERFLOW, USE_TIMESCALEDB
+from .config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    ASYNC_DB_ENABLED,
+    DB_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    USE_TIMESCALEDB,
+    SLOW_QUERY_LOG_ENABLED,
+    SLOW_QUERY_THRESHOLD_MS,
+    SLOW_QUERY_EXPLAIN,
+    SLOW_QUERY_MAX_STATEMENTS
+)
 from .models import Base
+from .slow_query_log import SlowQueryLog
+from ..services.metrics_service import record_db_query
 
 # Configurar engine
 if DATABASE_URL.startswith("sqlite"):
@@ -34,6 +52,132 @@ else:
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# Threads das sessões síncronas chamadas pelos handlers async. Uma thread
+# por conexão do pool; no SQLite a conexão é única (StaticPool), e uma
+# thread só evita disputa pelo GIL entre consultas que não rodariam em
+# paralelo de qualquer forma.
+_sync_session_executor = ThreadPoolExecutor(
+    max_workers=1 if DATABASE_URL.startswith("sqlite") else DB_POOL_SIZE + DB_MAX_OVERFLOW,
+    thread_name_prefix="db-session"
+)
+
+
+class SyncSessionAdapter:
+    """
+    Interface de AsyncSession usada pelos repositórios Async* (execute,
+    scalar, scalars, get, run_sync, close) sobre uma Session síncrona.
+    
+    Cada chamada roda nas threads de _sync_session_executor: a espera pelo
+    banco não bloqueia o event loop. As chamadas de uma sessão são
+    aguardadas uma a uma, então a Session nunca é usada por duas threads
+    ao mesmo tempo.
+    """
+    
+    def __init__(self, session: Session):
+        self.sync_session = session
+    
+    @staticmethod
+    async def _run(fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_sync_session_executor, partial(fn, *args, **kwargs))
+    
+    async def execute(self, statement, *args, **kwargs):
+        return await self._run(self.sync_session.execute, statement, *args, **kwargs)
+    
+    async def scalar(self, statement, *args, **kwargs):
+        return await self._run(self.sync_session.scalar, statement, *args, **kwargs)
+    
+    async def scalars(self, statement, *args, **kwargs):
+        return await self._run(self.sync_session.scalars, statement, *args, **kwargs)
+    
+    async def get(self, entity, ident, **kwargs):
+        return await self._run(self.sync_session.get, entity, ident, **kwargs)
+    
+    async def run_sync(self, fn, *args, **kwargs):
+        return await self._run(fn, self.sync_session, *args, **kwargs)
+    
+    async def close(self):
+        await self._run(self.sync_session.close)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+def sync_session_adapter() -> SyncSessionAdapter:
+    """Fábrica no lugar de AsyncSessionLocal quando o acesso assíncrono está desligado ou indisponível"""
+    return SyncSessionAdapter(SessionLocal())
+
+
+# Engine assíncrono para os handlers async da API (aiosqlite / asyncpg).
+# As consultas não bloqueiam o event loop enquanto aguardam o banco.
+# Com ASYNC_DB_ENABLED=false (padrão) ou sem o driver instalado,
+# AsyncSessionLocal cai para sessões síncronas em threads (sync_session_adapter); o
+# engine assíncrono segue disponível para as exportações em streaming.
+try:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    
+    if ASYNC_DATABASE_URL.startswith("sqlite"):
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            # Banco em memória precisa de uma única conexão compartilhada
+            poolclass=StaticPool if ":memory:" in ASYNC_DATABASE_URL else None,
+            echo=DB_ECHO
+        )
+    else:
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            echo=DB_ECHO,
+            pool_pre_ping=True
+        )
+    
+    # expire_on_commit=False: objetos seguem legíveis após o commit sem
+    # recarga implícita (lazy load não é permitido em AsyncSession)
+    if ASYNC_DB_ENABLED:
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+    else:
+        AsyncSessionLocal = sync_session_adapter
+    ASYNC_DB_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  Driver assíncrono do banco não disponível: {e}. Usando sessões síncronas.")
+    async_engine = None
+    AsyncSessionLocal = sync_session_adapter
+    ASYNC_DB_AVAILABLE = False
+
+
+# Consultas acima do limite, com plano de execução (ver slow_query_log.py)
+slow_query_log = SlowQueryLog(
+    SLOW_QUERY_THRESHOLD_MS,
+    capture_plan=SLOW_QUERY_EXPLAIN,
+    max_statements=SLOW_QUERY_MAX_STATEMENTS
+)
+
+
+# Métricas: contagem e tempo de cada consulta (atribuídos à requisição corrente)
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._hullzero_query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_hullzero_query_started_at", None)
+    if started_at is not None:
+        seconds = time.perf_counter() - started_at
+        record_db_query(seconds)
+        if SLOW_QUERY_LOG_ENABLED:
+            slow_query_log.observe(conn, statement, parameters, executemany, seconds)
+
+
+for _engine in (engine, async_engine.sync_engine if async_engine is not None else None):
+    if _engine is not None:
+        event.listen(_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(_engine, "after_cursor_execute", _after_cursor_execute)
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency para obter sessão do banco de dados.
@@ -46,6 +190,15 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Dependency para obter sessão assíncrona do banco de dados.
+    Usar com FastAPI: db: AsyncSession = Depends(get_async_db)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     Inicializa o banco de dados criando todas as tabelas.
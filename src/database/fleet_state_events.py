@@ -0,0 +1,76 @@
+"""
+Atualização de fleet_state na Escrita - HullZero
+
+Eventos de sessão que registram as embarcações afetadas por escritas via
+ORM (FoulingData, MaintenanceEvent, Vessel) e, após o commit, recalculam
+suas linhas em fleet_state (ver services/fleet_state_service.py).
+
+Registrados na importação do pacote database, para valer em qualquer
+processo que escreva pelo ORM (API, scripts, pipelines). Inserções em lote
+via Core não disparam estes eventos; esses caminhos chamam
+refresh_fleet_state diretamente.
+"""
+
+from contextlib import contextmanager
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .models import Vessel, FoulingData, MaintenanceEvent
+
+# Chaves em Session.info
+PENDING_KEY = "fleet_state_pending"
+REFRESHING_KEY = "fleet_state_refreshing"
+
+
+@contextmanager
+def refreshing_fleet_state(db: Session):
+    """
+    Escopo de escrita em fleet_state: faz commit ao final (rollback em erro)
+    sem que as embarcações lidas durante o recálculo sejam reenfileiradas.
+    """
+    db.info[REFRESHING_KEY] = True
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.info.pop(REFRESHING_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_vessels(session, flush_context):
+    if session.info.get(REFRESHING_KEY):
+        return
+    pending = session.info.setdefault(PENDING_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Vessel):
+            pending.add(obj.id)
+        elif isinstance(obj, (FoulingData, MaintenanceEvent)) and obj.vessel_id:
+            pending.add(obj.vessel_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_commit(session):
+    vessel_ids = session.info.pop(PENDING_KEY, None)
+    if not vessel_ids:
+        return
+    from ..services.fleet_state_service import refresh_fleet_state
+    
+    # A sessão não emite SQL em after_commit: recalcular em uma sessão própria
+    refresh_session = Session(bind=session.get_bind())
+    try:
+        refresh_fleet_state(refresh_session, vessel_ids)
+    except Exception as e:
+        # Não desfazer a escrita já confirmada; o rebuild agendado corrige
+        print(f"⚠️  Erro ao atualizar fleet_state: {e}")
+    finally:
+        refresh_session.close()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(PENDING_KEY, None)
@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session
 from src.database.database import SessionLocal, init_db
 from src.database.models import Vessel, OperationalData, MaintenanceEvent
 from src.database.models_normalized import VesselClass, VesselType
+from src.data.ingestion_ledger import EVENTS_SOURCE
 
 # Configuração de caminhos
 BASE_PATH = Path("dados")
@@ -104,6 +105,13 @@ def ingest_events_and_consumption(db: Session):
         # Cache de navios para evitar queries repetidas
         vessels_cache = {v.name: v.id for v in db.query(Vessel).all()}
         
+        # Eventos já importados (chave natural de maintenance_events): reingerir não duplica
+        existing_events = {
+            tuple(row) for row in
+            db.query(MaintenanceEvent.vessel_id, MaintenanceEvent.event_type, MaintenanceEvent.start_date)
+            .filter(MaintenanceEvent.source == EVENTS_SOURCE)
+        }
+        
         print(f"  ⏳ Processando {len(df_events)} eventos...")
         
         for _, row in df_events.iterrows():
@@ -152,6 +160,10 @@ def ingest_events_and_consumption(db: Session):
                 # Se for DOCAGEM, é manutenção importante
                 
                 maint_type = 'docking' if event_name == 'DOCAGEM' else 'port_stay'
+                event_key = (vessel_id, maint_type, start_date.to_pydatetime())
+                if event_key in existing_events:
+                    continue
+                existing_events.add(event_key)
                 
                 maint_event = MaintenanceEvent(
                     id=str(uuid.uuid4()),
@@ -162,7 +174,8 @@ def ingest_events_and_consumption(db: Session):
                     duration_hours=row.get('duration'),
                     location=row.get('Porto'),
                     description=f"Evento importado: {event_name}",
-                    status='completed'
+                    status='completed',
+                    source=EVENTS_SOURCE
                 )
                 db.add(maint_event)
                 count_maint += 1
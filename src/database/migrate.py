@@ -5,12 +5,27 @@ Executa migrações SQL para normalizar o banco de dados.
 """
 
 import os
+import re
 from pathlib import Path
 from sqlalchemy import text, inspect
 from sqlalchemy.engine import Engine
 from .database import engine, SessionLocal
 from .config import DATABASE_URL
 
+# Tabela alvo de comandos de dados (UPDATE/DELETE/INSERT)
+_DATA_COMMAND_TABLE = re.compile(r'^\s*(?:UPDATE|DELETE\s+FROM|INSERT\s+INTO)\s+(\w+)', re.IGNORECASE)
+
+
+def missing_target_table(conn, command: str):
+    """
+    Tabela alvo de um comando de dados que ainda não existe no banco
+    (migração anterior não aplicada), ou None.
+    """
+    match = _DATA_COMMAND_TABLE.match(command)
+    if match and not inspect(conn).has_table(match.group(1)):
+        return match.group(1)
+    return None
+
 
 def execute_sql_file(engine: Engine, file_path: Path) -> bool:
     """
@@ -33,12 +48,15 @@ def execute_sql_file(engine: Engine, file_path: Path) -> bool:
         with open(file_path, 'r', encoding='utf-8') as f:
             sql_content = f.read()
         
-        # Dividir em comandos individuais (separados por ;)
-        # Remover comentários e linhas vazias
+        # Remover linhas de comentário e dividir em comandos (separados por ;)
+        sql_content = "\n".join(
+            line for line in sql_content.splitlines()
+            if not line.strip().startswith('--')
+        )
         commands = [
             cmd.strip() 
             for cmd in sql_content.split(';') 
-            if cmd.strip() and not cmd.strip().startswith('--')
+            if cmd.strip()
         ]
         
         with engine.connect() as conn:
@@ -46,6 +64,12 @@ def execute_sql_file(engine: Engine, file_path: Path) -> bool:
                 if not command:
                     continue
                 
+                # Comando de dados sobre tabela de outra migração ainda não aplicada
+                missing = missing_target_table(conn, command)
+                if missing:
+                    print(f"  ⚠️  Comando {i}: tabela {missing} não existe (ignorado)")
+                    continue
+                
                 try:
                     # Executar comando
                     conn.execute(text(command))
@@ -53,7 +77,7 @@ def execute_sql_file(engine: Engine, file_path: Path) -> bool:
                 except Exception as e:
                     # Ignorar erros de "já existe" ou "não existe"
                     error_msg = str(e).lower()
-                    if 'already exists' in error_msg or 'does not exist' in error_msg:
+                    if any(x in error_msg for x in ('already exists', 'does not exist', 'duplicate column')):
                         print(f"  ⚠️  Comando {i}: {str(e)[:100]}... (ignorado)")
                     else:
                         print(f"  ❌ Erro no comando {i}: {str(e)[:200]}")
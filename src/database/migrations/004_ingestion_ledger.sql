@@ -0,0 +1,64 @@
+-- Migração 004: Registro de Ingestão e Chaves Naturais (dados operacionais e eventos importados)
+-- Permite reimportações incrementais e idempotentes dos CSVs (AIS, consumo, eventos)
+
+-- Origem da importação em operational_data (NULL = dados manuais/sintéticos)
+ALTER TABLE operational_data ADD COLUMN source VARCHAR(50);
+
+-- Chave natural: reimportar a mesma linha não duplica (ON CONFLICT DO NOTHING)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_operational_vessel_time_source
+    ON operational_data(vessel_id, timestamp, source);
+
+-- Origem da importação em maintenance_events (NULL = evento registrado manualmente)
+ALTER TABLE maintenance_events ADD COLUMN source VARCHAR(50);
+
+-- Eventos gravados por importações anteriores (descrição padrão dos importadores)
+UPDATE maintenance_events SET source = 'events'
+WHERE source IS NULL AND description LIKE 'Evento importado%';
+
+-- Eventos importados em duplicidade por reimportações anteriores: as inspeções
+-- vinculadas a uma cópia passam para a primeira cópia de cada chave natural.
+-- Requer a tabela inspections (002); sem ela o comando é pulado pelo migrate.py
+UPDATE inspections SET maintenance_event_id = (
+    SELECT MIN(kept.id)
+    FROM maintenance_events kept
+    JOIN maintenance_events dup
+        ON kept.vessel_id = dup.vessel_id
+        AND kept.event_type = dup.event_type
+        AND kept.start_date = dup.start_date
+        AND kept.source = dup.source
+    WHERE dup.id = inspections.maintenance_event_id
+)
+WHERE maintenance_event_id IN (SELECT id FROM maintenance_events WHERE source IS NOT NULL);
+
+-- Remove as cópias importadas; eventos manuais (source NULL) não são tocados
+DELETE FROM maintenance_events
+WHERE source IS NOT NULL
+AND id NOT IN (
+    SELECT MIN(id) FROM maintenance_events
+    WHERE source IS NOT NULL
+    GROUP BY vessel_id, event_type, start_date, source
+);
+
+-- Chave natural de maintenance_events (ON CONFLICT DO NOTHING na importação de eventos).
+-- Substitui o índice sem source de uma versão anterior desta migração
+DROP INDEX IF EXISTS uq_maintenance_vessel_type_start;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_maintenance_vessel_type_start_source
+    ON maintenance_events(vessel_id, event_type, start_date, source);
+
+-- Registro de Ingestão (assinatura do arquivo + marca d'água por embarcação)
+CREATE TABLE IF NOT EXISTS ingestion_ledger (
+    id VARCHAR PRIMARY KEY,
+    source VARCHAR(50) NOT NULL,
+    file_path VARCHAR(500) NOT NULL,
+    vessel_id VARCHAR NOT NULL REFERENCES vessels(id),
+    file_hash VARCHAR(64) NOT NULL,
+    file_size INTEGER NOT NULL,
+    file_mtime FLOAT NOT NULL,
+    last_timestamp TIMESTAMP,
+    rows_imported INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_ingestion_source_file_vessel
+    ON ingestion_ledger(source, file_path, vessel_id);
@@ -0,0 +1,26 @@
+-- Migração 005: Estado Materializado da Frota
+-- Uma linha por embarcação, mantida a cada escrita; os endpoints de frota
+-- leem apenas esta tabela. Popular com: python scripts/rebuild_fleet_state.py
+
+CREATE TABLE IF NOT EXISTS fleet_state (
+    vessel_id VARCHAR PRIMARY KEY REFERENCES vessels(id) ON DELETE CASCADE,
+    vessel_name VARCHAR(255) NOT NULL,
+    short_id VARCHAR(20),
+    vessel_class VARCHAR(100),
+    vessel_type VARCHAR(100),
+    status VARCHAR(50),
+    fouling_timestamp TIMESTAMP,
+    fouling_mm FLOAT,
+    roughness_um FLOAT,
+    fouling_severity VARCHAR(50),
+    fr_level INTEGER NOT NULL,
+    performance_loss_percent FLOAT NOT NULL,
+    compliance_status VARCHAR(50) NOT NULL,
+    risk_15_fr INTEGER NOT NULL,
+    risk_30_fr INTEGER NOT NULL,
+    last_cleaning_date TIMESTAMP,
+    last_painting_date TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_fleet_state_status ON fleet_state(status);
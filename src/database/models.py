@@ -169,6 +169,7 @@ class OperationalData(Base):
     cargo_load_percent = Column(Float)
     
     # Metadados
+    source = Column(String(50))  # Origem da importação (ais, consumption); NULL = manual/sintético
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relacionamentos
@@ -177,6 +178,8 @@ class OperationalData(Base):
     __table_args__ = (
         Index("idx_operational_vessel_time", "vessel_id", "timestamp"),
         Index("idx_operational_timestamp", "timestamp"),
+        # Chave natural das importações: reimportar a mesma linha não duplica
+        Index("uq_operational_vessel_time_source", "vessel_id", "timestamp", "source", unique=True),
     )
 
 
@@ -222,6 +225,7 @@ class MaintenanceEvent(Base):
     status = Column(String(50), default="completed", index=True)  # planned, in_progress, completed, cancelled
     
     # Metadados
+    source = Column(String(50))  # Origem da importação (events); NULL = registro manual
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -231,6 +235,9 @@ class MaintenanceEvent(Base):
     __table_args__ = (
         Index("idx_maintenance_vessel_date", "vessel_id", "start_date"),
         Index("idx_maintenance_type", "event_type"),
+        # Chave natural das importações: reimportar o mesmo evento não duplica.
+        # Eventos manuais (source NULL) não conflitam entre si
+        Index("uq_maintenance_vessel_type_start_source", "vessel_id", "event_type", "start_date", "source", unique=True),
     )
 
 
@@ -393,6 +400,85 @@ class PredictionExplanation(Base):
     )
 
 
+class IngestionLedger(Base):
+    """
+    Registro de Ingestão de Arquivos
+    
+    Uma linha por (origem, arquivo, embarcação) com a assinatura do arquivo
+    e a marca d'água (último timestamp importado), usada para reimportações
+    incrementais.
+    """
+    __tablename__ = "ingestion_ledger"
+    
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    source = Column(String(50), nullable=False)  # ais, consumption, events
+    file_path = Column(String(500), nullable=False)
+    vessel_id = Column(String, ForeignKey("vessels.id"), nullable=False)
+    
+    # Assinatura do arquivo na última importação
+    file_hash = Column(String(64), nullable=False)  # sha256
+    file_size = Column(Integer, nullable=False)
+    file_mtime = Column(Float, nullable=False)
+    
+    # Marca d'água
+    last_timestamp = Column(DateTime)
+    rows_imported = Column(Integer, default=0)
+    
+    # Metadados
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("uq_ingestion_source_file_vessel", "source", "file_path", "vessel_id", unique=True),
+    )
+
+
+class FleetState(Base):
+    """
+    Estado Materializado da Frota
+    
+    Uma linha por embarcação com a última leitura de bioincrustação e os
+    indicadores derivados (nível FR, perda de performance, conformidade e
+    risco em 15/30 dias). Atualizada a cada escrita que afeta a embarcação
+    (ver services/fleet_state_service.py), para que os endpoints de frota
+    leiam uma única tabela.
+    """
+    __tablename__ = "fleet_state"
+    
+    vessel_id = Column(String, ForeignKey("vessels.id", ondelete="CASCADE"), primary_key=True)
+    
+    # Embarcação
+    vessel_name = Column(String(255), nullable=False)
+    short_id = Column(String(20))  # ID curto exibido no dashboard
+    vessel_class = Column(String(100))
+    vessel_type = Column(String(100))
+    status = Column(String(50))
+    
+    # Última leitura de bioincrustação (NULL = embarcação sem dados)
+    fouling_timestamp = Column(DateTime)
+    fouling_mm = Column(Float)
+    roughness_um = Column(Float)
+    fouling_severity = Column(String(50))
+    
+    # Indicadores derivados
+    fr_level = Column(Integer, nullable=False)
+    performance_loss_percent = Column(Float, nullable=False)
+    compliance_status = Column(String(50), nullable=False)
+    risk_15_fr = Column(Integer, nullable=False)
+    risk_30_fr = Column(Integer, nullable=False)
+    
+    # Manutenção
+    last_cleaning_date = Column(DateTime)
+    last_painting_date = Column(DateTime)
+    
+    # Metadados
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("idx_fleet_state_status", "status"),
+    )
+
+
 class CleaningMethod(Base):
     """
     Métodos de Limpeza Disponíveis
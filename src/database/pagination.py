@@ -0,0 +1,66 @@
+"""
+Paginação por Cursor (Keyset) - HullZero
+
+Substitui offset/limit nas listagens longas. A página seguinte é buscada a
+partir da última linha da anterior, com um predicado sobre as colunas de
+ordenação; como ele casa com os índices (vessel_id, timestamp), uma página
+profunda custa o mesmo que a primeira.
+
+O cursor é opaco para o cliente (ver src/cursors.py); o mesmo formato é
+usado pelo armazenamento em memória (src/services/memory_store.py).
+"""
+
+from typing import Optional, Sequence, TypeVar
+
+from sqlalchemy import and_, desc, or_
+
+from ..cursors import (  # noqa: F401 (reexportados para os repositórios)
+    Page,
+    decode_id_cursor,
+    decode_time_cursor,
+    encode_cursor,
+)
+
+T = TypeVar("T")
+
+
+def time_keyset(query, time_column, id_column, cursor: Optional[str], limit: int):
+    """
+    Ordena por (tempo, id) decrescente e aplica o cursor.
+
+    A condição `tempo <= t AND (tempo < t OR id < i)` equivale a
+    `(tempo, id) < (t, i)`, mas o primeiro termo é uma faixa simples que o
+    índice (vessel_id, tempo) resolve sem varrer as páginas anteriores.
+    Busca limit + 1 linhas para saber se há próxima página.
+    """
+    if cursor:
+        timestamp, row_id = decode_time_cursor(cursor)
+        query = query.where(and_(
+            time_column <= timestamp,
+            or_(time_column < timestamp, id_column < row_id)
+        ))
+    return query.order_by(desc(time_column), desc(id_column)).limit(limit + 1)
+
+
+def id_keyset(query, id_column, cursor: Optional[str], limit: int):
+    """Ordena por id crescente a partir do cursor (limit + 1 linhas)"""
+    if cursor:
+        query = query.where(id_column > decode_id_cursor(cursor))
+    return query.order_by(id_column).limit(limit + 1)
+
+
+def time_page(rows: Sequence[T], limit: int, time_attr: str) -> Page[T]:
+    """Monta a página a partir das limit + 1 linhas de time_keyset"""
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, time_attr), last.id)
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def id_page(rows: Sequence[T], limit: int) -> Page[T]:
+    """Monta a página a partir das limit + 1 linhas de id_keyset"""
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(items[-1].id) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
@@ -5,9 +5,11 @@ Implementa padrão Repository para acesso aos dados.
 """
 
 from typing import List, Optional, Dict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, and_, or_, func, select, case, literal
 
 from .models import (
     Vessel,
@@ -18,8 +20,11 @@ from .models import (
     Anomaly,
     CorrectiveAction,
     PredictionExplanation,
-    CleaningMethod
+    CleaningMethod,
+    IngestionLedger,
+    FleetState
 )
+from .pagination import Page, time_keyset, time_page, id_keyset, id_page
 
 
 class VesselRepository:
@@ -57,6 +62,32 @@ class VesselRepository:
     def get_by_status(db: Session, status: str) -> List[Vessel]:
         return db.query(Vessel).filter(Vessel.status == status).all()
     
+    @staticmethod
+    def page_query(
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        vessel_type: Optional[str] = None,
+        status: Optional[str] = None
+    ):
+        query = select(Vessel)
+        if vessel_type:
+            query = query.where(Vessel.vessel_type == vessel_type)
+        if status:
+            query = query.where(Vessel.status == status)
+        return id_keyset(query, Vessel.id, cursor, limit)
+    
+    @staticmethod
+    def get_page(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        vessel_type: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Page[Vessel]:
+        """Página ordenada por id a partir do cursor (ver database/pagination.py)"""
+        query = VesselRepository.page_query(cursor, limit, vessel_type, status)
+        return id_page(db.scalars(query).all(), limit)
+    
     @staticmethod
     def create(db: Session, vessel_data: Dict) -> Vessel:
         vessel = Vessel(**vessel_data)
@@ -114,6 +145,34 @@ class FoulingDataRepository:
         
         return query.order_by(desc(FoulingData.timestamp)).limit(limit).all()
     
+    @staticmethod
+    def page_query(
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ):
+        query = select(FoulingData).where(FoulingData.vessel_id == vessel_id)
+        if start_date:
+            query = query.where(FoulingData.timestamp >= start_date)
+        if end_date:
+            query = query.where(FoulingData.timestamp <= end_date)
+        return time_keyset(query, FoulingData.timestamp, FoulingData.id, cursor, limit)
+    
+    @staticmethod
+    def get_page_by_vessel(
+        db: Session,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[FoulingData]:
+        """Página mais recente primeiro, por (timestamp, id), a partir do cursor"""
+        query = FoulingDataRepository.page_query(vessel_id, cursor, start_date, end_date, limit)
+        return time_page(db.scalars(query).all(), limit, "timestamp")
+    
     @staticmethod
     def get_latest(db: Session, vessel_id: str) -> Optional[FoulingData]:
         return (
@@ -152,6 +211,34 @@ class OperationalDataRepository:
         
         return query.order_by(desc(OperationalData.timestamp)).limit(limit).all()
     
+    @staticmethod
+    def page_query(
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ):
+        query = select(OperationalData).where(OperationalData.vessel_id == vessel_id)
+        if start_date:
+            query = query.where(OperationalData.timestamp >= start_date)
+        if end_date:
+            query = query.where(OperationalData.timestamp <= end_date)
+        return time_keyset(query, OperationalData.timestamp, OperationalData.id, cursor, limit)
+    
+    @staticmethod
+    def get_page_by_vessel(
+        db: Session,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[OperationalData]:
+        """Página mais recente primeiro, por (timestamp, id), a partir do cursor"""
+        query = OperationalDataRepository.page_query(vessel_id, cursor, start_date, end_date, limit)
+        return time_page(db.scalars(query).all(), limit, "timestamp")
+    
     @staticmethod
     def get_latest(db: Session, vessel_id: str) -> Optional[OperationalData]:
         return (
@@ -195,6 +282,40 @@ class MaintenanceEventRepository:
         
         return query.order_by(desc(MaintenanceEvent.start_date)).limit(limit).all()
     
+    @staticmethod
+    def page_query(
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        event_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ):
+        query = select(MaintenanceEvent).where(MaintenanceEvent.vessel_id == vessel_id)
+        if event_type:
+            query = query.where(MaintenanceEvent.event_type == event_type)
+        if start_date:
+            query = query.where(MaintenanceEvent.start_date >= start_date)
+        if end_date:
+            query = query.where(MaintenanceEvent.start_date <= end_date)
+        return time_keyset(query, MaintenanceEvent.start_date, MaintenanceEvent.id, cursor, limit)
+    
+    @staticmethod
+    def get_page_by_vessel(
+        db: Session,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        event_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[MaintenanceEvent]:
+        """Página mais recente primeiro, por (start_date, id), a partir do cursor"""
+        query = MaintenanceEventRepository.page_query(
+            vessel_id, cursor, event_type, start_date, end_date, limit
+        )
+        return time_page(db.scalars(query).all(), limit, "start_date")
+    
     @staticmethod
     def get_latest(db: Session, vessel_id: str) -> Optional[MaintenanceEvent]:
         return (
@@ -223,6 +344,242 @@ class MaintenanceEventRepository:
         )
 
 
+@dataclass
+class FleetSnapshot:
+    """Estado mais recente de uma embarcação (uma linha por navio)"""
+    vessel: Vessel
+    latest_fouling: Optional[FoulingData] = None
+    last_cleaning: Optional[MaintenanceEvent] = None
+    last_painting: Optional[MaintenanceEvent] = None
+
+
+class FleetSnapshotRepository:
+    """
+    Repositório para o snapshot da frota.
+    
+    Retorna, em uma única consulta, a última predição de bioincrustação,
+    a última limpeza e a última pintura de cada embarcação, evitando
+    consultas N+1 nos endpoints de dashboard.
+    """
+    
+    @staticmethod
+    def _ranked_fouling_cte():
+        # MATERIALIZED: no SQLite impede o push-down dos filtros do JOIN para
+        # dentro da CTE e permite o uso de índice automático (vessel_id, rn)
+        return select(
+            FoulingData,
+            func.row_number().over(
+                partition_by=FoulingData.vessel_id,
+                order_by=(desc(FoulingData.timestamp), desc(FoulingData.id))
+            ).label("rn")
+        ).cte("ranked_fouling").prefix_with("MATERIALIZED")
+    
+    @staticmethod
+    def _ranked_maintenance_cte():
+        return select(
+            MaintenanceEvent,
+            func.row_number().over(
+                partition_by=(MaintenanceEvent.vessel_id, MaintenanceEvent.event_type),
+                order_by=(desc(MaintenanceEvent.start_date), desc(MaintenanceEvent.id))
+            ).label("rn")
+        ).cte("ranked_maintenance").prefix_with("MATERIALIZED")
+    
+    @staticmethod
+    def get_all(
+        db: Session,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[FleetSnapshot]:
+        fouling_cte = FleetSnapshotRepository._ranked_fouling_cte()
+        maintenance_cte = FleetSnapshotRepository._ranked_maintenance_cte()
+        cleaning_sq = maintenance_cte.alias("last_cleaning")
+        painting_sq = maintenance_cte.alias("last_painting")
+        
+        latest_fouling = aliased(FoulingData, fouling_cte)
+        last_cleaning = aliased(MaintenanceEvent, cleaning_sq)
+        last_painting = aliased(MaintenanceEvent, painting_sq)
+        
+        query = (
+            db.query(Vessel, latest_fouling, last_cleaning, last_painting)
+            .outerjoin(
+                latest_fouling,
+                and_(latest_fouling.vessel_id == Vessel.id, fouling_cte.c.rn == 1)
+            )
+            .outerjoin(
+                last_cleaning,
+                and_(
+                    last_cleaning.vessel_id == Vessel.id,
+                    last_cleaning.event_type == "cleaning",
+                    cleaning_sq.c.rn == 1
+                )
+            )
+            .outerjoin(
+                last_painting,
+                and_(
+                    last_painting.vessel_id == Vessel.id,
+                    last_painting.event_type == "painting",
+                    painting_sq.c.rn == 1
+                )
+            )
+        )
+        
+        if status:
+            query = query.filter(Vessel.status == status)
+        
+        query = query.order_by(Vessel.id)
+        if limit:
+            query = query.limit(limit)
+        
+        return [
+            FleetSnapshot(
+                vessel=vessel,
+                latest_fouling=fouling,
+                last_cleaning=cleaning,
+                last_painting=painting
+            )
+            for vessel, fouling, cleaning, painting in query.all()
+        ]
+    
+    @staticmethod
+    def get_by_vessel(db: Session, vessel_id: str) -> Optional[FleetSnapshot]:
+        """Snapshot de uma embarcação (consultas indexadas, sem varrer a frota)"""
+        vessel = VesselRepository.get_by_id(db, vessel_id)
+        if vessel is None:
+            return None
+        return FleetSnapshot(
+            vessel=vessel,
+            latest_fouling=FoulingDataRepository.get_latest(db, vessel_id),
+            last_cleaning=MaintenanceEventRepository.get_latest_by_type(db, vessel_id, "cleaning"),
+            last_painting=MaintenanceEventRepository.get_latest_by_type(db, vessel_id, "painting")
+        )
+
+
+@dataclass
+class MonthlyFoulingRollup:
+    """Agregado mensal de bioincrustação por classe de limite NORMAM 401"""
+    month: str  # YYYY-MM
+    limit_type: str  # classe de limite (tipo com limite específico ou 'standard')
+    readings: int
+    thickness_sum: float
+    roughness_sum: float
+    capped_thickness_sum: float  # Σ min(espessura, limite do tipo)
+    capped_roughness_sum: float  # Σ min(rugosidade, limite do tipo)
+    fuel_impact_kg_h: float  # Σ consumo típico × impacto (%) / 100, para impactos não nulos
+    co2_impact_kg_h: float  # Σ CO₂ das leituras com impacto de combustível
+
+
+class FleetTrendsRepository:
+    """
+    Repositório para as tendências mensais da frota.
+    
+    Agrega no banco (GROUP BY mês) em vez de carregar todas as leituras:
+    strftime no SQLite e date_trunc/to_char no PostgreSQL.
+    """
+    
+    DEFAULT_TYPICAL_CONSUMPTION_KG_H = 1000.0
+    
+    @staticmethod
+    def month_bucket(db: Session, column):
+        """Expressão 'YYYY-MM' do mês de uma coluna datetime"""
+        if db.get_bind().dialect.name == "postgresql":
+            return func.to_char(func.date_trunc("month", column), "YYYY-MM")
+        return func.strftime("%Y-%m", column)
+    
+    @staticmethod
+    def get_monthly_fouling(
+        db: Session,
+        start_date: datetime,
+        limits: Dict[str, Dict[str, float]],
+        default_type: str = "standard"
+    ) -> List[MonthlyFoulingRollup]:
+        """
+        Agrega as leituras de bioincrustação por mês e classe de limite.
+        
+        Args:
+            start_date: Leituras a partir desta data
+            limits: Limites por tipo ({tipo: {"thickness": mm, "roughness": μm}})
+            default_type: Classe usada para tipos sem limite específico
+        """
+        vessel_type = func.lower(func.coalesce(Vessel.vessel_type, default_type))
+        limit_type = case(
+            *[(vessel_type == name, literal(name)) for name in limits if name != default_type],
+            else_=literal(default_type)
+        )
+        
+        def type_limit(key: str):
+            return case(
+                *[(vessel_type == name, value[key]) for name, value in limits.items() if name != default_type],
+                else_=limits[default_type][key]
+            )
+        
+        def capped(value, cap):
+            return case((value > cap, cap), else_=value)
+        
+        thickness = func.coalesce(FoulingData.estimated_thickness_mm, 0.0)
+        roughness = func.coalesce(FoulingData.estimated_roughness_um, 0.0)
+        fuel_impact = FoulingData.predicted_fuel_impact_percent
+        has_fuel_impact = and_(fuel_impact.isnot(None), fuel_impact != 0)
+        typical_consumption = case(
+            (func.coalesce(Vessel.typical_consumption_kg_h, 0) == 0,
+             FleetTrendsRepository.DEFAULT_TYPICAL_CONSUMPTION_KG_H),
+            else_=Vessel.typical_consumption_kg_h
+        )
+        
+        month = FleetTrendsRepository.month_bucket(db, FoulingData.timestamp).label("month")
+        # Rótulo diferente de vessels.vessel_type: no PostgreSQL o GROUP BY
+        # por nome resolveria para a coluna de origem
+        limit_type = limit_type.label("limit_type")
+        rows = (
+            db.query(
+                month,
+                limit_type,
+                func.count(FoulingData.id),
+                func.sum(thickness),
+                func.sum(roughness),
+                func.sum(capped(thickness, type_limit("thickness"))),
+                func.sum(capped(roughness, type_limit("roughness"))),
+                func.sum(case(
+                    (has_fuel_impact, typical_consumption * case((fuel_impact > 0, fuel_impact), else_=0.0) / 100),
+                    else_=0.0
+                )),
+                func.sum(case((has_fuel_impact, func.coalesce(FoulingData.predicted_co2_impact_kg, 0.0)), else_=0.0)),
+            )
+            .join(Vessel, Vessel.id == FoulingData.vessel_id)
+            .filter(FoulingData.timestamp >= start_date)
+            .group_by(month, limit_type)
+            .order_by(month)
+            .all()
+        )
+        
+        return [
+            MonthlyFoulingRollup(
+                month=row[0],
+                limit_type=row[1],
+                readings=row[2],
+                thickness_sum=row[3] or 0.0,
+                roughness_sum=row[4] or 0.0,
+                capped_thickness_sum=row[5] or 0.0,
+                capped_roughness_sum=row[6] or 0.0,
+                fuel_impact_kg_h=row[7] or 0.0,
+                co2_impact_kg_h=row[8] or 0.0,
+            )
+            for row in rows
+        ]
+    
+    @staticmethod
+    def get_monthly_maintenance_counts(db: Session, start_date: datetime) -> Dict[str, int]:
+        """Eventos de manutenção por mês ('YYYY-MM' -> quantidade)"""
+        month = FleetTrendsRepository.month_bucket(db, MaintenanceEvent.start_date).label("month")
+        rows = (
+            db.query(month, func.count(MaintenanceEvent.id))
+            .join(Vessel, Vessel.id == MaintenanceEvent.vessel_id)
+            .filter(MaintenanceEvent.start_date >= start_date)
+            .group_by(month)
+            .all()
+        )
+        return {month_key: count for month_key, count in rows}
+
+
 class NORMAM401RiskRepository:
     """Repositório para riscos NORMAM 401"""
     
@@ -355,3 +712,316 @@ class CleaningMethodRepository:
             .all()
         )
 
+
+class IngestionLedgerRepository:
+    """Repositório para o registro de ingestão de arquivos"""
+    
+    @staticmethod
+    def get_by_file(db: Session, source: str, file_path: str) -> List[IngestionLedger]:
+        return (
+            db.query(IngestionLedger)
+            .filter(IngestionLedger.source == source)
+            .filter(IngestionLedger.file_path == file_path)
+            .all()
+        )
+    
+    @staticmethod
+    def upsert(
+        db: Session,
+        source: str,
+        file_path: str,
+        vessel_id: str,
+        ledger_data: Dict
+    ) -> IngestionLedger:
+        entry = (
+            db.query(IngestionLedger)
+            .filter(IngestionLedger.source == source)
+            .filter(IngestionLedger.file_path == file_path)
+            .filter(IngestionLedger.vessel_id == vessel_id)
+            .first()
+        )
+        if entry is None:
+            entry = IngestionLedger(source=source, file_path=file_path, vessel_id=vessel_id)
+            db.add(entry)
+        for key, value in ledger_data.items():
+            setattr(entry, key, value)
+        db.commit()
+        db.refresh(entry)
+        return entry
+
+
+class FleetStateRepository:
+    """Repositório para o estado materializado da frota"""
+    
+    @staticmethod
+    def get_all(db: Session, status: Optional[str] = None) -> List[FleetState]:
+        query = db.query(FleetState)
+        if status:
+            query = query.filter(FleetState.status == status)
+        return query.order_by(FleetState.vessel_id).all()
+    
+    @staticmethod
+    def count(db: Session) -> int:
+        return db.query(func.count(FleetState.vessel_id)).scalar() or 0
+    
+    @staticmethod
+    def upsert(db: Session, state_data: Dict) -> FleetState:
+        """Insere ou atualiza a linha da embarcação (commit fica com o chamador)"""
+        state = db.get(FleetState, state_data["vessel_id"])
+        if state is None:
+            state = FleetState(vessel_id=state_data["vessel_id"])
+            db.add(state)
+        for key, value in state_data.items():
+            setattr(state, key, value)
+        state.updated_at = datetime.utcnow()
+        return state
+    
+    @staticmethod
+    def delete(db: Session, vessel_id: str) -> bool:
+        return db.query(FleetState).filter(FleetState.vessel_id == vessel_id).delete() > 0
+
+
+# ==================== REPOSITÓRIOS ASSÍNCRONOS ====================
+#
+# Variantes para AsyncSession, usadas pelos handlers async da API: a espera
+# pelo banco não bloqueia o event loop. As consultas compostas (snapshot da
+# frota, tendências mensais) reutilizam a implementação síncrona via
+# AsyncSession.run_sync.
+
+
+class AsyncVesselRepository:
+    """Repositório assíncrono para embarcações"""
+    
+    @staticmethod
+    async def get_all(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Vessel]:
+        result = await db.execute(select(Vessel).offset(skip).limit(limit))
+        return list(result.scalars())
+    
+    @staticmethod
+    async def get_by_id(db: AsyncSession, vessel_id: str) -> Optional[Vessel]:
+        return await db.get(Vessel, vessel_id)
+    
+    @staticmethod
+    async def get_by_type(db: AsyncSession, vessel_type: str) -> List[Vessel]:
+        result = await db.execute(select(Vessel).where(Vessel.vessel_type == vessel_type))
+        return list(result.scalars())
+    
+    @staticmethod
+    async def get_by_status(db: AsyncSession, status: str) -> List[Vessel]:
+        result = await db.execute(select(Vessel).where(Vessel.status == status))
+        return list(result.scalars())
+    
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        vessel_type: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Page[Vessel]:
+        query = VesselRepository.page_query(cursor, limit, vessel_type, status)
+        return id_page((await db.scalars(query)).all(), limit)
+    
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        return (await db.scalar(select(func.count(Vessel.id)))) or 0
+
+
+class AsyncFoulingDataRepository:
+    """Repositório assíncrono para dados de bioincrustação"""
+    
+    @staticmethod
+    async def get_by_vessel(
+        db: AsyncSession,
+        vessel_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[FoulingData]:
+        query = select(FoulingData).where(FoulingData.vessel_id == vessel_id)
+        
+        if start_date:
+            query = query.where(FoulingData.timestamp >= start_date)
+        if end_date:
+            query = query.where(FoulingData.timestamp <= end_date)
+        
+        result = await db.execute(query.order_by(desc(FoulingData.timestamp)).limit(limit))
+        return list(result.scalars())
+    
+    @staticmethod
+    async def get_page_by_vessel(
+        db: AsyncSession,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[FoulingData]:
+        query = FoulingDataRepository.page_query(vessel_id, cursor, start_date, end_date, limit)
+        return time_page((await db.scalars(query)).all(), limit, "timestamp")
+    
+    @staticmethod
+    async def get_latest(db: AsyncSession, vessel_id: str) -> Optional[FoulingData]:
+        result = await db.execute(
+            select(FoulingData)
+            .where(FoulingData.vessel_id == vessel_id)
+            .order_by(desc(FoulingData.timestamp))
+            .limit(1)
+        )
+        return result.scalars().first()
+
+
+class AsyncOperationalDataRepository:
+    """Repositório assíncrono para dados operacionais"""
+    
+    @staticmethod
+    async def get_by_vessel(
+        db: AsyncSession,
+        vessel_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[OperationalData]:
+        query = select(OperationalData).where(OperationalData.vessel_id == vessel_id)
+        
+        if start_date:
+            query = query.where(OperationalData.timestamp >= start_date)
+        if end_date:
+            query = query.where(OperationalData.timestamp <= end_date)
+        
+        result = await db.execute(query.order_by(desc(OperationalData.timestamp)).limit(limit))
+        return list(result.scalars())
+    
+    @staticmethod
+    async def get_page_by_vessel(
+        db: AsyncSession,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[OperationalData]:
+        query = OperationalDataRepository.page_query(vessel_id, cursor, start_date, end_date, limit)
+        return time_page((await db.scalars(query)).all(), limit, "timestamp")
+    
+    @staticmethod
+    async def get_latest(db: AsyncSession, vessel_id: str) -> Optional[OperationalData]:
+        result = await db.execute(
+            select(OperationalData)
+            .where(OperationalData.vessel_id == vessel_id)
+            .order_by(desc(OperationalData.timestamp))
+            .limit(1)
+        )
+        return result.scalars().first()
+
+
+class AsyncMaintenanceEventRepository:
+    """Repositório assíncrono para eventos de manutenção"""
+    
+    @staticmethod
+    async def get_by_vessel(
+        db: AsyncSession,
+        vessel_id: str,
+        event_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[MaintenanceEvent]:
+        query = select(MaintenanceEvent).where(MaintenanceEvent.vessel_id == vessel_id)
+        
+        if event_type:
+            query = query.where(MaintenanceEvent.event_type == event_type)
+        
+        if start_date:
+            query = query.where(MaintenanceEvent.start_date >= start_date)
+        
+        if end_date:
+            query = query.where(MaintenanceEvent.start_date <= end_date)
+        
+        result = await db.execute(query.order_by(desc(MaintenanceEvent.start_date)).limit(limit))
+        return list(result.scalars())
+    
+    @staticmethod
+    async def get_page_by_vessel(
+        db: AsyncSession,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        event_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[MaintenanceEvent]:
+        query = MaintenanceEventRepository.page_query(
+            vessel_id, cursor, event_type, start_date, end_date, limit
+        )
+        return time_page((await db.scalars(query)).all(), limit, "start_date")
+    
+    @staticmethod
+    async def get_latest(db: AsyncSession, vessel_id: str) -> Optional[MaintenanceEvent]:
+        result = await db.execute(
+            select(MaintenanceEvent)
+            .where(MaintenanceEvent.vessel_id == vessel_id)
+            .order_by(desc(MaintenanceEvent.start_date))
+            .limit(1)
+        )
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_latest_by_type(
+        db: AsyncSession,
+        vessel_id: str,
+        event_type: str
+    ) -> Optional[MaintenanceEvent]:
+        result = await db.execute(
+            select(MaintenanceEvent)
+            .where(
+                and_(
+                    MaintenanceEvent.vessel_id == vessel_id,
+                    MaintenanceEvent.event_type == event_type
+                )
+            )
+            .order_by(desc(MaintenanceEvent.start_date))
+            .limit(1)
+        )
+        return result.scalars().first()
+
+
+class AsyncFleetSnapshotRepository:
+    """Snapshot da frota (ver FleetSnapshotRepository) para AsyncSession"""
+    
+    @staticmethod
+    async def get_all(
+        db: AsyncSession,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[FleetSnapshot]:
+        return await db.run_sync(FleetSnapshotRepository.get_all, status, limit)
+
+
+class AsyncFleetStateRepository:
+    """Estado materializado da frota para AsyncSession"""
+    
+    @staticmethod
+    async def get_all(db: AsyncSession, status: Optional[str] = None) -> List[FleetState]:
+        query = select(FleetState)
+        if status:
+            query = query.where(FleetState.status == status)
+        result = await db.execute(query.order_by(FleetState.vessel_id))
+        return list(result.scalars())
+
+
+class AsyncFleetTrendsRepository:
+    """Agregados mensais (ver FleetTrendsRepository) para AsyncSession"""
+    
+    @staticmethod
+    async def get_monthly_fouling(
+        db: AsyncSession,
+        start_date: datetime,
+        limits: Dict[str, Dict[str, float]],
+        default_type: str = "standard"
+    ) -> List[MonthlyFoulingRollup]:
+        return await db.run_sync(FleetTrendsRepository.get_monthly_fouling, start_date, limits, default_type)
+    
+    @staticmethod
+    async def get_monthly_maintenance_counts(db: AsyncSession, start_date: datetime) -> Dict[str, int]:
+        return await db.run_sync(FleetTrendsRepository.get_monthly_maintenance_counts, start_date)
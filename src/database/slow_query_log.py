@@ -0,0 +1,194 @@
+"""
+Log de Consultas Lentas - HullZero
+
+Registra toda consulta acima de SLOW_QUERY_THRESHOLD_MS, a partir dos
+eventos de cursor dos engines (database.py), com:
+- parâmetros vinculados;
+- rota da requisição que a executou (quando há uma, ver metrics_service);
+- plano de execução capturado no momento (EXPLAIN QUERY PLAN no SQLite,
+  EXPLAIN no PostgreSQL), com indicação de varredura completa de tabela
+  (ex.: filtro que não usa idx_fouling_vessel_time).
+
+As consultas são agrupadas pelo texto SQL (os valores ficam nos
+parâmetros). O ranking por tempo total fica em /api/admin/slow-queries.
+"""
+
+import re
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..services.metrics_service import current_request
+
+MAX_PARAMETERS_LENGTH = 1000
+MAX_ROUTES_PER_STATEMENT = 10
+ORDER_FIELDS = ("total_ms", "max_ms", "count")
+
+# Comandos que EXPLAIN analisa sem executar
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+_WHITESPACE = re.compile(r"\s+")
+_CTE_NAME = re.compile(r"(\w+) AS (?:NOT )?(?:MATERIALIZED )?\(", re.IGNORECASE)
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\S+)")
+
+
+def _format_parameters(parameters) -> str:
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        text = text[:MAX_PARAMETERS_LENGTH] + "..."
+    return text
+
+
+def _sqlite_plan(rows) -> List[str]:
+    """Linhas do EXPLAIN QUERY PLAN (id, parent, notused, detail) indentadas pela árvore"""
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+def _is_full_scan(plan: List[str], statement: str) -> bool:
+    """Varredura de tabela sem índice (subconsultas e CTEs materializadas não contam)"""
+    cte_names = {name.lower() for name in _CTE_NAME.findall(statement)}
+    for line in plan:
+        detail = line.strip()
+        if "Seq Scan" in detail:
+            return True
+        match = _SQLITE_SCAN.match(detail)
+        if match and " USING " not in detail:
+            name = match.group(1)
+            if not name.startswith("(") and name.lower() not in cte_names:
+                return True
+    return False
+
+
+def explain(conn, statement: str, parameters) -> Optional[List[str]]:
+    """
+    Plano da consulta na mesma conexão (cursor do driver, fora dos eventos).
+    None se o banco não for suportado ou o EXPLAIN falhar.
+    """
+    dialect = conn.dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        return None
+    if statement.lstrip().split(None, 1)[0].upper() not in _EXPLAINABLE:
+        return None
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    # No PostgreSQL um erro abortaria a transação da requisição
+    savepoint = dialect == "postgresql" and conn.in_transaction()
+    try:
+        if savepoint:
+            cursor.execute("SAVEPOINT hullzero_explain")
+        try:
+            if dialect == "sqlite":
+                cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+                plan = _sqlite_plan(cursor.fetchall())
+            else:
+                cursor.execute("EXPLAIN " + statement, parameters)
+                plan = [row[0] for row in cursor.fetchall()]
+        except Exception:
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT hullzero_explain")
+            return None
+        if savepoint:
+            cursor.execute("RELEASE SAVEPOINT hullzero_explain")
+        return plan
+    except Exception:
+        return None
+    finally:
+        cursor.close()
+
+
+class SlowQueryLog:
+    """Consultas lentas agregadas por texto SQL (limitado a max_statements)"""
+
+    def __init__(self, threshold_ms: float, capture_plan: bool = True, max_statements: int = 200):
+        self.threshold_ms = threshold_ms
+        self.capture_plan = capture_plan
+        self.max_statements = max_statements
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, conn, statement: str, parameters, executemany: bool, seconds: float):
+        """Chamado após cada consulta; registra as que passaram do limite"""
+        duration_ms = seconds * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        timing = current_request()
+        route = timing.route() if timing is not None else None
+        plan = None
+        if self.capture_plan and not executemany:
+            plan = explain(conn, statement, parameters)
+        full_scan = _is_full_scan(plan, statement) if plan else None
+        self.record(statement, parameters, duration_ms, route, plan, full_scan)
+
+        print(
+            f"⚠️  Consulta lenta ({duration_ms:.1f} ms) em {route or 'fora de requisição'}"
+            f"{' [varredura completa]' if full_scan else ''}: "
+            f"{_WHITESPACE.sub(' ', statement).strip()[:200]}"
+        )
+
+    def record(
+        self,
+        statement: str,
+        parameters,
+        duration_ms: float,
+        route: Optional[str] = None,
+        plan: Optional[List[str]] = None,
+        full_scan: Optional[bool] = None
+    ):
+        key = _WHITESPACE.sub(" ", statement).strip()
+        now = datetime.now().isoformat()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_statements:
+                    cheapest = min(self._entries, key=lambda item: self._entries[item]["total_ms"])
+                    del self._entries[cheapest]
+                entry = self._entries[key] = {
+                    "statement": key,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "first_seen": now,
+                    "routes": [],
+                }
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["last_seen"] = now
+            if route and route not in entry["routes"] and len(entry["routes"]) < MAX_ROUTES_PER_STATEMENT:
+                entry["routes"].append(route)
+            # Parâmetros e plano da execução mais lenta
+            if duration_ms >= entry["max_ms"]:
+                entry["max_ms"] = duration_ms
+                entry["slowest"] = {
+                    "duration_ms": round(duration_ms, 1),
+                    "at": now,
+                    "route": route,
+                    "parameters": _format_parameters(parameters),
+                    "plan": plan,
+                    "full_scan": full_scan,
+                }
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[Dict]:
+        """Consultas mais custosas (por tempo total, máximo ou contagem)"""
+        if order_by not in ORDER_FIELDS:
+            raise ValueError(f"order_by deve ser um de {ORDER_FIELDS}")
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda item: item[order_by], reverse=True)[:limit]
+            return [
+                {
+                    **entry,
+                    "routes": list(entry["routes"]),
+                    "total_ms": round(entry["total_ms"], 1),
+                    "max_ms": round(entry["max_ms"], 1),
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 1),
+                }
+                for entry in entries
+            ]
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,16 +1,29 @@
 """
 Modelos de IA/ML para predição de bioincrustação e impacto no combustível
+
+Os submódulos são carregados no primeiro acesso (scikit-learn, XGBoost e
+SciPy levam segundos para importar): `import src.models.normam401_risk` ou
+`from src.models import predict_fouling` importam apenas o necessário.
 """
 
-from .fouling_prediction import predict_fouling, VesselFeatures, FoulingPrediction
-from .fuel_impact import calculate_fuel_impact, ConsumptionFeatures, FuelImpactResult
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'predict_fouling': '.fouling_prediction',
+    'VesselFeatures': '.fouling_prediction',
+    'FoulingPrediction': '.fouling_prediction',
+    'calculate_fuel_impact': '.fuel_impact',
+    'ConsumptionFeatures': '.fuel_impact',
+    'FuelImpactResult': '.fuel_impact',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
 
-__all__ = [
-    'predict_fouling',
-    'VesselFeatures',
-    'FoulingPrediction',
-    'calculate_fuel_impact',
-    'ConsumptionFeatures',
-    'FuelImpactResult'
-]
 
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
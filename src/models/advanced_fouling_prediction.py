@@ -8,9 +8,9 @@ e técnicas de machine learning de última geração.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -42,9 +42,16 @@ except ImportError:
     PROPHET_AVAILABLE = False
     Prophet = None
 
+from .model_registry import get_model_registry
+from .fouling_prediction import HISTORY_ROW_DEFAULTS, features_to_frame
+from .feature_encoding import CategoricalEncoder
+
 # Physical Constants
 CO2_EMISSION_FACTOR = 3.15  # kg CO2 per kg fuel
 
+# Nome do modelo no registro de modelos
+ADVANCED_MODEL_NAME = "fouling_advanced"
+
 # Dados baseados em pesquisas científicas
 # Fonte: Tese Mikael Luiz Morales Pereira (2025) - FURG
 MACROPHYTE_EXTRACTS_EFFICACY = {
@@ -112,6 +119,64 @@ class AdvancedVesselFeatures:
     depth_m: Optional[float] = None  # Profundidade média de operação
 
 
+# Colunas do DataFrame usado nas predições em lote
+ADVANCED_FEATURE_COLUMNS = [f.name for f in fields(AdvancedVesselFeatures)]
+
+# Valores padrão das features opcionais numéricas (mesma ordem de prepare_features)
+OPTIONAL_FEATURE_DEFAULTS = {
+    'paint_age_days': 180.0,
+    'port_water_quality_index': 0.7,
+    'chlorophyll_a_concentration': 2.0,
+    'dissolved_oxygen': 6.0,
+    'ph_level': 7.5,
+    'turbidity': 5.0,
+    'current_velocity': 0.5,
+    'depth_m': 20.0,
+}
+
+SEASONAL_MULTIPLIERS = {
+    'summer': 1.3,  # Maior crescimento no verão
+    'spring': 1.1,
+    'autumn': 0.9,
+    'winter': 0.7
+}
+
+# Features opcionais (podem faltar em um DataFrame de entrada)
+_OPTIONAL_ADVANCED_COLUMNS = {
+    f.name for f in fields(AdvancedVesselFeatures) if f.default is None
+}
+
+# Entrada aceita pelas predições em lote
+AdvancedFeatureBatch = Union[Sequence[AdvancedVesselFeatures], pd.DataFrame]
+
+
+def advanced_features_to_frame(features: AdvancedFeatureBatch) -> pd.DataFrame:
+    """
+    Converte um lote de features avançadas em DataFrame.
+    
+    Colunas opcionais ausentes de um DataFrame de entrada são criadas
+    vazias (None), como os defaults da dataclass.
+    """
+    if isinstance(features, pd.DataFrame):
+        features = features.copy()
+        for name in _OPTIONAL_ADVANCED_COLUMNS - set(features.columns):
+            features[name] = None
+    return features_to_frame(features, ADVANCED_FEATURE_COLUMNS)
+
+
+def _numeric_column(frame: pd.DataFrame, name: str) -> np.ndarray:
+    """Coluna numérica com None convertido em NaN"""
+    values = frame[name]
+    if values.dtype != object:
+        return values.to_numpy(dtype=float)
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+
+
+def _unwrap(values: np.ndarray):
+    """Resultado de entrada escalar (array 0-d) como float; arrays inalterados"""
+    return float(values) if np.ndim(values) == 0 else values
+
+
 class AdvancedPhysicalModel:
     """
     Modelo físico avançado baseado em princípios de biologia marinha,
@@ -126,73 +191,79 @@ class AdvancedPhysicalModel:
         self.salinity_optimum = 32.5  # PSU
         self.salinity_range = (28.0, 38.0)
         
-    def calculate_temperature_factor(self, temperature: float) -> float:
-        """Fator de temperatura (curva gaussiana melhorada)"""
-        if self.temperature_range[0] <= temperature <= self.temperature_range[1]:
-            # Dentro da faixa ótima
-            temp_factor = np.exp(-0.5 * ((temperature - self.temperature_optimum) / 4.0) ** 2)
-        else:
-            # Fora da faixa ótima - crescimento reduzido
-            if temperature < self.temperature_range[0]:
-                temp_factor = 0.3 * np.exp(-0.5 * ((temperature - self.temperature_range[0]) / 3.0) ** 2)
-            else:
-                temp_factor = 0.3 * np.exp(-0.5 * ((temperature - self.temperature_range[1]) / 3.0) ** 2)
-        return max(0.1, min(1.0, temp_factor))
+    def calculate_temperature_factor(self, temperature):
+        """Fator de temperatura (curva gaussiana melhorada; aceita escalar ou array)"""
+        temperature = np.asarray(temperature, dtype=float)
+        low, high = self.temperature_range
+        temp_factor = np.select(
+            [temperature < low, temperature > high],
+            [
+                # Fora da faixa ótima - crescimento reduzido
+                0.3 * np.exp(-0.5 * ((temperature - low) / 3.0) ** 2),
+                0.3 * np.exp(-0.5 * ((temperature - high) / 3.0) ** 2)
+            ],
+            default=np.exp(-0.5 * ((temperature - self.temperature_optimum) / 4.0) ** 2)
+        )
+        return _unwrap(np.clip(temp_factor, 0.1, 1.0))
     
-    def calculate_salinity_factor(self, salinity: float) -> float:
-        """Fator de salinidade"""
-        if self.salinity_range[0] <= salinity <= self.salinity_range[1]:
-            salinity_factor = np.exp(-0.5 * ((salinity - self.salinity_optimum) / 3.0) ** 2)
-        else:
-            salinity_factor = 0.5
-        return max(0.1, min(1.0, salinity_factor))
+    def calculate_salinity_factor(self, salinity):
+        """Fator de salinidade (aceita escalar ou array)"""
+        salinity = np.asarray(salinity, dtype=float)
+        in_range = (salinity >= self.salinity_range[0]) & (salinity <= self.salinity_range[1])
+        salinity_factor = np.where(
+            in_range,
+            np.exp(-0.5 * ((salinity - self.salinity_optimum) / 3.0) ** 2),
+            0.5
+        )
+        return _unwrap(np.clip(salinity_factor, 0.1, 1.0))
     
-    def calculate_nutrient_factor(self, chlorophyll_a: Optional[float], do: Optional[float]) -> float:
-        """Fator de nutrientes (clorofila-a e oxigênio dissolvido)"""
-        nutrient_factor = 1.0
-        
-        if chlorophyll_a is not None:
-            # Mais nutrientes = mais crescimento (até certo ponto)
-            # Ótimo: 2-5 mg/m³
-            if 2.0 <= chlorophyll_a <= 5.0:
-                nutrient_factor *= 1.2
-            elif chlorophyll_a > 10.0:
-                nutrient_factor *= 1.4  # Eutrofização
-            elif chlorophyll_a < 0.5:
-                nutrient_factor *= 0.8  # Águas oligotróficas
-        
-        if do is not None:
-            # Oxigênio dissolvido afeta crescimento
-            if do < 4.0:  # Hipóxia
-                nutrient_factor *= 0.7
-            elif do > 8.0:  # Águas bem oxigenadas
-                nutrient_factor *= 1.1
-        
-        return nutrient_factor
+    def calculate_nutrient_factor(self, chlorophyll_a, do):
+        """
+        Fator de nutrientes (clorofila-a e oxigênio dissolvido).
+        
+        Aceita escalares ou arrays; valores ausentes (None ou NaN) não
+        satisfazem nenhuma condição (fator neutro).
+        """
+        chlorophyll_a = np.asarray(chlorophyll_a, dtype=float)
+        do = np.asarray(do, dtype=float)
+        
+        # Mais nutrientes = mais crescimento (até certo ponto)
+        # Ótimo: 2-5 mg/m³; eutrofização acima de 10; oligotróficas abaixo de 0.5
+        chlorophyll_factor = np.select(
+            [
+                (chlorophyll_a >= 2.0) & (chlorophyll_a <= 5.0),
+                chlorophyll_a > 10.0,
+                chlorophyll_a < 0.5
+            ],
+            [1.2, 1.4, 0.8],
+            default=1.0
+        )
+        # Oxigênio dissolvido: hipóxia abaixo de 4, águas bem oxigenadas acima de 8
+        do_factor = np.select([do < 4.0, do > 8.0], [0.7, 1.1], default=1.0)
+        return _unwrap(chlorophyll_factor * do_factor)
     
-    def calculate_invasive_species_risk(
-        self,
-        route_region: str,
-        water_temperature_c: float
-    ) -> Dict[str, float]:
-        """Calcula risco de espécies invasoras baseado em região e temperatura"""
+    def calculate_invasive_species_risk(self, route_region, water_temperature_c) -> Dict:
+        """
+        Calcula risco de espécies invasoras baseado em região e temperatura.
+        
+        Aceita escalares ou arrays; retorna o risco (float ou array) por espécie.
+        """
+        route_region = np.asarray(route_region, dtype=object)
+        water_temperature_c = np.asarray(water_temperature_c, dtype=float)
         risks = {}
         
         for species, data in INVASIVE_SPECIES_RISK.items():
-            if route_region in data["regions"]:
+            in_region = np.isin(route_region, data["regions"])
+            if species == "Tubastraea_coccinea":
                 # Temperatura adequada para coral sol: 20-30°C
-                if species == "Tubastraea_coccinea":
-                    if 20.0 <= water_temperature_c <= 30.0:
-                        temp_suitability = 1.0
-                    else:
-                        temp_suitability = 0.5
-                else:
-                    temp_suitability = 1.0
-                
-                risk = data["growth_rate_multiplier"] * temp_suitability
-                risks[species] = min(1.0, risk)
+                temp_suitability = np.where(
+                    (water_temperature_c >= 20.0) & (water_temperature_c <= 30.0), 1.0, 0.5
+                )
             else:
-                risks[species] = 0.1  # Risco baixo fora da região
+                temp_suitability = 1.0
+            
+            risk = np.minimum(1.0, data["growth_rate_multiplier"] * temp_suitability)
+            risks[species] = _unwrap(np.where(in_region, risk, 0.1))  # Risco baixo fora da região
         
         return risks
     
@@ -206,42 +277,55 @@ class AdvancedPhysicalModel:
         Returns:
             (thickness_mm, invasive_species_risks)
         """
-        days = features.time_since_cleaning_days
+        thickness, invasive_risks = self.predict_growth_batch(advanced_features_to_frame([features]))
+        return float(thickness[0]), {species: float(risk[0]) for species, risk in invasive_risks.items()}
+    
+    def predict_growth_batch(
+        self,
+        frame: pd.DataFrame
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Prediz crescimento para um lote (predict_growth usa um lote de uma linha).
+        
+        Args:
+            frame: DataFrame com as colunas de AdvancedVesselFeatures
+            
+        Returns:
+            (thickness_mm por linha, risco por espécie invasora por linha)
+        """
+        days = _numeric_column(frame, 'time_since_cleaning_days')
+        temperature = _numeric_column(frame, 'water_temperature_c')
         
         # Fatores ambientais
-        temp_factor = self.calculate_temperature_factor(features.water_temperature_c)
-        salinity_factor = self.calculate_salinity_factor(features.salinity_psu)
+        temp_factor = self.calculate_temperature_factor(temperature)
+        salinity_factor = self.calculate_salinity_factor(_numeric_column(frame, 'salinity_psu'))
         nutrient_factor = self.calculate_nutrient_factor(
-            features.chlorophyll_a_concentration,
-            features.dissolved_oxygen
+            _numeric_column(frame, 'chlorophyll_a_concentration'),
+            _numeric_column(frame, 'dissolved_oxygen')
         )
         
         # Fator de tempo em porto
-        port_factor = 1.0 + (features.time_in_port_hours / 24.0) * 0.15
+        port_factor = 1.0 + (_numeric_column(frame, 'time_in_port_hours') / 24.0) * 0.15
         
         # Fator de velocidade (reduz crescimento)
-        speed_factor = max(0.2, 1.0 - (features.average_speed_knots / 20.0) * 0.8)
+        speed_factor = np.maximum(
+            0.2, 1.0 - (_numeric_column(frame, 'average_speed_knots') / 20.0) * 0.8
+        )
         
         # Fator sazonal
-        seasonal_multiplier = 1.0
-        if features.seasonal_factor:
-            seasonal_factors = {
-                'summer': 1.3,  # Maior crescimento no verão
-                'spring': 1.1,
-                'autumn': 0.9,
-                'winter': 0.7
-            }
-            seasonal_multiplier = seasonal_factors.get(features.seasonal_factor, 1.0)
+        seasonal_multiplier = np.array(
+            [SEASONAL_MULTIPLIERS.get(season, 1.0) for season in frame['seasonal_factor']],
+            dtype=float
+        )
         
         # Risco de espécies invasoras
         invasive_risks = self.calculate_invasive_species_risk(
-            features.route_region,
-            features.water_temperature_c
+            frame['route_region'].to_numpy(), temperature
         )
         
-        # Ajuste por espécies invasoras
-        max_invasive_risk = max(invasive_risks.values()) if invasive_risks else 0.0
-        invasive_factor = 1.0 + (max_invasive_risk - 1.0) * 0.5  # Até 25% de aumento
+        # Ajuste por espécies invasoras (até 25% de aumento)
+        max_invasive_risk = np.maximum.reduce(list(invasive_risks.values()))
+        invasive_factor = 1.0 + (max_invasive_risk - 1.0) * 0.5
         
         # Taxa de crescimento combinada
         growth_rate = (
@@ -259,7 +343,11 @@ class AdvancedPhysicalModel:
         max_thickness = 15.0  # mm
         thickness = max_thickness * (1 - np.exp(-growth_rate * days / 30.0))
         
-        return max(0.0, thickness), invasive_risks
+        return np.maximum(0.0, thickness), invasive_risks
+
+
+# Variáveis categóricas codificadas pelo encoder do ensemble
+ADVANCED_CATEGORICAL_COLUMNS = ('route_region', 'paint_type', 'vessel_type', 'seasonal_factor')
 
 
 class AdvancedMLModel:
@@ -270,76 +358,43 @@ class AdvancedMLModel:
     def __init__(self):
         self.models = {}
         self.scalers = {}
-        self.label_encoders = {}
+        self.encoder = CategoricalEncoder(ADVANCED_CATEGORICAL_COLUMNS)
         self.is_trained = False
         self.feature_importance = {}
+    
+    def __setstate__(self, state):
+        # Artefatos anteriores ao encoder determinístico: ver MLFoulingModel
+        if 'encoder' not in state:
+            print("⚠️  Ensemble sem vocabulário categórico persistido; retreine o modelo")
+            state.pop('label_encoders', None)
+            state['encoder'] = CategoricalEncoder(ADVANCED_CATEGORICAL_COLUMNS)
+            state['is_trained'] = False
+        self.__dict__.update(state)
         
     def prepare_features(self, features: AdvancedVesselFeatures) -> np.ndarray:
-        """Prepara features avançadas"""
-        # Features numéricas
-        numeric_features = [
-            features.time_since_cleaning_days,
-            features.water_temperature_c,
-            features.salinity_psu,
-            features.time_in_port_hours,
-            features.average_speed_knots,
-            features.hull_area_m2,
+        """Prepara features avançadas (matriz de uma linha)"""
+        return self.prepare_features_batch(advanced_features_to_frame([features]))
+    
+    def prepare_features_batch(self, frame: pd.DataFrame) -> np.ndarray:
+        """Prepara a matriz de features para um lote"""
+        columns = [
+            _numeric_column(frame, name)
+            for name in (
+                'time_since_cleaning_days', 'water_temperature_c', 'salinity_psu',
+                'time_in_port_hours', 'average_speed_knots', 'hull_area_m2'
+            )
         ]
         
         # Features opcionais
-        if features.paint_age_days is not None:
-            numeric_features.append(features.paint_age_days)
-        else:
-            numeric_features.append(180.0)  # Default
-        
-        if features.port_water_quality_index is not None:
-            numeric_features.append(features.port_water_quality_index)
-        else:
-            numeric_features.append(0.7)  # Default
-        
-        if features.chlorophyll_a_concentration is not None:
-            numeric_features.append(features.chlorophyll_a_concentration)
-        else:
-            numeric_features.append(2.0)  # Default
-        
-        if features.dissolved_oxygen is not None:
-            numeric_features.append(features.dissolved_oxygen)
-        else:
-            numeric_features.append(6.0)  # Default
-        
-        if features.ph_level is not None:
-            numeric_features.append(features.ph_level)
-        else:
-            numeric_features.append(7.5)  # Default
-        
-        if features.turbidity is not None:
-            numeric_features.append(features.turbidity)
-        else:
-            numeric_features.append(5.0)  # Default
-        
-        if features.current_velocity is not None:
-            numeric_features.append(features.current_velocity)
-        else:
-            numeric_features.append(0.5)  # Default
-        
-        if features.depth_m is not None:
-            numeric_features.append(features.depth_m)
-        else:
-            numeric_features.append(20.0)  # Default
+        for name, default in OPTIONAL_FEATURE_DEFAULTS.items():
+            values = _numeric_column(frame, name)
+            columns.append(np.where(np.isnan(values), default, values))
         
-        # Encoding categórico
-        route_encoded = hash(features.route_region) % 100
-        paint_encoded = hash(features.paint_type) % 100
-        vessel_encoded = hash(features.vessel_type) % 100
+        # Encoding categórico (vocabulário do treinamento)
+        for column in ADVANCED_CATEGORICAL_COLUMNS:
+            columns.append(self.encoder.encode_batch(column, frame[column]))
         
-        if features.seasonal_factor:
-            season_encoded = hash(features.seasonal_factor) % 10
-        else:
-            season_encoded = 5
-        
-        numeric_features.extend([route_encoded, paint_encoded, vessel_encoded, season_encoded])
-        
-        return np.array(numeric_features).reshape(1, -1)
+        return np.column_stack(columns)
     
     def train_ensemble(
         self,
@@ -417,6 +472,7 @@ class AdvancedMLModel:
             estimators=ensemble_models,
             weights=[weights.get(name, 0.25) for name, _ in ensemble_models]
         )
+        self.models['ensemble'].fit(X_train_scaled, y_train)
         
         # Feature importance (do melhor modelo)
         best_model_name = max(model_scores, key=model_scores.get)
@@ -433,25 +489,42 @@ class AdvancedMLModel:
         self.is_trained = True
     
     def predict(self, features: AdvancedVesselFeatures) -> Tuple[float, Dict[str, float]]:
-        """Prediz usando ensemble"""
-        if not self.is_trained:
-            # Fallback para modelo simples
-            return self._simple_predict(features), {}
-        
-        X = self.prepare_features(features)
-        X_scaled = self.scalers['main'].transform(X)
-        
-        # Predição do ensemble
-        ensemble_pred = self.models['ensemble'].predict(X_scaled)[0]
+        """Prediz usando ensemble (lote de uma linha)"""
+        thickness, contributions = self.predict_batch(advanced_features_to_frame([features]))
+        return float(thickness[0]), {name: float(pred[0]) for name, pred in contributions.items()}
+    
+    def predict_batch(
+        self,
+        frame: pd.DataFrame,
+        physical_thickness: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Prediz um lote com uma chamada predict() por modelo do ensemble.
         
-        # Contribuições individuais
-        contributions = {}
-        for name, model in self.models.items():
-            if name != 'ensemble':
-                pred = model.predict(X_scaled)[0]
-                contributions[name] = float(pred)
+        Args:
+            frame: DataFrame com as colunas de AdvancedVesselFeatures
+            physical_thickness: Predição física já calculada, usada como
+                fallback quando o ensemble não foi treinado
+            
+        Returns:
+            (espessura por linha, contribuição de cada modelo por linha)
+        """
+        if not self.is_trained:
+            # Fallback para modelo físico
+            if physical_thickness is None:
+                physical_thickness, _ = AdvancedPhysicalModel().predict_growth_batch(frame)
+            return physical_thickness, {}
+        
+        X_scaled = self.scalers['main'].transform(self.prepare_features_batch(frame))
+        
+        ensemble_pred = self.models['ensemble'].predict(X_scaled)
+        contributions = {
+            name: model.predict(X_scaled)
+            for name, model in self.models.items()
+            if name != 'ensemble'
+        }
         
-        return max(0.0, ensemble_pred), contributions
+        return np.maximum(0.0, ensemble_pred), contributions
 
 
 class AdvancedHybridModel:
@@ -500,82 +573,147 @@ class AdvancedHybridModel:
     ) -> AdvancedFoulingPrediction:
         """
         Prediz bioincrustação usando modelo híbrido avançado.
+        
+        Usa predict_batch com uma linha (mesmas fórmulas do lote).
+        """
+        return self.predict_batch([features])[0]
+    
+    def predict_batch(self, features: AdvancedFeatureBatch) -> List[AdvancedFoulingPrediction]:
         """
-        # Predição física
-        physical_thickness, invasive_risks = self.physical_model.predict_growth(features)
+        Prediz bioincrustação para um lote de embarcações.
         
-        # Predição ML
-        ml_thickness, model_contributions = self.ml_model.predict(features)
+        Física, combinação híbrida, confiança e impactos são calculados com
+        arrays NumPy; cada modelo do ensemble é chamado uma vez por lote.
+        
+        Args:
+            features: Sequência de AdvancedVesselFeatures ou DataFrame com as
+                mesmas colunas (opcionais podem ser omitidas)
+            
+        Returns:
+            Predições na mesma ordem da entrada
+        """
+        frame = advanced_features_to_frame(features)
+        if frame.empty:
+            return []
+        
+        physical_thickness, invasive_risks = self.physical_model.predict_growth_batch(frame)
+        ml_thickness, model_contributions = self.ml_model.predict_batch(frame, physical_thickness)
         
-        # Combinação híbrida
         hybrid_thickness = (
             self.physical_weight * physical_thickness +
             self.ml_weight * ml_thickness
         )
+        roughness = np.minimum(50.0 * hybrid_thickness + 100.0, 1000.0)
         
-        # Rugosidade (modelo físico)
-        roughness = 50.0 * hybrid_thickness + 100.0
-        roughness = min(roughness, 1000.0)
-        
-        # Severidade
-        if hybrid_thickness < 2.0:
-            severity = 'light'
-        elif hybrid_thickness < 5.0:
-            severity = 'moderate'
-        elif hybrid_thickness < 8.0:
-            severity = 'severe'
-        else:
-            severity = 'critical'
+        severity = np.select(
+            [hybrid_thickness < 2.0, hybrid_thickness < 5.0, hybrid_thickness < 8.0],
+            ['light', 'moderate', 'severe'],
+            default='critical'
+        )
         
-        # Confiança (baseada na consistência)
+        # Confiança (consistência entre modelos + concordância física/ML)
         if model_contributions:
-            std_dev = np.std(list(model_contributions.values()))
+            std_dev = np.std(np.vstack(list(model_contributions.values())), axis=0)
             consistency = 1.0 / (1.0 + std_dev)
         else:
-            consistency = 0.8
-        
-        agreement = 1.0 - abs(physical_thickness - ml_thickness) / max(physical_thickness, ml_thickness, 1.0)
-        confidence = (consistency * 0.6 + agreement * 0.4)
-        confidence = max(0.6, min(0.98, confidence))
-        
-        # Impacto no combustível (estimativa melhorada)
-        # Baseado em pesquisas: até 50% de aumento com bioincrustação severa
-        if hybrid_thickness < 2.0:
-            fuel_impact = hybrid_thickness * 2.0  # 2% por mm
-        elif hybrid_thickness < 5.0:
-            fuel_impact = 4.0 + (hybrid_thickness - 2.0) * 3.0  # 4-13%
-        else:
-            fuel_impact = 13.0 + (hybrid_thickness - 5.0) * 7.0  # 13-50%
+            consistency = np.full(len(frame), 0.8)
         
-        fuel_impact = min(50.0, fuel_impact)
+        agreement = 1.0 - np.abs(physical_thickness - ml_thickness) / np.maximum.reduce(
+            [physical_thickness, ml_thickness, np.ones_like(hybrid_thickness)]
+        )
+        confidence = np.clip(consistency * 0.6 + agreement * 0.4, 0.6, 0.98)
+        
+        fuel_impact = np.select(
+            [hybrid_thickness < 2.0, hybrid_thickness < 5.0],
+            [hybrid_thickness * 2.0, 4.0 + (hybrid_thickness - 2.0) * 3.0],
+            default=13.0 + (hybrid_thickness - 5.0) * 7.0
+        )
+        fuel_impact = np.minimum(50.0, fuel_impact)
         
-        # CO2 impact
-        # Assumindo consumo típico de 1000 kg/h
         typical_consumption = 1000.0  # kg/h
         co2_impact = (typical_consumption * fuel_impact / 100.0) * CO2_EMISSION_FACTOR
         
-        # Recomendações de controle natural
-        natural_recommendations = self.get_natural_control_recommendations(
-            features.route_region,
-            hybrid_thickness
-        )
-        
-        # Feature importance
         feature_importance = self.ml_model.feature_importance.copy() if self.ml_model.feature_importance else {}
+        route_regions = frame['route_region'].tolist()
+        timestamp = datetime.now()
+        
+        return [
+            AdvancedFoulingPrediction(
+                timestamp=timestamp,
+                estimated_thickness_mm=round(float(hybrid_thickness[i]), 2),
+                estimated_roughness_um=round(float(roughness[i]), 2),
+                fouling_severity=str(severity[i]),
+                confidence_score=round(float(confidence[i]), 3),
+                predicted_fuel_impact_percent=round(float(fuel_impact[i]), 2),
+                predicted_co2_impact_kg=round(float(co2_impact[i]), 2),
+                invasive_species_risk={
+                    species: float(risk[i]) for species, risk in invasive_risks.items()
+                },
+                natural_control_recommendations=self.get_natural_control_recommendations(
+                    route_regions[i], float(hybrid_thickness[i])
+                ),
+                model_ensemble_contributions={
+                    name: float(pred[i]) for name, pred in model_contributions.items()
+                },
+                feature_importance=dict(feature_importance)
+            )
+            for i in range(len(frame))
+        ]
+
+
+def train_advanced_model(historical_data: pd.DataFrame) -> AdvancedHybridModel:
+    """
+    Treina o ensemble avançado a partir de dados históricos.
+    
+    O modelo retornado deve ser publicado no registro de modelos
+    (get_model_registry().publish(ADVANCED_MODEL_NAME, model)) para
+    passar a atender as requisições.
+    
+    Args:
+        historical_data: DataFrame com colunas vessel_id, days_since_cleaning,
+            temperature, salinity, time_in_port, speed, route, paint,
+            vessel_type, hull_area e fouling_thickness (alvo)
         
-        return AdvancedFoulingPrediction(
-            timestamp=datetime.now(),
-            estimated_thickness_mm=round(hybrid_thickness, 2),
-            estimated_roughness_um=round(roughness, 2),
-            fouling_severity=severity,
-            confidence_score=round(confidence, 3),
-            predicted_fuel_impact_percent=round(fuel_impact, 2),
-            predicted_co2_impact_kg=round(co2_impact, 2),
-            invasive_species_risk=invasive_risks,
-            natural_control_recommendations=natural_recommendations,
-            model_ensemble_contributions=model_contributions,
-            feature_importance=feature_importance
-        )
+    Returns:
+        Modelo híbrido avançado treinado
+    """
+    model = AdvancedHybridModel()
+    
+    hist_features = []
+    y = []
+    defaults = HISTORY_ROW_DEFAULTS
+    for _, row in historical_data.iterrows():
+        # Criar features do histórico
+        hist_features.append(AdvancedVesselFeatures(
+            vessel_id=row.get('vessel_id', defaults['vessel_id']),
+            time_since_cleaning_days=int(row.get('days_since_cleaning', defaults['days_since_cleaning'])),
+            water_temperature_c=float(row.get('temperature', defaults['temperature'])),
+            salinity_psu=float(row.get('salinity', defaults['salinity'])),
+            time_in_port_hours=float(row.get('time_in_port', defaults['time_in_port'])),
+            average_speed_knots=float(row.get('speed', defaults['speed'])),
+            route_region=row.get('route', defaults['route']),
+            paint_type=row.get('paint', defaults['paint']),
+            vessel_type=row.get('vessel_type', defaults['vessel_type']),
+            hull_area_m2=float(row.get('hull_area', defaults['hull_area']))
+        ))
+        y.append(float(row.get('fouling_thickness', 0)))
+    
+    # Vocabulário categórico aprendido no treinamento e salvo com o modelo
+    frame = advanced_features_to_frame(hist_features)
+    model.ml_model.encoder.fit(frame)
+    X = model.ml_model.prepare_features_batch(frame)
+    
+    model.ml_model.train_ensemble(X, np.array(y))
+    return model
+
+
+def get_advanced_model() -> AdvancedHybridModel:
+    """Retorna o modelo avançado ativo no registro de modelos"""
+    return get_model_registry().get(ADVANCED_MODEL_NAME)
+
+
+# Modelo padrão (não treinado) quando não há artefato publicado
+get_model_registry().register_default(ADVANCED_MODEL_NAME, AdvancedHybridModel)
 
 
 # Função de conveniência
@@ -586,42 +724,31 @@ def predict_advanced_fouling(
     """
     Prediz bioincrustação usando modelo avançado.
     
+    Usa o modelo compartilhado do registro de modelos. O treinamento não
+    acontece mais durante a requisição: use train_advanced_model() e
+    publique o resultado no registro (scripts/train_models.py).
+    
     Args:
         features: Features avançadas da embarcação
-        historical_data: Dados históricos para treinamento (opcional)
+        historical_data: Dados históricos (opcional, repassado ao modelo)
         
     Returns:
         Predição avançada
     """
-    model = AdvancedHybridModel()
-    
-    # Se dados históricos disponíveis, treinar
-    if historical_data is not None and len(historical_data) > 50:
-        # Preparar dados de treinamento
-        X = []
-        y = []
-        for _, row in historical_data.iterrows():
-            # Criar features do histórico
-            hist_features = AdvancedVesselFeatures(
-                vessel_id=row.get('vessel_id', ''),
-                time_since_cleaning_days=int(row.get('days_since_cleaning', 0)),
-                water_temperature_c=float(row.get('temperature', 25.0)),
-                salinity_psu=float(row.get('salinity', 32.5)),
-                time_in_port_hours=float(row.get('time_in_port', 0)),
-                average_speed_knots=float(row.get('speed', 12.0)),
-                route_region=row.get('route', 'South_Atlantic'),
-                paint_type=row.get('paint', 'Antifouling_Type_A'),
-                vessel_type=row.get('vessel_type', 'tanker'),
-                hull_area_m2=float(row.get('hull_area', 5000.0))
-            )
-            X.append(model.ml_model.prepare_features(hist_features)[0])
-            y.append(float(row.get('fouling_thickness', 0)))
-        
-        X = np.array(X)
-        y = np.array(y)
-        
-        # Treinar modelo
-        model.ml_model.train_ensemble(X, y)
-    
+    model = get_advanced_model()
     return model.predict(features, historical_data)
 
+
+def predict_advanced_fouling_batch(
+    features: AdvancedFeatureBatch
+) -> List[AdvancedFoulingPrediction]:
+    """
+    Predição avançada para um lote de embarcações.
+    
+    Args:
+        features: Sequência de AdvancedVesselFeatures ou DataFrame com as mesmas colunas
+        
+    Returns:
+        Predições na mesma ordem da entrada
+    """
+    return get_advanced_model().predict_batch(features)
@@ -0,0 +1,78 @@
+"""
+Codificação de Features Categóricas - HullZero
+
+Encoder ordinal determinístico para as variáveis categóricas dos modelos
+(rota, tinta, tipo de embarcação, estação). O vocabulário é aprendido no
+treinamento e salvo junto com o modelo (faz parte do artefato publicado no
+registro de modelos), de modo que entradas idênticas geram vetores de
+features idênticos em qualquer processo ou reinício.
+
+Substitui o antigo `hash(valor) % 100`, que variava entre processos por
+causa da randomização de hash de strings do Python.
+"""
+
+from typing import Any, Dict, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# Código reservado para valores ausentes ou não vistos no treinamento
+UNKNOWN_CODE = 0
+
+
+def _is_missing(value: Any) -> bool:
+    """None, NaN (pd.isna) e string vazia são tratados como ausentes"""
+    if isinstance(value, str):
+        return not value
+    return pd.api.types.is_scalar(value) and bool(pd.isna(value))
+
+
+class CategoricalEncoder:
+    """
+    Encoder ordinal com vocabulário persistido.
+
+    Cada coluna recebe códigos 1..N na ordem alfabética dos valores vistos
+    no treinamento; valores ausentes ou desconhecidos recebem UNKNOWN_CODE.
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = tuple(columns)
+        self.vocabulary: Dict[str, Dict[str, int]] = {column: {} for column in self.columns}
+
+    @property
+    def is_fitted(self) -> bool:
+        return any(self.vocabulary.values())
+
+    def fit(self, frame: pd.DataFrame) -> "CategoricalEncoder":
+        """
+        Aprende o vocabulário de cada coluna.
+
+        Args:
+            frame: DataFrame com as colunas categóricas
+
+        Returns:
+            O próprio encoder
+        """
+        for column in self.columns:
+            values = sorted({str(v) for v in frame[column] if not _is_missing(v)})
+            self.vocabulary[column] = {value: code for code, value in enumerate(values, start=1)}
+        return self
+
+    def encode(self, column: str, value: Any) -> int:
+        """Código de um valor (UNKNOWN_CODE se ausente ou não visto)"""
+        if _is_missing(value):
+            return UNKNOWN_CODE
+        return self.vocabulary[column].get(str(value), UNKNOWN_CODE)
+
+    def encode_batch(self, column: str, values: Iterable[Any]) -> np.ndarray:
+        """Códigos de uma coluna inteira (array float64, pronto para a matriz de features)"""
+        series = pd.Series(values, dtype=object)
+        missing = series.isna() | (series == "")
+        codes = series.astype(str).map(self.vocabulary[column]).mask(missing)
+        return codes.fillna(UNKNOWN_CODE).to_numpy(dtype=float)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Vocabulário serializável (JSON) para inspeção e auditoria"""
+        return {column: dict(mapping) for column, mapping in self.vocabulary.items()}
+
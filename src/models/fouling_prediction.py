@@ -7,9 +7,9 @@ de crescimento de bioincrustação em cascos de embarcações.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 # ML Libraries
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
@@ -25,9 +25,15 @@ except ImportError:
     PROPHET_AVAILABLE = False
     Prophet = None
 
+from .model_registry import get_model_registry
+from .feature_encoding import CategoricalEncoder
+
 # Physical Constants
 CO2_EMISSION_FACTOR = 3.15  # kg CO2 per kg fuel
 
+# Nome do modelo no registro de modelos
+FOULING_MODEL_NAME = "fouling_hybrid"
+
 
 @dataclass
 class FoulingPrediction:
@@ -56,6 +62,106 @@ class VesselFeatures:
     hull_area_m2: float
 
 
+# Colunas do DataFrame usado nas predições em lote
+VESSEL_FEATURE_COLUMNS = [f.name for f in fields(VesselFeatures)]
+
+# Entrada aceita pelas predições em lote
+FeatureBatch = Union[Sequence[VesselFeatures], pd.DataFrame]
+
+
+def features_to_frame(
+    features: FeatureBatch,
+    columns: Sequence[str] = VESSEL_FEATURE_COLUMNS
+) -> pd.DataFrame:
+    """
+    Converte um lote de features em DataFrame (uma linha por embarcação).
+    
+    Args:
+        features: Sequência de dataclasses de features ou DataFrame já
+            com as colunas esperadas
+        columns: Colunas esperadas (campos da dataclass)
+        
+    Returns:
+        DataFrame com as colunas na ordem de `columns`
+    """
+    if isinstance(features, pd.DataFrame):
+        missing = [c for c in columns if c not in features.columns]
+        if missing:
+            raise ValueError(f"Colunas ausentes no lote de features: {missing}")
+        return features.reset_index(drop=True)
+    
+    return pd.DataFrame([vars(f) for f in features], columns=list(columns))
+
+
+def fouling_severity(thickness_mm: np.ndarray) -> np.ndarray:
+    """Classificação de severidade (light/moderate/severe) para um array de espessuras"""
+    return np.select(
+        [thickness_mm < 3.0, thickness_mm < 8.0],
+        ['light', 'moderate'],
+        default='severe'
+    )
+
+
+@dataclass
+class FoulingTrajectory:
+    """
+    Trajetória de bioincrustação para os dias 0..H à frente.
+    
+    Os arrays têm shape (H+1,) para uma embarcação ou
+    (n_embarcações, H+1) para um lote; o índice da última dimensão é o
+    número de dias à frente.
+    """
+    vessel_ids: List[str]
+    days_ahead: np.ndarray
+    thickness_mm: np.ndarray
+    roughness_um: np.ndarray
+    fuel_impact_percent: np.ndarray
+    co2_impact_kg: np.ndarray
+    confidence: np.ndarray
+    timestamp: datetime
+    
+    @property
+    def horizon_days(self) -> int:
+        return int(self.days_ahead[-1])
+    
+    def for_vessel(self, index: int) -> 'FoulingTrajectory':
+        """Trajetória (1-D) de uma embarcação do lote"""
+        return FoulingTrajectory(
+            vessel_ids=[self.vessel_ids[index]],
+            days_ahead=self.days_ahead,
+            thickness_mm=self.thickness_mm[index],
+            roughness_um=self.roughness_um[index],
+            fuel_impact_percent=self.fuel_impact_percent[index],
+            co2_impact_kg=self.co2_impact_kg[index],
+            confidence=self.confidence[index],
+            timestamp=self.timestamp
+        )
+    
+    def prediction_at(self, days_ahead: int) -> FoulingPrediction:
+        """
+        Predição em um dia específico da trajetória de uma embarcação.
+        
+        Args:
+            days_ahead: Dias à frente (0..H)
+            
+        Returns:
+            Mesma predição que predict_fouling() daria para a data
+        """
+        if self.thickness_mm.ndim != 1:
+            raise ValueError("prediction_at() requer a trajetória de uma única embarcação (use for_vessel)")
+        
+        thickness = self.thickness_mm[days_ahead]
+        return FoulingPrediction(
+            timestamp=self.timestamp,
+            estimated_thickness_mm=float(thickness),
+            estimated_roughness_um=float(self.roughness_um[days_ahead]),
+            fouling_severity=str(fouling_severity(thickness)),
+            confidence_score=float(self.confidence[days_ahead]),
+            predicted_fuel_impact_percent=float(self.fuel_impact_percent[days_ahead]),
+            predicted_co2_impact_kg=float(self.co2_impact_kg[days_ahead])
+        )
+
+
 class PhysicalFoulingModel:
     """
     Modelo físico baseado em princípios de biologia marinha
@@ -90,6 +196,31 @@ class PhysicalFoulingModel:
         Returns:
             Espessura estimada em mm
         """
+        return self._growth(
+            days_since_cleaning, temperature, salinity, time_in_port, average_speed
+        )
+    
+    def predict_batch(self, features: FeatureBatch) -> np.ndarray:
+        """
+        Prediz crescimento de bioincrustação para um lote de embarcações.
+        
+        Args:
+            features: Sequência de VesselFeatures ou DataFrame com as mesmas colunas
+            
+        Returns:
+            Array com a espessura estimada (mm) de cada embarcação
+        """
+        frame = features_to_frame(features)
+        return self._growth(
+            frame['time_since_cleaning_days'].to_numpy(dtype=float),
+            frame['water_temperature_c'].to_numpy(dtype=float),
+            frame['salinity_psu'].to_numpy(dtype=float),
+            frame['time_in_port_hours'].to_numpy(dtype=float),
+            frame['average_speed_knots'].to_numpy(dtype=float)
+        )
+    
+    def _growth(self, days_since_cleaning, temperature, salinity, time_in_port, average_speed):
+        """Modelo de crescimento (aceita escalares ou arrays NumPy)"""
         # Fator de temperatura (curva gaussiana)
         temp_factor = np.exp(-0.5 * ((temperature - self.temperature_optimum) / 5.0) ** 2)
         
@@ -101,7 +232,7 @@ class PhysicalFoulingModel:
         
         # Fator de velocidade (reduz crescimento)
         speed_factor = 1.0 - (average_speed / 20.0) * self.velocity_reduction_factor
-        speed_factor = max(0.2, speed_factor)  # Mínimo 20%
+        speed_factor = np.maximum(0.2, speed_factor)  # Mínimo 20%
         
         # Crescimento exponencial com saturação
         growth_rate = self.growth_rate_base * temp_factor * salinity_factor * port_factor * speed_factor
@@ -124,7 +255,11 @@ class PhysicalFoulingModel:
         """
         # Relação empírica: rugosidade ~ 50 * espessura
         roughness = 50.0 * thickness_mm + 100.0  # Base de 100 um
-        return min(roughness, 1000.0)  # Máximo 1000 um
+        return np.minimum(roughness, 1000.0)  # Máximo 1000 um
+
+
+# Variáveis categóricas codificadas pelo encoder do modelo ML
+CATEGORICAL_COLUMNS = ('route_region', 'paint_type', 'vessel_type')
 
 
 class MLFoulingModel:
@@ -135,7 +270,18 @@ class MLFoulingModel:
     def __init__(self):
         self.model = None
         self.scaler = StandardScaler()
+        self.encoder = CategoricalEncoder(CATEGORICAL_COLUMNS)
         self.is_trained = False
+    
+    def __setstate__(self, state):
+        # Artefatos anteriores ao encoder determinístico usavam hash() por
+        # processo: as features não são reproduzíveis, então o modelo é
+        # desativado até ser retreinado (scripts/train_models.py)
+        if 'encoder' not in state:
+            print("⚠️  Modelo ML sem vocabulário categórico persistido; retreine o modelo")
+            state['encoder'] = CategoricalEncoder(CATEGORICAL_COLUMNS)
+            state['is_trained'] = False
+        self.__dict__.update(state)
         
     def prepare_features(self, features: VesselFeatures) -> np.ndarray:
         """
@@ -153,15 +299,38 @@ class MLFoulingModel:
             features.salinity_psu,
             features.time_in_port_hours,
             features.average_speed_knots,
-            # Encoding de variáveis categóricas (simplificado)
-            hash(features.route_region) % 100,
-            hash(features.paint_type) % 100,
-            hash(features.vessel_type) % 100,
+            # Encoding de variáveis categóricas (vocabulário do treinamento)
+            self.encoder.encode('route_region', features.route_region),
+            self.encoder.encode('paint_type', features.paint_type),
+            self.encoder.encode('vessel_type', features.vessel_type),
             features.hull_area_m2
-        ])
+        ], dtype=float)
         
         return feature_array.reshape(1, -1)
     
+    def prepare_features_batch(self, frame: pd.DataFrame) -> np.ndarray:
+        """
+        Prepara a matriz de features (n_amostras, 9) para um lote.
+        
+        Args:
+            frame: DataFrame com as colunas de VesselFeatures
+            
+        Returns:
+            Matriz de features na mesma ordem de prepare_features
+        """
+        return np.column_stack([
+            frame['time_since_cleaning_days'].to_numpy(dtype=float),
+            frame['water_temperature_c'].to_numpy(dtype=float),
+            frame['salinity_psu'].to_numpy(dtype=float),
+            frame['time_in_port_hours'].to_numpy(dtype=float),
+            frame['average_speed_knots'].to_numpy(dtype=float),
+            # Encoding de variáveis categóricas (vocabulário do treinamento)
+            self.encoder.encode_batch('route_region', frame['route_region']),
+            self.encoder.encode_batch('paint_type', frame['paint_type']),
+            self.encoder.encode_batch('vessel_type', frame['vessel_type']),
+            frame['hull_area_m2'].to_numpy(dtype=float)
+        ])
+    
     def train(self, X: np.ndarray, y: np.ndarray):
         """
         Treina o modelo ML.
@@ -203,6 +372,23 @@ class MLFoulingModel:
         
         thickness = self.model.predict(X_scaled)[0]
         return max(0.0, thickness)  # Não negativo
+    
+    def predict_batch(self, frame: pd.DataFrame) -> np.ndarray:
+        """
+        Prediz espessura para um lote com uma única chamada ao modelo.
+        
+        Args:
+            frame: DataFrame com as colunas de VesselFeatures
+            
+        Returns:
+            Array com a espessura estimada (mm) de cada linha
+        """
+        if not self.is_trained:
+            # Retorna predição base (modelo não treinado)
+            return np.full(len(frame), 2.0)
+        
+        X_scaled = self.scaler.transform(self.prepare_features_batch(frame))
+        return np.maximum(0.0, self.model.predict(X_scaled))  # Não negativo
 
 
 class HybridFoulingModel:
@@ -280,6 +466,130 @@ class HybridFoulingModel:
             predicted_co2_impact_kg=co2_impact
         )
     
+    def predict_batch(self, features: FeatureBatch) -> List[FoulingPrediction]:
+        """
+        Prediz bioincrustação para um lote de embarcações.
+        
+        Toda a combinação física + ML é feita com arrays NumPy e o modelo
+        ML é chamado uma única vez para o lote inteiro.
+        
+        Args:
+            features: Sequência de VesselFeatures ou DataFrame com as mesmas colunas
+            
+        Returns:
+            Predições na mesma ordem da entrada
+        """
+        frame = features_to_frame(features)
+        if frame.empty:
+            return []
+        
+        arrays = self._predict_arrays(frame)
+        severity = fouling_severity(arrays['thickness_mm'])
+        
+        timestamp = datetime.now()
+        return [
+            FoulingPrediction(
+                timestamp=timestamp,
+                estimated_thickness_mm=float(arrays['thickness_mm'][i]),
+                estimated_roughness_um=float(arrays['roughness_um'][i]),
+                fouling_severity=str(severity[i]),
+                confidence_score=float(arrays['confidence'][i]),
+                predicted_fuel_impact_percent=float(arrays['fuel_impact_percent'][i]),
+                predicted_co2_impact_kg=float(arrays['co2_impact_kg'][i])
+            )
+            for i in range(len(frame))
+        ]
+    
+    def predict_trajectory(
+        self,
+        vessel_features: VesselFeatures,
+        horizon_days: int
+    ) -> FoulingTrajectory:
+        """
+        Prediz a trajetória de uma embarcação para os dias 0..horizon_days.
+        
+        Args:
+            vessel_features: Features atuais da embarcação
+            horizon_days: Último dia à frente a predizer
+            
+        Returns:
+            Trajetória com arrays de shape (horizon_days + 1,)
+        """
+        return self.predict_trajectory_batch([vessel_features], horizon_days).for_vessel(0)
+    
+    def predict_trajectory_batch(
+        self,
+        features: FeatureBatch,
+        horizon_days: int
+    ) -> FoulingTrajectory:
+        """
+        Prediz as trajetórias de um lote de embarcações em uma única avaliação.
+        
+        Cada embarcação é expandida em horizon_days + 1 linhas (tempo desde a
+        limpeza + d, para d = 0..H) e o lote inteiro passa uma vez pelo
+        modelo físico e pelo modelo ML.
+        
+        Args:
+            features: Sequência de VesselFeatures ou DataFrame com as mesmas colunas
+            horizon_days: Último dia à frente a predizer
+            
+        Returns:
+            Trajetória com arrays de shape (n_embarcações, horizon_days + 1)
+        """
+        if horizon_days < 0:
+            raise ValueError("horizon_days deve ser >= 0")
+        
+        frame = features_to_frame(features)
+        steps = horizon_days + 1
+        days_ahead = np.arange(steps)
+        
+        expanded = frame.loc[frame.index.repeat(steps)].reset_index(drop=True)
+        expanded['time_since_cleaning_days'] = (
+            expanded['time_since_cleaning_days'].to_numpy() + np.tile(days_ahead, len(frame))
+        )
+        
+        arrays = self._predict_arrays(expanded)
+        shape = (len(frame), steps)
+        return FoulingTrajectory(
+            vessel_ids=frame['vessel_id'].tolist(),
+            days_ahead=days_ahead,
+            thickness_mm=arrays['thickness_mm'].reshape(shape),
+            roughness_um=arrays['roughness_um'].reshape(shape),
+            fuel_impact_percent=arrays['fuel_impact_percent'].reshape(shape),
+            co2_impact_kg=arrays['co2_impact_kg'].reshape(shape),
+            confidence=arrays['confidence'].reshape(shape),
+            timestamp=datetime.now()
+        )
+    
+    def _predict_arrays(self, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Combinação física + ML vetorizada (uma chamada ao modelo ML)"""
+        physical_thickness = self.physical_model.predict_batch(frame)
+        ml_thickness = self.ml_model.predict_batch(frame)
+        
+        hybrid_thickness = (
+            self.physical_weight * physical_thickness +
+            self.ml_weight * ml_thickness
+        )
+        roughness = self.physical_model.calculate_roughness(hybrid_thickness)
+        
+        confidence = 1.0 - np.abs(physical_thickness - ml_thickness) / np.maximum.reduce(
+            [physical_thickness, ml_thickness, np.ones_like(hybrid_thickness)]
+        )
+        confidence = np.clip(confidence, 0.5, 1.0)
+        
+        fuel_impact_percent = self._estimate_fuel_impact(hybrid_thickness, roughness)
+        co2_impact = self._co2_from_fuel_impact(
+            fuel_impact_percent, frame['hull_area_m2'].to_numpy(dtype=float)
+        )
+        
+        return {
+            'thickness_mm': hybrid_thickness,
+            'roughness_um': roughness,
+            'confidence': confidence,
+            'fuel_impact_percent': fuel_impact_percent,
+            'co2_impact_kg': co2_impact,
+        }
+    
     def _estimate_fuel_impact(self, thickness_mm: float, roughness_um: float) -> float:
         """
         Estima impacto percentual no consumo de combustível.
@@ -294,7 +604,7 @@ class HybridFoulingModel:
         # Relação empírica: ~1% de aumento por mm de espessura
         # + ~0.1% por 100 um de rugosidade
         impact = (thickness_mm * 1.0) + (roughness_um / 100.0 * 0.1)
-        return min(impact, 40.0)  # Máximo 40%
+        return np.minimum(impact, 40.0)  # Máximo 40%
     
     def _estimate_co2_impact(
         self,
@@ -311,9 +621,13 @@ class HybridFoulingModel:
         Returns:
             Impacto em kg de CO2 (anual estimado)
         """
+        return self._co2_from_fuel_impact(fuel_impact_percent, features.hull_area_m2)
+    
+    def _co2_from_fuel_impact(self, fuel_impact_percent, hull_area_m2):
+        """Impacto em CO2 a partir da área do casco (escalares ou arrays)"""
         # Consumo anual estimado (simplificado)
         # Baseado no tipo de embarcação e área do casco
-        base_consumption_kg_year = features.hull_area_m2 * 50  # Estimativa
+        base_consumption_kg_year = hull_area_m2 * 50  # Estimativa
         
         # Impacto em kg de combustível
         fuel_impact_kg = base_consumption_kg_year * (fuel_impact_percent / 100.0)
@@ -379,6 +693,79 @@ class TimeSeriesFoulingModel:
         return forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
 
 
+# Valores das colunas de histórico ausentes (use com fillna: NaN não é ausente para row.get)
+HISTORY_ROW_DEFAULTS = {
+    'vessel_id': '',
+    'days_since_cleaning': 0,
+    'temperature': 25.0,
+    'salinity': 32.5,
+    'time_in_port': 0.0,
+    'speed': 12.0,
+    'route': 'South_Atlantic',
+    'paint': 'Antifouling_Type_A',
+    'vessel_type': 'tanker',
+    'hull_area': 5000.0,
+}
+
+
+def features_from_history_row(row: pd.Series) -> VesselFeatures:
+    """
+    Converte uma linha de histórico de treinamento em VesselFeatures.
+    
+    Colunas esperadas: vessel_id, days_since_cleaning, temperature, salinity,
+    time_in_port, speed, route, paint, vessel_type, hull_area
+    """
+    defaults = HISTORY_ROW_DEFAULTS
+    return VesselFeatures(
+        vessel_id=row.get('vessel_id', defaults['vessel_id']),
+        time_since_cleaning_days=int(row.get('days_since_cleaning', defaults['days_since_cleaning'])),
+        water_temperature_c=float(row.get('temperature', defaults['temperature'])),
+        salinity_psu=float(row.get('salinity', defaults['salinity'])),
+        time_in_port_hours=float(row.get('time_in_port', defaults['time_in_port'])),
+        average_speed_knots=float(row.get('speed', defaults['speed'])),
+        route_region=row.get('route', defaults['route']),
+        paint_type=row.get('paint', defaults['paint']),
+        vessel_type=row.get('vessel_type', defaults['vessel_type']),
+        hull_area_m2=float(row.get('hull_area', defaults['hull_area']))
+    )
+
+
+def train_fouling_model(historical_data: pd.DataFrame) -> HybridFoulingModel:
+    """
+    Treina um novo modelo híbrido a partir de dados históricos.
+    
+    O modelo retornado deve ser publicado no registro de modelos
+    (get_model_registry().publish(FOULING_MODEL_NAME, model)) para
+    passar a atender as requisições.
+    
+    Args:
+        historical_data: DataFrame com as colunas de features_from_history_row
+            e a coluna alvo 'fouling_thickness'
+        
+    Returns:
+        Modelo híbrido treinado
+    """
+    model = HybridFoulingModel()
+    frame = features_to_frame([
+        features_from_history_row(row) for _, row in historical_data.iterrows()
+    ])
+    # Vocabulário categórico aprendido no treinamento e salvo com o modelo
+    model.ml_model.encoder.fit(frame)
+    X = model.ml_model.prepare_features_batch(frame)
+    y = historical_data['fouling_thickness'].astype(float).to_numpy()
+    model.ml_model.train(X, y)
+    return model
+
+
+def get_fouling_model() -> HybridFoulingModel:
+    """Retorna o modelo híbrido ativo no registro de modelos"""
+    return get_model_registry().get(FOULING_MODEL_NAME)
+
+
+# Modelo padrão (não treinado) quando não há artefato publicado
+get_model_registry().register_default(FOULING_MODEL_NAME, HybridFoulingModel)
+
+
 # Função de conveniência
 def predict_fouling(
     vessel_features: VesselFeatures,
@@ -387,6 +774,9 @@ def predict_fouling(
     """
     Função principal para predição de bioincrustação.
     
+    Usa o modelo compartilhado do registro de modelos; nenhuma
+    construção ou treinamento acontece durante a requisição.
+    
     Args:
         vessel_features: Features da embarcação
         historical_data: Dados históricos (opcional)
@@ -394,10 +784,57 @@ def predict_fouling(
     Returns:
         Predição de bioincrustação
     """
-    model = HybridFoulingModel()
+    model = get_fouling_model()
     return model.predict(vessel_features, historical_data)
 
 
+def predict_fouling_batch(features: FeatureBatch) -> List[FoulingPrediction]:
+    """
+    Predição de bioincrustação para um lote de embarcações.
+    
+    Args:
+        features: Sequência de VesselFeatures ou DataFrame com as mesmas colunas
+        
+    Returns:
+        Predições na mesma ordem da entrada
+    """
+    return get_fouling_model().predict_batch(features)
+
+
+def predict_fouling_trajectory(
+    vessel_features: VesselFeatures,
+    horizon_days: int
+) -> FoulingTrajectory:
+    """
+    Trajetória de bioincrustação (dias 0..horizon_days) de uma embarcação.
+    
+    Args:
+        vessel_features: Features atuais da embarcação
+        horizon_days: Último dia à frente a predizer
+        
+    Returns:
+        Trajetória com espessura, rugosidade e impacto no combustível por dia
+    """
+    return get_fouling_model().predict_trajectory(vessel_features, horizon_days)
+
+
+def predict_fouling_trajectory_batch(
+    features: FeatureBatch,
+    horizon_days: int
+) -> FoulingTrajectory:
+    """
+    Trajetórias de bioincrustação (dias 0..horizon_days) de um lote de embarcações.
+    
+    Args:
+        features: Sequência de VesselFeatures ou DataFrame com as mesmas colunas
+        horizon_days: Último dia à frente a predizer
+        
+    Returns:
+        Trajetória com arrays (n_embarcações, horizon_days + 1)
+    """
+    return get_fouling_model().predict_trajectory_batch(features, horizon_days)
+
+
 if __name__ == "__main__":
     # Exemplo de uso
     features = VesselFeatures(
@@ -146,7 +146,7 @@ class InspectionOptimizer:
         horizon_days: int
     ) -> List[NORMAM401RiskPrediction]:
         """
-        Prediz risco ao longo do horizonte.
+        Prediz risco ao longo do horizonte (uma única trajetória de bioincrustação).
         """
         intervals = []
         # Intervalos: semanal nos primeiros 30 dias, depois mensal
@@ -157,16 +157,12 @@ class InspectionOptimizer:
         if horizon_days not in intervals:
             intervals.append(horizon_days)
         
-        predictions = []
-        for days_ahead in intervals:
-            prediction = self.risk_predictor.predict_risk(
-                vessel_id,
-                vessel_features,
-                days_ahead
-            )
-            predictions.append(prediction)
-        
-        return predictions
+        return self.risk_predictor.predict_risk_timeline(
+            vessel_id,
+            vessel_features,
+            horizon_days,
+            intervals
+        )
     
     def find_optimal_windows(
         self,
@@ -0,0 +1,249 @@
+"""
+Registro de Modelos - HullZero
+
+Mantém uma instância única (por processo) de cada modelo treinado,
+carregada a partir de artefatos versionados (joblib) em ML_MODEL_PATH.
+Os modelos são compartilhados entre requisições e substituídos de forma
+atômica quando uma nova versão é publicada.
+
+Estrutura dos artefatos:
+    {ML_MODEL_PATH}/{nome}/{versao}.joblib
+    {ML_MODEL_PATH}/{nome}/LATEST          # contém a versão ativa
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import joblib
+
+from ..config import ML_MODEL_PATH, ML_MODEL_REFRESH_SECONDS
+
+
+LATEST_POINTER = "LATEST"
+DEFAULT_VERSION = "default"
+
+
+@dataclass(frozen=True)
+class ModelEntry:
+    """Modelo carregado e seus metadados"""
+    name: str
+    version: str
+    model: Any
+    loaded_at: datetime
+    artifact_path: Optional[str] = None  # None quando construído pela factory padrão
+
+
+class ModelRegistry:
+    """
+    Registro de modelos treinados compartilhado pelo processo.
+
+    - get(): retorna o modelo ativo (carrega na primeira chamada)
+    - publish(): salva uma nova versão e a ativa
+    - refresh(): verifica se outro processo publicou nova versão
+    """
+
+    def __init__(
+        self,
+        base_path: str = ML_MODEL_PATH,
+        refresh_interval_seconds: float = ML_MODEL_REFRESH_SECONDS
+    ):
+        self.base_path = Path(base_path)
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ModelEntry] = {}
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._last_check: Dict[str, float] = {}
+        self._failed_versions: Dict[str, str] = {}
+
+    def register_default(self, name: str, factory: Callable[[], Any]):
+        """
+        Registra a factory usada quando não há artefato publicado.
+
+        Args:
+            name: Nome do modelo
+            factory: Função sem argumentos que constrói o modelo padrão
+        """
+        self._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        """Retorna o modelo ativo para `name`"""
+        return self.get_entry(name).model
+
+    def get_entry(self, name: str) -> ModelEntry:
+        """Retorna o modelo ativo e seus metadados"""
+        entry = self._entries.get(name)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is None:
+                    entry = self._load(name)
+                    self._entries[name] = entry
+                    self._last_check[name] = time.monotonic()
+            return entry
+
+        if self.refresh_interval_seconds > 0:
+            elapsed = time.monotonic() - self._last_check.get(name, 0.0)
+            if elapsed >= self.refresh_interval_seconds:
+                entry = self.refresh(name) or entry
+        return entry
+
+    def refresh(self, name: str) -> Optional[ModelEntry]:
+        """
+        Recarrega o modelo se a versão publicada mudou.
+
+        A verificação e a carga ocorrem sob o lock, de modo que só uma
+        thread carrega a nova versão. Se a carga falhar, o erro é registrado
+        e a entrada atual continua ativa; a versão com falha só é tentada de
+        novo quando LATEST mudar.
+
+        Returns:
+            Entrada ativa após a verificação (None se o modelo nunca foi carregado)
+        """
+        self._last_check[name] = time.monotonic()
+        with self._lock:
+            current = self._entries.get(name)
+            published = self._read_latest_version(name)
+            if (
+                current is None
+                or published is None
+                or published == current.version
+                or published == self._failed_versions.get(name)
+            ):
+                return current
+
+            try:
+                new_entry = self._load_artifact(name, published)
+            except Exception as e:
+                self._failed_versions[name] = published
+                print(f"⚠️  Não foi possível carregar {name} v{published}: {e}. Mantendo v{current.version}.")
+                return current
+
+            self._entries[name] = new_entry
+            self._failed_versions.pop(name, None)
+            return new_entry
+
+    def publish(self, name: str, model: Any, version: Optional[str] = None) -> ModelEntry:
+        """
+        Salva uma nova versão do modelo e a torna ativa.
+
+        Args:
+            name: Nome do modelo
+            model: Objeto do modelo treinado
+            version: Versão (padrão: timestamp UTC)
+
+        Returns:
+            Entrada publicada
+        """
+        version = version or datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        model_dir = self.base_path / name
+        model_dir.mkdir(parents=True, exist_ok=True)
+
+        artifact_path = model_dir / f"{version}.joblib"
+        tmp_path = model_dir / f".{version}.joblib.tmp"
+        joblib.dump(model, tmp_path)
+        os.replace(tmp_path, artifact_path)
+
+        # Ponteiro atualizado por rename atômico: outros processos nunca
+        # veem um LATEST parcial ou apontando para artefato incompleto
+        pointer_tmp = model_dir / f".{LATEST_POINTER}.tmp"
+        pointer_tmp.write_text(version)
+        os.replace(pointer_tmp, model_dir / LATEST_POINTER)
+
+        entry = ModelEntry(
+            name=name,
+            version=version,
+            model=model,
+            loaded_at=datetime.utcnow(),
+            artifact_path=str(artifact_path)
+        )
+        with self._lock:
+            self._entries[name] = entry
+            self._last_check[name] = time.monotonic()
+            self._failed_versions.pop(name, None)
+        return entry
+
+    def load_all(self) -> List[ModelEntry]:
+        """Carrega todos os modelos registrados (usado no startup da API)"""
+        return [self.get_entry(name) for name in list(self._factories)]
+
+    def list_versions(self, name: str) -> List[str]:
+        """Lista as versões publicadas de um modelo"""
+        model_dir = self.base_path / name
+        if not model_dir.exists():
+            return []
+        return sorted(p.stem for p in model_dir.glob("*.joblib"))
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Resumo dos modelos carregados"""
+        return {
+            name: {
+                "version": entry.version,
+                "loaded_at": entry.loaded_at.isoformat(),
+                "artifact_path": entry.artifact_path,
+            }
+            for name, entry in self._entries.items()
+        }
+
+    def clear(self):
+        """Descarta os modelos carregados (próximo get() recarrega)"""
+        with self._lock:
+            self._entries.clear()
+            self._last_check.clear()
+            self._failed_versions.clear()
+
+    def _read_latest_version(self, name: str) -> Optional[str]:
+        pointer = self.base_path / name / LATEST_POINTER
+        try:
+            version = pointer.read_text().strip()
+        except OSError:
+            return None
+        return version or None
+
+    def _load(self, name: str) -> ModelEntry:
+        version = self._read_latest_version(name)
+        if version is not None:
+            try:
+                return self._load_artifact(name, version)
+            except Exception as e:
+                print(f"⚠️  Não foi possível carregar {name} v{version}: {e}. Usando modelo padrão.")
+
+        factory = self._factories.get(name)
+        if factory is None:
+            raise KeyError(f"Modelo '{name}' não registrado e sem artefato publicado")
+
+        return ModelEntry(
+            name=name,
+            version=DEFAULT_VERSION,
+            model=factory(),
+            loaded_at=datetime.utcnow()
+        )
+
+    def _load_artifact(self, name: str, version: str) -> ModelEntry:
+        artifact_path = self.base_path / name / f"{version}.joblib"
+        model = joblib.load(artifact_path)
+        return ModelEntry(
+            name=name,
+            version=version,
+            model=model,
+            loaded_at=datetime.utcnow(),
+            artifact_path=str(artifact_path)
+        )
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Retorna o registro de modelos do processo"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
@@ -12,7 +12,12 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
-from .fouling_prediction import predict_fouling, VesselFeatures
+from .fouling_prediction import (
+    predict_fouling,
+    predict_fouling_trajectory,
+    VesselFeatures,
+    FoulingPrediction
+)
 from .fuel_impact import ConsumptionFeatures
 
 
@@ -111,6 +116,26 @@ class NORMAM401RiskPredictor:
         )
         
         future_prediction = predict_fouling(future_features)
+        
+        return self._assess_risk(
+            vessel_id,
+            vessel_features,
+            days_ahead,
+            current_fouling_mm,
+            future_prediction
+        )
+    
+    def _assess_risk(
+        self,
+        vessel_id: str,
+        vessel_features: VesselFeatures,
+        days_ahead: int,
+        current_fouling_mm: float,
+        future_prediction: FoulingPrediction
+    ) -> NORMAM401RiskPrediction:
+        """
+        Avalia o risco a partir da predição de bioincrustação futura.
+        """
         future_fouling = future_prediction.estimated_thickness_mm
         future_roughness = future_prediction.estimated_roughness_um
         
@@ -150,10 +175,7 @@ class NORMAM401RiskPredictor:
         )
         
         # Calcular confiança (baseada na consistência das predições)
-        confidence = self._calculate_confidence(
-            current_prediction if current_fouling_mm is None else None,
-            future_prediction
-        )
+        confidence = self._calculate_confidence(None, future_prediction)
         
         return NORMAM401RiskPrediction(
             vessel_id=vessel_id,
@@ -284,8 +306,8 @@ class NORMAM401RiskPredictor:
                 recommendation="Considerar limpeza preventiva"
             ))
         
-        # Fator 2: Taxa de crescimento
-        growth_rate = (future_fouling - current_fouling) / days_ahead  # mm/dia
+        # Fator 2: Taxa de crescimento (sem taxa para o dia atual)
+        growth_rate = (future_fouling - current_fouling) / days_ahead if days_ahead > 0 else 0.0  # mm/dia
         if growth_rate > 0.1:
             contribution = min(0.3, growth_rate * 2.0)
             factors.append(RiskFactor(
@@ -428,6 +450,9 @@ class NORMAM401RiskPredictor:
         """
         Prediz risco ao longo de um horizonte temporal.
         
+        A trajetória de bioincrustação de todo o horizonte é calculada em
+        uma única avaliação do modelo; cada intervalo apenas lê o seu dia.
+        
         Args:
             vessel_id: ID da embarcação
             vessel_features: Features da embarcação
@@ -437,18 +462,23 @@ class NORMAM401RiskPredictor:
         Returns:
             Lista de predições de risco para cada intervalo
         """
-        predictions = []
-        
-        for days_ahead in intervals:
-            if days_ahead <= horizon_days:
-                prediction = self.predict_risk(
-                    vessel_id,
-                    vessel_features,
-                    days_ahead
-                )
-                predictions.append(prediction)
-        
-        return predictions
+        days = [days_ahead for days_ahead in intervals if days_ahead <= horizon_days]
+        if not days:
+            return []
+        
+        trajectory = predict_fouling_trajectory(vessel_features, max(days))
+        current_fouling_mm = float(trajectory.thickness_mm[0])
+        
+        return [
+            self._assess_risk(
+                vessel_id,
+                vessel_features,
+                days_ahead,
+                current_fouling_mm,
+                trajectory.prediction_at(days_ahead)
+            )
+            for days_ahead in days
+        ]
 
 
 # Função de conveniência
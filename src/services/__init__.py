@@ -1,14 +1,26 @@
 """
 Serviços de negócio: Recomendação e Conformidade
+
+Carregados no primeiro acesso: o serviço de recomendação depende dos
+modelos de ML (ver src/models/__init__.py).
 """
 
-from .recommendation_service import get_cleaning_recommendation, Recommendation
-from .compliance_service import check_normam401_compliance, ComplianceCheck
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'get_cleaning_recommendation': '.recommendation_service',
+    'Recommendation': '.recommendation_service',
+    'check_normam401_compliance': '.compliance_service',
+    'ComplianceCheck': '.compliance_service',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
 
-__all__ = [
-    'get_cleaning_recommendation',
-    'Recommendation',
-    'check_normam401_compliance',
-    'ComplianceCheck'
-]
 
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
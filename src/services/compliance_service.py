@@ -5,12 +5,13 @@ Este módulo implementa verificação de conformidade com a NORMAM 401,
 geração de relatórios regulatórios e alertas de não conformidade.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
-from ..models.fouling_prediction import predict_fouling, VesselFeatures
+import numpy as np
+
 
 
 class ComplianceStatus(Enum):
@@ -542,6 +543,39 @@ def check_normam401_compliance(
     )
 
 
+def mean_compliance_scores(
+    limit_types: Sequence[str],
+    readings: np.ndarray,
+    capped_thickness_sum: np.ndarray,
+    capped_roughness_sum: np.ndarray
+) -> np.ndarray:
+    """
+    Score médio de conformidade (0-1) de grupos de leituras, vetorizado.
+    
+    Equivale a calcular _calculate_compliance_score leitura a leitura e
+    tirar a média de cada grupo, usando as somas de min(valor, limite do
+    tipo) de cada grupo (ver FleetTrendsRepository.get_monthly_fouling).
+    
+    Args:
+        limit_types: Classe de limite de cada grupo (chave de VESSEL_TYPE_LIMITS)
+        readings: Número de leituras de cada grupo
+        capped_thickness_sum: Σ min(espessura, limite) de cada grupo
+        capped_roughness_sum: Σ min(rugosidade, limite) de cada grupo
+        
+    Returns:
+        Array com o score médio de cada grupo
+    """
+    limits = NORMAM401ComplianceService.VESSEL_TYPE_LIMITS
+    standard = limits["standard"]
+    max_thickness = np.array([limits.get(t, standard)["thickness"] for t in limit_types], dtype=float)
+    max_roughness = np.array([limits.get(t, standard)["roughness"] for t in limit_types], dtype=float)
+    readings = np.maximum(np.asarray(readings, dtype=float), 1.0)
+    
+    thickness_score = 1.0 - np.asarray(capped_thickness_sum, dtype=float) / (max_thickness * readings)
+    roughness_score = 1.0 - np.asarray(capped_roughness_sum, dtype=float) / (max_roughness * readings)
+    return np.clip(thickness_score * 0.6 + roughness_score * 0.4, 0.0, 1.0)
+
+
 if __name__ == "__main__":
     # Exemplo de uso
     check = check_normam401_compliance(
@@ -5,11 +5,13 @@ Este módulo calcula economia acumulada baseada na redução de consumo
 de combustível atribuível à gestão de bioincrustação.
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
-from src.models.fuel_impact import calculate_fuel_impact, ConsumptionFeatures, FuelImpactResult
+if TYPE_CHECKING:
+    # Modelo de ML importado sob demanda (XGBoost/scikit-learn são pesados)
+    from src.models.fuel_impact import FuelImpactResult
 
 
 @dataclass
@@ -28,7 +30,7 @@ class VesselEconomy:
     """Economia por embarcação"""
     vessel_id: str
     period: EconomyPeriod
-    fuel_impact_records: List[FuelImpactResult]
+    fuel_impact_records: List["FuelImpactResult"]
 
 
 @dataclass
@@ -125,6 +127,8 @@ class EconomyService:
         """
         Calcula economia para uma embarcação.
         """
+        from src.models.fuel_impact import calculate_fuel_impact, ConsumptionFeatures
+        
         # Filtrar dados da embarcação
         vessel_fuel_data = [
             d for d in fuel_consumption_data
@@ -0,0 +1,246 @@
+"""
+Serviço de Estado da Frota - HullZero
+
+Mantém a tabela fleet_state: uma linha por embarcação com a última leitura
+de bioincrustação, nível FR, perda de performance, conformidade NORMAM 401
+e risco FR em 15/30 dias. Os endpoints de frota leem apenas essa tabela em
+vez de recalcular tudo a cada requisição.
+
+A tabela é atualizada na escrita:
+- Escritas via ORM (FoulingData, MaintenanceEvent, Vessel) são detectadas
+  pelos eventos de sessão em database/fleet_state_events.py e as
+  embarcações afetadas são recalculadas após o commit.
+- Caminhos em lote via Core (BulkInserter) chamam refresh_fleet_state
+  diretamente com as embarcações importadas.
+
+O risco em 15/30 dias depende da data atual; rebuild_fleet_state (ou
+scripts/rebuild_fleet_state.py) deve ser agendado periodicamente.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..database.models import Vessel, MaintenanceEvent, FleetState
+from ..database.fleet_state_events import refreshing_fleet_state
+from ..database.repositories import (
+    FleetSnapshot,
+    FleetSnapshotRepository,
+    FleetStateRepository
+)
+from .compliance_service import check_normam401_compliance
+
+
+FR_LABELS = {
+    0: "Sem Incrustação",
+    1: "Micro Incrustação",
+    2: "Macro Leve",
+    3: "Macro Moderada",
+    4: "Macro Pesada"
+}
+
+# Valores assumidos para FR/perda/risco quando a embarcação não tem leituras
+DEFAULT_FOULING_MM = 3.5
+DEFAULT_ROUGHNESS_UM = 350.0
+
+
+def calculate_fr_level(fouling_mm: float, roughness_um: float) -> int:
+    """
+    Calcula nível FR (Fouling Risk) baseado em espessura e rugosidade.
+
+    FR 0: Limpo (Sem incrustação) - fouling < 1mm
+    FR 1: Microincrustação - 1mm <= fouling < 3mm
+    FR 2: Macro Leve (Alerta) - 3mm <= fouling < 4mm
+    FR 3: Macro Moderada - 4mm <= fouling < 5mm
+    FR 4: Macro Pesada (Crítico) - fouling >= 5mm
+    """
+    if fouling_mm < 1.0:
+        return 0
+    elif fouling_mm < 3.0:
+        return 1
+    elif fouling_mm < 4.0:
+        return 2
+    elif fouling_mm < 5.0:
+        return 3
+    else:
+        return 4
+
+
+def calculate_performance_loss(fouling_mm: float, roughness_um: float) -> float:
+    """
+    Calcula perda de performance (resistência adicional) em %.
+    Baseado em modelos empíricos de resistência hidrodinâmica.
+    """
+    # Fórmula simplificada baseada em estudos de resistência
+    thickness_impact = (fouling_mm / 5.0) * 15.0  # Até 15% por 5mm
+    roughness_impact = ((roughness_um - 100.0) / 400.0) * 10.0  # Até 10% por 500um
+    return min(50.0, max(0.0, thickness_impact + roughness_impact))
+
+
+def predict_risk_levels(
+    vessel: Vessel,
+    fouling_mm: float,
+    roughness_um: float,
+    fr_level: int,
+    last_cleaning: Optional[MaintenanceEvent] = None,
+    now: Optional[datetime] = None
+) -> Tuple[int, int]:
+    """Nível FR previsto em 15 e 30 dias"""
+    from ..models.normam401_risk import predict_normam401_risk
+    from ..models.fouling_prediction import VesselFeatures
+
+    now = now or datetime.now()
+    try:
+        time_since_cleaning = 90
+        if last_cleaning and last_cleaning.start_date:
+            time_since_cleaning = (now - last_cleaning.start_date).days
+
+        vessel_features = VesselFeatures(
+            vessel_id=vessel.id,
+            time_since_cleaning_days=time_since_cleaning,
+            water_temperature_c=25.0,
+            salinity_psu=35.0,
+            time_in_port_hours=48.0,
+            average_speed_knots=vessel.typical_speed_knots or 12.0,
+            route_region="Brazil_Coast",
+            paint_type=vessel.paint_type or "AFS",
+            vessel_type=vessel.vessel_type or "tanker",
+            hull_area_m2=vessel.hull_area_m2 or 5000.0
+        )
+
+        risk_15 = predict_normam401_risk(
+            vessel.id, vessel_features, days_ahead=15,
+            current_fouling_mm=fouling_mm,
+            current_roughness_um=roughness_um
+        )
+        risk_30 = predict_normam401_risk(
+            vessel.id, vessel_features, days_ahead=30,
+            current_fouling_mm=fouling_mm,
+            current_roughness_um=roughness_um
+        )
+
+        return (
+            calculate_fr_level(risk_15.predicted_fouling_mm, risk_15.predicted_roughness_um),
+            calculate_fr_level(risk_30.predicted_fouling_mm, risk_30.predicted_roughness_um)
+        )
+    except Exception:
+        # Fallback se predição falhar
+        return fr_level, min(4, fr_level + 1)
+
+
+def fleet_alert(fr_level: int, risk_30_fr: int) -> Tuple[Optional[str], Optional[str]]:
+    """Mensagem e tipo ('critical', 'warning', 'info') do alerta do dashboard"""
+    if fr_level >= 4:
+        return f"CRÍTICO: FR {fr_level}. Docagem a Seco Reativa urgente.", "critical"
+    elif fr_level == 3 or risk_30_fr >= 3:
+        return "Proximidade FR 3 em 30 dias. Limpeza Reativa necessária.", "warning"
+    elif fr_level == 0:
+        return "Sem incrustação. Limpeza Proativa recomendada em 30 dias.", "info"
+    return None, None
+
+
+def compute_fleet_state(snapshot: FleetSnapshot, now: Optional[datetime] = None) -> Dict:
+    """
+    Calcula a linha de fleet_state de uma embarcação a partir do seu snapshot.
+
+    Returns:
+        Dicionário com as colunas de FleetState
+    """
+    vessel = snapshot.vessel
+    latest_fouling = snapshot.latest_fouling
+    last_cleaning = snapshot.last_cleaning
+    last_painting = snapshot.last_painting
+
+    if latest_fouling:
+        fouling_mm = latest_fouling.estimated_thickness_mm or 0.0
+        roughness_um = latest_fouling.estimated_roughness_um or 0.0
+        effective_mm, effective_um = fouling_mm, roughness_um
+    else:
+        # Sem leitura: conformidade verificada com 0/0, indicadores com os valores padrão
+        fouling_mm, roughness_um = 0.0, 0.0
+        effective_mm, effective_um = DEFAULT_FOULING_MM, DEFAULT_ROUGHNESS_UM
+
+    fr_level = calculate_fr_level(effective_mm, effective_um)
+    compliance_check = check_normam401_compliance(
+        vessel_id=vessel.id,
+        fouling_thickness_mm=fouling_mm,
+        roughness_um=roughness_um,
+        vessel_type=vessel.vessel_type or "standard"
+    )
+    risk_15_fr, risk_30_fr = predict_risk_levels(
+        vessel, effective_mm, effective_um, fr_level, last_cleaning, now
+    )
+
+    return {
+        "vessel_id": vessel.id,
+        "vessel_name": vessel.name,
+        "short_id": vessel.call_sign or vessel.imo_number[-6:] if vessel.imo_number else vessel.id[:6],
+        "vessel_class": vessel.vessel_class,
+        "vessel_type": vessel.vessel_type,
+        "status": vessel.status,
+        "fouling_timestamp": latest_fouling.timestamp if latest_fouling else None,
+        "fouling_mm": latest_fouling.estimated_thickness_mm if latest_fouling else None,
+        "roughness_um": latest_fouling.estimated_roughness_um if latest_fouling else None,
+        "fouling_severity": latest_fouling.fouling_severity if latest_fouling else None,
+        "fr_level": fr_level,
+        "performance_loss_percent": calculate_performance_loss(effective_mm, effective_um),
+        "compliance_status": compliance_check.status.value,
+        "risk_15_fr": risk_15_fr,
+        "risk_30_fr": risk_30_fr,
+        "last_cleaning_date": last_cleaning.start_date if last_cleaning else None,
+        "last_painting_date": (
+            last_painting.start_date
+            if last_painting and last_painting.start_date else vessel.paint_application_date
+        ),
+    }
+
+
+def refresh_fleet_state(db: Session, vessel_ids: Iterable[str]) -> int:
+    """
+    Recalcula fleet_state das embarcações indicadas e faz commit.
+    Embarcações removidas têm a linha apagada.
+
+    Returns:
+        Número de linhas atualizadas
+    """
+    now = datetime.now()
+    refreshed = 0
+    with refreshing_fleet_state(db):
+        for vessel_id in sorted(set(vessel_ids)):
+            snapshot = FleetSnapshotRepository.get_by_vessel(db, vessel_id)
+            if snapshot is None:
+                FleetStateRepository.delete(db, vessel_id)
+                continue
+            FleetStateRepository.upsert(db, compute_fleet_state(snapshot, now))
+            refreshed += 1
+    return refreshed
+
+
+def rebuild_fleet_state(db: Session) -> int:
+    """
+    Reconstrói fleet_state para a frota inteira (snapshot em uma consulta).
+
+    Returns:
+        Número de embarcações
+    """
+    now = datetime.now()
+    with refreshing_fleet_state(db):
+        snapshots = FleetSnapshotRepository.get_all(db)
+        db.query(FleetState).delete()
+        for snapshot in snapshots:
+            FleetStateRepository.upsert(db, compute_fleet_state(snapshot, now))
+    return len(snapshots)
+
+
+def ensure_fleet_state(db: Session) -> int:
+    """
+    Popula fleet_state se estiver vazia e houver embarcações (primeira
+    execução após a migração).
+
+    Returns:
+        Número de embarcações reconstruídas (0 se já populada)
+    """
+    if FleetStateRepository.count(db) > 0 or not db.query(Vessel.id).first():
+        return 0
+    return rebuild_fleet_state(db)
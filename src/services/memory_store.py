@@ -0,0 +1,227 @@
+"""
+Séries Temporais em Memória - HullZero
+
+Armazenamento dos dados operacionais e eventos de manutenção quando o
+banco não está disponível (DB_AVAILABLE=False) ou a embarcação só existe
+em memória.
+
+Cada embarcação tem uma série em colunas (uma lista por campo), mantida
+ordenada por (tempo, id) na inserção:
+- filtros de data por bisect na coluna de tempo, sem converter nem
+  ordenar as linhas a cada consulta;
+- registro mais recente no fim da série;
+- retenção limitada por número de linhas e, opcionalmente, por idade em
+  relação ao registro mais recente; as linhas descartadas saem das listas
+  em lote, não a cada inserção.
+
+Os repositórios Memory* seguem a interface dos repositórios do banco
+(create, get_page_by_vessel, get_latest), com o store no lugar da sessão,
+e paginam com os mesmos cursores (src/cursors.py).
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from ..cursors import Page, decode_time_cursor, encode_cursor
+
+
+def _as_datetime(value: Union[str, datetime]) -> datetime:
+    """Datetime sem fuso (convertido para UTC quando vier com fuso), como no banco"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class _VesselSeries:
+    """
+    Colunas de uma embarcação, ordenadas por (tempo, id).
+
+    As linhas antes de start já foram descartadas pela retenção; só saem
+    das listas quando passam de 10% das linhas mantidas (remoção O(n) a
+    cada ~n/10 descartes, O(1) amortizado por inserção).
+    """
+
+    __slots__ = ("times", "ids", "columns", "start")
+
+    def __init__(self, fields: Iterable[str]):
+        self.times: List[datetime] = []
+        self.ids: List[str] = []
+        self.columns: Dict[str, List[Any]] = {name: [] for name in fields}
+        self.start = 0
+
+    def __len__(self) -> int:
+        return len(self.times) - self.start
+
+    def position(self, time: datetime, row_id: str) -> int:
+        """Índice da primeira linha mantida com (tempo, id) >= (time, row_id)"""
+        low = bisect_left(self.times, time, self.start)
+        high = bisect_right(self.times, time, low)
+        return bisect_left(self.ids, row_id, low, high)
+
+    def insert(self, time: datetime, row_id: str, record: Dict):
+        # Registros chegam quase sempre em ordem: inserção no fim
+        if len(self) and (time, row_id) < (self.times[-1], self.ids[-1]):
+            index = self.position(time, row_id)
+        else:
+            index = len(self.times)
+        self.times.insert(index, time)
+        self.ids.insert(index, row_id)
+        for name, column in self.columns.items():
+            column.insert(index, record.get(name))
+
+    def drop_oldest(self, count: int):
+        self.start += count
+        if self.start > len(self) // 10:
+            del self.times[:self.start]
+            del self.ids[:self.start]
+            for column in self.columns.values():
+                del column[:self.start]
+            self.start = 0
+
+    def row(self, index: int) -> Dict:
+        return {name: column[index] for name, column in self.columns.items()}
+
+
+class TimeSeriesStore:
+    """
+    Séries em memória por embarcação.
+
+    time_field é o campo de ordenação (string ISO ou datetime); fields, os
+    campos guardados de cada registro. Cada série guarda no máximo
+    max_rows_per_vessel linhas e, com retention_days, só os registros até
+    retention_days antes do mais recente.
+    """
+
+    def __init__(
+        self,
+        time_field: str,
+        fields: Iterable[str],
+        max_rows_per_vessel: int = 50000,
+        retention_days: float = 0
+    ):
+        self.time_field = time_field
+        self.fields = tuple(fields)
+        self.max_rows_per_vessel = max_rows_per_vessel
+        self.retention = timedelta(days=retention_days) if retention_days else None
+        self._series: Dict[str, _VesselSeries] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, vessel_id: str) -> bool:
+        return bool(self._series.get(vessel_id))
+
+    def add(self, vessel_id: str, record: Dict):
+        time = _as_datetime(record[self.time_field])
+        with self._lock:
+            series = self._series.get(vessel_id)
+            if series is None:
+                series = self._series[vessel_id] = _VesselSeries(self.fields)
+            series.insert(time, str(record["id"]), record)
+
+            excess = len(series) - self.max_rows_per_vessel
+            if self.retention is not None:
+                cutoff = bisect_left(series.times, series.times[-1] - self.retention, series.start)
+                excess = max(excess, cutoff - series.start)
+            if excess > 0:
+                series.drop_oldest(excess)
+
+    def latest(self, vessel_id: str) -> Optional[Dict]:
+        with self._lock:
+            series = self._series.get(vessel_id)
+            return series.row(-1) if series else None
+
+    def page(
+        self,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        limit: int = 100,
+        equals: Optional[Dict[str, Any]] = None
+    ) -> Page[Dict]:
+        """
+        Página mais recente primeiro, por (tempo, id), a partir do cursor.
+        start_date/end_date são inclusivos; equals filtra por igualdade de campos.
+        """
+        filters = {name: value for name, value in (equals or {}).items() if value is not None}
+        with self._lock:
+            series = self._series.get(vessel_id)
+            if series is None:
+                return Page()
+
+            low = series.start
+            if start_date:
+                low = bisect_left(series.times, _as_datetime(start_date), low)
+            high = bisect_right(series.times, _as_datetime(end_date), low) if end_date else len(series.times)
+            if cursor:
+                time, row_id = decode_time_cursor(cursor)
+                high = min(high, series.position(_as_datetime(time), row_id))
+
+            # limit + 1 linhas, para saber se há próxima página
+            indexes = []
+            for index in range(high - 1, low - 1, -1):
+                if all(series.columns[name][index] == value for name, value in filters.items()):
+                    indexes.append(index)
+                    if len(indexes) > limit:
+                        break
+
+            items = [series.row(index) for index in indexes[:limit]]
+            next_cursor = None
+            if len(indexes) > limit:
+                last = indexes[limit - 1]
+                next_cursor = encode_cursor(series.times[last], series.ids[last])
+        return Page(items=items, next_cursor=next_cursor)
+
+
+class MemoryOperationalDataRepository:
+    """Dados operacionais em memória (interface de OperationalDataRepository)"""
+
+    @staticmethod
+    def create(store: TimeSeriesStore, operational_data: Dict) -> Dict:
+        store.add(operational_data["vessel_id"], operational_data)
+        return operational_data
+
+    @staticmethod
+    def get_page_by_vessel(
+        store: TimeSeriesStore,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[Dict]:
+        """Página mais recente primeiro, por (timestamp, id), a partir do cursor"""
+        return store.page(vessel_id, cursor, start_date, end_date, limit)
+
+    @staticmethod
+    def get_latest(store: TimeSeriesStore, vessel_id: str) -> Optional[Dict]:
+        return store.latest(vessel_id)
+
+
+class MemoryMaintenanceEventRepository:
+    """Eventos de manutenção em memória (interface de MaintenanceEventRepository)"""
+
+    @staticmethod
+    def create(store: TimeSeriesStore, maintenance_data: Dict) -> Dict:
+        store.add(maintenance_data["vessel_id"], maintenance_data)
+        return maintenance_data
+
+    @staticmethod
+    def get_page_by_vessel(
+        store: TimeSeriesStore,
+        vessel_id: str,
+        cursor: Optional[str] = None,
+        event_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Page[Dict]:
+        """Página mais recente primeiro, por (start_date, id), a partir do cursor"""
+        return store.page(vessel_id, cursor, start_date, end_date, limit, equals={"event_type": event_type})
+
+    @staticmethod
+    def get_latest(store: TimeSeriesStore, vessel_id: str) -> Optional[Dict]:
+        return store.latest(vessel_id)
@@ -0,0 +1,263 @@
+"""
+Serviço de Métricas - HullZero
+
+Métricas de desempenho da API no formato de texto do Prometheus, sem
+dependências externas:
+
+- latência por rota (histograma), requisições em andamento e total;
+- consultas ao banco e tempo de banco por requisição (eventos
+  before/after_cursor_execute registrados em database/database.py);
+- tempo de inferência por modelo (run_inference em api/inference_executor.py).
+
+Os contadores da requisição corrente ficam em um ContextVar aberto pelo
+middleware (api/metrics_middleware.py). O contexto é copiado para o
+threadpool, então consultas feitas por endpoints síncronos também são
+atribuídas à requisição.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Buckets padrão do cliente Prometheus (segundos)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+_INF_LABEL = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_number(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items()) or ([((), 0.0)] if not self.labelnames else [])
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_number(value)}"
+            for labels, value in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [contagem por bucket, soma, total]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][position] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, [list(s[0]), s[1], s[2]]) for labels, s in self._series.items())
+        lines = self._header()
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_number(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, _INF_LABEL)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_number(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+# ==================== MÉTRICAS ====================
+
+HTTP_REQUESTS = Counter(
+    "hullzero_http_requests_total", "Requisições HTTP atendidas",
+    ("method", "route", "status")
+)
+HTTP_LATENCY = Histogram(
+    "hullzero_http_request_duration_seconds", "Latência das requisições HTTP por rota",
+    ("method", "route")
+)
+HTTP_IN_FLIGHT = Gauge(
+    "hullzero_http_requests_in_flight", "Requisições HTTP em andamento"
+)
+REQUEST_DB_QUERIES = Histogram(
+    "hullzero_http_request_db_queries", "Consultas ao banco por requisição",
+    ("method", "route"), QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_TIME = Histogram(
+    "hullzero_http_request_db_seconds", "Tempo de banco por requisição",
+    ("method", "route")
+)
+DB_QUERIES = Counter(
+    "hullzero_db_queries_total", "Consultas executadas no banco (dentro e fora de requisições)"
+)
+DB_QUERY_TIME = Counter(
+    "hullzero_db_query_seconds_total", "Tempo total gasto em consultas ao banco"
+)
+MODEL_INFERENCE_TIME = Histogram(
+    "hullzero_model_inference_seconds", "Tempo de inferência por modelo (inclui espera na fila)",
+    ("model", "executor")
+)
+
+METRICS = (
+    HTTP_REQUESTS,
+    HTTP_LATENCY,
+    HTTP_IN_FLIGHT,
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_TIME,
+    DB_QUERIES,
+    DB_QUERY_TIME,
+    MODEL_INFERENCE_TIME,
+)
+
+
+# ==================== REQUISIÇÃO CORRENTE ====================
+
+@dataclass
+class RequestTiming:
+    """Tempos acumulados durante uma requisição"""
+    started_at: float = field(default_factory=time.perf_counter)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    inference_seconds: float = 0.0
+    scope: Optional[dict] = field(default=None, repr=False)
+
+    def route(self) -> Optional[str]:
+        """Método e rota da requisição (modelo do path, se já roteada)"""
+        if self.scope is None:
+            return None
+        path = getattr(self.scope.get("route"), "path", None) or self.scope.get("path")
+        return f"{self.scope.get('method')} {path}"
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        """Valor do header Server-Timing (durações em ms)"""
+        entries = [
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries"'
+        ]
+        if self.inference_seconds:
+            entries.append(f"inference;dur={self.inference_seconds * 1000:.1f}")
+        entries.append(f"app;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current_request: ContextVar[Optional[RequestTiming]] = ContextVar("hullzero_request_timing", default=None)
+
+
+def begin_request(scope: Optional[dict] = None) -> Tuple[RequestTiming, object]:
+    """Abre os contadores da requisição (retorna o token para end_request)"""
+    timing = RequestTiming(scope=scope)
+    return timing, _current_request.set(timing)
+
+
+def end_request(token):
+    _current_request.reset(token)
+
+
+def current_request() -> Optional[RequestTiming]:
+    return _current_request.get()
+
+
+def record_db_query(seconds: float):
+    """Chamado pelos eventos do engine após cada consulta"""
+    DB_QUERIES.inc()
+    DB_QUERY_TIME.inc(amount=seconds)
+    timing = _current_request.get()
+    if timing is not None:
+        timing.db_queries += 1
+        timing.db_seconds += seconds
+
+
+def record_inference(model: str, executor: str, seconds: float):
+    MODEL_INFERENCE_TIME.observe(seconds, model, executor)
+    timing = _current_request.get()
+    if timing is not None:
+        timing.inference_seconds += seconds
+
+
+def record_request(method: str, route: str, status: int, timing: RequestTiming):
+    elapsed = timing.elapsed()
+    HTTP_REQUESTS.inc(method, route, str(status))
+    HTTP_LATENCY.observe(elapsed, method, route)
+    REQUEST_DB_QUERIES.observe(timing.db_queries, method, route)
+    REQUEST_DB_TIME.observe(timing.db_seconds, method, route)
+
+
+def render_metrics() -> str:
+    """Todas as métricas no formato de texto do Prometheus (0.0.4)"""
+    lines: List[str] = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
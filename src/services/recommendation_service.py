@@ -12,7 +12,11 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
-from ..models.fouling_prediction import predict_fouling, VesselFeatures
+from ..models.fouling_prediction import (
+    predict_fouling,
+    predict_fouling_trajectory,
+    VesselFeatures
+)
 from ..models.fuel_impact import calculate_fuel_impact, ConsumptionFeatures
 
 
@@ -56,6 +60,7 @@ class CleaningScenario:
     """Cenário de limpeza"""
     cleaning_date: datetime
     estimated_fouling_at_cleaning: float  # mm
+    estimated_roughness_um: float  # μm na data da limpeza
     estimated_fuel_savings_brl: float
     estimated_co2_reduction_kg: float
     cleaning_cost_brl: float
@@ -85,6 +90,9 @@ class RecommendationOptimizer:
     MAX_FOULING_THICKNESS_MM = 5.0  # Limite máximo de espessura
     MAX_ROUGHNESS_UM = 500.0  # Limite máximo de rugosidade
     
+    # Datas candidatas para limpeza (dias à frente)
+    SCENARIO_DAYS_AHEAD = [7, 14, 21, 30, 45, 60, 90]
+    
     def __init__(self):
         self.horizon_days = 90  # Horizonte de otimização
     
@@ -193,31 +201,24 @@ class RecommendationOptimizer:
         """
         scenarios = []
         
+        # Trajetória de bioincrustação até o último cenário (uma avaliação do modelo)
+        trajectory = predict_fouling_trajectory(
+            vessel_features,
+            max(self.SCENARIO_DAYS_AHEAD)
+        )
+        
         # Gera cenários para diferentes datas (7, 14, 21, 30, 45, 60, 90 dias)
-        for days_ahead in [7, 14, 21, 30, 45, 60, 90]:
+        for days_ahead in self.SCENARIO_DAYS_AHEAD:
             cleaning_date = current_date + timedelta(days=days_ahead)
             
-            # Prediz bioincrustação na data de limpeza
-            future_features = VesselFeatures(
-                vessel_id=vessel_features.vessel_id,
-                time_since_cleaning_days=vessel_features.time_since_cleaning_days + days_ahead,
-                water_temperature_c=vessel_features.water_temperature_c,
-                salinity_psu=vessel_features.salinity_psu,
-                time_in_port_hours=vessel_features.time_in_port_hours,
-                average_speed_knots=vessel_features.average_speed_knots,
-                route_region=vessel_features.route_region,
-                paint_type=vessel_features.paint_type,
-                vessel_type=vessel_features.vessel_type,
-                hull_area_m2=vessel_features.hull_area_m2
-            )
-            
-            prediction = predict_fouling(future_features)
-            estimated_fouling = prediction.estimated_thickness_mm
-            estimated_roughness = prediction.estimated_roughness_um
+            # Bioincrustação prevista na data de limpeza
+            estimated_fouling = float(trajectory.thickness_mm[days_ahead])
+            estimated_roughness = float(trajectory.roughness_um[days_ahead])
             
             scenario = CleaningScenario(
                 cleaning_date=cleaning_date,
                 estimated_fouling_at_cleaning=estimated_fouling,
+                estimated_roughness_um=estimated_roughness,
                 estimated_fuel_savings_brl=0.0,  # Será calculado
                 estimated_co2_reduction_kg=0.0,  # Será calculado
                 cleaning_cost_brl=0.0,  # Será calculado
@@ -0,0 +1,43 @@
+"""
+Configuração Comum dos Testes - HullZero
+
+O banco é configurado na importação de src (src/config.py lê
+DATABASE_URL), então a URL de um SQLite temporário é definida aqui, antes
+de qualquer teste importar o pacote. A fixture `db` recria as tabelas a
+cada teste.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="hullzero_tests_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_DIR}/hullzero_test.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["SLOW_QUERY_LOG_ENABLED"] = "false"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def db():
+    """Sessão em um banco SQLite limpo (tabelas recriadas a cada teste)"""
+    from src.database.database import SessionLocal, engine
+    from src.database.models import Base
+    from src.data.vessel_name_mapper import VesselNameMapper
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    VesselNameMapper.invalidate_index()
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,87 @@
+"""
+Sessão Síncrona no Lugar do AsyncSession - HullZero
+
+Sem driver assíncrono (ou com o acesso assíncrono desligado), os handlers
+recebem de AsyncSessionLocal um SyncSessionAdapter. Os testes rodam os
+repositórios Async* sobre o adaptador e comparam com os síncronos, e
+verificam que uma consulta lenta não bloqueia o event loop.
+
+Uso:
+    python -m pytest tests/test_async_fallback.py -q
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from src.database.database import SyncSessionAdapter, sync_session_adapter
+from src.database.repositories import (
+    AsyncFleetSnapshotRepository,
+    AsyncMaintenanceEventRepository,
+    AsyncVesselRepository,
+    FleetSnapshotRepository,
+    MaintenanceEventRepository,
+    VesselRepository
+)
+
+
+def _seed(db):
+    vessel = VesselRepository.create(db, {"id": "V1", "name": "BRUNO LIMA"})
+    start = datetime(2024, 1, 1)
+    for day in range(3):
+        MaintenanceEventRepository.create(db, {
+            "vessel_id": vessel.id,
+            "event_type": "cleaning",
+            "start_date": start + timedelta(days=day),
+        })
+    return vessel
+
+
+def test_async_repositories_run_on_sync_session(db):
+    vessel = _seed(db)
+
+    async def read():
+        async with sync_session_adapter() as session:
+            assert isinstance(session, SyncSessionAdapter)
+            return (
+                await AsyncVesselRepository.count(session),
+                await AsyncVesselRepository.get_by_id(session, vessel.id),
+                await AsyncMaintenanceEventRepository.get_page_by_vessel(session, vessel.id, limit=2),
+                await AsyncMaintenanceEventRepository.get_latest_by_type(session, vessel.id, "cleaning"),
+                await AsyncFleetSnapshotRepository.get_all(session),
+            )
+
+    count, found, page, latest, snapshots = asyncio.run(read())
+    assert count == 1
+    assert found.name == "BRUNO LIMA"
+    assert [event.start_date.day for event in page.items] == [3, 2]
+    assert page.next_cursor is not None
+    assert latest.start_date == datetime(2024, 1, 3)
+    assert len(snapshots) == len(FleetSnapshotRepository.get_all(db))
+
+
+def test_slow_sync_call_does_not_block_event_loop(db):
+    _seed(db)
+
+    def slow_count(session):
+        time.sleep(0.3)
+        return len(VesselRepository.get_all(session))
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        async with sync_session_adapter() as session:
+            count = await session.run_sync(slow_count)
+        task.cancel()
+        return count, ticks
+
+    count, ticks = asyncio.run(run())
+    assert count == 1
+    assert ticks >= 10  # o loop seguiu atendendo durante a consulta
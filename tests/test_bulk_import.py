@@ -0,0 +1,80 @@
+"""
+Importação em Blocos dos CSVs - HullZero
+
+Roda os importadores de src/data/import_real_data.py sobre os CSVs de
+tests/fixtures/import/ (arquivos pequenos com linhas inválidas) e verifica
+que:
+- linhas sem embarcação conhecida, sem data ou sem dados mínimos são
+  ignoradas;
+- formatos de data misturados no mesmo arquivo são convertidos;
+- o resultado não depende do tamanho do bloco.
+
+Uso:
+    python -m pytest tests/test_bulk_import.py -q
+"""
+
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.data.import_real_data import (
+    import_consumption_data,
+    import_events_data,
+    parse_ais_chunks
+)
+from src.database.models import MaintenanceEvent, OperationalData
+from src.database.repositories import VesselRepository
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "import"
+
+
+@pytest.fixture
+def vessels(db):
+    return {
+        name: VesselRepository.create(db, {"name": name}).id
+        for name in ("BRUNO LIMA", "CARLA SILVA")
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_ais_chunks_parse_mixed_formats_and_skip_invalid_rows(chunk_size):
+    rejected = Counter()
+    chunks = list(parse_ais_chunks(str(FIXTURES / "BRUNO LIMA.csv"), chunk_size, rejected))
+
+    rows = [row for data in chunks for row in data.to_dict("records")]
+    assert [row["timestamp"] for row in rows] == [
+        datetime(2024, 2, 1, 10, 0),
+        datetime(2024, 2, 1, 11, 0, 0, 500000),
+    ]
+    assert rows[0]["speed_knots"] == 10.5
+    assert rejected["missing_timestamp"] == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_consumption_import_skips_unknown_vessels_and_missing_dates(db, vessels, chunk_size):
+    path = str(FIXTURES / "consumo.csv")
+    assert import_consumption_data(db, path, chunk_size=chunk_size, incremental=False) == 1
+
+    row = db.query(OperationalData).one()
+    assert row.vessel_id == vessels["CARLA SILVA"]
+    assert row.timestamp == datetime(2024, 1, 2)
+    assert row.fuel_consumption_kg_h == 200.0
+    assert row.engine_power_kw is None
+    assert row.source == "consumption"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_events_import_normalizes_types_and_resolves_ship_names(db, vessels, chunk_size):
+    path = str(FIXTURES / "eventos.csv")
+    assert import_events_data(db, path, chunk_size=chunk_size, incremental=False) == 2
+
+    events = {
+        event.vessel_id: event
+        for event in db.query(MaintenanceEvent).order_by(MaintenanceEvent.start_date)
+    }
+    assert events[vessels["BRUNO LIMA"]].event_type == "cleaning"
+    assert events[vessels["BRUNO LIMA"]].description == f"Evento importado de {path}"
+    assert events[vessels["CARLA SILVA"]].event_type == "inspection"
+    assert events[vessels["CARLA SILVA"]].description == "ok"
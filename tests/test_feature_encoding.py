@@ -0,0 +1,124 @@
+"""
+Codificação Determinística de Features - HullZero
+
+Verifica o CategoricalEncoder (src/models/feature_encoding.py):
+- códigos independentes da ordem das linhas e da seed de hash do processo;
+- valores ausentes ou não vistos no treinamento recebem UNKNOWN_CODE, no
+  lote (encode_batch) e valor a valor (encode);
+- vocabulário preservado no artefato (pickle) do modelo;
+- artefato sem vocabulário (hash() por processo) é carregado como não treinado.
+
+Uso:
+    python -m pytest tests/test_feature_encoding.py -q
+"""
+
+import json
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.models.feature_encoding import UNKNOWN_CODE, CategoricalEncoder
+from src.models.fouling_prediction import CATEGORICAL_COLUMNS, MLFoulingModel, VesselFeatures
+
+
+ROOT = Path(__file__).parent.parent
+
+TRAINING = pd.DataFrame({
+    "route_region": ["South_Atlantic", "Brazil_Coast", "Tropical", "South_Atlantic"],
+    "paint_type": ["Antifouling_Type_B", "Antifouling_Type_A", None, "Antifouling_Type_A"],
+    "vessel_type": ["tanker", "gas_carrier", "tanker", ""],
+})
+
+# Codifica TRAINING em outro processo (PYTHONHASHSEED definido pelo teste)
+ENCODE_IN_SUBPROCESS = """
+import json, sys
+import pandas as pd
+from src.models.feature_encoding import CategoricalEncoder
+frame = pd.DataFrame(json.loads(sys.argv[1]))
+encoder = CategoricalEncoder(list(frame.columns)).fit(frame)
+print(json.dumps([encoder.encode_batch(column, frame[column]).tolist() for column in frame.columns]))
+"""
+
+
+def _encode(frame: pd.DataFrame):
+    encoder = CategoricalEncoder(CATEGORICAL_COLUMNS).fit(frame)
+    return [encoder.encode_batch(column, frame[column]).tolist() for column in CATEGORICAL_COLUMNS]
+
+
+def test_codes_follow_sorted_vocabulary_with_reserved_unknown():
+    encoder = CategoricalEncoder(CATEGORICAL_COLUMNS).fit(TRAINING)
+    assert encoder.vocabulary["route_region"] == {"Brazil_Coast": 1, "South_Atlantic": 2, "Tropical": 3}
+    assert encoder.vocabulary["vessel_type"] == {"gas_carrier": 1, "tanker": 2}
+
+    for missing in (None, float("nan"), "", "Arctic"):
+        assert encoder.encode("route_region", missing) == UNKNOWN_CODE
+
+
+def test_encode_batch_matches_encode():
+    encoder = CategoricalEncoder(CATEGORICAL_COLUMNS).fit(TRAINING)
+    values = ["Tropical", None, float("nan"), np.nan, pd.NA, "", "Arctic", "Brazil_Coast", 3]
+    expected = [encoder.encode("route_region", value) for value in values]
+    assert expected == [3, 0, 0, 0, 0, 0, 0, 1, 0]
+    assert encoder.encode_batch("route_region", values).tolist() == expected
+    assert encoder.encode_batch("route_region", pd.Series(values, index=range(10, 19))).tolist() == expected
+    assert encoder.encode_batch("route_region", []).shape == (0,)
+
+
+def test_codes_do_not_depend_on_row_order():
+    shuffled = TRAINING.iloc[::-1].reset_index(drop=True)
+    assert _encode(shuffled) == [list(reversed(codes)) for codes in _encode(TRAINING)]
+
+
+def test_codes_do_not_depend_on_process_hash_seed():
+    training = TRAINING.where(TRAINING.notna(), None).to_dict("list")
+    outputs = set()
+    for seed in ("1", "2", "12345"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        result = subprocess.run(
+            [sys.executable, "-c", ENCODE_IN_SUBPROCESS, json.dumps(training)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        outputs.add(result.stdout.strip().splitlines()[-1])
+    assert outputs == {json.dumps(_encode(TRAINING))}
+
+
+def test_vocabulary_survives_model_artifact_round_trip():
+    model = MLFoulingModel()
+    model.encoder.fit(TRAINING)
+    features = VesselFeatures(
+        vessel_id="V1",
+        time_since_cleaning_days=90,
+        water_temperature_c=25.0,
+        salinity_psu=34.0,
+        time_in_port_hours=12.0,
+        average_speed_knots=12.0,
+        route_region="Tropical",
+        paint_type="Antifouling_Type_B",
+        vessel_type="tanker",
+        hull_area_m2=5000.0
+    )
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert restored.encoder.to_dict() == model.encoder.to_dict()
+    np.testing.assert_array_equal(restored.prepare_features(features), model.prepare_features(features))
+    np.testing.assert_array_equal(
+        model.prepare_features_batch(pd.DataFrame([features.__dict__]))[0],
+        model.prepare_features(features)[0]
+    )
+
+
+def test_artifact_without_vocabulary_loads_untrained():
+    legacy = MLFoulingModel()
+    legacy.is_trained = True
+    state = dict(legacy.__dict__)
+    del state["encoder"]
+
+    restored = MLFoulingModel.__new__(MLFoulingModel)
+    restored.__setstate__(state)
+    assert not restored.is_trained
+    assert not restored.encoder.is_fitted
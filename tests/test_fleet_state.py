@@ -0,0 +1,107 @@
+"""
+fleet_state Atualizado no Commit - HullZero
+
+Verifica os eventos de sessão de src/database/fleet_state_events.py:
+- criar, alterar e remover embarcação atualiza a linha em fleet_state;
+- nova leitura de bioincrustação e novas limpeza/pintura entram na linha
+  da embarcação após o commit;
+- escrita desfeita (rollback) não altera fleet_state;
+- inserção em lote via Core não dispara os eventos; rebuild_fleet_state
+  reconstrói a tabela.
+
+Uso:
+    python -m pytest tests/test_fleet_state.py -q
+"""
+
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from src.database.fleet_state_events import PENDING_KEY
+from src.database.models import FleetState, FoulingData
+from src.database.repositories import (
+    FleetStateRepository,
+    FoulingDataRepository,
+    MaintenanceEventRepository,
+    VesselRepository
+)
+from src.services.fleet_state_service import rebuild_fleet_state
+
+
+def _state(db, vessel_id):
+    db.expire_all()
+    return db.get(FleetState, vessel_id)
+
+
+def _fouling(vessel_id, timestamp, thickness):
+    return {
+        "vessel_id": vessel_id,
+        "timestamp": timestamp,
+        "estimated_thickness_mm": thickness,
+        "estimated_roughness_um": 50.0 * thickness + 100.0,
+        "fouling_severity": "moderate",
+    }
+
+
+def test_vessel_writes_update_fleet_state(db):
+    VesselRepository.create(db, {"id": "V1", "name": "BRUNO LIMA", "status": "active"})
+    state = _state(db, "V1")
+    assert state.vessel_name == "BRUNO LIMA"
+    assert state.fouling_mm is None
+
+    VesselRepository.update(db, "V1", {"status": "maintenance"})
+    assert _state(db, "V1").status == "maintenance"
+
+    assert VesselRepository.delete(db, "V1")
+    assert _state(db, "V1") is None
+    assert FleetStateRepository.count(db) == 0
+
+
+def test_fouling_and_maintenance_refresh_vessel_row(db):
+    VesselRepository.create(db, {"id": "V1", "name": "BRUNO LIMA"})
+    VesselRepository.create(db, {"id": "V2", "name": "CARLA SILVA"})
+
+    FoulingDataRepository.create(db, _fouling("V1", datetime(2024, 3, 1), 2.0))
+    FoulingDataRepository.create(db, _fouling("V1", datetime(2024, 1, 1), 5.0))  # leitura antiga
+    state = _state(db, "V1")
+    assert state.fouling_mm == 2.0
+    assert state.fouling_timestamp == datetime(2024, 3, 1)
+
+    MaintenanceEventRepository.create(db, {
+        "vessel_id": "V1", "event_type": "cleaning", "start_date": datetime(2024, 2, 1)
+    })
+    MaintenanceEventRepository.create(db, {
+        "vessel_id": "V1", "event_type": "painting", "start_date": datetime(2023, 6, 1)
+    })
+    state = _state(db, "V1")
+    assert state.last_cleaning_date == datetime(2024, 2, 1)
+    assert state.last_painting_date == datetime(2023, 6, 1)
+
+    # Só a embarcação escrita é recalculada
+    assert _state(db, "V2").fouling_mm is None
+
+
+def test_rolled_back_write_leaves_fleet_state_unchanged(db):
+    VesselRepository.create(db, {"id": "V1", "name": "BRUNO LIMA"})
+    VesselRepository.create(db, {"id": "V2", "name": "CARLA SILVA"})
+
+    db.add(FoulingData(**_fouling("V1", datetime(2024, 3, 1), 4.0)))
+    db.flush()
+    assert db.info[PENDING_KEY] == {"V1"}
+    db.rollback()
+    assert PENDING_KEY not in db.info
+
+    # Commit seguinte (outra embarcação) não recalcula V1 com dados descartados
+    FoulingDataRepository.create(db, _fouling("V2", datetime(2024, 3, 1), 1.0))
+    assert _state(db, "V1").fouling_mm is None
+    assert _state(db, "V2").fouling_mm == 1.0
+
+
+def test_core_bulk_insert_needs_rebuild(db):
+    VesselRepository.create(db, {"id": "V1", "name": "BRUNO LIMA"})
+    db.execute(insert(FoulingData), [{"id": "F1", **_fouling("V1", datetime(2024, 3, 1), 3.0)}])
+    db.commit()
+    assert _state(db, "V1").fouling_mm is None
+
+    assert rebuild_fleet_state(db) == 1
+    assert _state(db, "V1").fouling_mm == 3.0
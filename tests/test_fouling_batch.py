@@ -0,0 +1,183 @@
+"""
+Predição em Lote x Predição Unitária - HullZero
+
+A predição unitária (predict/predict_growth, usada nas requisições de um
+navio) deve dar o mesmo resultado que a linha correspondente de um lote
+(predict_batch/predict_growth_batch). No modelo avançado a unitária é o lote
+de uma linha; no básico, as duas versões são separadas. Verifica, linha a
+linha:
+- fatores físicos avançados com escalares (float, None para ausente) e
+  arrays;
+- modelo físico avançado, inclusive faixas fora do ótimo, nutrientes
+  ausentes e fatores sazonais;
+- modelo avançado sem ensemble treinado (fallback físico) e treinado;
+- modelo híbrido básico, sem treino e treinado.
+
+Uso:
+    python -m pytest tests/test_fouling_batch.py -q
+"""
+
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.advanced_fouling_prediction import (
+    AdvancedHybridModel,
+    AdvancedVesselFeatures,
+    advanced_features_to_frame,
+    train_advanced_model,
+)
+from src.models.fouling_prediction import HybridFoulingModel, VesselFeatures, train_fouling_model
+
+
+ROUTES = ("South_Atlantic", "Brazil_Coast", "Estuaries", "North_Sea")
+SEASONS = (None, "summer", "spring", "autumn", "winter")
+
+
+def _advanced_features(n: int = 40):
+    """Lote variado: temperatura e salinidade dentro e fora da faixa ótima, opcionais ausentes"""
+    rng = np.random.default_rng(7)
+    return [
+        AdvancedVesselFeatures(
+            vessel_id=f"V{i:03d}",
+            time_since_cleaning_days=int(rng.integers(0, 400)),
+            water_temperature_c=float(rng.uniform(10.0, 36.0)),
+            salinity_psu=float(rng.uniform(24.0, 40.0)),
+            time_in_port_hours=float(rng.uniform(0.0, 240.0)),
+            average_speed_knots=float(rng.uniform(0.0, 22.0)),
+            route_region=ROUTES[i % len(ROUTES)],
+            paint_type=("Antifouling_Type_A", "Antifouling_Type_B")[i % 2],
+            vessel_type=("tanker", "gas_carrier", "container")[i % 3],
+            hull_area_m2=float(rng.uniform(3000.0, 9000.0)),
+            seasonal_factor=SEASONS[i % len(SEASONS)],
+            chlorophyll_a_concentration=None if i % 4 == 0 else float(rng.uniform(0.0, 12.0)),
+            dissolved_oxygen=None if i % 3 == 0 else float(rng.uniform(2.0, 10.0)),
+            paint_age_days=None if i % 2 else int(rng.integers(0, 900)),
+        )
+        for i in range(n)
+    ]
+
+
+def _basic_features(n: int = 40):
+    return [
+        VesselFeatures(**{
+            name: value for name, value in asdict(features).items()
+            if name in VesselFeatures.__dataclass_fields__
+        })
+        for features in _advanced_features(n)
+    ]
+
+
+def _history(n: int = 80) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    days = rng.integers(0, 400, n)
+    return pd.DataFrame({
+        "vessel_id": [f"V{i % 10:03d}" for i in range(n)],
+        "days_since_cleaning": days,
+        "temperature": rng.uniform(15.0, 32.0, n),
+        "salinity": rng.uniform(28.0, 38.0, n),
+        "time_in_port": rng.uniform(0.0, 120.0, n),
+        "speed": rng.uniform(5.0, 18.0, n),
+        "route": [ROUTES[i % len(ROUTES)] for i in range(n)],
+        "paint": ["Antifouling_Type_A"] * n,
+        "vessel_type": [("tanker", "gas_carrier")[i % 2] for i in range(n)],
+        "hull_area": rng.uniform(3000.0, 9000.0, n),
+        "fouling_thickness": days * 0.02 + rng.normal(0.0, 0.2, n),
+    })
+
+
+@pytest.fixture(scope="module")
+def trained_advanced_model():
+    return train_advanced_model(_history())
+
+
+@pytest.fixture(scope="module")
+def trained_basic_model():
+    return train_fouling_model(_history())
+
+
+def _assert_same_prediction(single, batched):
+    single, batched = asdict(single), asdict(batched)
+    single.pop("timestamp")
+    batched.pop("timestamp")
+    assert single.keys() == batched.keys()
+    for name, value in single.items():
+        if isinstance(value, dict):
+            assert value.keys() == batched[name].keys(), name
+            for key, item in value.items():
+                assert batched[name][key] == pytest.approx(item), f"{name}[{key}]"
+        elif isinstance(value, float):
+            assert batched[name] == pytest.approx(value), name
+        else:
+            assert batched[name] == value, name
+
+
+def test_advanced_physical_factors_accept_scalars_and_arrays():
+    model = AdvancedHybridModel().physical_model
+    temperature = np.array([10.0, 18.0, 25.0, 33.0])
+    salinity = np.array([24.0, 32.5, 36.0, 40.0])
+    chlorophyll = np.array([np.nan, 3.0, 11.0, 0.2])
+    oxygen = np.array([3.0, np.nan, 9.0, 6.0])
+    regions = np.array(["Brazil_Coast", "Estuaries", "North_Sea", "Tropical"], dtype=object)
+
+    temperature_factor = model.calculate_temperature_factor(temperature)
+    salinity_factor = model.calculate_salinity_factor(salinity)
+    nutrient_factor = model.calculate_nutrient_factor(chlorophyll, oxygen)
+    risks = model.calculate_invasive_species_risk(regions, temperature)
+    assert nutrient_factor.tolist() == pytest.approx([0.7, 1.2, 1.54, 0.8])
+    assert temperature_factor[2] == 1.0
+
+    for i in range(len(temperature)):
+        scalar = model.calculate_temperature_factor(float(temperature[i]))
+        assert isinstance(scalar, float) and scalar == temperature_factor[i]
+        assert model.calculate_salinity_factor(float(salinity[i])) == salinity_factor[i]
+        missing = [None if np.isnan(value) else float(value) for value in (chlorophyll[i], oxygen[i])]
+        assert model.calculate_nutrient_factor(*missing) == pytest.approx(nutrient_factor[i])
+        scalar_risks = model.calculate_invasive_species_risk(regions[i], float(temperature[i]))
+        assert scalar_risks == {species: float(risk[i]) for species, risk in risks.items()}
+
+
+def test_advanced_physical_growth_batch_matches_scalar():
+    model = AdvancedHybridModel().physical_model
+    features = _advanced_features()
+    thickness, risks = model.predict_growth_batch(advanced_features_to_frame(features))
+
+    for i, row in enumerate(features):
+        expected_thickness, expected_risks = model.predict_growth(row)
+        assert thickness[i] == pytest.approx(expected_thickness)
+        assert {species: risk[i] for species, risk in risks.items()} == pytest.approx(expected_risks)
+
+
+def test_advanced_batch_matches_scalar_without_trained_ensemble():
+    model = AdvancedHybridModel()
+    features = _advanced_features()
+    for single, batched in zip((model.predict(row) for row in features), model.predict_batch(features)):
+        _assert_same_prediction(single, batched)
+
+
+def test_advanced_batch_matches_scalar_with_trained_ensemble(trained_advanced_model):
+    features = _advanced_features()
+    batch = trained_advanced_model.predict_batch(features)
+    assert len(batch) == len(features)
+    for row, batched in zip(features, batch):
+        _assert_same_prediction(trained_advanced_model.predict(row), batched)
+
+
+def test_advanced_batch_accepts_frame_without_optional_columns(trained_advanced_model):
+    features = _advanced_features(10)
+    required = [name for name, value in asdict(features[0]).items() if name in VesselFeatures.__dataclass_fields__]
+    frame = pd.DataFrame([asdict(row) for row in features])[required]
+
+    stripped = [AdvancedVesselFeatures(**row) for row in frame.to_dict("records")]
+    for row, batched in zip(stripped, trained_advanced_model.predict_batch(frame)):
+        _assert_same_prediction(trained_advanced_model.predict(row), batched)
+
+
+@pytest.mark.parametrize("trained", [False, True])
+def test_basic_batch_matches_scalar(trained, request):
+    model = request.getfixturevalue("trained_basic_model") if trained else HybridFoulingModel()
+    features = _basic_features()
+    for row, batched in zip(features, model.predict_batch(features)):
+        _assert_same_prediction(model.predict(row), batched)
@@ -0,0 +1,76 @@
+"""
+Orçamento de Importação da API - HullZero
+
+Sobe `import src.api.main` em um processo limpo com `python -X importtime`
+e verifica que:
+- nenhuma biblioteca pesada de ML é importada na subida (elas carregam em
+  segundo plano ou na primeira predição);
+- o tempo cumulativo de importação fica dentro do orçamento.
+
+O orçamento padrão cobre FastAPI + SQLAlchemy em uma máquina modesta;
+ajuste com HULLZERO_IMPORT_BUDGET_SECONDS.
+
+Uso:
+    python -m pytest tests/test_import_time.py -q
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("HULLZERO_IMPORT_BUDGET_SECONDS", "2.0"))
+
+HEAVY_MODULES = {
+    "sklearn",
+    "xgboost",
+    "scipy",
+    "pandas",
+    "shap",
+    "prophet",
+    "tensorflow",
+}
+
+
+def _import_profile(tmp_path):
+    """Executa a importação e retorna {módulo: tempo cumulativo em segundos}"""
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{tmp_path / 'import_time.db'}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.api.main"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total_us, module = line.split("|")
+        if total_us.strip().isdigit():
+            cumulative[module.strip()] = int(total_us) / 1_000_000
+    return cumulative
+
+
+def test_api_import_skips_heavy_ml_modules(tmp_path):
+    profile = _import_profile(tmp_path)
+    imported = {module.split(".")[0] for module in profile}
+    assert not imported & HEAVY_MODULES, (
+        f"Bibliotecas de ML importadas na subida da API: {sorted(imported & HEAVY_MODULES)}"
+    )
+
+
+def test_api_import_within_budget(tmp_path):
+    profile = _import_profile(tmp_path)
+    elapsed = profile["src.api.main"]
+    slowest = sorted(profile.items(), key=lambda item: item[1], reverse=True)[:10]
+    assert elapsed <= IMPORT_BUDGET_SECONDS, (
+        f"import src.api.main levou {elapsed:.2f}s (orçamento {IMPORT_BUDGET_SECONDS:.2f}s). "
+        f"Mais lentos: {[(name, round(seconds, 3)) for name, seconds in slowest]}"
+    )
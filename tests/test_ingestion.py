@@ -0,0 +1,125 @@
+"""
+Reimportação Idempotente dos CSVs - HullZero
+
+Verifica o registro de ingestão (src/data/ingestion_ledger.py) e as
+chaves naturais de operational_data e maintenance_events:
+- reimportar o arquivo inteiro (incremental=False) não duplica linhas;
+- arquivo sem alterações é pulado pelo ledger;
+- arquivo com linhas novas grava só as novas;
+- linhas AIS sem timestamp são descartadas e contadas;
+- eventos registrados manualmente (source NULL) ficam fora da chave
+  natural: não conflitam entre si nem com os importados.
+
+Uso:
+    python -m pytest tests/test_ingestion.py -q
+"""
+
+import os
+from collections import Counter
+from datetime import datetime
+
+from src.data.import_real_data import import_ais_data, import_events_data, parse_ais_chunks
+from src.database.models import MaintenanceEvent, OperationalData
+from src.database.repositories import MaintenanceEventRepository, VesselRepository
+
+EVENTS_CSV = (
+    "shipName,eventType,startDate,obs\n"
+    "BRUNO LIMA,Limpeza casco,2024-03-01,\n"
+    "BRUNO LIMA,Inspeção,2024-03-01,\n"
+    "CARLA SILVA,Inspeção,2024-03-02,ok\n"
+)
+
+AIS_CSV = (
+    "Data;Latitude;Longitude;SOG;COG\n"
+    "2024-02-01 10:00:00;-23.1;-43.2;10.5;90\n"
+    "2024-02-01 11:00:00;-23.2;-43.3;11.0;92\n"
+    "2024-02-01 12:00:00;-23.3;-43.4;11.5;95\n"
+)
+
+
+def _create_vessels(db):
+    VesselRepository.create(db, {"name": "BRUNO LIMA"})
+    VesselRepository.create(db, {"name": "CARLA SILVA"})
+
+
+def _write(path, content, mtime=None):
+    path.write_text(content, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_full_events_reimport_keeps_row_count(db, tmp_path):
+    _create_vessels(db)
+    csv_path = _write(tmp_path / "eventos.csv", EVENTS_CSV)
+
+    assert import_events_data(db, csv_path, incremental=False) == 3
+    assert db.query(MaintenanceEvent).count() == 3
+
+    assert import_events_data(db, csv_path, incremental=False) == 0
+    assert db.query(MaintenanceEvent).count() == 3
+
+
+def test_full_ais_reimport_keeps_row_count(db, tmp_path):
+    _create_vessels(db)
+    csv_path = _write(tmp_path / "BRUNO LIMA.csv", AIS_CSV)
+
+    assert import_ais_data(db, "BRUNO LIMA", csv_path, incremental=False) == 3
+    assert import_ais_data(db, "BRUNO LIMA", csv_path, incremental=False) == 0
+    assert db.query(OperationalData).count() == 3
+
+
+def test_unchanged_file_is_skipped(db, tmp_path):
+    _create_vessels(db)
+    csv_path = _write(tmp_path / "eventos.csv", EVENTS_CSV)
+
+    assert import_events_data(db, csv_path) == 3
+    assert import_events_data(db, csv_path) == 0
+    assert db.query(MaintenanceEvent).count() == 3
+
+
+def test_appended_rows_import_only_new_rows(db, tmp_path):
+    _create_vessels(db)
+    csv_path = _write(tmp_path / "BRUNO LIMA.csv", AIS_CSV, mtime=1_700_000_000)
+    assert import_ais_data(db, "BRUNO LIMA", csv_path) == 3
+
+    _write(
+        tmp_path / "BRUNO LIMA.csv",
+        AIS_CSV + "2024-02-01 13:00:00;-23.4;-43.5;12.0;97\n",
+        mtime=1_700_000_100
+    )
+    assert import_ais_data(db, "BRUNO LIMA", csv_path) == 1
+    assert db.query(OperationalData).count() == 4
+
+
+def test_ais_rows_without_timestamp_are_dropped_and_counted(db, tmp_path):
+    _create_vessels(db)
+    csv_path = _write(
+        tmp_path / "BRUNO LIMA.csv",
+        AIS_CSV + ";-23.5;-43.6;12.5;99\nsem data;-23.6;-43.7;;\n"
+    )
+
+    rejected = Counter()
+    rows = sum(len(data) for data in parse_ais_chunks(csv_path, rejected=rejected))
+    assert rows == 3
+    assert rejected["missing_timestamp"] == 2
+
+    assert import_ais_data(db, "BRUNO LIMA", csv_path, incremental=False) == 3
+    assert import_ais_data(db, "BRUNO LIMA", csv_path, incremental=False) == 0
+    assert db.query(OperationalData).count() == 3
+
+
+def test_manual_events_are_outside_the_natural_key(db, tmp_path):
+    _create_vessels(db)
+    vessel_id = VesselRepository.get_by_name(db, "BRUNO LIMA").id
+    manual = {"vessel_id": vessel_id, "event_type": "cleaning", "start_date": datetime(2024, 3, 1)}
+    MaintenanceEventRepository.create(db, {**manual, "cost_brl": 150000.0, "location": "Santos"})
+    MaintenanceEventRepository.create(db, {**manual, "cost_brl": 80000.0, "location": "Suape"})
+
+    csv_path = _write(tmp_path / "eventos.csv", EVENTS_CSV)
+    assert import_events_data(db, csv_path, incremental=False) == 3
+    assert import_events_data(db, csv_path, incremental=False) == 0
+
+    events = db.query(MaintenanceEvent).filter_by(**manual).all()
+    assert sorted(event.source or "manual" for event in events) == ["events", "manual", "manual"]
+    assert db.query(MaintenanceEvent).count() == 5
@@ -0,0 +1,145 @@
+"""
+Séries Temporais em Memória - HullZero
+
+Verifica o TimeSeriesStore e os repositórios Memory*
+(src/services/memory_store.py):
+- inserção fora de ordem mantém a série ordenada por (tempo, id);
+- páginas seguem o cursor e os filtros de data (inclusivos), e aceitam os
+  cursores do banco;
+- registro mais recente por embarcação;
+- retenção por número de linhas (descartes removidos em lote) e por idade;
+- filtro por tipo de evento nos eventos de manutenção.
+
+Uso:
+    python -m pytest tests/test_memory_store.py -q
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from src.cursors import encode_cursor
+from src.services.memory_store import (
+    MemoryMaintenanceEventRepository,
+    MemoryOperationalDataRepository,
+    TimeSeriesStore
+)
+
+START = datetime(2024, 1, 1)
+FIELDS = ("id", "vessel_id", "timestamp", "speed_knots")
+
+
+def _record(row_id, hours, vessel_id="V1"):
+    return {
+        "id": row_id,
+        "vessel_id": vessel_id,
+        "timestamp": (START + timedelta(hours=hours)).isoformat(),
+        "speed_knots": float(hours),
+    }
+
+
+def _walk(store, limit, **filters):
+    rows, cursor = [], None
+    while True:
+        page = MemoryOperationalDataRepository.get_page_by_vessel(store, "V1", cursor=cursor, limit=limit, **filters)
+        rows.extend(page.items)
+        if page.next_cursor is None:
+            return rows
+        cursor = page.next_cursor
+
+
+def test_out_of_order_inserts_page_newest_first():
+    store = TimeSeriesStore("timestamp", FIELDS)
+    # Fora de ordem e com empates de timestamp (desempate por id)
+    for row_id, hours in [("b", 5), ("a", 1), ("d", 5), ("c", 3), ("e", 0), ("f", 5)]:
+        MemoryOperationalDataRepository.create(store, _record(row_id, hours))
+    MemoryOperationalDataRepository.create(store, _record("z", 2, vessel_id="V2"))
+
+    for limit in (1, 2, 4, 10):
+        assert [row["id"] for row in _walk(store, limit)] == ["f", "d", "b", "c", "a", "e"]
+    assert MemoryOperationalDataRepository.get_latest(store, "V1")["id"] == "f"
+    assert MemoryOperationalDataRepository.get_latest(store, "V3") is None
+    assert "V2" in store and "V3" not in store
+
+
+def test_date_filters_are_inclusive_and_timezone_aware():
+    store = TimeSeriesStore("timestamp", FIELDS)
+    for hours in range(10):
+        store.add("V1", _record(f"r{hours}", hours))
+
+    rows = _walk(store, 2, start_date=START + timedelta(hours=3), end_date=START + timedelta(hours=6))
+    assert [row["id"] for row in rows] == ["r6", "r5", "r4", "r3"]
+
+    # Datas com fuso são comparadas em UTC, como no banco
+    start = (START + timedelta(hours=5)).replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=-3)))
+    assert [row["id"] for row in _walk(store, 10, start_date=start)] == ["r9", "r8", "r7", "r6", "r5"]
+
+
+def test_cursor_from_database_listing_is_accepted():
+    store = TimeSeriesStore("timestamp", FIELDS)
+    for hours in range(5):
+        store.add("V1", _record(f"r{hours}", hours))
+
+    cursor = encode_cursor(START + timedelta(hours=3), "r3")
+    page = MemoryOperationalDataRepository.get_page_by_vessel(store, "V1", cursor=cursor, limit=10)
+    assert [row["id"] for row in page.items] == ["r2", "r1", "r0"]
+    assert page.next_cursor is None
+
+
+def test_retention_by_row_count_keeps_newest():
+    store = TimeSeriesStore("timestamp", FIELDS, max_rows_per_vessel=3)
+    for hours in range(6):
+        store.add("V1", _record(f"r{hours}", hours))
+
+    assert [row["id"] for row in _walk(store, 10)] == ["r5", "r4", "r3"]
+
+
+def test_retention_by_age_relative_to_latest_record():
+    store = TimeSeriesStore("timestamp", FIELDS, retention_days=1)
+    for hours in (0, 12, 24, 30, 47):
+        store.add("V1", _record(f"r{hours}", hours))
+
+    assert [row["id"] for row in _walk(store, 10)] == ["r47", "r30", "r24"]
+
+    # Registro antigo chegando atrasado é descartado na hora
+    store.add("V1", _record("late", 1))
+    assert [row["id"] for row in _walk(store, 10)] == ["r47", "r30", "r24"]
+
+
+def test_maintenance_pages_filter_by_event_type():
+    store = TimeSeriesStore("start_date", ("id", "vessel_id", "event_type", "start_date"))
+    for day in range(9):
+        MemoryMaintenanceEventRepository.create(store, {
+            "id": f"M{day}",
+            "vessel_id": "V1",
+            "event_type": ("cleaning", "inspection", "painting")[day % 3],
+            "start_date": START + timedelta(days=day),
+        })
+
+    first = MemoryMaintenanceEventRepository.get_page_by_vessel(store, "V1", event_type="cleaning", limit=2)
+    assert [row["id"] for row in first.items] == ["M6", "M3"]
+    rest = MemoryMaintenanceEventRepository.get_page_by_vessel(
+        store, "V1", cursor=first.next_cursor, event_type="cleaning", limit=2
+    )
+    assert [row["id"] for row in rest.items] == ["M0"]
+    assert rest.next_cursor is None
+
+    everything = MemoryMaintenanceEventRepository.get_page_by_vessel(store, "V1", limit=100)
+    assert len(everything.items) == 9
+    assert MemoryMaintenanceEventRepository.get_latest(store, "V1")["id"] == "M8"
+
+
+def test_row_cap_trims_in_batches():
+    store = TimeSeriesStore("timestamp", FIELDS, max_rows_per_vessel=100)
+    for hours in range(1000):
+        store.add("V1", _record(f"r{hours:04d}", hours))
+        # Descartadas ficam no máximo 10% acima do limite até a remoção em lote
+        assert len(store._series["V1"].times) <= 111
+    store.add("V1", _record("late", 950))
+
+    rows = _walk(store, 30)
+    assert len(rows) == 100
+    assert rows[0]["id"] == "r0999" and rows[-1]["id"] == "r0901"
+    assert "late" in [row["id"] for row in rows]
+    assert MemoryOperationalDataRepository.get_latest(store, "V1")["id"] == "r0999"
+
+    # Filtro de data anterior à janela mantida não devolve linhas descartadas
+    assert _walk(store, 10, end_date=START + timedelta(hours=900)) == []
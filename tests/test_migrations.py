@@ -0,0 +1,85 @@
+"""
+Migração 004 (Chaves Naturais) - HullZero
+
+Aplica src/database/migrations/004_ingestion_ledger.sql a um SQLite com o
+esquema anterior e verifica:
+- cópias de eventos importados são removidas (inspeções passam para a
+  cópia mantida);
+- eventos manuais com a mesma embarcação, tipo e início são mantidos;
+- sem a tabela inspections (migração 002 não aplicada) o repasse é pulado
+  e o restante da migração é aplicado.
+
+Uso:
+    python -m pytest tests/test_migrations.py -q
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.database.migrate import execute_sql_file
+
+MIGRATION = Path(__file__).parent.parent / "src" / "database" / "migrations" / "004_ingestion_ledger.sql"
+
+PRE_004_SCHEMA = (
+    "CREATE TABLE vessels (id VARCHAR PRIMARY KEY, name VARCHAR)",
+    "CREATE TABLE operational_data (id VARCHAR PRIMARY KEY, vessel_id VARCHAR, timestamp TIMESTAMP)",
+    "CREATE TABLE maintenance_events (id VARCHAR PRIMARY KEY, vessel_id VARCHAR, event_type VARCHAR, "
+    "start_date TIMESTAMP, description TEXT, cost_brl FLOAT)",
+)
+
+EVENTS = [
+    # Importado duas vezes (mesma chave natural)
+    ("imp-a", "cleaning", "Evento importado de eventos.csv", None),
+    ("imp-b", "cleaning", "Evento importado de eventos.csv", None),
+    # Manuais no mesmo instante, com custos diferentes
+    ("man-a", "cleaning", "Limpeza em Santos", 150000.0),
+    ("man-b", "cleaning", "Limpeza em Suape", 80000.0),
+]
+
+
+def _database(tmp_path, with_inspections: bool):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pre_004.db'}")
+    with engine.begin() as conn:
+        for statement in PRE_004_SCHEMA:
+            conn.execute(text(statement))
+        if with_inspections:
+            conn.execute(text("CREATE TABLE inspections (id VARCHAR PRIMARY KEY, maintenance_event_id VARCHAR)"))
+            conn.execute(text("INSERT INTO inspections VALUES ('insp-1', 'imp-b')"))
+        conn.execute(text("INSERT INTO vessels VALUES ('V1', 'BRUNO LIMA')"))
+        for event_id, event_type, description, cost in EVENTS:
+            conn.execute(
+                text("INSERT INTO maintenance_events VALUES (:id, 'V1', :type, '2024-03-01 00:00:00', :description, :cost)"),
+                {"id": event_id, "type": event_type, "description": description, "cost": cost}
+            )
+    return engine
+
+
+@pytest.mark.parametrize("with_inspections", [True, False])
+def test_migration_deduplicates_only_imported_events(tmp_path, with_inspections):
+    engine = _database(tmp_path, with_inspections)
+    assert execute_sql_file(engine, MIGRATION)
+
+    with engine.connect() as conn:
+        events = dict(conn.execute(text("SELECT id, source FROM maintenance_events ORDER BY id")).all())
+        assert events == {"imp-a": "events", "man-a": None, "man-b": None}
+        if with_inspections:
+            assert conn.execute(text("SELECT maintenance_event_id FROM inspections")).scalar() == "imp-a"
+
+    schema = inspect(engine)
+    assert "ingestion_ledger" in schema.get_table_names()
+    assert "uq_maintenance_vessel_type_start_source" in {
+        index["name"] for index in schema.get_indexes("maintenance_events")
+    }
+    engine.dispose()
+
+
+def test_migration_can_run_again(tmp_path):
+    engine = _database(tmp_path, with_inspections=True)
+    assert execute_sql_file(engine, MIGRATION)
+    assert execute_sql_file(engine, MIGRATION)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM maintenance_events")).scalar() == 3
+    engine.dispose()
@@ -0,0 +1,82 @@
+"""
+Troca de Modelos em Execução - HullZero
+
+Verifica o ModelRegistry (src/models/model_registry.py):
+- versão publicada por outro processo é carregada no refresh;
+- artefato corrompido não derruba o modelo ativo;
+- refresh concorrente carrega a nova versão uma única vez.
+
+Uso:
+    python -m pytest tests/test_model_registry.py -q
+"""
+
+import threading
+
+from src.models.model_registry import DEFAULT_VERSION, ModelRegistry
+
+
+def _registry(tmp_path):
+    registry = ModelRegistry(base_path=str(tmp_path), refresh_interval_seconds=0)
+    registry.register_default("fouling", lambda: {"weights": "padrão"})
+    return registry
+
+
+def test_default_model_until_a_version_is_published(tmp_path):
+    registry = _registry(tmp_path)
+    entry = registry.get_entry("fouling")
+    assert entry.version == DEFAULT_VERSION
+    assert entry.model == {"weights": "padrão"}
+
+
+def test_refresh_hot_swaps_version_published_by_another_process(tmp_path):
+    api = _registry(tmp_path)
+    trainer = _registry(tmp_path)
+    trainer.publish("fouling", {"weights": 1}, version="v1")
+    assert api.get("fouling") == {"weights": 1}
+
+    trainer.publish("fouling", {"weights": 2}, version="v2")
+    assert api.get("fouling") == {"weights": 1}  # sem refresh automático
+    assert api.refresh("fouling").version == "v2"
+    assert api.get("fouling") == {"weights": 2}
+
+
+def test_corrupt_artifact_keeps_current_model(tmp_path):
+    api = _registry(tmp_path)
+    trainer = _registry(tmp_path)
+    trainer.publish("fouling", {"weights": 1}, version="v1")
+    assert api.get("fouling") == {"weights": 1}
+
+    (tmp_path / "fouling" / "v2.joblib").write_bytes(b"artefato truncado")
+    (tmp_path / "fouling" / "LATEST").write_text("v2")
+
+    assert api.refresh("fouling").version == "v1"
+    assert api.get("fouling") == {"weights": 1}
+
+    # Nova publicação válida volta a ser carregada
+    trainer.publish("fouling", {"weights": 3}, version="v3")
+    assert api.refresh("fouling").version == "v3"
+
+
+def test_concurrent_refresh_loads_new_version_once(tmp_path):
+    api = _registry(tmp_path)
+    trainer = _registry(tmp_path)
+    trainer.publish("fouling", {"weights": 1}, version="v1")
+    api.get("fouling")
+    trainer.publish("fouling", {"weights": 2}, version="v2")
+
+    loads = []
+    load_artifact = api._load_artifact
+
+    def counting_load(name, version):
+        loads.append(version)
+        return load_artifact(name, version)
+
+    api._load_artifact = counting_load
+    threads = [threading.Thread(target=api.refresh, args=("fouling",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["v2"]
+    assert api.get_entry("fouling").version == "v2"
@@ -0,0 +1,136 @@
+"""
+Paginação por Cursor (Keyset) - HullZero
+
+Verifica os cursores (src/cursors.py) e a paginação dos repositórios
+(src/database/pagination.py):
+- percorrer as páginas devolve cada linha uma única vez, em ordem
+  (tempo, id) decrescente, inclusive com vários registros no mesmo
+  instante;
+- filtros de data e de tipo de evento valem em todas as páginas;
+- embarcações paginadas por id, com filtros;
+- cursor malformado ou de outro tipo de listagem gera InvalidCursor.
+
+Uso:
+    python -m pytest tests/test_pagination.py -q
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.cursors import InvalidCursor, decode_id_cursor, decode_time_cursor, encode_cursor
+from src.database.models import FoulingData, MaintenanceEvent, OperationalData, Vessel
+from src.database.repositories import (
+    FoulingDataRepository,
+    MaintenanceEventRepository,
+    OperationalDataRepository,
+    VesselRepository
+)
+
+START = datetime(2024, 1, 1)
+SOURCES = ("ais", "noon_report", "manual")
+
+
+def _walk(fetch, limit):
+    """Todas as linhas, página a página, seguindo next_cursor"""
+    rows, cursor, pages = [], None, 0
+    while True:
+        page = fetch(cursor=cursor, limit=limit)
+        assert len(page.items) <= limit
+        rows.extend(page.items)
+        pages += 1
+        if page.next_cursor is None:
+            return rows, pages
+        cursor = page.next_cursor
+
+
+def _seed_history(db):
+    """10 instantes com 3 registros cada (mesmo timestamp) para V1, e um navio vizinho"""
+    db.add_all([Vessel(id="V1", name="BRUNO LIMA"), Vessel(id="V2", name="CARLA SILVA")])
+    db.flush()
+    for hour in range(10):
+        timestamp = START + timedelta(hours=hour)
+        for n, source in enumerate(SOURCES):
+            db.add(FoulingData(id=f"F{hour:02d}{n}", vessel_id="V1", timestamp=timestamp))
+            db.add(OperationalData(id=f"O{hour:02d}{n}", vessel_id="V1", timestamp=timestamp, source=source))
+        db.add(FoulingData(id=f"X{hour:02d}", vessel_id="V2", timestamp=timestamp))
+    db.commit()
+
+
+def test_cursor_round_trip():
+    timestamp = datetime(2024, 5, 1, 12, 30)
+    assert decode_time_cursor(encode_cursor(timestamp, "F001")) == (timestamp, "F001")
+    assert decode_id_cursor(encode_cursor("V1")) == "V1"
+
+
+@pytest.mark.parametrize("cursor", ["não-é-base64!", encode_cursor("V1"), encode_cursor("ontem", "F001")])
+def test_malformed_time_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_time_cursor(cursor)
+
+
+@pytest.mark.parametrize("limit", [1, 4, 30, 100])
+def test_history_pages_return_every_row_once_in_order(db, limit):
+    _seed_history(db)
+
+    for repository in (FoulingDataRepository, OperationalDataRepository):
+        rows, pages = _walk(
+            lambda cursor, limit: repository.get_page_by_vessel(db, "V1", cursor=cursor, limit=limit),
+            limit
+        )
+        keys = [(row.timestamp, row.id) for row in rows]
+        assert len(keys) == 30
+        assert keys == sorted(set(keys), reverse=True)
+        assert pages == max(1, -(-30 // limit))
+
+
+def test_date_filters_apply_to_every_page(db):
+    _seed_history(db)
+    start_date, end_date = START + timedelta(hours=2), START + timedelta(hours=5)
+
+    rows, _ = _walk(
+        lambda cursor, limit: FoulingDataRepository.get_page_by_vessel(
+            db, "V1", cursor=cursor, start_date=start_date, end_date=end_date, limit=limit
+        ),
+        limit=5
+    )
+    assert len(rows) == 12
+    assert all(start_date <= row.timestamp <= end_date for row in rows)
+
+
+def test_maintenance_pages_filter_by_event_type(db):
+    db.add(Vessel(id="V1", name="BRUNO LIMA"))
+    db.flush()
+    for day in range(12):
+        db.add(MaintenanceEvent(
+            id=f"M{day:02d}",
+            vessel_id="V1",
+            event_type=("cleaning", "inspection", "painting")[day % 3],
+            start_date=START + timedelta(days=day)
+        ))
+    db.commit()
+
+    rows, pages = _walk(
+        lambda cursor, limit: MaintenanceEventRepository.get_page_by_vessel(
+            db, "V1", cursor=cursor, event_type="cleaning", limit=limit
+        ),
+        limit=3
+    )
+    assert [row.id for row in rows] == ["M09", "M06", "M03", "M00"]
+    assert pages == 2
+
+
+def test_vessel_pages_follow_id_order_with_filters(db):
+    for i in range(7):
+        db.add(Vessel(id=f"V{i}", name=f"Navio {i}", vessel_type=("tanker", "gas_carrier")[i % 2]))
+    db.commit()
+
+    rows, pages = _walk(lambda cursor, limit: VesselRepository.get_page(db, cursor=cursor, limit=limit), limit=3)
+    assert [vessel.id for vessel in rows] == [f"V{i}" for i in range(7)]
+    assert pages == 3
+
+    rows, _ = _walk(
+        lambda cursor, limit: VesselRepository.get_page(db, cursor=cursor, limit=limit, vessel_type="tanker"),
+        limit=2
+    )
+    assert [vessel.id for vessel in rows] == ["V0", "V2", "V4", "V6"]
@@ -0,0 +1,81 @@
+"""
+Cache de Respostas - HullZero
+
+Verifica o ResponseCache (src/api/response_cache.py):
+- misses simultâneos da mesma chave executam o endpoint uma única vez;
+- após invalidate(), novos pedidos não aguardam um cálculo iniciado antes
+  da invalidação, e o resultado defasado não é gravado;
+- commits que alteram modelos em cache invalidam as respostas.
+
+Uso:
+    python -m pytest tests/test_response_cache.py -q
+"""
+
+import asyncio
+
+from src.api.response_cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    get_response_cache,
+    set_response_cache_backend
+)
+from src.database.repositories import VesselRepository
+
+
+def test_concurrent_misses_compute_once():
+    cache = ResponseCache(MemoryCacheBackend())
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"vessels": 3}
+
+    async def run():
+        values = await asyncio.gather(*(cache.get_or_compute("kpis", compute) for _ in range(10)))
+        return values + [await cache.get_or_compute("kpis", compute)]
+
+    values = asyncio.run(run())
+    assert values == [{"vessels": 3}] * 11
+    assert len(calls) == 1
+    status = cache.status()
+    assert (status["misses"], status["coalesced"], status["hits"]) == (1, 9, 1)
+
+
+def test_requests_after_invalidate_do_not_join_stale_computation():
+    cache = ResponseCache(MemoryCacheBackend())
+    state = {"version": 1}
+
+    async def compute():
+        version = state["version"]
+        await asyncio.sleep(0.02)
+        return {"version": version}
+
+    async def run():
+        stale = asyncio.ensure_future(cache.get_or_compute("kpis", compute))
+        await asyncio.sleep(0.005)  # cálculo iniciado com a versão 1
+
+        state["version"] = 2
+        cache.invalidate()
+        fresh = await cache.get_or_compute("kpis", compute)
+        return await stale, fresh, await cache.get_or_compute("kpis", compute)
+
+    stale, fresh, cached = asyncio.run(run())
+    assert stale == {"version": 1}
+    assert fresh == {"version": 2}
+    assert cached == {"version": 2}
+    assert cache.status()["misses"] == 2
+
+
+def test_commit_of_cached_model_invalidates_responses(db):
+    cache = set_response_cache_backend(MemoryCacheBackend())
+    assert cache is get_response_cache()
+
+    async def compute():
+        return {"vessels": 0}
+
+    asyncio.run(cache.get_or_compute("dashboard:kpis", compute))
+    assert cache.backend.get("dashboard:kpis") == {"vessels": 0}
+
+    VesselRepository.create(db, {"name": "BRUNO LIMA"})
+    assert cache.backend.get("dashboard:kpis") is None